@@ -1,10 +1,24 @@
 import os
 from flask import Flask, request
+from werkzeug.local import LocalProxy
 from .routes import register_blueprints
 from .health import health_bp
+from .metrics import install_metrics, metrics_bp
+from .profiling import install_request_profiling
 from .services import sites as site_service
-from pillow_heif import register_heif_opener
-register_heif_opener()
+from .services.request_cache import install_request_cache
+
+
+def _lazy(loader):
+    """Proxy that calls `loader` once, on first access from a template."""
+    loaded = []
+
+    def resolve():
+        if not loaded:
+            loaded.append(loader())
+        return loaded[0]
+
+    return LocalProxy(resolve)
 
 
 def initialise_application():
@@ -30,21 +44,31 @@ def initialise_application():
         if request.method != "GET":
             preferred_site_return_to = request.referrer or request.full_path
 
+        # Resolved on first use in the template, so pages that never show
+        # the site picker don't touch the catalog at all.
         return {
-            "available_sites": site_service.list_sites(),
-            "current_site": site_service.get_current_site(),
+            "available_sites": _lazy(lambda: site_service.get_site_catalog()["sites"]),
+            "current_site": _lazy(site_service.get_current_site),
             "preferred_site_return_to": preferred_site_return_to,
         }
 
     register_blueprints(app)
     app.register_blueprint(health_bp, url_prefix="/maintenance")
+    app.register_blueprint(metrics_bp, url_prefix="/maintenance")
     app.secret_key = os.environ["FLASK_SECRET"]
 
     app.config.update(
         {
             "ATTACHMENT_ROOT": os.environ.get("ATTACHMENT_ROOT", "/tmp/attachments"),
             "MAINTENANCE_PUBLIC_BASE_URL": os.environ.get("MAINTENANCE_PUBLIC_BASE_URL", "http://server2-ubuntu"),
+            "REQUEST_PROFILING": os.environ.get("REQUEST_PROFILING", "1") != "0",
+            "SEARCH_BUDGET_MS": int(os.environ.get("SEARCH_BUDGET_MS", "300")),
+            "EVENTS_MAX_STREAMS": int(os.environ.get("EVENTS_MAX_STREAMS", "100")),
         }
     )
 
+    install_request_profiling(app)
+    install_metrics(app)
+    install_request_cache(app)
+
     return app
@@ -0,0 +1,114 @@
+from sqlalchemy import text
+from app.db import events as events_repo
+from app.db.connection import get_connection
+
+# Column lists for the moves. The generated search_vector columns are left
+# out: the archive tables compute their own.
+_ISSUE_COLUMNS = "id, asset_id, status_id, title, description, reported_by, closed_at, created_at, updated_at, version"
+_ISSUE_ACTION_COLUMNS = "id, issue_id, action_type_id, body, created_at, created_by"
+_ISSUE_STATUS_HISTORY_COLUMNS = "id, issue_id, from_status_id, to_status_id, changed_at, changed_by"
+_ISSUE_ATTACHMENT_COLUMNS = "id, issue_id, filepath, content_type, width, height, created_at"
+
+
+def count_archivable_issue_rows(closed_before) -> int:
+    """Number of live issues with closed_at < closed_before."""
+
+    sql = text("""
+        SELECT COUNT(*)::int AS total
+        FROM issue
+        WHERE closed_at < :closed_before
+    """)
+
+    with get_connection() as conn:
+        row = conn.execute(sql, {"closed_before": closed_before}).mappings().first()
+
+    return 0 if row is None else int(row["total"])
+
+
+def archive_closed_issue_batch(closed_before, *, batch_size: int = 500) -> dict:
+    """
+    Move up to `batch_size` issues closed before `closed_before`, oldest
+    first, into the *_archive tables together with their actions, status
+    history and attachment rows, then delete them from the live tables.
+
+    The whole batch is one transaction: an interrupted run leaves every issue
+    either fully live or fully archived, so the job simply picks up where it
+    stopped. Claimed issues are locked with SKIP LOCKED, so two runs never
+    fight over the same rows and a concurrent edit is not blocked for long.
+
+    Returns:
+        {"issues": n, "actions": n, "status_history": n, "attachments": n}
+    """
+
+    claim_sql = text("""
+        SELECT id
+        FROM issue
+        WHERE closed_at < :closed_before
+        ORDER BY closed_at, id
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    """)
+
+    copy_issue_sql = text(f"""
+        INSERT INTO issue_archive ({_ISSUE_COLUMNS})
+        SELECT {_ISSUE_COLUMNS}
+        FROM issue
+        WHERE id = ANY(:ids)
+    """)
+
+    copy_action_sql = text(f"""
+        INSERT INTO issue_action_archive ({_ISSUE_ACTION_COLUMNS})
+        SELECT {_ISSUE_ACTION_COLUMNS}
+        FROM issue_action
+        WHERE issue_id = ANY(:ids)
+    """)
+
+    copy_status_history_sql = text(f"""
+        INSERT INTO issue_status_history_archive ({_ISSUE_STATUS_HISTORY_COLUMNS})
+        SELECT {_ISSUE_STATUS_HISTORY_COLUMNS}
+        FROM issue_status_history
+        WHERE issue_id = ANY(:ids)
+    """)
+
+    copy_attachment_sql = text(f"""
+        INSERT INTO issue_attachment_archive ({_ISSUE_ATTACHMENT_COLUMNS})
+        SELECT {_ISSUE_ATTACHMENT_COLUMNS}
+        FROM issue_attachment
+        WHERE issue_id = ANY(:ids)
+    """)
+
+    # issue_action, issue_status_history and issue_attachment cascade.
+    delete_issue_sql = text("""
+        DELETE FROM issue
+        WHERE id = ANY(:ids)
+    """)
+
+    with get_connection() as conn:
+        ids = conn.execute(
+            claim_sql,
+            {"closed_before": closed_before, "batch_size": batch_size},
+        ).scalars().all()
+
+        if not ids:
+            return {"issues": 0, "actions": 0, "status_history": 0, "attachments": 0}
+
+        # The deletes below are a move: sync logs them as op "archive"
+        # (014_archive_change_log), and live streams get one resync event
+        # instead of an issue.deleted per issue.
+        conn.execute(text("SELECT set_config('maintenance.archiving', 'on', true)"))
+        events_repo.suppress_change_notifications(conn)
+        events_repo.notify_resync(conn, "issues.archive")
+
+        params = {"ids": list(ids)}
+        issues = conn.execute(copy_issue_sql, params).rowcount
+        actions = conn.execute(copy_action_sql, params).rowcount
+        status_history = conn.execute(copy_status_history_sql, params).rowcount
+        attachments = conn.execute(copy_attachment_sql, params).rowcount
+        conn.execute(delete_issue_sql, params)
+
+    return {
+        "issues": issues,
+        "actions": actions,
+        "status_history": status_history,
+        "attachments": attachments,
+    }
@@ -1,5 +1,6 @@
 from sqlalchemy import text
-from app.db.connection import get_connection
+from app.db import events as events_repo
+from app.db.connection import get_connection, set_statement_timeout
 
 def get_asset_row(asset_id):
     """
@@ -44,6 +45,7 @@ def get_asset_row(asset_id):
             asset.retire_reason,
             asset.created_at,
             asset.updated_at,
+            asset.version,
             site.shorthand AS site_shorthand,
             site.fullname AS site_fullname,
             category.name AS category_name,
@@ -92,6 +94,7 @@ def get_asset_row_by_tag(asset_tag: str):
             asset.retire_reason,
             asset.created_at,
             asset.updated_at,
+            asset.version,
             site.shorthand AS site_shorthand,
             site.fullname AS site_fullname,
             category.name AS category_name,
@@ -124,6 +127,190 @@ def get_asset_row_by_tag(asset_tag: str):
     return dict(row)
 
 
+def lookup_asset_rows(*, asset_tags: list[str], asset_ids: list[str]) -> list[dict]:
+    """
+    Resolve many scanned asset tags and/or asset ids in one query.
+
+    Only site and status are joined: enough to reconcile a stocktake without
+    the make/model/variant detail of get_asset_row_by_tag.
+    """
+
+    sql = text("""
+        SELECT
+            asset.id,
+            asset.asset_tag,
+            asset.site_id,
+            asset.status_id,
+            asset.retired_at,
+            site.shorthand AS site_shorthand,
+            asset_status.code AS status_code,
+            asset_status.label AS status_label
+        FROM asset
+        LEFT JOIN site ON asset.site_id = site.id
+        LEFT JOIN asset_status ON asset.status_id = asset_status.id
+        WHERE asset.asset_tag = ANY(:asset_tags)
+           OR asset.id = ANY(CAST(:asset_ids AS uuid[]))
+        ORDER BY asset.asset_tag, asset.id
+    """)
+
+    with get_connection() as conn:
+        rows = conn.execute(sql, {"asset_tags": list(asset_tags), "asset_ids": list(asset_ids)}).mappings().all()
+
+    return [dict(row) for row in rows]
+
+
+ACTIVE_ISSUE_STATUS_CODES = ("OPEN", "IN_PROGRESS")
+
+_ASSET_ISSUE_HISTORY_SQL = """
+        SELECT
+            issue.id AS issue_id,
+            issue.title AS issue_title,
+            issue.status_id AS issue_status_id,
+            issue_status.code AS issue_status_code,
+            issue_status.label AS issue_status_label,
+            issue.reported_by AS issue_reported_by,
+            issue.created_at AS issue_created_at,
+            issue.closed_at AS issue_closed_at
+        FROM issue
+        JOIN issue_status ON issue.status_id = issue_status.id
+        WHERE issue.asset_id = :id
+        {before_sql}
+        ORDER BY issue.created_at DESC, issue.id DESC
+        LIMIT :limit
+"""
+
+_ASSET_ISSUE_HISTORY_BEFORE_SQL = "AND (issue.created_at, issue.id) < (:before_created_at, CAST(:before_id AS uuid))"
+
+
+def _issue_history_params(asset_id, before, limit) -> tuple[str, dict]:
+    params = {"id": asset_id, "limit": limit}
+    if before is None:
+        return "", params
+
+    params["before_created_at"], params["before_id"] = before
+    return _ASSET_ISSUE_HISTORY_BEFORE_SQL, params
+
+
+def get_asset_detail_rows(asset_id, *, history_limit: int, before=None):
+    """
+    Everything the asset page needs in one round trip: the asset row, its
+    issue counts (total, open, per status code) and the newest issues.
+
+    Args:
+        asset_id: uuid of the asset.
+        history_limit: max issue rows to return.
+        before: optional (created_at, issue_id) keyset cursor; only issues
+            older than it are returned.
+
+    Returns:
+        None if the asset doesn't exist, otherwise
+        {"asset": {...}, "issue_counts": {"total", "open", "by_status"}, "issues": [...]}
+        where each issue is a dict of the issue_* columns.
+    """
+
+    before_sql, params = _issue_history_params(asset_id, before, history_limit)
+    params["active_codes"] = list(ACTIVE_ISSUE_STATUS_CODES)
+
+    # Asset columns repeat on every history row; the LEFT JOIN keeps one row
+    # when the asset has no issues yet.
+    sql = text(f"""
+        WITH target AS (
+            SELECT
+                asset.id,
+                asset.variant_id,
+                asset.category_id,
+                asset.site_id,
+                asset.status_id,
+                asset.serial_num,
+                asset.asset_tag,
+                asset.acquired_at,
+                asset.retired_at,
+                asset.retire_reason,
+                asset.created_at,
+                asset.updated_at,
+                asset.version,
+                site.shorthand AS site_shorthand,
+                site.fullname AS site_fullname,
+                category.name AS category_name,
+                category.label AS category_label,
+                asset_status.code AS status_code,
+                asset_status.label AS status_label,
+                variant.name AS variant_name,
+                variant.label AS variant_label,
+                model.name AS model_name,
+                model.label AS model_label,
+                make.name AS make_name,
+                make.label AS make_label
+            FROM asset
+            LEFT JOIN site ON asset.site_id = site.id
+            LEFT JOIN category ON asset.category_id = category.id
+            LEFT JOIN asset_status ON asset.status_id = asset_status.id
+            LEFT JOIN variant ON asset.variant_id = variant.id
+            LEFT JOIN model ON variant.model_id = model.id
+            LEFT JOIN make ON model.make_id = make.id
+            WHERE asset.id = :id
+        ),
+        status_counts AS (
+            SELECT
+                issue_status.code,
+                COUNT(*)::int AS issue_count
+            FROM issue
+            JOIN issue_status ON issue.status_id = issue_status.id
+            WHERE issue.asset_id = :id
+            GROUP BY issue_status.code
+        ),
+        counts AS (
+            SELECT
+                COALESCE(SUM(issue_count), 0)::int AS counts_total,
+                COALESCE(SUM(issue_count) FILTER (WHERE code = ANY(:active_codes)), 0)::int AS counts_open,
+                COALESCE(jsonb_object_agg(code, issue_count) FILTER (WHERE code IS NOT NULL), '{{}}'::jsonb)
+                    AS counts_by_status
+            FROM status_counts
+        ),
+        history AS ({_ASSET_ISSUE_HISTORY_SQL.format(before_sql=before_sql)})
+        SELECT
+            target.*,
+            counts.*,
+            history.*
+        FROM target
+        CROSS JOIN counts
+        LEFT JOIN history ON TRUE
+        ORDER BY history.issue_created_at DESC NULLS LAST, history.issue_id DESC
+    """)
+
+    with get_connection() as conn:
+        rows = conn.execute(sql, params).mappings().all()
+
+    if not rows:
+        return None
+
+    first = rows[0]
+    return {
+        "asset": {key: value for key, value in first.items() if not key.startswith(("issue_", "counts_"))},
+        "issue_counts": {
+            "total": first["counts_total"],
+            "open": first["counts_open"],
+            "by_status": dict(first["counts_by_status"]),
+        },
+        "issues": [
+            {key: value for key, value in row.items() if key.startswith("issue_")}
+            for row in rows
+            if row["issue_id"] is not None
+        ],
+    }
+
+
+def list_asset_issue_history_rows(asset_id, *, limit: int, before=None) -> list[dict]:
+    """Issue rows for one asset, newest first; `before` is a (created_at, issue_id) cursor."""
+    before_sql, params = _issue_history_params(asset_id, before, limit)
+    sql = text(_ASSET_ISSUE_HISTORY_SQL.format(before_sql=before_sql))
+
+    with get_connection() as conn:
+        rows = conn.execute(sql, params).mappings().all()
+
+    return [dict(r) for r in rows]
+
+
 def list_asset_status_rows():
     sql = text("""
         SELECT
@@ -161,22 +348,8 @@ def get_asset_status_row(status_id: str):
     return dict(row)
 
 
-def get_asset_status_id(asset_id: str):
-    sql = text("""
-        SELECT status_id
-        FROM asset
-        WHERE id = :id
-    """)
-
-    with get_connection() as conn:
-        row = conn.execute(sql, {"id": asset_id}).mappings().first()
-
-    if row is None:
-        return None
-
-    return row["status_id"]
-
-def list_asset_rows(
+def _asset_filter_clauses(
+    *,
     site_id=None,
     category_id=None,
     status_id=None,
@@ -184,62 +357,11 @@ def list_asset_rows(
     model_id=None,
     variant_id=None,
     asset_tag=None,
-    sort=None,
-    limit=None,
-    offset=None,
     retired_mode: str = "active",
-    ):
-    """
-    List assets with optional filters, sorting, and pagination.
-    Aassumes arguments are already validated by service / route layer.
-
-    Args:
-        site_id: filter by asset.site_id
-        category_id: filter by asset.category_id
-        status_id: filter by asset.status_id
-        make_id: filter by make.id (via variant -> model -> make join)
-        model_id: filter by model.id (via variant -> model join)
-        variant_id: filter by asset.variant_id
-        asset_tag: filter by exact asset_tag
-        sort: list of (field_name, direction) pairs, e.g.
-              [("asset_tag", "asc"), ("created_at", "desc")]
-        limit: max number of rows to return (for pagination)
-        offset: number of rows to skip (for pagination)
-        retired_mode: view asset based on active statuses, e.g., ["active" (only), "retired" (only), all]
-
-    Returns:
-        (rows, total_count)
-
-        rows: list of dicts, each dict is one asset row (same shape as
-              get_asset_row()).
-
-        total_count: integer number of rows that match the filters,
-                     ignoring limit/offset.
-
+) -> tuple[list[str], dict]:
     """
-
-    # Base SELECT – join variant/model so make_id/model_id filters work.
-    base_select = """
-        SELECT
-            asset.id,
-            asset.variant_id,
-            asset.category_id,
-            asset.site_id,
-            asset.status_id,
-            asset.serial_num,
-            asset.asset_tag,
-            asset.acquired_at,
-            asset.retired_at,
-            asset.retire_reason,
-            asset.created_at,
-            asset.updated_at,
-            variant.name AS variant_name,
-            model.name AS model_name,
-            make.name AS make_name
-        FROM asset
-        LEFT JOIN variant ON asset.variant_id = variant.id
-        LEFT JOIN model ON variant.model_id = model.id
-        LEFT JOIN make ON model.make_id = make.id
+    WHERE clauses and params for the asset list filters. make_id / model_id
+    need `variant` and `model` joined onto `asset`.
     """
 
     where_clauses = []
@@ -287,6 +409,150 @@ def list_asset_rows(
         where_clauses.append("model.make_id = :make_id")
         params["make_id"] = make_id
 
+    return where_clauses, params
+
+
+# Sparse fieldsets: the column behind each field of the asset list payload
+# (fields=...). "id" is always selected.
+ASSET_LIST_FIELD_COLUMNS = {
+    "id": "asset.id",
+    "variant_id": "asset.variant_id",
+    "category_id": "asset.category_id",
+    "site_id": "asset.site_id",
+    "status_id": "asset.status_id",
+    "serial_number": "asset.serial_num",
+    "asset_tag": "asset.asset_tag",
+    "acquired_at": "asset.acquired_at",
+    "retired_at": "asset.retired_at",
+    "retire_reason": "asset.retire_reason",
+    "created_at": "asset.created_at",
+    "updated_at": "asset.updated_at",
+    "variant_name": "variant.name AS variant_name",
+    "model_name": "model.name AS model_name",
+    "make_name": "make.name AS make_name",
+}
+
+# Added to list rows by with_issue_summary (and by filtering or sorting on
+# them).
+ASSET_ISSUE_SUMMARY_COLUMNS = ("open_issue_count", "last_issue_at", "last_status_change_at")
+
+
+def list_asset_rows(
+    site_id=None,
+    category_id=None,
+    status_id=None,
+    make_id=None,
+    model_id=None,
+    variant_id=None,
+    asset_tag=None,
+    sort=None,
+    limit=None,
+    offset=None,
+    retired_mode: str = "active",
+    with_issue_summary: bool = False,
+    has_open_issues: bool | None = None,
+    fields=None,
+    ):
+    """
+    List assets with optional filters, sorting, and pagination.
+    Aassumes arguments are already validated by service / route layer.
+
+    Args:
+        site_id: filter by asset.site_id
+        category_id: filter by asset.category_id
+        status_id: filter by asset.status_id
+        make_id: filter by make.id (via variant -> model -> make join)
+        model_id: filter by model.id (via variant -> model join)
+        variant_id: filter by asset.variant_id
+        asset_tag: filter by exact asset_tag
+        sort: list of (field_name, direction) pairs, e.g.
+              [("asset_tag", "asc"), ("created_at", "desc")]
+        limit: max number of rows to return (for pagination)
+        offset: number of rows to skip (for pagination)
+        retired_mode: view asset based on active statuses, e.g., ["active" (only), "retired" (only), all]
+        with_issue_summary: add open_issue_count, last_issue_at and
+              last_status_change_at to each row. Implied by has_open_issues
+              or by sorting on one of those columns.
+        has_open_issues: True/False keeps only assets with/without open
+              (OPEN, IN_PROGRESS) issues; None = no filter.
+        fields: names from ASSET_LIST_FIELD_COLUMNS to select (id always
+              is); None selects every column.
+
+    Returns:
+        (rows, total_count)
+
+        rows: list of dicts, each dict is one asset row (same shape as
+              get_asset_row()).
+
+        total_count: integer number of rows that match the filters,
+                     ignoring limit/offset.
+
+    """
+
+    if has_open_issues is not None or any(field_name in ASSET_ISSUE_SUMMARY_COLUMNS for field_name, _ in sort or ()):
+        with_issue_summary = True
+
+    # Per-asset aggregates, evaluated only for the assets that pass the other
+    # filters (both lookups are index scans on asset_id).
+    summary_select_sql = ""
+    summary_join_sql = ""
+    if with_issue_summary:
+        summary_select_sql = """,
+            COALESCE(issue_summary.open_issue_count, 0) AS open_issue_count,
+            issue_summary.last_issue_at,
+            status_summary.last_status_change_at"""
+        summary_join_sql = """
+        LEFT JOIN LATERAL (
+            SELECT
+                (COUNT(*) FILTER (WHERE issue_status.code = ANY(:active_codes)))::int AS open_issue_count,
+                MAX(issue.created_at) AS last_issue_at
+            FROM issue
+            JOIN issue_status ON issue.status_id = issue_status.id
+            WHERE issue.asset_id = asset.id
+        ) AS issue_summary ON TRUE
+        LEFT JOIN LATERAL (
+            SELECT MAX(asset_status_history.changed_at) AS last_status_change_at
+            FROM asset_status_history
+            WHERE asset_status_history.asset_id = asset.id
+        ) AS status_summary ON TRUE"""
+
+    if fields is None:
+        field_names = list(ASSET_LIST_FIELD_COLUMNS)
+    else:
+        unknown = [name for name in fields if name not in ASSET_LIST_FIELD_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown field: {unknown[0]}")
+        field_names = ["id", *(name for name in fields if name != "id")]
+    columns_sql = ",\n            ".join(ASSET_LIST_FIELD_COLUMNS[name] for name in field_names)
+
+    # Base SELECT – join variant/model so make_id/model_id filters work.
+    base_select = f"""
+        SELECT
+            {columns_sql}{summary_select_sql}
+        FROM asset
+        LEFT JOIN variant ON asset.variant_id = variant.id
+        LEFT JOIN model ON variant.model_id = model.id
+        LEFT JOIN make ON model.make_id = make.id{summary_join_sql}
+    """
+
+    where_clauses, params = _asset_filter_clauses(
+        site_id=site_id,
+        category_id=category_id,
+        status_id=status_id,
+        make_id=make_id,
+        model_id=model_id,
+        variant_id=variant_id,
+        asset_tag=asset_tag,
+        retired_mode=retired_mode,
+    )
+    if with_issue_summary:
+        params["active_codes"] = list(ACTIVE_ISSUE_STATUS_CODES)
+
+    if has_open_issues is True:
+        where_clauses.append("COALESCE(issue_summary.open_issue_count, 0) > 0")
+    elif has_open_issues is False:
+        where_clauses.append("COALESCE(issue_summary.open_issue_count, 0) = 0")
+
     where_sql = ""
     if where_clauses:
         where_sql = "WHERE " + " AND ".join(where_clauses)
@@ -301,6 +567,9 @@ def list_asset_rows(
         "status_id": "asset.status_id",
         "created_at": "asset.created_at",
         "updated_at": "asset.updated_at",
+        "open_issue_count": "COALESCE(issue_summary.open_issue_count, 0)",
+        "last_issue_at": "issue_summary.last_issue_at",
+        "last_status_change_at": "status_summary.last_status_change_at",
     }
 
     # Default ordering
@@ -318,7 +587,9 @@ def list_asset_rows(
             if isinstance(direction, str) and direction.lower() == "desc":
                 dir_sql = "DESC"
 
-            order_parts.append(f"{col} {dir_sql}")
+            # Assets with no issues / no history sort last either way.
+            nulls_sql = " NULLS LAST" if field_name in ASSET_ISSUE_SUMMARY_COLUMNS else ""
+            order_parts.append(f"{col} {dir_sql}{nulls_sql}")
 
         if order_parts:
             order_by_sql = "ORDER BY " + ", ".join(order_parts)
@@ -347,6 +618,7 @@ def list_asset_rows(
         FROM asset
         LEFT JOIN variant ON asset.variant_id = variant.id
         LEFT JOIN model ON variant.model_id = model.id
+        {summary_join_sql if has_open_issues is not None else ""}
         {where_sql}
     """)
 
@@ -359,6 +631,125 @@ def list_asset_rows(
     rows = [dict(row) for row in result]
     return rows, total
 
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_asset_rows(
+    term: str,
+    *,
+    site_id=None,
+    limit: int = 10,
+    include_retired: bool = False,
+    timeout_ms: int | None = None,
+) -> list[dict]:
+    """
+    Typeahead search over asset tag, serial number and make/model/variant
+    labels. Assumes `term` is already stripped and non-empty.
+
+    Matches, best first:
+        exact tag > tag prefix > serial prefix > fuzzy tag (pg_trgm) > label match
+
+        timeout_ms: optional statement_timeout for this query; PostgreSQL
+        cancels it (QueryCanceled) once exceeded.
+
+    Returns:
+        up to `limit` rows shaped like get_asset_row(), each with a `rank`
+        in [0, 1].
+    """
+
+    where_clauses = []
+    params = {
+        "term": term.lower(),
+        "prefix": _escape_like(term.lower()) + "%",
+        "contains": "%" + _escape_like(term) + "%",
+        "limit": limit,
+    }
+
+    if not include_retired:
+        where_clauses.append("asset.retired_at IS NULL")
+    if site_id is not None:
+        where_clauses.append("asset.site_id = :site_id")
+        params["site_id"] = site_id
+
+    filter_sql = "".join(f"AND {clause}\n" for clause in where_clauses)
+
+    # Each OR branch has its own index (pattern btrees, trigram GIN,
+    # asset_variant_idx), so the planner can BitmapOr them instead of
+    # scanning every asset.
+    sql = text(f"""
+        WITH labels AS (
+            SELECT
+                variant.id AS variant_id,
+                concat_ws(' ', make.label, model.label, variant.label) AS label_text
+            FROM variant
+            JOIN model ON variant.model_id = model.id
+            JOIN make ON model.make_id = make.id
+        ),
+        label_matches AS (
+            SELECT variant_id, label_text
+            FROM labels
+            WHERE label_text ILIKE :contains ESCAPE '\\'
+               OR :term <% label_text
+        )
+        SELECT
+            asset.id,
+            asset.variant_id,
+            asset.category_id,
+            asset.site_id,
+            asset.status_id,
+            asset.serial_num,
+            asset.asset_tag,
+            asset.retired_at,
+            site.shorthand AS site_shorthand,
+            site.fullname AS site_fullname,
+            asset_status.code AS status_code,
+            asset_status.label AS status_label,
+            variant.name AS variant_name,
+            variant.label AS variant_label,
+            model.name AS model_name,
+            model.label AS model_label,
+            make.name AS make_name,
+            make.label AS make_label,
+            GREATEST(
+                CASE
+                    WHEN lower(asset.asset_tag) = :term THEN 1.0
+                    WHEN lower(asset.asset_tag) LIKE :prefix ESCAPE '\\' THEN 0.9
+                    WHEN asset.serial_num::text LIKE :prefix ESCAPE '\\' THEN 0.8
+                    ELSE 0.0
+                END,
+                similarity(asset.asset_tag, :term) * 0.7,
+                CASE WHEN label_matches.variant_id IS NOT NULL
+                    THEN 0.3 + 0.3 * word_similarity(:term, label_matches.label_text)
+                    ELSE 0.0
+                END
+            )::float AS rank
+        FROM asset
+        LEFT JOIN site ON asset.site_id = site.id
+        LEFT JOIN asset_status ON asset.status_id = asset_status.id
+        LEFT JOIN variant ON asset.variant_id = variant.id
+        LEFT JOIN model ON variant.model_id = model.id
+        LEFT JOIN make ON model.make_id = make.id
+        LEFT JOIN label_matches ON label_matches.variant_id = asset.variant_id
+        WHERE (
+            lower(asset.asset_tag) LIKE :prefix ESCAPE '\\'
+            OR asset.serial_num::text LIKE :prefix ESCAPE '\\'
+            OR asset.asset_tag % :term
+            OR asset.variant_id IN (SELECT variant_id FROM label_matches)
+        )
+        {filter_sql}
+        ORDER BY rank DESC, asset.asset_tag ASC
+        LIMIT :limit
+    """)
+
+    with get_connection() as conn:
+        if timeout_ms is not None:
+            set_statement_timeout(conn, timeout_ms)
+        rows = conn.execute(sql, params).mappings().all()
+
+    return [dict(r) for r in rows]
+
+
 def asset_tag_exists(asset_tag: str, *, exclude_asset_id=None) -> bool:
     sql = """
         SELECT 1
@@ -422,7 +813,8 @@ def create_asset_row(
             retired_at,
             retire_reason,
             created_at,
-            updated_at
+            updated_at,
+            version
     """)
 
     params = {
@@ -444,7 +836,7 @@ def create_asset_row(
 
     return dict(row)
 
-def update_asset_row(asset_id, fields: dict):
+def update_asset_row(asset_id, fields: dict, *, expected_version: int | None = None):
     """
     Partially update an asset row.
 
@@ -452,9 +844,12 @@ def update_asset_row(asset_id, fields: dict):
         asset_id: UUID (or string) primary key value.
         fields: dict of {column_name: value} with DB column names,
                 e.g. {"site_id": ..., "status_id": ..., "asset_tag": ...}
+        expected_version: only update if the row is still at this version
+                (compare-and-swap); None updates unconditionally.
 
     Returns:
-        dict of the updated row, or None if asset_id not found.
+        dict of the updated row (version bumped), or None if asset_id not
+        found or no longer at expected_version.
     """
 
     if not fields:
@@ -463,6 +858,10 @@ def update_asset_row(asset_id, fields: dict):
 
     set_clauses = []
     params = {"id": asset_id}
+    where_sql = "id = :id"
+    if expected_version is not None:
+        where_sql += " AND version = :expected_version"
+        params["expected_version"] = expected_version
 
     idx = 0
     for col, value in fields.items():
@@ -471,15 +870,16 @@ def update_asset_row(asset_id, fields: dict):
         params[param_name] = value
         idx += 1
 
-    # Always bump updated_at
+    # Always bump updated_at and version
     set_clauses.append("updated_at = NOW()")
+    set_clauses.append("version = version + 1")
 
     set_sql = ", ".join(set_clauses)
 
     sql = text(f"""
         UPDATE asset
         SET {set_sql}
-        WHERE id = :id
+        WHERE {where_sql}
         RETURNING
             id,
             variant_id,
@@ -492,7 +892,8 @@ def update_asset_row(asset_id, fields: dict):
             retired_at,
             retire_reason,
             created_at,
-            updated_at
+            updated_at,
+            version
     """)
 
     with get_connection() as conn:
@@ -504,39 +905,116 @@ def update_asset_row(asset_id, fields: dict):
     return dict(row)
 
 
-def create_asset_status_history_row(
+def transition_asset_status_row(
     asset_id,
-    from_status_id,
     to_status_id,
-    changed_by,
-):
-    sql = text("""
-        INSERT INTO asset_status_history (
-            asset_id,
-            from_status_id,
-            to_status_id,
-            changed_at,
-            changed_by
-        )
-        VALUES (
-            :asset_id,
-            :from_status_id,
-            :to_status_id,
-            NOW(),
-            :changed_by
+    *,
+    changed_by=None,
+    fields: dict | None = None,
+    expected_version: int | None = None,
+) -> dict:
+    """
+    Move an asset to `to_status_id` and record the transition in
+    asset_status_history, in one statement: compare, update and history
+    insert happen in a single round trip and transaction.
+
+    The current row is read FOR UPDATE inside the statement, so the history
+    row's from_status_id is always the status actually replaced, even with
+    concurrent writers. An unchanged status writes nothing (no history row,
+    no version bump) unless `fields` (other {column_name: value} to set in
+    the same update) are given.
+
+    Args:
+        expected_version: only apply while the asset is still at this
+                version (compare-and-swap); None applies unconditionally.
+
+    Returns:
+        {
+            "asset_found": bool,
+            "status_found": bool,      # to_status_id exists in asset_status
+            "applied": bool,           # both found and expected_version matched
+            "changed": bool,           # status changed, history row written
+            "from_status_id": ...,
+            "version": ...,            # asset version after the statement
+        }
+    """
+
+    set_clauses = []
+    params = {
+        "id": asset_id,
+        "to_status_id": to_status_id,
+        "changed_by": changed_by,
+    }
+
+    for idx, (col, value) in enumerate((fields or {}).items()):
+        param_name = f"v_{idx}"
+        set_clauses.append(f"{col} = :{param_name}")
+        params[param_name] = value
+
+    set_clauses.append("status_id = :to_status_id")
+    set_clauses.append("updated_at = NOW()")
+    set_clauses.append("version = asset.version + 1")
+    set_sql = ", ".join(set_clauses)
+
+    prev_where_sql = ""
+    if expected_version is not None:
+        prev_where_sql = "AND asset.version = :expected_version"
+        params["expected_version"] = expected_version
+
+    # Without other fields, an unchanged status is a no-op.
+    update_where_sql = ""
+    if not fields:
+        update_where_sql = "AND prev.status_id IS DISTINCT FROM :to_status_id"
+
+    sql = text(f"""
+        WITH prev AS (
+            SELECT asset.id, asset.status_id, asset.version
+            FROM asset
+            WHERE asset.id = :id
+              AND EXISTS (SELECT 1 FROM asset_status WHERE asset_status.id = :to_status_id)
+              {prev_where_sql}
+            FOR UPDATE OF asset
+        ),
+        updated AS (
+            UPDATE asset
+            SET {set_sql}
+            FROM prev
+            WHERE asset.id = prev.id
+              {update_where_sql}
+            RETURNING asset.id, prev.status_id AS from_status_id, asset.status_id AS to_status_id, asset.version
+        ),
+        history AS (
+            INSERT INTO asset_status_history (
+                asset_id,
+                from_status_id,
+                to_status_id,
+                changed_at,
+                changed_by
+            )
+            -- clock_timestamp(), not NOW(): taken after the row lock, so
+            -- concurrent transitions are timestamped in the order they applied
+            SELECT id, from_status_id, to_status_id, clock_timestamp(), :changed_by
+            FROM updated
+            WHERE from_status_id IS DISTINCT FROM to_status_id
+            RETURNING asset_id
         )
+        SELECT
+            EXISTS (SELECT 1 FROM asset WHERE asset.id = :id) AS asset_found,
+            EXISTS (SELECT 1 FROM asset_status WHERE asset_status.id = :to_status_id) AS status_found,
+            prev.id IS NOT NULL AS applied,
+            EXISTS (SELECT 1 FROM history) AS changed,
+            prev.status_id AS from_status_id,
+            COALESCE(updated.version, prev.version) AS version
+        FROM (VALUES (1)) AS one (x)
+        LEFT JOIN prev ON TRUE
+        LEFT JOIN updated ON TRUE
     """)
 
     with get_connection() as conn:
-        conn.execute(
-            sql,
-            {
-                "asset_id": asset_id,
-                "from_status_id": from_status_id,
-                "to_status_id": to_status_id,
-                "changed_by": changed_by,
-            },
-        )
+        row = conn.execute(sql, params).mappings().first()
+
+    return dict(row)
+
 
 def retire_asset_row(asset_id, retire_reason=None):
     """
@@ -551,7 +1029,8 @@ def retire_asset_row(asset_id, retire_reason=None):
         SET
             retired_at = NOW(),
             retire_reason = :retire_reason,
-            updated_at = NOW()
+            updated_at = NOW(),
+            version = version + 1
         WHERE id = :id
         RETURNING
             id,
@@ -565,7 +1044,8 @@ def retire_asset_row(asset_id, retire_reason=None):
             retired_at,
             retire_reason,
             created_at,
-            updated_at
+            updated_at,
+            version
     """)
 
     params = {
@@ -582,6 +1062,168 @@ def retire_asset_row(asset_id, retire_reason=None):
     return dict(row)
 
 
+def bulk_update_asset_rows(
+    *,
+    asset_ids: list | None = None,
+    filters: dict | None = None,
+    to_site_id=None,
+    to_status_id=None,
+    retire_reason: str | None = None,
+    changed_by=None,
+    max_assets: int,
+    dry_run: bool = False,
+) -> dict:
+    """
+    Move assets to another site, change their status and/or retire them, for
+    an explicit id list or for every asset matching `filters` (the
+    _asset_filter_clauses keywords), as one set-based UPDATE ... FROM with a
+    single multi-row asset_status_history insert, in one transaction.
+
+    Only assets whose values actually change are updated (and get a version
+    bump / history row); retiring skips assets that are already retired.
+    Nothing is written when dry_run is set or more than max_assets match
+    when the update runs (checked within the UPDATE statement itself).
+
+    Returns:
+        {
+            "matched": n,          # assets selected
+            "updated": n,          # assets that changed (would change on dry_run)
+            "status_changes": n,   # history rows written (would be, on dry_run)
+            "missing_ids": [...],  # asset_ids that matched no asset
+            "applied": bool,
+        }
+    """
+
+    if asset_ids is not None:
+        where_clauses = ["asset.id = ANY(CAST(:asset_ids AS uuid[]))"]
+        params = {"asset_ids": [str(asset_id) for asset_id in asset_ids]}
+    else:
+        where_clauses, params = _asset_filter_clauses(**(filters or {}))
+    where_sql = " AND ".join(where_clauses) or "TRUE"
+
+    set_clauses = []
+    change_clauses = []
+    if to_site_id is not None:
+        set_clauses.append("site_id = :to_site_id")
+        change_clauses.append("asset.site_id IS DISTINCT FROM :to_site_id")
+        params["to_site_id"] = to_site_id
+    if to_status_id is not None:
+        set_clauses.append("status_id = :to_status_id")
+        change_clauses.append("asset.status_id IS DISTINCT FROM :to_status_id")
+        params["to_status_id"] = to_status_id
+    if retire_reason is not None:
+        set_clauses.append("retired_at = NOW()")
+        set_clauses.append("retire_reason = :retire_reason")
+        change_clauses.append("asset.retired_at IS NULL")
+        params["retire_reason"] = retire_reason
+    if not set_clauses:
+        raise ValueError("bulk_update_asset_rows needs a site, status or retirement change")
+
+    set_clauses.append("updated_at = NOW()")
+    set_clauses.append("version = asset.version + 1")
+    set_sql = ", ".join(set_clauses)
+    change_sql = " OR ".join(change_clauses)
+    params["changed_by"] = changed_by
+
+    # Only a status change writes history; the update otherwise keeps it.
+    status_change_sql = "FALSE"
+    if to_status_id is not None:
+        status_change_sql = "asset.status_id IS DISTINCT FROM :to_status_id"
+
+    missing_sql = "CAST(ARRAY[] AS uuid[])"
+    if asset_ids is not None:
+        missing_sql = """ARRAY(
+                SELECT requested.id
+                FROM unnest(CAST(:asset_ids AS uuid[])) AS requested (id)
+                WHERE NOT EXISTS (SELECT 1 FROM asset WHERE asset.id = requested.id)
+            )"""
+
+    count_sql = text(f"""
+        SELECT
+            COUNT(*)::int AS matched,
+            (COUNT(*) FILTER (WHERE {change_sql}))::int AS updated,
+            (COUNT(*) FILTER (WHERE {status_change_sql}))::int AS status_changes,
+            {missing_sql} AS missing_ids
+        FROM asset
+        LEFT JOIN variant ON asset.variant_id = variant.id
+        LEFT JOIN model ON variant.model_id = model.id
+        WHERE {where_sql}
+    """)
+
+    update_sql = text(f"""
+        WITH target AS (
+            SELECT asset.id, asset.status_id
+            FROM asset
+            LEFT JOIN variant ON asset.variant_id = variant.id
+            LEFT JOIN model ON variant.model_id = model.id
+            WHERE {where_sql}
+            FOR UPDATE OF asset
+        ),
+        -- The cap is checked on the rows this statement locked, not on the
+        -- earlier count, which rows inserted or re-sited since may outgrow.
+        within_limit AS (
+            SELECT COUNT(*) <= :max_assets AS ok
+            FROM target
+        ),
+        updated AS (
+            UPDATE asset
+            SET {set_sql}
+            FROM target, within_limit
+            WHERE asset.id = target.id
+              AND within_limit.ok
+              AND ({change_sql})
+            RETURNING asset.id, target.status_id AS from_status_id, asset.status_id AS to_status_id
+        ),
+        history AS (
+            INSERT INTO asset_status_history (
+                asset_id,
+                from_status_id,
+                to_status_id,
+                changed_at,
+                changed_by
+            )
+            SELECT id, from_status_id, to_status_id, clock_timestamp(), :changed_by
+            FROM updated
+            WHERE from_status_id IS DISTINCT FROM to_status_id
+            RETURNING asset_id
+        )
+        SELECT
+            (SELECT COUNT(*) FROM target)::int AS matched,
+            (SELECT COUNT(*) FROM updated)::int AS updated,
+            (SELECT COUNT(*) FROM history)::int AS status_changes
+    """)
+
+    with get_connection() as conn:
+        counts = dict(conn.execute(count_sql, params).mappings().first())
+        summary = {
+            "matched": counts["matched"],
+            "updated": counts["updated"],
+            "status_changes": counts["status_changes"],
+            "missing_ids": list(counts["missing_ids"]),
+            "applied": False,
+        }
+        if dry_run:
+            return summary
+
+        # One resync event instead of a NOTIFY per changed asset.
+        events_repo.suppress_change_notifications(conn)
+        row = conn.execute(update_sql, {**params, "max_assets": max_assets}).mappings().first()
+        if row["updated"]:
+            events_repo.notify_resync(conn, "assets.bulk_update")
+
+    if row["matched"] > max_assets:
+        summary["matched"] = row["matched"]
+        return summary
+
+    summary.update(
+        matched=row["matched"],
+        updated=row["updated"],
+        status_changes=row["status_changes"],
+        applied=True,
+    )
+    return summary
+
+
 def delete_asset_row(asset_id) -> bool:
     sql = text("""
         DELETE FROM asset
@@ -1,10 +1,16 @@
+import logging
 import os
-from contextlib import contextmanager
+import threading
+from contextlib import ExitStack, contextmanager
+from time import perf_counter
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import URL, Engine, Connection
 
 
+logger = logging.getLogger(__name__)
+
+
 def _build_db_url() -> URL:
     return URL.create(
         drivername="postgresql+psycopg2",
@@ -16,23 +22,101 @@ def _build_db_url() -> URL:
     )
 
 
-_engine: Engine = create_engine(
-    _build_db_url(),
-    pool_pre_ping=True,
-    future=True,
-)
+def pool_settings() -> dict:
+    """Pool sizing from the environment (SQLAlchemy QueuePool semantics)."""
+    return {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.environ.get("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", "1800")),
+    }
+
+
+# The engine is built on first use rather than at import, so importing the
+# app (including gunicorn --preload in the master) opens no connections and
+# reads POSTGRES_* after load_dotenv() has run.
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
+
+_pool_wait_listeners = []
 
 
 def get_engine() -> Engine:
-    """Return the shared SQLAlchemy engine (connection pool)."""
+    """Return the shared SQLAlchemy engine (connection pool), creating it on first use."""
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(
+                    _build_db_url(),
+                    pool_pre_ping=True,
+                    future=True,
+                    **pool_settings(),
+                )
     return _engine
 
 
+def _dispose_inherited_pool() -> None:
+    # Runs in a freshly forked child: connections in the pool belong to the
+    # parent. close=False drops them without sending a terminate over the
+    # parent's sockets; the child opens its own on first checkout.
+    if _engine is not None:
+        _engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_dispose_inherited_pool)
+
+
+def warm_up_pool(connections: int | None = None) -> int:
+    """
+    Open `connections` pooled connections up front (default DB_POOL_WARMUP,
+    else 1) so the first requests after boot skip the connect handshake.
+    Returns how many were opened; failures are logged, not raised.
+    """
+    if connections is None:
+        connections = int(os.environ.get("DB_POOL_WARMUP", "1"))
+    connections = min(connections, pool_settings()["pool_size"])
+
+    opened = 0
+    try:
+        with ExitStack() as stack:
+            for _ in range(connections):
+                conn = stack.enter_context(get_engine().connect())
+                conn.execute(text("SELECT 1"))
+                opened += 1
+    except Exception:
+        logger.exception("Database pool warm-up failed after %s connection(s)", opened)
+    return opened
+
+
+def add_pool_wait_listener(listener) -> None:
+    """
+    Register a callable that receives the seconds spent checking a
+    connection out of the pool, once per get_connection() call.
+    """
+    _pool_wait_listeners.append(listener)
+
+
+def set_statement_timeout(conn: Connection, timeout_ms: int) -> None:
+    """Cap every statement in the connection's current transaction at timeout_ms."""
+    conn.execute(
+        text("SELECT set_config('statement_timeout', :timeout, true)"),
+        {"timeout": f"{max(int(timeout_ms), 1)}ms"},
+    )
+
+
 @contextmanager
 def get_connection() -> Connection:
     """
     Context manager that yields a DB connection and
     ensures it is properly closed / returned to the pool.
     """
-    with _engine.begin() as conn:
-        yield conn
\ No newline at end of file
+    started = perf_counter()
+    with get_engine().connect() as conn:
+        waited = perf_counter() - started
+        for listener in _pool_wait_listeners:
+            listener(waited)
+
+        with conn.begin():
+            yield conn
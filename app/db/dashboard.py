@@ -284,7 +284,7 @@ def get_top_models_by_issue_rate(*, window_start, site_id=None):
 def get_issue_trend_rows(*, trend_start, trend_end, site_id=None):
     sql = text("""
         WITH daily AS (
-            SELECT generate_series(:trend_start::date, :trend_end::date, INTERVAL '1 day')::date AS day
+            SELECT generate_series(CAST(:trend_start AS date), CAST(:trend_end AS date), INTERVAL '1 day')::date AS day
         ),
         scoped_issues AS (
             SELECT
@@ -328,6 +328,9 @@ def get_issue_trend_rows(*, trend_start, trend_end, site_id=None):
             FROM issue_status_history
             JOIN scoped_issues
               ON scoped_issues.issue_id = issue_status_history.issue_id
+            -- later changes cannot affect any day in the window; skips the
+            -- newer partitions
+            WHERE issue_status_history.changed_at < CAST(:trend_end AS date) + 1
         ),
         all_events AS (
             SELECT issue_id, changed_at, status_id
@@ -0,0 +1,69 @@
+import json
+import select
+
+from sqlalchemy import text
+
+from app.db.connection import get_engine
+
+# Channel the 007_change_events triggers publish on.
+EVENTS_CHANNEL = "maintenance_events"
+
+
+def open_listen_connection():
+    """
+    Open a dedicated autocommit DBAPI connection LISTENing on EVENTS_CHANNEL.
+
+    The connection bypasses the pool: it stays open for the life of the
+    listener and must not count against (or be recycled by) the pool that
+    serves requests. Close it with .close().
+    """
+    engine = get_engine()
+    cargs, cparams = engine.dialect.create_connect_args(engine.url)
+    dbapi_conn = engine.dialect.connect(*cargs, **cparams)
+    dbapi_conn.autocommit = True
+
+    with dbapi_conn.cursor() as cursor:
+        cursor.execute(f"LISTEN {EVENTS_CHANNEL}")
+
+    return dbapi_conn
+
+
+def wait_for_events(dbapi_conn, timeout: float) -> list[dict]:
+    """
+    Block up to `timeout` seconds for notifications on a connection from
+    open_listen_connection() and return their decoded payloads (possibly
+    none). Payloads that are not JSON objects are skipped.
+    """
+    if not dbapi_conn.notifies:
+        readable, _, _ = select.select([dbapi_conn], [], [], timeout)
+        if readable:
+            dbapi_conn.poll()
+
+    events = []
+    while dbapi_conn.notifies:
+        notify = dbapi_conn.notifies.pop(0)
+        try:
+            payload = json.loads(notify.payload)
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            events.append(payload)
+    return events
+
+
+def suppress_change_notifications(conn) -> None:
+    """
+    Silence the row-trigger notifications for the rest of this transaction
+    (013_coalesced_change_events); the sync change log still records it.
+    For bulk writes, whose row events would overflow every subscriber's
+    queue: send one notify_resync() instead once something changed.
+    """
+    conn.execute(text("SELECT set_config('maintenance.skip_notify', 'on', true)"))
+
+
+def notify_resync(conn, reason: str) -> None:
+    """Tell every stream to refetch, on commit of this transaction."""
+    conn.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": EVENTS_CHANNEL, "payload": json.dumps({"type": "resync", "reason": reason})},
+    )
@@ -0,0 +1,130 @@
+import json
+
+from sqlalchemy import text
+from app.db.connection import get_connection
+
+
+def claim_idempotency_key_row(key: str, *, request_hash: str, ttl_seconds: float, lock_seconds: float) -> dict:
+    """
+    Try to claim `key` for a request about to run.
+
+    The claim succeeds for a new key, an expired one, or a 'pending' claim
+    for the same request whose lock ran out (its request died). Otherwise
+    the existing row is returned for the caller to replay or refuse.
+
+    Returns:
+        {"claimed": True, "row": None} or {"claimed": False, "row": {...}}
+        where row has request_hash, status, response_status,
+        response_headers, response_body.
+    """
+
+    claim_sql = text("""
+        INSERT INTO idempotency_key (
+            key,
+            request_hash,
+            status,
+            locked_until,
+            expires_at
+        )
+        VALUES (
+            :key,
+            :request_hash,
+            'pending',
+            now() + make_interval(secs => :lock_seconds),
+            now() + make_interval(secs => :ttl_seconds)
+        )
+        ON CONFLICT (key) DO UPDATE
+        SET request_hash = EXCLUDED.request_hash,
+            status = 'pending',
+            response_status = NULL,
+            response_headers = NULL,
+            response_body = NULL,
+            locked_until = EXCLUDED.locked_until,
+            created_at = now(),
+            expires_at = EXCLUDED.expires_at
+        WHERE idempotency_key.expires_at <= now()
+           OR (
+                idempotency_key.status = 'pending'
+            AND idempotency_key.locked_until <= now()
+            AND idempotency_key.request_hash = EXCLUDED.request_hash
+           )
+        RETURNING key
+    """)
+
+    existing_sql = text("""
+        SELECT
+            request_hash,
+            status,
+            response_status,
+            response_headers,
+            response_body
+        FROM idempotency_key
+        WHERE key = :key
+    """)
+
+    params = {
+        "key": key,
+        "request_hash": request_hash,
+        "ttl_seconds": ttl_seconds,
+        "lock_seconds": lock_seconds,
+    }
+
+    # A conflicting row can be released between the two statements; the
+    # next round then claims the key.
+    for _ in range(3):
+        with get_connection() as conn:
+            if conn.execute(claim_sql, params).scalar() is not None:
+                return {"claimed": True, "row": None}
+            row = conn.execute(existing_sql, {"key": key}).mappings().first()
+        if row is not None:
+            row = dict(row)
+            if row["response_body"] is not None:
+                row["response_body"] = bytes(row["response_body"])
+            return {"claimed": False, "row": row}
+
+    raise RuntimeError(f"Could not claim idempotency key {key!r}")
+
+
+def complete_idempotency_key_row(key: str, *, status_code: int, headers: dict, body: bytes) -> None:
+    sql = text("""
+        UPDATE idempotency_key
+        SET status = 'completed',
+            response_status = :status_code,
+            response_headers = CAST(:headers AS jsonb),
+            response_body = :body,
+            locked_until = NULL
+        WHERE key = :key
+    """)
+
+    params = {
+        "key": key,
+        "status_code": status_code,
+        "headers": json.dumps(headers),
+        "body": body,
+    }
+    with get_connection() as conn:
+        conn.execute(sql, params)
+
+
+def release_idempotency_key_row(key: str, *, request_hash: str) -> None:
+    """Drop a pending claim so the key can be retried from scratch."""
+
+    sql = text("""
+        DELETE FROM idempotency_key
+        WHERE key = :key
+          AND status = 'pending'
+          AND request_hash = :request_hash
+    """)
+
+    with get_connection() as conn:
+        conn.execute(sql, {"key": key, "request_hash": request_hash})
+
+
+def delete_expired_idempotency_key_rows() -> int:
+    sql = text("""
+        DELETE FROM idempotency_key
+        WHERE expires_at <= now()
+    """)
+
+    with get_connection() as conn:
+        return conn.execute(sql).rowcount
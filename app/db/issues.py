@@ -3,6 +3,81 @@ from sqlalchemy.exc import IntegrityError
 from app.db.connection import get_connection
 from app.db.lookups import list_issue_status_rows
 
+_ISSUE_LIST_COLUMNS = "id, asset_id, status_id, title, description, reported_by, closed_at, created_at, updated_at"
+
+# (issue, issue_action, issue_status_history, issue_attachment) per side.
+_LIVE_TABLES = ("issue", "issue_action", "issue_status_history", "issue_attachment")
+_ARCHIVE_TABLES = ("issue_archive", "issue_action_archive", "issue_status_history_archive", "issue_attachment_archive")
+
+
+_ASSET_HIERARCHY_COLUMNS = (
+    "variant.id AS variant_id",
+    "variant.name AS variant_name",
+    "variant.label AS variant_label",
+    "model.id AS model_id",
+    "model.name AS model_name",
+    "model.label AS model_label",
+    "make.id AS make_id",
+    "make.name AS make_name",
+    "make.label AS make_label",
+)
+
+# Sparse fieldsets: the columns behind each field of the issue list / detail
+# payload (fields=...). "id" is always selected; get_issue_row always selects
+# version too, it is the ETag. last_action.* comes from the lateral last-action
+# lookup, which is skipped when none of its columns are asked for.
+ISSUE_LIST_FIELD_COLUMNS = {
+    "id": ("issue.id",),
+    "title": ("issue.title",),
+    "description": ("issue.description",),
+    "status": ("issue.status_id", "issue_status.code AS status_code", "issue_status.label AS status_label"),
+    "asset": (
+        "issue.asset_id",
+        "asset.asset_tag",
+        "asset.site_id",
+        *_ASSET_HIERARCHY_COLUMNS,
+        "make.category_id AS category_id",
+    ),
+    "reported_by": ("issue.reported_by",),
+    "created_at": ("issue.created_at",),
+    "updated_at": ("issue.updated_at",),
+    "closed_at": ("issue.closed_at",),
+    "last_action_at": ("last_action.last_action_at",),
+    "last_action_type": ("last_action.last_action_type_code", "last_action.last_action_type_label"),
+    "site_shorthand": ("site.shorthand AS site_shorthand",),
+    "site_fullname": ("site.fullname AS site_fullname",),
+}
+
+ISSUE_DETAIL_FIELD_COLUMNS = {
+    **{name: columns for name, columns in ISSUE_LIST_FIELD_COLUMNS.items() if name != "asset"},
+    "asset": ("issue.asset_id", "asset.asset_tag", "asset.site_id", *_ASSET_HIERARCHY_COLUMNS),
+    "version": ("issue.version",),
+    "last_action_type_label": ("last_action.last_action_type_label",),
+}
+
+
+def _issue_tables(archived: bool) -> tuple[str, str, str, str]:
+    return _ARCHIVE_TABLES if archived else _LIVE_TABLES
+
+
+def _select_field_columns(field_columns: dict, fields, always: tuple[str, ...] = ("id",)) -> list[str]:
+    """SELECT list for a sparse fieldset; fields=None selects every field."""
+    if fields is None:
+        names = list(field_columns)
+    else:
+        unknown = [name for name in fields if name not in field_columns]
+        if unknown:
+            raise ValueError(f"Unknown field: {unknown[0]}")
+        names = [*always, *fields]
+
+    columns = []
+    for name in names:
+        for column in field_columns[name]:
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
 def get_action_type_id_by_code(code: str):
     """
     Return the id from action_type for a given code, or None if not found.
@@ -50,7 +125,13 @@ def list_issue_rows(
     limit=200,
     offset=0,
     active_status_ids=None, #TODO: sad face
+    include_archived=False,
+    fields=None,
 ):
+    """
+    fields: names from ISSUE_LIST_FIELD_COLUMNS to select (plus id and
+    is_archived); None selects everything.
+    """
     where = []
     params = {
         "site_id": site_id,
@@ -82,9 +163,9 @@ def list_issue_rows(
     
     # status_id filter with special handling for -1 (any status)
     status_rows = list_issue_status_rows()
-    status_codes = {row["code"]: row["id"] for row in status_rows}
+    status_codes = {row["code"]: str(row["id"]) for row in status_rows}
     if status_id:
-        if status_id in status_codes.values():
+        if str(status_id) in status_codes.values():
             where.append("issue.status_id = :status_id")
         elif active_status_ids is not None: #hardcoded status uuid for ACTIVE issues (Open, In progress) TODO:sad face
             where.append(f"issue.status_id IN {active_status_ids}")
@@ -141,68 +222,73 @@ def list_issue_rows(
         if parts:
             order_sql = "ORDER BY " + ", ".join(parts)
 
-    sql = text(f"""
-        SELECT
-            issue.id,
-            issue.asset_id,
-            issue.status_id,
-            issue.title,
-            issue.description,
-            issue.reported_by,
-            issue.created_at,
-            issue.updated_at,
-            issue.closed_at,
-
-            asset.asset_tag,
-            asset.site_id,
-
-            variant.id AS variant_id,
-            variant.name AS variant_name,
-            variant.label AS variant_label,
-
-            model.id AS model_id,
-            model.name AS model_name,
-            model.label AS model_label,
-
-            make.id AS make_id,
-            make.name AS make_name,
-            make.label AS make_label,
-            make.category_id AS category_id,
-
-            issue_status.code  AS status_code,
-            issue_status.label AS status_label,
-
-            last_action.last_action_at,
-            last_action.last_action_type_code,
-            last_action.last_action_type_label,
-
-            site.shorthand AS site_shorthand,
-            site.fullname AS site_fullname
-
-        FROM issue
-        JOIN issue_status
-          ON issue.status_id = issue_status.id
-        JOIN asset
-          ON issue.asset_id = asset.id
-        JOIN site
-          ON asset.site_id = site.id
-
+    # archived issues (and their actions) are read side by side with the live
+    # ones; each branch keeps its own indexes.
+    if include_archived:
+        issue_source = f"""(
+            SELECT {_ISSUE_LIST_COLUMNS}, FALSE AS is_archived FROM issue
+            UNION ALL
+            SELECT {_ISSUE_LIST_COLUMNS}, TRUE AS is_archived FROM issue_archive
+        )"""
+        action_source = """(
+            SELECT issue_id, action_type_id, created_at FROM issue_action
+            UNION ALL
+            SELECT issue_id, action_type_id, created_at FROM issue_action_archive
+        )"""
+        is_archived_sql = "issue.is_archived"
+    else:
+        issue_source = "issue"
+        action_source = "issue_action"
+        is_archived_sql = "FALSE"
+
+    columns = _select_field_columns(ISSUE_LIST_FIELD_COLUMNS, fields)
+    select_sql = ",\n            ".join([*columns, f"{is_archived_sql} AS is_archived"])
+
+    # The lateral last-action lookup and the variant/model/make joins are only
+    # paid for when a selected field, filter or sort needs them.
+    join_hierarchy = any(column.startswith(("variant.", "model.", "make.")) for column in columns) or any(
+        (category_id, make_id, model_id, variant_id)
+    )
+    join_last_action = any(column.startswith("last_action.") for column in columns) or "last_action.last_action_at" in order_sql
+
+    hierarchy_join_sql = ""
+    if join_hierarchy:
+        hierarchy_join_sql = """
         LEFT JOIN variant ON asset.variant_id = variant.id
         LEFT JOIN model   ON variant.model_id = model.id
-        LEFT JOIN make    ON model.make_id = make.id
+        LEFT JOIN make    ON model.make_id = make.id"""
 
+    last_action_join_sql = ""
+    if join_last_action:
+        last_action_join_sql = f"""
         LEFT JOIN LATERAL (
             SELECT
                 ia.created_at AS last_action_at,
                 at.code       AS last_action_type_code,
                 at.label      AS last_action_type_label
-            FROM issue_action ia
+            FROM {action_source} AS ia
             JOIN action_type at
               ON ia.action_type_id = at.id
             WHERE ia.issue_id = issue.id
+              -- actions never predate their issue; prunes older partitions
+              AND ia.created_at >= issue.created_at
             ORDER BY ia.created_at DESC
             LIMIT 1
-        ) AS last_action ON TRUE
+        ) AS last_action ON TRUE"""
+
+    sql = text(f"""
+        SELECT
+            {select_sql}
+
+        FROM {issue_source} AS issue
+        JOIN issue_status
+          ON issue.status_id = issue_status.id
+        JOIN asset
+          ON issue.asset_id = asset.id
+        JOIN site
+          ON asset.site_id = site.id
+        {hierarchy_join_sql}
+        {last_action_join_sql}
 
         {where_sql}
         {order_sql}
@@ -211,7 +297,7 @@ def list_issue_rows(
 
     count_sql = text(f"""
         SELECT COUNT(*)::int AS total
-        FROM issue
+        FROM {issue_source} AS issue
         JOIN asset
           ON issue.asset_id = asset.id
         LEFT JOIN variant ON asset.variant_id = variant.id
@@ -227,79 +313,66 @@ def list_issue_rows(
     total = 0 if total_row is None else int(total_row["total"])
     return [dict(r) for r in rows], total
 
-def get_issue_row(issue_id):
+def get_issue_row(issue_id, *, archived=False, fields=None):
     """
     Fetch a single issue row by id, with joined status/asset info and last action.
+    archived=True reads issue_archive / issue_action_archive instead.
+    fields: names from ISSUE_DETAIL_FIELD_COLUMNS to select (id and version
+    always are); None selects everything.
 
     Returns:
         dict with keys:
           - id, asset_id, status_id, title, description, reported_by,
-            created_at, updated_at, closed_at
+            created_at, updated_at, closed_at, version
           - asset_tag, site_id
           - status_code, status_label
           - last_action_at, last_action_type_code, last_action_type_label
         or None if not found.
     """
 
-    sql = text("""
-        SELECT
-            issue.id,
-            issue.asset_id,
-            issue.status_id,
-            issue.title,
-            issue.description,
-            issue.reported_by,
-            issue.created_at,
-            issue.updated_at,
-            issue.closed_at,
-
-            asset.asset_tag,
-            asset.site_id,
-            
-            variant.id AS variant_id,
-            variant.name AS variant_name,
-            variant.label AS variant_label,
-               
-            model.id AS model_id,
-            model.name AS model_name,
-            model.label AS model_label,
-               
-            make.id AS make_id,
-            make.name AS make_name,
-            make.label AS make_label,
-
-            issue_status.code  AS status_code,
-            issue_status.label AS status_label,
-
-            last_action.last_action_at,
-            last_action.last_action_type_code,
-            last_action.last_action_type_label,
-            
-            site.shorthand AS site_shorthand,
-            site.fullname AS site_fullname 
-            
-        FROM issue
-        JOIN issue_status
-          ON issue.status_id = issue_status.id
-        JOIN asset
-          ON issue.asset_id = asset.id
-        JOIN site 
-          ON asset.site_id = site.id
+    issue_table, action_table, _, _ = _issue_tables(archived)
+
+    columns = _select_field_columns(ISSUE_DETAIL_FIELD_COLUMNS, fields, always=("id", "version"))
+    select_sql = ",\n            ".join(columns)
+
+    hierarchy_join_sql = ""
+    if any(column.startswith(("variant.", "model.", "make.")) for column in columns):
+        hierarchy_join_sql = """
+        LEFT JOIN variant ON asset.variant_id = variant.id
+        LEFT JOIN model ON variant.model_id = model.id
+        LEFT JOIN make ON model.make_id = make.id"""
+
+    last_action_join_sql = ""
+    if any(column.startswith("last_action.") for column in columns):
+        last_action_join_sql = f"""
         LEFT JOIN LATERAL (
             SELECT
                 ia.created_at AS last_action_at,
                 at.code       AS last_action_type_code,
                 at.label      AS last_action_type_label
-            FROM issue_action ia
+            FROM {action_table} ia
             JOIN action_type at
               ON ia.action_type_id = at.id
             WHERE ia.issue_id = issue.id
+              -- actions never predate their issue; prunes older partitions
+              AND ia.created_at >= issue.created_at
             ORDER BY ia.created_at DESC
             LIMIT 1
-        ) AS last_action ON TRUE
-        LEFT JOIN variant ON asset.variant_id = variant.id
-        LEFT JOIN model ON variant.model_id = model.id
-        LEFT JOIN make ON model.make_id = make.id
+        ) AS last_action ON TRUE"""
+
+    sql = text(f"""
+        SELECT
+            {select_sql}
+
+        FROM {issue_table} AS issue
+        JOIN issue_status
+          ON issue.status_id = issue_status.id
+        JOIN asset
+          ON issue.asset_id = asset.id
+        JOIN site
+          ON asset.site_id = site.id
+        {last_action_join_sql}
+        {hierarchy_join_sql}
 
         WHERE issue.id = :id
     """)
@@ -312,9 +385,10 @@ def get_issue_row(issue_id):
 
     return dict(row)
 
-def list_issue_actions(issue_id):
+def list_issue_actions(issue_id, *, archived=False):
     """
     Return all actions for a given issue, oldest first.
+    archived=True reads issue_action_archive.
 
     Each row:
       - id
@@ -326,7 +400,9 @@ def list_issue_actions(issue_id):
       - created_by
     """
 
-    sql = text("""
+    _, action_table, _, _ = _issue_tables(archived)
+
+    sql = text(f"""
         SELECT
             ia.id,
             ia.action_type_id,
@@ -335,7 +411,7 @@ def list_issue_actions(issue_id):
             ia.body,
             ia.created_at,
             ia.created_by
-        FROM issue_action ia
+        FROM {action_table} ia
         JOIN action_type at
           ON ia.action_type_id = at.id
         WHERE ia.issue_id = :issue_id
@@ -487,6 +563,71 @@ def create_issue_status_history_row(
     with get_connection() as conn:
         conn.execute(sql, params)
 
+def change_issue_status_row(
+    issue_id,
+    *,
+    expected_version: int,
+    from_status_id,
+    to_status_id,
+    closed_at,
+    changed_by,
+):
+    """
+    Move an issue from `from_status_id` to `to_status_id` and record the
+    transition in issue_status_history, in one statement.
+
+    The update only applies while the issue is still at expected_version,
+    the version the caller read from_status_id at, so the history row's
+    from_status_id is always the status actually replaced.
+
+    Returns:
+        {"id", "status_id", "updated_at", "version"} of the updated issue,
+        or None if it is missing or has moved past expected_version.
+    """
+
+    sql = text("""
+        WITH updated AS (
+            UPDATE issue
+            SET status_id = :to_status_id,
+                closed_at = :closed_at,
+                updated_at = NOW(),
+                version = version + 1
+            WHERE id = :id
+              AND version = :expected_version
+            RETURNING id, status_id, updated_at, version
+        ),
+        history AS (
+            INSERT INTO issue_status_history (
+                issue_id,
+                from_status_id,
+                to_status_id,
+                changed_at,
+                changed_by
+            )
+            SELECT id, :from_status_id, :to_status_id, NOW(), :changed_by
+            FROM updated
+        )
+        SELECT id, status_id, updated_at, version
+        FROM updated
+    """)
+
+    params = {
+        "id": issue_id,
+        "expected_version": expected_version,
+        "from_status_id": from_status_id,
+        "to_status_id": to_status_id,
+        "closed_at": closed_at,
+        "changed_by": changed_by,
+    }
+
+    with get_connection() as conn:
+        row = conn.execute(sql, params).mappings().first()
+
+    if row is None:
+        return None
+
+    return dict(row)
+
 def get_issue_status_id(issue_id):
     """
     Return the current status_id for a given issue, or None if the issue
@@ -512,7 +653,7 @@ def get_issue_status_id(issue_id):
 
     return row["status_id"]
 
-def update_issue_row(issue_id, fields: dict = None):
+def update_issue_row(issue_id, fields: dict = None, *, expected_version: int | None = None):
     """
     Partially update an issue row.
 
@@ -520,13 +661,20 @@ def update_issue_row(issue_id, fields: dict = None):
         issue_id: UUID (or string) primary key value.
         fields: dict of {column_name: value} with DB column names,
                 e.g. {"status_id": ..., "title": ..., "description": ...}
+        expected_version: only update if the row is still at this version
+                (compare-and-swap); None updates unconditionally.
 
     Returns:
-        dict of the updated row, or None if issue_id not found.
+        dict of the updated row (version bumped), or None if issue_id not
+        found or no longer at expected_version.
     """
 
     set_clauses = []
     params = {"id": issue_id}
+    where_sql = "id = :id"
+    if expected_version is not None:
+        where_sql += " AND version = :expected_version"
+        params["expected_version"] = expected_version
 
     if fields:
         idx = 0
@@ -536,17 +684,18 @@ def update_issue_row(issue_id, fields: dict = None):
             params[param_name] = value
             idx += 1
 
-        # Always bump updated_at
+        # Always bump updated_at and version
         set_clauses.append("updated_at = NOW()")
+        set_clauses.append("version = version + 1")
 
         set_sql = ", ".join(set_clauses)
     else:
-        set_sql = "updated_at = NOW()"
+        set_sql = "updated_at = NOW(), version = version + 1"
     
     sql = text(f"""
         UPDATE issue
         SET {set_sql}
-        WHERE id = :id
+        WHERE {where_sql}
         RETURNING
             id,
             asset_id,
@@ -556,7 +705,8 @@ def update_issue_row(issue_id, fields: dict = None):
             reported_by,
             created_at,
             updated_at,
-            closed_at
+            closed_at,
+            version
     """)
 
     with get_connection() as conn:
@@ -598,9 +748,10 @@ def delete_issue_row(issue_id) -> bool:
 
     return result.rowcount > 0
 
-def list_issue_status_history(issue_id):
+def list_issue_status_history(issue_id, *, archived=False):
     """
     Return all status history entries for a given issue, oldest first.
+    archived=True reads issue_status_history_archive.
 
     Each row:
       - id
@@ -610,7 +761,9 @@ def list_issue_status_history(issue_id):
       - changed_by
     """
 
-    sql = text("""
+    _, _, history_table, _ = _issue_tables(archived)
+
+    sql = text(f"""
         SELECT
             ish.id,
             ish.from_status_id,
@@ -621,7 +774,7 @@ def list_issue_status_history(issue_id):
             ts.label AS to_status_label,
             ish.changed_at,
             ish.changed_by
-        FROM issue_status_history ish
+        FROM {history_table} ish
         LEFT JOIN issue_status fs
           ON ish.from_status_id = fs.id
         JOIN issue_status ts
@@ -759,14 +912,16 @@ def create_action_type_row(code: str, label: str, display_order: int | None = No
 
     return dict(row)
 
-def get_issue_attachment_by_issue_id(issue_id: str):
-    sql = text("""
+def get_issue_attachment_by_issue_id(issue_id: str, *, archived=False):
+    _, _, _, attachment_table = _issue_tables(archived)
+
+    sql = text(f"""
         SELECT
             id,
             issue_id,
             filepath,
             content_type
-        FROM issue_attachment
+        FROM {attachment_table}
         WHERE issue_id = :issue_id
         LIMIT 1
     """)
@@ -779,14 +934,16 @@ def get_issue_attachment_by_issue_id(issue_id: str):
 
     return dict(row)
 
-def list_issue_attachment_rows(issue_id: str):
-    sql = text("""
+def list_issue_attachment_rows(issue_id: str, *, archived=False):
+    _, _, _, attachment_table = _issue_tables(archived)
+
+    sql = text(f"""
         SELECT
             id,
             issue_id,
             filepath,
             content_type
-        FROM issue_attachment
+        FROM {attachment_table}
         WHERE issue_id = :issue_id
         ORDER BY id ASC
     """)
@@ -836,6 +993,62 @@ def create_issue_attachment(
 
     return dict(row)
 
+def get_issue_attachment_row(attachment_id):
+    sql = text("""
+        SELECT
+            id,
+            issue_id,
+            filepath,
+            content_type
+        FROM issue_attachment
+        WHERE id = :attachment_id
+    """)
+
+    with get_connection() as conn:
+        row = conn.execute(sql, {"attachment_id": attachment_id}).mappings().first()
+
+    if row is None:
+        return None
+
+    return dict(row)
+
+def replace_issue_attachment_file(
+    attachment_id,
+    *,
+    from_filepath: str,
+    filepath: str,
+    content_type: str,
+    width: int | None = None,
+    height: int | None = None,
+) -> bool:
+    """
+    Point an attachment at a new file, but only if it still points at
+    `from_filepath` (it may have been deleted or replaced meanwhile).
+    Returns whether the row was updated.
+    """
+    sql = text("""
+        UPDATE issue_attachment
+        SET filepath = :filepath,
+            content_type = :content_type,
+            width = :width,
+            height = :height
+        WHERE id = :attachment_id
+          AND filepath = :from_filepath
+    """)
+
+    params = {
+        "attachment_id": attachment_id,
+        "from_filepath": from_filepath,
+        "filepath": filepath,
+        "content_type": content_type,
+        "width": width,
+        "height": height,
+    }
+    with get_connection() as conn:
+        result = conn.execute(sql, params)
+
+    return result.rowcount > 0
+
 def list_accepted_attachment_content_types():
     sql = text("""
         SELECT content_type
@@ -0,0 +1,207 @@
+import json
+
+from sqlalchemy import text
+from app.db.connection import get_connection
+
+_JOB_COLUMNS = """
+    id,
+    kind,
+    payload,
+    dedup_key,
+    status,
+    attempts,
+    max_attempts,
+    run_after,
+    locked_at,
+    locked_by,
+    created_at
+"""
+
+
+def enqueue_job_row(kind: str, payload: dict, *, dedup_key: str | None = None, delay_seconds: float = 0, max_attempts: int = 5):
+    """
+    Insert a queued job. With a dedup_key, a job of the same kind and key
+    that is still queued or running wins and nothing is inserted.
+
+    Returns:
+        the new job id, or None if it was deduplicated.
+    """
+
+    sql = text("""
+        INSERT INTO job (
+            kind,
+            payload,
+            dedup_key,
+            max_attempts,
+            run_after
+        )
+        VALUES (
+            :kind,
+            CAST(:payload AS jsonb),
+            :dedup_key,
+            :max_attempts,
+            now() + make_interval(secs => :delay_seconds)
+        )
+        ON CONFLICT (kind, dedup_key)
+            WHERE dedup_key IS NOT NULL AND status IN ('queued', 'running')
+            DO NOTHING
+        RETURNING id
+    """)
+
+    params = {
+        "kind": kind,
+        "payload": json.dumps(payload, default=str),
+        "dedup_key": dedup_key,
+        "max_attempts": max_attempts,
+        "delay_seconds": delay_seconds,
+    }
+    with get_connection() as conn:
+        return conn.execute(sql, params).scalar()
+
+
+def claim_job_rows(worker_id: str, *, limit: int = 1) -> list[dict]:
+    """
+    Mark up to `limit` ready jobs running for `worker_id` and return them.
+    SKIP LOCKED lets concurrent workers claim disjoint jobs without waiting
+    on each other; the claim commits before any job runs.
+    """
+
+    sql = text(f"""
+        UPDATE job
+        SET status = 'running',
+            attempts = job.attempts + 1,
+            locked_at = now(),
+            locked_by = :worker_id
+        WHERE job.id IN (
+            SELECT ready.id
+            FROM job ready
+            WHERE ready.status = 'queued'
+              AND ready.run_after <= now()
+            ORDER BY ready.run_after, ready.id
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING {_JOB_COLUMNS}
+    """)
+
+    with get_connection() as conn:
+        rows = conn.execute(sql, {"worker_id": worker_id, "limit": limit}).mappings().all()
+
+    return sorted((dict(r) for r in rows), key=lambda row: (row["run_after"], row["id"]))
+
+
+# The outcome writes below only touch a job still running under the worker
+# that claimed it: once its lease expired and it was requeued (and maybe
+# claimed again), the late finisher's result is dropped. They return
+# whether the row was updated.
+
+def complete_job_row(job_id, *, worker_id: str) -> bool:
+    sql = text("""
+        UPDATE job
+        SET status = 'done',
+            finished_at = now(),
+            locked_at = NULL,
+            last_error = NULL
+        WHERE id = :job_id
+          AND status = 'running'
+          AND locked_by = :worker_id
+    """)
+
+    with get_connection() as conn:
+        return conn.execute(sql, {"job_id": job_id, "worker_id": worker_id}).rowcount > 0
+
+
+def retry_job_row(job_id, *, worker_id: str, error: str, delay_seconds: float) -> bool:
+    sql = text("""
+        UPDATE job
+        SET status = 'queued',
+            run_after = now() + make_interval(secs => :delay_seconds),
+            locked_at = NULL,
+            locked_by = NULL,
+            last_error = :error
+        WHERE id = :job_id
+          AND status = 'running'
+          AND locked_by = :worker_id
+    """)
+
+    params = {"job_id": job_id, "worker_id": worker_id, "error": error, "delay_seconds": delay_seconds}
+    with get_connection() as conn:
+        return conn.execute(sql, params).rowcount > 0
+
+
+def fail_job_row(job_id, *, worker_id: str, error: str) -> bool:
+    sql = text("""
+        UPDATE job
+        SET status = 'failed',
+            finished_at = now(),
+            locked_at = NULL,
+            last_error = :error
+        WHERE id = :job_id
+          AND status = 'running'
+          AND locked_by = :worker_id
+    """)
+
+    with get_connection() as conn:
+        return conn.execute(sql, {"job_id": job_id, "worker_id": worker_id, "error": error}).rowcount > 0
+
+
+def requeue_stale_job_rows(lease_seconds: float) -> int:
+    """
+    Put running jobs whose lease (locked_at + lease_seconds) has expired back
+    in the queue; their worker died or hung. The attempt already counted.
+    Jobs out of attempts are failed instead. Returns rows touched.
+    """
+
+    sql = text("""
+        UPDATE job
+        SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+            finished_at = CASE WHEN attempts >= max_attempts THEN now() END,
+            run_after = now(),
+            locked_at = NULL,
+            locked_by = NULL,
+            last_error = 'lease expired'
+        WHERE status = 'running'
+          AND locked_at < now() - make_interval(secs => :lease_seconds)
+    """)
+
+    with get_connection() as conn:
+        return conn.execute(sql, {"lease_seconds": lease_seconds}).rowcount
+
+
+def delete_finished_job_rows(finished_before) -> int:
+    sql = text("""
+        DELETE FROM job
+        WHERE status IN ('done', 'failed')
+          AND finished_at < :finished_before
+    """)
+
+    with get_connection() as conn:
+        return conn.execute(sql, {"finished_before": finished_before}).rowcount
+
+
+def list_job_stat_rows() -> list[dict]:
+    """
+    Per kind and status: job count, and for queued jobs how overdue the
+    oldest ready one is.
+
+    Returns:
+        list of dicts: kind, status, total, oldest_ready_seconds
+    """
+
+    sql = text("""
+        SELECT
+            kind,
+            status,
+            COUNT(*)::int AS total,
+            EXTRACT(EPOCH FROM (now() - MIN(run_after) FILTER (
+                WHERE status = 'queued' AND run_after <= now()
+            )))::float8 AS oldest_ready_seconds
+        FROM job
+        GROUP BY kind, status
+        ORDER BY kind, status
+    """)
+
+    with get_connection() as conn:
+        rows = conn.execute(sql).mappings().all()
+
+    return [dict(r) for r in rows]
@@ -507,6 +507,37 @@ def get_variant_row(variant_id):
     return None if row is None else dict(row)
 
 
+def list_variant_rows_by_ids(variant_ids) -> list[dict]:
+    sql = text("""
+        SELECT
+            variant.id,
+            variant.name,
+            variant.label,
+            variant.model_id,
+            model.name AS model_name,
+            model.label AS model_label,
+            model.make_id AS make_id,
+            make.name AS make_name,
+            make.label AS make_label,
+            make.category_id AS category_id,
+            category.name AS category_name,
+            category.label AS category_label
+        FROM variant
+        LEFT JOIN model
+          ON variant.model_id = model.id
+        LEFT JOIN make
+          ON model.make_id = make.id
+        LEFT JOIN category
+          ON make.category_id = category.id
+        WHERE variant.id = ANY(CAST(:ids AS uuid[]))
+    """)
+
+    with get_connection() as conn:
+        rows = conn.execute(sql, {"ids": [str(variant_id) for variant_id in variant_ids]}).mappings().all()
+
+    return [dict(r) for r in rows]
+
+
 def variant_name_exists_in_model(name: str, model_id, *, exclude_id=None) -> bool:
     sql = """
         SELECT 1
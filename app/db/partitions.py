@@ -0,0 +1,64 @@
+from sqlalchemy import text
+from app.db.connection import get_connection
+
+# Monthly range-partitioned event logs and their partition keys
+# (sql/migrations/005_event_log_partitions.sql).
+PARTITIONED_TABLES = {
+    "issue_action": "created_at",
+    "issue_status_history": "changed_at",
+    "asset_status_history": "changed_at",
+}
+
+
+def create_monthly_partition_rows(from_month, to_month) -> dict[str, list[str]]:
+    """
+    Create any missing monthly partitions between from_month and to_month
+    (inclusive) for every partitioned event log.
+
+    Returns:
+        {"issue_action": ["issue_action_p2026_11", ...], ...} - only the
+        partitions that were created by this call.
+    """
+
+    sql = text("""
+        SELECT create_monthly_partitions(CAST(:parent AS regclass), :column, :from_month, :to_month) AS name
+    """)
+
+    created = {}
+    with get_connection() as conn:
+        for parent, column in PARTITIONED_TABLES.items():
+            rows = conn.execute(
+                sql,
+                {"parent": parent, "column": column, "from_month": from_month, "to_month": to_month},
+            ).scalars().all()
+            created[parent] = list(rows)
+
+    return created
+
+
+def list_partition_rows() -> list[dict]:
+    """
+    Partitions of the event logs with their bounds and estimated row counts.
+
+    Returns:
+        list of {parent, name, bounds, estimated_rows}, oldest first per parent;
+        the DEFAULT partition has bounds "DEFAULT".
+    """
+
+    sql = text("""
+        SELECT
+            parent.relname AS parent,
+            child.relname AS name,
+            pg_get_expr(child.relpartbound, child.oid) AS bounds,
+            GREATEST(child.reltuples, 0)::bigint AS estimated_rows
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.oid = ANY(CAST(:parents AS regclass[]))
+        ORDER BY parent.relname, child.relname
+    """)
+
+    with get_connection() as conn:
+        rows = conn.execute(sql, {"parents": list(PARTITIONED_TABLES)}).mappings().all()
+
+    return [dict(r) for r in rows]
@@ -0,0 +1,366 @@
+from sqlalchemy import text
+from app.db.connection import get_connection
+
+# Assets in service at some point before the window ends, numbered in a
+# stable order so the event queries can hand back plain integer indexes.
+_SCOPED_ASSET_CTE = """
+    scoped_asset AS (
+        SELECT
+            asset.id,
+            asset.site_id,
+            asset.status_id,
+            asset.created_at,
+            variant.model_id,
+            (ROW_NUMBER() OVER (ORDER BY asset.id) - 1)::int AS asset_idx
+        FROM asset
+        JOIN variant
+          ON variant.id = asset.variant_id
+        WHERE asset.created_at < :window_end
+    )
+"""
+
+# Same notion of "down" as the dashboard's assets_down tile.
+_ASSET_STATUS_IS_DOWN_SQL = """(
+    UPPER(COALESCE(asset_status.code, '')) LIKE '%MAINTEN%'
+    OR UPPER(COALESCE(asset_status.label, '')) LIKE '%MAINTEN%'
+    OR UPPER(COALESCE(asset_status.code, '')) IN ('DOWN', 'BLOCKED')
+)"""
+
+
+def _columns(rows, names) -> dict[str, list]:
+    if not rows:
+        return {name: [] for name in names}
+    return dict(zip(names, (list(column) for column in zip(*rows))))
+
+
+def fetch_reliability_input_rows(*, window_start, window_end) -> dict:
+    """
+    Bulk-fetch everything the reliability engine needs for one window, as
+    columns (lists) rather than row dicts. Timestamps are epoch seconds.
+
+    Returns:
+        {
+          "assets": {id, site_id, model_id}                      (asset_idx order)
+          "asset_events": {asset_idx, changed_at, is_down, is_retired}
+                          sorted by asset_idx, changed_at; each asset starts with
+                          the state it entered the window in (or its creation)
+          "issues": {asset_idx, created_at, closed_at}            (issue_idx order)
+          "issue_events": {issue_idx, changed_at, is_closed}
+                          sorted by issue_idx, changed_at; starts with creation
+        }
+    """
+
+    assets_sql = text(f"""
+        WITH {_SCOPED_ASSET_CTE}
+        SELECT
+            scoped_asset.id,
+            scoped_asset.site_id,
+            scoped_asset.model_id
+        FROM scoped_asset
+        ORDER BY scoped_asset.asset_idx
+    """)
+
+    asset_events_sql = text(f"""
+        WITH {_SCOPED_ASSET_CTE},
+        events AS (
+            SELECT
+                ash.asset_id,
+                ash.changed_at,
+                ash.to_status_id,
+                ash.id
+            FROM asset_status_history ash
+            WHERE ash.changed_at >= :window_start
+              AND ash.changed_at < :window_end
+
+            UNION ALL
+
+            (
+                SELECT DISTINCT ON (ash.asset_id)
+                    ash.asset_id,
+                    ash.changed_at,
+                    ash.to_status_id,
+                    ash.id
+                FROM asset_status_history ash
+                WHERE ash.changed_at < :window_start
+                ORDER BY ash.asset_id, ash.changed_at DESC, ash.id DESC
+            )
+
+            UNION ALL
+
+            SELECT
+                scoped_asset.id,
+                scoped_asset.created_at,
+                scoped_asset.status_id,
+                0
+            FROM scoped_asset
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM asset_status_history ash
+                WHERE ash.asset_id = scoped_asset.id
+            )
+        )
+        SELECT
+            scoped_asset.asset_idx,
+            EXTRACT(EPOCH FROM events.changed_at)::float8 AS changed_at,
+            {_ASSET_STATUS_IS_DOWN_SQL} AS is_down,
+            UPPER(COALESCE(asset_status.code, '')) = 'RETIRED' AS is_retired
+        FROM events
+        JOIN scoped_asset
+          ON scoped_asset.id = events.asset_id
+        LEFT JOIN asset_status
+          ON asset_status.id = events.to_status_id
+        ORDER BY scoped_asset.asset_idx, events.changed_at, events.id
+    """)
+
+    scoped_issue_cte = """
+        scoped_issue AS (
+            SELECT
+                issue.id,
+                issue.created_at,
+                issue.closed_at,
+                scoped_asset.asset_idx,
+                (ROW_NUMBER() OVER (ORDER BY issue.id) - 1)::int AS issue_idx
+            FROM issue
+            JOIN scoped_asset
+              ON scoped_asset.id = issue.asset_id
+            WHERE issue.created_at < :window_end
+              AND (issue.closed_at IS NULL OR issue.closed_at >= :window_start)
+        )
+    """
+
+    issues_sql = text(f"""
+        WITH {_SCOPED_ASSET_CTE}, {scoped_issue_cte}
+        SELECT
+            scoped_issue.asset_idx,
+            EXTRACT(EPOCH FROM scoped_issue.created_at)::float8 AS created_at,
+            EXTRACT(EPOCH FROM scoped_issue.closed_at)::float8 AS closed_at
+        FROM scoped_issue
+        ORDER BY scoped_issue.issue_idx
+    """)
+
+    issue_events_sql = text(f"""
+        WITH {_SCOPED_ASSET_CTE}, {scoped_issue_cte},
+        events AS (
+            SELECT
+                scoped_issue.issue_idx,
+                scoped_issue.created_at AS changed_at,
+                FALSE AS is_closed,
+                0 AS event_order
+            FROM scoped_issue
+
+            UNION ALL
+
+            SELECT
+                scoped_issue.issue_idx,
+                ish.changed_at,
+                UPPER(issue_status.code::text) = 'CLOSED' AS is_closed,
+                1 AS event_order
+            FROM scoped_issue
+            JOIN issue_status_history ish
+              ON ish.issue_id = scoped_issue.id
+            JOIN issue_status
+              ON issue_status.id = ish.to_status_id
+        )
+        SELECT
+            issue_idx,
+            EXTRACT(EPOCH FROM changed_at)::float8 AS changed_at,
+            is_closed
+        FROM events
+        ORDER BY issue_idx, changed_at, event_order
+    """)
+
+    params = {"window_start": window_start, "window_end": window_end}
+    with get_connection() as conn:
+        # asset_idx / issue_idx are numbered per statement; one snapshot keeps
+        # them lined up across the four queries.
+        conn.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"))
+        assets = conn.execute(assets_sql, params).all()
+        asset_events = conn.execute(asset_events_sql, params).all()
+        issues = conn.execute(issues_sql, params).all()
+        issue_events = conn.execute(issue_events_sql, params).all()
+
+    return {
+        "assets": _columns(assets, ("id", "site_id", "model_id")),
+        "asset_events": _columns(asset_events, ("asset_idx", "changed_at", "is_down", "is_retired")),
+        "issues": _columns(issues, ("asset_idx", "created_at", "closed_at")),
+        "issue_events": _columns(issue_events, ("issue_idx", "changed_at", "is_closed")),
+    }
+
+
+_SNAPSHOT_COLUMNS = (
+    "scope",
+    "subject_id",
+    "site_id",
+    "window_start",
+    "window_end",
+    "asset_count",
+    "observed_seconds",
+    "downtime_seconds",
+    "failure_count",
+    "repair_count",
+    "repair_seconds",
+    "mtbf_seconds",
+    "mttr_seconds",
+    "availability",
+)
+
+
+def replace_reliability_snapshot_rows(rows: list[dict]) -> int:
+    """
+    Swap the whole reliability_snapshot for `rows` in one transaction, so
+    readers see either the previous run or this one. Returns rows written.
+    """
+
+    delete_sql = text("DELETE FROM reliability_snapshot")
+    insert_sql = text(f"""
+        INSERT INTO reliability_snapshot ({", ".join(_SNAPSHOT_COLUMNS)})
+        VALUES ({", ".join(":" + column for column in _SNAPSHOT_COLUMNS)})
+    """)
+
+    with get_connection() as conn:
+        conn.execute(delete_sql)
+        if rows:
+            conn.execute(insert_sql, rows)
+
+    return len(rows)
+
+
+def get_reliability_snapshot_meta():
+    """Window and computed_at of the current snapshot, or None if it is empty."""
+
+    sql = text("""
+        SELECT
+            window_start,
+            window_end,
+            computed_at
+        FROM reliability_snapshot
+        LIMIT 1
+    """)
+
+    with get_connection() as conn:
+        row = conn.execute(sql).mappings().first()
+
+    return None if row is None else dict(row)
+
+
+# Label columns and joins per scope.
+_SCOPE_LABEL_SQL = {
+    "asset": (
+        """
+            asset.asset_tag AS label,
+            CONCAT_WS(' / ', COALESCE(make.label, make.name), COALESCE(model.label, model.name)) AS sublabel,
+            site.shorthand AS site_shorthand
+        """,
+        """
+            JOIN asset ON asset.id = rs.subject_id
+            JOIN variant ON variant.id = asset.variant_id
+            JOIN model ON model.id = variant.model_id
+            JOIN make ON make.id = model.make_id
+            JOIN site ON site.id = asset.site_id
+        """,
+    ),
+    "model": (
+        """
+            COALESCE(model.label, model.name) AS label,
+            COALESCE(make.label, make.name) AS sublabel,
+            site.shorthand AS site_shorthand
+        """,
+        """
+            JOIN model ON model.id = rs.subject_id
+            JOIN make ON make.id = model.make_id
+            LEFT JOIN site ON site.id = rs.site_id
+        """,
+    ),
+    "site": (
+        """
+            site.shorthand AS label,
+            site.fullname AS sublabel,
+            site.shorthand AS site_shorthand
+        """,
+        """
+            JOIN site ON site.id = rs.subject_id
+        """,
+    ),
+}
+
+RELIABILITY_SORTS = {
+    "availability": "rs.availability ASC NULLS LAST, rs.downtime_seconds DESC",
+    "mtbf": "rs.mtbf_seconds ASC NULLS LAST, rs.failure_count DESC",
+    "mttr": "rs.mttr_seconds DESC NULLS LAST",
+    "failures": "rs.failure_count DESC, rs.availability ASC NULLS LAST",
+}
+
+
+def list_reliability_snapshot_rows(scope: str, *, site_id=None, sort: str = "availability", limit: int = 100) -> list[dict]:
+    """
+    Snapshot rows for one scope with display labels, worst first by `sort`
+    (a RELIABILITY_SORTS key). Model rows without site_id cover all sites.
+
+    Returns:
+        list of dicts: snapshot columns plus label, sublabel, site_shorthand
+    """
+
+    label_sql, join_sql = _SCOPE_LABEL_SQL[scope]
+    order_sql = RELIABILITY_SORTS[sort]
+
+    params = {"scope": scope, "limit": limit}
+    if site_id is not None:
+        site_sql = "AND rs.site_id = :site_id"
+        params["site_id"] = site_id
+    elif scope == "model":
+        site_sql = "AND rs.site_id IS NULL"
+    else:
+        site_sql = ""
+
+    sql = text(f"""
+        SELECT
+            rs.scope,
+            rs.subject_id,
+            rs.site_id,
+            rs.window_start,
+            rs.window_end,
+            rs.asset_count,
+            rs.observed_seconds,
+            rs.downtime_seconds,
+            rs.failure_count,
+            rs.repair_count,
+            rs.repair_seconds,
+            rs.mtbf_seconds,
+            rs.mttr_seconds,
+            rs.availability,
+            rs.computed_at,
+            {label_sql}
+        FROM reliability_snapshot rs
+        {join_sql}
+        WHERE rs.scope = :scope
+        {site_sql}
+        ORDER BY {order_sql}, label
+        LIMIT :limit
+    """)
+
+    with get_connection() as conn:
+        rows = conn.execute(sql, params).mappings().all()
+
+    return [dict(r) for r in rows]
+
+
+def get_asset_reliability_row(asset_id):
+    sql = text("""
+        SELECT
+            availability,
+            mtbf_seconds,
+            mttr_seconds,
+            failure_count,
+            window_start,
+            window_end,
+            computed_at
+        FROM reliability_snapshot
+        WHERE scope = 'asset'
+          AND subject_id = :asset_id
+        LIMIT 1
+    """)
+
+    with get_connection() as conn:
+        row = conn.execute(sql, {"asset_id": asset_id}).mappings().first()
+
+    return None if row is None else dict(row)
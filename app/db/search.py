@@ -0,0 +1,140 @@
+from sqlalchemy import text
+from app.db.connection import get_connection, set_statement_timeout
+
+# Snippets are plain text; the UI escapes them like any other field.
+_HEADLINE_OPTIONS = "MaxFragments=1, MaxWords=24, MinWords=10, StartSel=\"\", StopSel=\"\", FragmentDelimiter=\" … \""
+
+
+def search_issue_rows(query: str, *, site_id=None, limit: int = 5, timeout_ms: int | None = None) -> list[dict]:
+    """
+    Full-text search over issue title (weight A) and description (weight B)
+    via issue.search_vector. `query` uses websearch syntax ("hydraulic leak",
+    "pump -filter", "\"exact phrase\"").
+
+    Returns:
+        up to `limit` dicts, best first:
+        id, title, snippet, rank, created_at, asset_id, asset_tag, site_id,
+        status_code, status_label
+    """
+
+    site_sql = ""
+    params = {"query": query, "limit": limit, "headline_options": _HEADLINE_OPTIONS}
+    if site_id is not None:
+        site_sql = "AND asset.site_id = :site_id"
+        params["site_id"] = site_id
+
+    # ts_headline re-parses the document, so it only runs on the rows that
+    # survive the LIMIT.
+    sql = text(f"""
+        WITH q AS (
+            SELECT websearch_to_tsquery('english', :query) AS query
+        ),
+        hits AS (
+            SELECT
+                issue.id,
+                issue.title,
+                issue.description,
+                issue.created_at,
+                issue.asset_id,
+                issue.status_id,
+                asset.asset_tag,
+                asset.site_id,
+                ts_rank_cd(issue.search_vector, q.query) AS rank
+            FROM issue
+            CROSS JOIN q
+            JOIN asset ON issue.asset_id = asset.id
+            WHERE issue.search_vector @@ q.query
+            {site_sql}
+            ORDER BY rank DESC, issue.created_at DESC
+            LIMIT :limit
+        )
+        SELECT
+            hits.id,
+            hits.title,
+            ts_headline('english', hits.description, q.query, :headline_options) AS snippet,
+            hits.rank::float AS rank,
+            hits.created_at,
+            hits.asset_id,
+            hits.asset_tag,
+            hits.site_id,
+            issue_status.code AS status_code,
+            issue_status.label AS status_label
+        FROM hits
+        CROSS JOIN q
+        JOIN issue_status ON hits.status_id = issue_status.id
+        ORDER BY hits.rank DESC, hits.created_at DESC
+    """)
+
+    with get_connection() as conn:
+        if timeout_ms is not None:
+            set_statement_timeout(conn, timeout_ms)
+        rows = conn.execute(sql, params).mappings().all()
+
+    return [dict(r) for r in rows]
+
+
+def search_issue_action_rows(query: str, *, site_id=None, limit: int = 5, timeout_ms: int | None = None) -> list[dict]:
+    """
+    Full-text search over issue action bodies via issue_action.search_vector.
+
+    Returns:
+        up to `limit` dicts, best first:
+        id, issue_id, issue_title, snippet, rank, created_at, created_by,
+        action_type_code, action_type_label, asset_tag, site_id
+    """
+
+    site_sql = ""
+    params = {"query": query, "limit": limit, "headline_options": _HEADLINE_OPTIONS}
+    if site_id is not None:
+        site_sql = "AND asset.site_id = :site_id"
+        params["site_id"] = site_id
+
+    sql = text(f"""
+        WITH q AS (
+            SELECT websearch_to_tsquery('english', :query) AS query
+        ),
+        hits AS (
+            SELECT
+                issue_action.id,
+                issue_action.issue_id,
+                issue_action.action_type_id,
+                issue_action.body,
+                issue_action.created_at,
+                issue_action.created_by,
+                issue.title AS issue_title,
+                asset.asset_tag,
+                asset.site_id,
+                ts_rank_cd(issue_action.search_vector, q.query) AS rank
+            FROM issue_action
+            CROSS JOIN q
+            JOIN issue ON issue_action.issue_id = issue.id
+            JOIN asset ON issue.asset_id = asset.id
+            WHERE issue_action.search_vector @@ q.query
+            {site_sql}
+            ORDER BY rank DESC, issue_action.created_at DESC
+            LIMIT :limit
+        )
+        SELECT
+            hits.id,
+            hits.issue_id,
+            hits.issue_title,
+            ts_headline('english', hits.body, q.query, :headline_options) AS snippet,
+            hits.rank::float AS rank,
+            hits.created_at,
+            hits.created_by,
+            action_type.code AS action_type_code,
+            action_type.label AS action_type_label,
+            hits.asset_tag,
+            hits.site_id
+        FROM hits
+        CROSS JOIN q
+        JOIN action_type ON hits.action_type_id = action_type.id
+        ORDER BY hits.rank DESC, hits.created_at DESC
+    """)
+
+    with get_connection() as conn:
+        if timeout_ms is not None:
+            set_statement_timeout(conn, timeout_ms)
+        rows = conn.execute(sql, params).mappings().all()
+
+    return [dict(r) for r in rows]
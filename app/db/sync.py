@@ -0,0 +1,95 @@
+from sqlalchemy import text
+from app.db.connection import get_connection
+
+
+def list_change_rows(*, since_txid: int, since_seq: int, limit: int) -> dict:
+    """
+    change_log rows after the (since_txid, since_seq) cursor, oldest first,
+    limited to transactions older than the current snapshot's xmin so that
+    no row can later commit behind the returned ones (see 012_change_log).
+
+    Returns:
+        {
+          "rows": [{seq, txid, entity, entity_id, op, data, changed_at}, ...],
+          "pruned_through_txid": newest purged transaction (0 = none),
+        }
+    """
+
+    horizon_sql = text("""
+        SELECT pruned_through_txid::text::bigint AS pruned_through_txid
+        FROM change_log_horizon
+    """)
+
+    rows_sql = text("""
+        SELECT
+            seq,
+            txid::text::bigint AS txid,
+            entity,
+            entity_id,
+            op,
+            data,
+            changed_at
+        FROM change_log
+        WHERE (txid, seq) > (CAST(CAST(:since_txid AS text) AS xid8), :since_seq)
+          AND txid < pg_snapshot_xmin(pg_current_snapshot())
+        ORDER BY txid, seq
+        LIMIT :limit
+    """)
+
+    with get_connection() as conn:
+        horizon = conn.execute(horizon_sql).scalar()
+        rows = conn.execute(
+            rows_sql,
+            {"since_txid": since_txid, "since_seq": since_seq, "limit": limit},
+        ).mappings().all()
+
+    return {
+        "rows": [dict(row) for row in rows],
+        "pruned_through_txid": horizon or 0,
+    }
+
+
+def get_change_log_head() -> dict:
+    """
+    A (txid, seq) cursor covering every change committed so far: the last
+    transaction id below the snapshot xmin and the highest seq handed out.
+
+    Returns:
+        {"txid": n, "seq": n}
+    """
+
+    sql = text("""
+        SELECT
+            pg_snapshot_xmin(pg_current_snapshot())::text::bigint - 1 AS txid,
+            COALESCE((SELECT MAX(seq) FROM change_log), 0) AS seq
+    """)
+
+    with get_connection() as conn:
+        row = conn.execute(sql).mappings().first()
+
+    return dict(row)
+
+
+def delete_expired_change_rows(changed_before) -> int:
+    """
+    Purge change_log rows older than `changed_before` and move the horizon
+    up to the newest purged transaction. A transaction's rows share
+    changed_at (now()), so it is purged all at once.
+    """
+
+    sql = text("""
+        WITH doomed AS (
+            DELETE FROM change_log
+            WHERE changed_at < :changed_before
+            RETURNING txid
+        ),
+        horizon AS (
+            UPDATE change_log_horizon
+            SET pruned_through_txid = GREATEST(pruned_through_txid, (SELECT MAX(txid) FROM doomed))
+            WHERE EXISTS (SELECT 1 FROM doomed)
+        )
+        SELECT COUNT(*)::int FROM doomed
+    """)
+
+    with get_connection() as conn:
+        return conn.execute(sql, {"changed_before": changed_before}).scalar()
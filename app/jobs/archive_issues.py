@@ -0,0 +1,64 @@
+"""
+Move long-closed issues into the archive tables.
+
+    python -m app.jobs.archive_issues [--after-days N] [--batch-size N]
+
+Safe to stop and re-run at any point (each batch is its own transaction);
+meant to run nightly from cron.
+"""
+import argparse
+import logging
+
+from dotenv import load_dotenv
+
+from app.services import archive as archive_service
+
+
+def _parse_args(argv=None):
+    settings = archive_service.archive_settings()
+    parser = argparse.ArgumentParser(
+        prog="python -m app.jobs.archive_issues",
+        description="Move issues closed longer than the archive window into the archive tables.",
+    )
+    parser.add_argument(
+        "--after-days",
+        type=int,
+        default=settings["after_days"],
+        help=f"archive issues closed more than this many days ago (default: {settings['after_days']})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings["batch_size"],
+        help=f"issues moved per transaction (default: {settings['batch_size']})",
+    )
+    parser.add_argument("--max-batches", type=int, help="stop after this many batches")
+    parser.add_argument("--dry-run", action="store_true", help="only count the issues that would move")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = _parse_args(argv)
+
+    if args.dry_run:
+        total = archive_service.count_archivable_issues(args.after_days)
+        print(f"{total} issue(s) closed more than {args.after_days} days ago would be archived")
+        return 0
+
+    result = archive_service.archive_closed_issues(
+        args.after_days,
+        batch_size=args.batch_size,
+        max_batches=args.max_batches,
+    )
+    print(
+        f"archived {result['issues']} issue(s) closed before {result['cutoff']:%Y-%m-%d} "
+        f"({result['actions']} actions, {result['status_history']} status changes, "
+        f"{result['attachments']} attachments) in {result['batches']} batch(es), {result['took_s']}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(main())
@@ -0,0 +1,48 @@
+"""
+Create the monthly partitions of the event logs ahead of time.
+
+    python -m app.jobs.create_partitions [--months-ahead N] [--list]
+
+Idempotent; meant to run daily from cron next to archive_issues.
+"""
+import argparse
+import logging
+
+from dotenv import load_dotenv
+
+from app.services import partitions as partition_service
+
+
+def _parse_args(argv=None):
+    months_ahead = partition_service.months_ahead_setting()
+    parser = argparse.ArgumentParser(
+        prog="python -m app.jobs.create_partitions",
+        description="Create missing monthly partitions for issue_action and the status history tables.",
+    )
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=months_ahead,
+        help=f"months past the current one to create (default: {months_ahead})",
+    )
+    parser.add_argument("--list", action="store_true", help="print the partitions afterwards")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = _parse_args(argv)
+
+    created = partition_service.ensure_future_partitions(args.months_ahead)
+    for parent, names in created.items():
+        print(f"{parent}: {len(names)} partition(s) created{': ' + ', '.join(names) if names else ''}")
+
+    if args.list:
+        for row in partition_service.list_partitions():
+            print(f"  {row['name']:<40} {row['bounds']:<70} ~{row['estimated_rows']} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(main())
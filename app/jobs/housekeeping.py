@@ -0,0 +1,58 @@
+"""
+Requeue jobs whose worker died, delete old finished jobs and purge expired
+idempotency keys and sync change log entries.
+
+    python -m app.jobs.housekeeping [--lease-seconds N] [--retention-days N]
+
+Job workers also do this every minute while they run; this keeps it going
+when none are (JOB_WORKER_THREADS=0 and no run_worker service). Idempotent;
+meant to run every few minutes from cron next to archive_issues.
+"""
+import argparse
+import logging
+
+from dotenv import load_dotenv
+
+from app.services import jobs as job_service
+
+
+def _parse_args(argv=None):
+    settings = job_service.job_settings()
+    parser = argparse.ArgumentParser(
+        prog="python -m app.jobs.housekeeping",
+        description="Requeue stale jobs and purge finished jobs, idempotency keys and sync changes.",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=settings["lease_seconds"],
+        help=f"requeue running jobs silent for this long (default: {settings['lease_seconds']:.0f})",
+    )
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=settings["retention_days"],
+        help=f"delete finished jobs older than this (default: {settings['retention_days']})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = _parse_args(argv)
+
+    result = job_service.run_housekeeping(
+        lease_seconds=args.lease_seconds,
+        retention_days=args.retention_days,
+    )
+    print(
+        f"requeued {result['requeued']} stale job(s), deleted {result['deleted']} finished job(s), "
+        f"purged {result['idempotency_keys_purged']} idempotency key(s) and "
+        f"{result['sync_changes_purged']} sync change(s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(main())
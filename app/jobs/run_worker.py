@@ -0,0 +1,91 @@
+"""
+Run background job workers (HEIC conversion, attachment file clean-up,
+QR rendering) against the Postgres job queue.
+
+    python -m app.jobs.run_worker [--threads N] [--drain] [--stats]
+
+Gunicorn workers run JOB_WORKER_THREADS of these in-process; run this
+instead (with JOB_WORKER_THREADS=0 for gunicorn) to keep jobs away from
+request handling altogether.
+"""
+import argparse
+import logging
+import signal
+import threading
+
+from dotenv import load_dotenv
+
+from app.services import jobs as job_service
+
+
+def _parse_args(argv=None):
+    settings = job_service.job_settings()
+    threads = max(settings["worker_threads"], 1)
+    parser = argparse.ArgumentParser(
+        prog="python -m app.jobs.run_worker",
+        description="Claim and run jobs from the Postgres job queue.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=threads,
+        help=f"worker threads in this process (default: {threads})",
+    )
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="run every job that is ready now, then exit",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print queue counts per kind and status, then exit",
+    )
+    return parser.parse_args(argv)
+
+
+def _print_stats() -> None:
+    rows = job_service.get_job_stats()
+    if not rows:
+        print("job queue is empty")
+        return
+    for row in rows:
+        line = f"{row['kind']:<28} {row['status']:<8} {row['total']:>8}"
+        if row["oldest_ready_seconds"] is not None:
+            line += f"  oldest ready {row['oldest_ready_seconds']:.0f}s ago"
+        print(line)
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = _parse_args(argv)
+
+    if args.stats:
+        _print_stats()
+        return 0
+
+    # Job handlers read ATTACHMENT_ROOT etc. from the app config.
+    from app import initialise_application
+
+    app = initialise_application()
+
+    if args.drain:
+        ran = job_service.JobWorker(app, name="drain").run_available()
+        print(f"ran {ran} job(s)")
+        return 0
+
+    stopped = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stopped.set())
+
+    job_service.start_worker_threads(app, args.threads)
+    print(f"job worker running with {args.threads} thread(s)")
+    stopped.wait()
+
+    job_service.stop_worker_threads(timeout=30)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(main())
@@ -0,0 +1,204 @@
+import hmac
+import os
+from contextlib import contextmanager
+from time import perf_counter
+
+from flask import Blueprint, Response, abort, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+
+from app.db.connection import add_pool_wait_listener, get_engine, pool_settings
+from app.services import auth as auth_service
+
+
+# Multiprocess mode is switched on by PROMETHEUS_MULTIPROC_DIR being set in
+# the environment before this module is imported; every gunicorn worker then
+# writes its samples to mmap files in that dir and /metrics aggregates them.
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+REQUESTS = Counter(
+    "maintenance_http_requests_total",
+    "HTTP requests handled, by endpoint and status code.",
+    ["method", "endpoint", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "maintenance_http_request_duration_seconds",
+    "Time spent handling a request, by endpoint.",
+    ["method", "endpoint"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+POOL_CHECKED_OUT = Gauge(
+    "maintenance_db_pool_checked_out",
+    "Database connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "maintenance_db_pool_overflow",
+    "Connections open beyond pool_size (overflow in use).",
+    multiprocess_mode="livesum",
+)
+POOL_CAPACITY = Gauge(
+    "maintenance_db_pool_capacity",
+    "pool_size + max_overflow, i.e. the most connections the pool will open.",
+    multiprocess_mode="livesum",
+)
+POOL_WAIT = Histogram(
+    "maintenance_db_pool_wait_seconds",
+    "Time spent waiting to check a connection out of the pool.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+CACHE_LOOKUPS = Counter(
+    "maintenance_cache_lookups_total",
+    "In-process cache lookups, by cache and result (hit/miss).",
+    ["cache", "result"],
+)
+ATTACHMENT_BYTES = Histogram(
+    "maintenance_attachment_upload_bytes",
+    "Size of uploaded issue attachments.",
+    ["content_type"],
+    buckets=(64_000, 256_000, 512_000, 1_000_000, 2_000_000, 4_000_000, 8_000_000, 16_000_000, 32_000_000),
+)
+ATTACHMENT_PROCESSING = Histogram(
+    "maintenance_attachment_processing_seconds",
+    "Time spent storing (and converting) an uploaded attachment.",
+    ["content_type"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+DASHBOARD_QUERY_DURATION = Histogram(
+    "maintenance_dashboard_query_duration_seconds",
+    "Duration of each dashboard query.",
+    ["query"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+JOBS_ENQUEUED = Counter(
+    "maintenance_jobs_enqueued_total",
+    "Background jobs enqueued, by kind and result (queued/deduplicated).",
+    ["kind", "result"],
+)
+JOBS_FINISHED = Counter(
+    "maintenance_jobs_finished_total",
+    "Background job attempts, by kind and outcome (done/retry/failed/lease_lost).",
+    ["kind", "outcome"],
+)
+JOB_DURATION = Histogram(
+    "maintenance_job_duration_seconds",
+    "Time spent running one background job attempt.",
+    ["kind"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+JOB_QUEUE_DELAY = Histogram(
+    "maintenance_job_queue_delay_seconds",
+    "Time a background job was ready (run_after passed) before a worker started it.",
+    ["kind"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def observe_attachment(content_type: str, size_bytes: int, seconds: float) -> None:
+    ATTACHMENT_BYTES.labels(content_type=content_type).observe(size_bytes)
+    ATTACHMENT_PROCESSING.labels(content_type=content_type).observe(seconds)
+
+
+def record_job_enqueued(kind: str, queued: bool) -> None:
+    JOBS_ENQUEUED.labels(kind=kind, result="queued" if queued else "deduplicated").inc()
+
+
+def observe_job(kind: str, outcome: str, seconds: float, queue_delay_seconds: float) -> None:
+    JOBS_FINISHED.labels(kind=kind, outcome=outcome).inc()
+    JOB_DURATION.labels(kind=kind).observe(seconds)
+    JOB_QUEUE_DELAY.labels(kind=kind).observe(max(queue_delay_seconds, 0.0))
+
+
+@contextmanager
+def timed_dashboard_query(query: str):
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        DASHBOARD_QUERY_DURATION.labels(query=query).observe(perf_counter() - started)
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    # Set here rather than at install so that, with --preload, each worker
+    # (not the master) reports its own capacity.
+    settings = pool_settings()
+    POOL_CAPACITY.set(settings["pool_size"] + max(settings["max_overflow"], 0))
+    POOL_CHECKED_OUT.inc()
+    POOL_OVERFLOW.set(max(get_engine().pool.overflow(), 0))
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    POOL_CHECKED_OUT.dec()
+    POOL_OVERFLOW.set(max(get_engine().pool.overflow(), 0))
+
+
+def _record_pool_wait(seconds: float) -> None:
+    POOL_WAIT.observe(seconds)
+
+
+def _registry():
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def _scrape_allowed() -> bool:
+    # Same gate as the settings pages; a scraper, which can't unlock that,
+    # sends "Authorization: Bearer <METRICS_TOKEN>" instead.
+    if auth_service.is_settings_admin_unlocked():
+        return True
+    token = os.environ.get("METRICS_TOKEN")
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    return bool(token) and hmac.compare_digest(supplied.encode(), token.encode())
+
+
+@metrics_bp.route("/metrics", methods=["GET"], strict_slashes=False)
+def metrics():
+    if not _scrape_allowed():
+        abort(403, description="Unlock the settings admin gate or send the METRICS_TOKEN bearer token")
+    return Response(generate_latest(_registry()), mimetype=CONTENT_TYPE_LATEST)
+
+
+def install_metrics(app) -> None:
+    """
+    Count and time every request by endpoint, and track pool checkouts on
+    the shared engine. The scrape endpoint is metrics_bp.
+    """
+    engine = get_engine()
+    if not event.contains(engine, "checkout", _on_checkout):
+        event.listen(engine, "checkout", _on_checkout)
+        event.listen(engine, "checkin", _on_checkin)
+        add_pool_wait_listener(_record_pool_wait)
+
+    @app.before_request
+    def start_request_timer():
+        g._metrics_started_at = perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started_at = g.pop("_metrics_started_at", None)
+        if started_at is None:
+            return response
+
+        # Unmatched URLs all share one label so 404 scans can't blow up cardinality.
+        endpoint = request.endpoint or "unmatched"
+        REQUEST_DURATION.labels(method=request.method, endpoint=endpoint).observe(perf_counter() - started_at)
+        REQUESTS.labels(method=request.method, endpoint=endpoint, status=str(response.status_code)).inc()
+        return response
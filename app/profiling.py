@@ -0,0 +1,176 @@
+import json
+import logging
+from time import perf_counter
+
+from flask import g, has_app_context, request, before_render_template, template_rendered
+from flask.json.provider import DefaultJSONProvider
+from flask.logging import default_handler, has_level_handler
+from sqlalchemy import event
+
+from app.db.connection import add_pool_wait_listener, get_engine
+
+
+logger = logging.getLogger(__name__)
+
+_PROFILE_KEY = "_request_profile"
+
+
+class RequestProfile:
+    """Timings collected for a single request."""
+
+    def __init__(self):
+        self.started_at = perf_counter()
+        self.query_count = 0
+        self.sql_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+        self.template_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.statement_counts = {}
+        self._template_started_at = None
+
+    @property
+    def repeated_query_count(self) -> int:
+        return sum(count - 1 for count in self.statement_counts.values() if count > 1)
+
+    def total_seconds(self) -> float:
+        return perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        parts = [
+            f'db;dur={self.sql_seconds * 1000:.2f};desc="{self.query_count} queries"',
+            f"pool;dur={self.pool_wait_seconds * 1000:.2f}",
+            f"tpl;dur={self.template_seconds * 1000:.2f}",
+            f"ser;dur={self.serialization_seconds * 1000:.2f}",
+            f"total;dur={self.total_seconds() * 1000:.2f}",
+        ]
+        return ", ".join(parts)
+
+    def as_log_fields(self) -> dict:
+        return {
+            "query_count": self.query_count,
+            "repeated_query_count": self.repeated_query_count,
+            "sql_ms": round(self.sql_seconds * 1000, 2),
+            "pool_wait_ms": round(self.pool_wait_seconds * 1000, 2),
+            "template_ms": round(self.template_seconds * 1000, 2),
+            "serialization_ms": round(self.serialization_seconds * 1000, 2),
+            "total_ms": round(self.total_seconds() * 1000, 2),
+        }
+
+
+def current_profile() -> RequestProfile | None:
+    if not has_app_context():
+        return None
+    return g.get(_PROFILE_KEY)
+
+
+def begin_profile() -> RequestProfile:
+    """Start a fresh profile on `g`, replacing any profile already there."""
+    profile = RequestProfile()
+    setattr(g, _PROFILE_KEY, profile)
+    return profile
+
+
+class ProfilingJSONProvider(DefaultJSONProvider):
+    """JSON provider that records time spent building JSON responses."""
+
+    def response(self, *args, **kwargs):
+        profile = current_profile()
+        if profile is None:
+            return super().response(*args, **kwargs)
+
+        started = perf_counter()
+        try:
+            return super().response(*args, **kwargs)
+        finally:
+            profile.serialization_seconds += perf_counter() - started
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, not the connection: a statement that
+    # raises never reaches after_cursor_execute, and its context goes with it.
+    if current_profile() is not None and context is not None:
+        context._profiling_started_at = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = current_profile()
+    started_at = getattr(context, "_profiling_started_at", None)
+    if profile is None or started_at is None:
+        return
+
+    profile.sql_seconds += perf_counter() - started_at
+    profile.query_count += 1
+    profile.statement_counts[statement] = profile.statement_counts.get(statement, 0) + 1
+
+
+def _record_pool_wait(seconds: float) -> None:
+    profile = current_profile()
+    if profile is not None:
+        profile.pool_wait_seconds += seconds
+
+
+def _before_render_template(sender, template, context, **extra):
+    profile = current_profile()
+    if profile is not None:
+        profile._template_started_at = perf_counter()
+
+
+def _template_rendered(sender, template, context, **extra):
+    profile = current_profile()
+    if profile is None or profile._template_started_at is None:
+        return
+
+    profile.template_seconds += perf_counter() - profile._template_started_at
+    profile._template_started_at = None
+
+
+def install_request_profiling(app) -> None:
+    """
+    Attach per-request profiling to the app: SQL count/time from the shared
+    engine, pool checkout wait, template render and JSON serialization time.
+    Results go out as a Server-Timing header and one structured log line.
+    """
+    if not app.config.get("REQUEST_PROFILING", True):
+        return
+
+    # Make sure the INFO line is neither filtered out nor dropped: when
+    # nothing has configured a handler that would take it, send it to Flask's
+    # stderr handler ourselves (without propagating, so it isn't logged twice
+    # once app.logger gets the same handler).
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    if not has_level_handler(logger):
+        logger.addHandler(default_handler)
+        logger.propagate = False
+
+    engine = get_engine()
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        add_pool_wait_listener(_record_pool_wait)
+
+    before_render_template.connect(_before_render_template, app)
+    template_rendered.connect(_template_rendered, app)
+    app.json = ProfilingJSONProvider(app)
+
+    @app.before_request
+    def start_request_profile():
+        g.setdefault(_PROFILE_KEY, RequestProfile())
+
+    @app.after_request
+    def emit_request_profile(response):
+        profile = current_profile()
+        if profile is None:
+            return response
+
+        response.headers["Server-Timing"] = profile.server_timing()
+
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+            **profile.as_log_fields(),
+        }
+        logger.info("request_profile %s", json.dumps(fields, sort_keys=True))
+        return response
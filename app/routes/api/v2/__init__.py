@@ -1,5 +1,7 @@
 from flask import Blueprint, jsonify
 
+from app.services.concurrency import VersionConflict, etag_for
+
 # This is the v2 API blueprint
 bp = Blueprint("api_v2", __name__, url_prefix="/maintenance/api/v2")
 # or "/api/v2" if that’s what you want
@@ -13,6 +15,20 @@ from . import sites     # noqa: F401
 from . import asset_statuses #noqa:F401
 from . import asset_categories #noqa:F401
 from . import dashboard #noqa:F401
+from . import search #noqa:F401
+from . import reliability #noqa:F401
+from . import events #noqa:F401
+from . import sync #noqa:F401
+
+@bp.errorhandler(VersionConflict)
+def version_conflict(exc: VersionConflict):
+    # If-Match named an older version (or retries kept losing the race):
+    # the client should re-read the resource and reapply its change.
+    response = jsonify({"error": "precondition_failed", "message": str(exc)})
+    response.status_code = 412
+    if exc.current_version is not None:
+        response.headers["ETag"] = etag_for(exc.current_version)
+    return response
 
 @bp.route("/", methods=["GET"])
 def api_v2_root():
@@ -26,6 +42,10 @@ def api_v2_root():
             "issues": "/issues",
             "sites": "/sites",
             "dashboard": "/dashboard",
+            "search": "/search",
+            "reliability": "/reliability",
+            "events": "/events",
+            "sync": "/sync",
             "action_types": "/action-types",
             "issue_statuses": "/issue-statuses",
             "asset_statuses": "/asset-statuses",
@@ -2,7 +2,9 @@ import io
 from flask import abort, request, jsonify, send_file
 from . import bp
 from app.services import assets as asset_service
+from app.services import auth as auth_service
 from app.services import sites as site_service
+from app.services.concurrency import etag_for, expected_version_from_request
 from uuid import UUID
 from app.services import lookups
 
@@ -28,6 +30,17 @@ def parse_site_arg(name: str = "site_id"):
         abort(400, description=str(exc))
 
 
+def parse_bool_arg(name: str):
+    value = (request.args.get(name) or "").strip().lower()
+    if value == "":
+        return None
+    if value in ("true", "1", "yes"):
+        return True
+    if value in ("false", "0", "no"):
+        return False
+    abort(400, description=f"Invalid {name}, must be true or false")
+
+
 def validate_uuid_path(value: str, field_name: str):
     try:
         return str(UUID(value))
@@ -35,6 +48,11 @@ def validate_uuid_path(value: str, field_name: str):
         abort(400, description=f"Invalid {field_name}, must be UUID")
 
 
+def require_settings_admin_gate():
+    if request.cookies.get(auth_service.SETTINGS_ADMIN_GATE_COOKIE_NAME) != "1":
+        abort(403, description="Settings admin gate is locked")
+
+
 @bp.route("/assets", methods=["GET"])
 def list_assets():
     page = request.args.get("page", default=1, type=int)
@@ -49,6 +67,7 @@ def list_assets():
         "model_id": parse_uuid_arg("model_id"),
         "variant_id": parse_uuid_arg("variant_id"),
         "asset_tag": request.args.get("asset_tag"),  # string
+        "has_open_issues": parse_bool_arg("has_open_issues"),
     }
 
     # retired mode: active (default), retired, all
@@ -83,14 +102,21 @@ def list_assets():
     include_param = request.args.get("include", "")
     include = [x.strip() for x in include_param.split(",") if x.strip()]
 
-    result = asset_service.list_assets_service(
-        filters=filters,
-        sort=sort,
-        page=page,
-        page_size=page_size,
-        include=include,
-        retired_mode=retired_mode,
-    )
+    fields_param = request.args.get("fields", "")
+    fields = [x.strip() for x in fields_param.split(",") if x.strip()] or None
+
+    try:
+        result = asset_service.list_assets_service(
+            filters=filters,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            include=include,
+            retired_mode=retired_mode,
+            fields=fields,
+        )
+    except ValueError as e:
+        return jsonify({"error": "invalid_input", "message": str(e)}), 400
 
     return jsonify(result), 200
 
@@ -110,6 +136,27 @@ def create_asset():
     return jsonify(asset), 201
 
 
+@bp.route("/assets/bulk", methods=["POST"])
+def bulk_update_assets():
+    """
+    Move, re-status or retire many assets at once (see
+    bulk_update_assets_service for the payload). Behind the settings admin
+    gate; returns a summary of what matched and what changed.
+    """
+    require_settings_admin_gate()
+
+    data = request.get_json(silent=True)
+    if data is None:
+        return jsonify({"error": "invalid_json", "message": "Request body must be JSON"}), 400
+
+    try:
+        summary = asset_service.bulk_update_assets_service(data)
+    except ValueError as e:
+        return jsonify({"error": "invalid_input", "message": str(e)}), 400
+
+    return jsonify(summary), 200
+
+
 @bp.route("/assets/<asset_id>/qr", methods=["GET"])
 def get_asset_qr_png(asset_id: str):
     asset_id = validate_uuid_path(asset_id, "asset_id")
@@ -135,7 +182,7 @@ def get_asset(asset_id:UUID):
     if asset is None:
         return jsonify({"error": "asset_not_found"}), 404
 
-    return jsonify(asset), 200
+    return jsonify(asset), 200, {"ETag": etag_for(asset["version"])}
 
 @bp.route("/assets/<uuid:asset_id>", methods=["PATCH"])
 def update_asset(asset_id: UUID):
@@ -144,7 +191,8 @@ def update_asset(asset_id: UUID):
         return jsonify({"error": "invalid_json", "message": "Request body must be JSON"}), 400
 
     try:
-        asset = asset_service.patch_asset_service(asset_id, data)
+        expected_version = expected_version_from_request(lambda: asset_service.get_asset_version(asset_id))
+        asset = asset_service.patch_asset_service(asset_id, data, expected_version=expected_version)
     except ValueError as e:
         return jsonify({"error": "invalid_input", "message": str(e)}), 400
 
@@ -152,7 +200,7 @@ def update_asset(asset_id: UUID):
         # asset_id not found
         return jsonify({"error": "asset_not_found"}), 404
 
-    return jsonify(asset), 200
+    return jsonify(asset), 200, {"ETag": etag_for(asset["version"])}
 
 @bp.route("/assets/<uuid:asset_id>", methods=["DELETE"])
 def retire_asset(asset_id: UUID):
@@ -199,6 +247,43 @@ def get_asset_by_tag(asset_tag: str):
         return jsonify({"error": "asset_not_found"}), 404
     return jsonify(items[0]), 200
 
+@bp.route("/assets/lookup", methods=["POST"])
+def lookup_assets():
+    """
+    Resolve a batch of scanned tags / ids in one query (see
+    lookup_assets_service). A read: nothing is written.
+    """
+    data = request.get_json(silent=True)
+    if data is None:
+        return jsonify({"error": "invalid_json", "message": "Request body must be JSON"}), 400
+
+    try:
+        result = asset_service.lookup_assets_service(data)
+    except ValueError as e:
+        return jsonify({"error": "invalid_input", "message": str(e)}), 400
+
+    return jsonify(result), 200
+
+
+@bp.route("/assets/search", methods=["GET"])
+def search_assets():
+    """
+    Typeahead for the asset picker; cheap enough to call per keystroke.
+    Example:
+      /maintenance/api/v2/assets/search?q=ev3-r&site_id=<uuid>&limit=10
+    """
+    try:
+        items = asset_service.search_assets_service(
+            request.args.get("q", ""),
+            site_id=request.args.get("site_id"),
+            limit=request.args.get("limit", asset_service.ASSET_SEARCH_DEFAULT_LIMIT),
+            include_retired=parse_bool_arg("include_retired") or False,
+        )
+    except ValueError as e:
+        return jsonify({"error": "invalid_input", "message": str(e)}), 400
+
+    return jsonify({"items": items}), 200
+
 @bp.route("/assets/makes", methods=["GET"])
 def list_makes_for_assets():
     """
@@ -0,0 +1,63 @@
+import json
+
+from flask import Response, current_app, jsonify, request
+from . import bp
+from app.services import events as events_service
+
+# Comment frames keep proxies from timing the stream out and surface a
+# closed client socket within this many seconds.
+KEEPALIVE_SECONDS = 15
+RECONNECT_MS = 5000
+
+
+def _sse_frame(event_type: str, data) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'), default=str)}\n\n"
+
+
+@bp.route("/events", methods=["GET"])
+def events():
+    """
+    Server-Sent Events stream of issue, issue action and asset status changes.
+    Example:
+      /maintenance/api/v2/events?site_id=<uuid>
+
+    Every (re)connect starts with a "ready" event; events missed while
+    disconnected are not replayed, so clients refetch what they show on it.
+    """
+    try:
+        subscription = events_service.subscribe(
+            site_id=request.args.get("site_id"),
+            max_streams=current_app.config["EVENTS_MAX_STREAMS"],
+        )
+    except ValueError as e:
+        return jsonify({"error": "invalid_input", "message": str(e)}), 400
+
+    if subscription is None:
+        response = jsonify({"error": "unavailable", "message": "Too many live event streams on this worker"})
+        response.headers["Retry-After"] = str(KEEPALIVE_SECONDS)
+        return response, 503
+
+    # Deliberately not stream_with_context: the stream needs no request or
+    # app context, and holding one open would pin it for the whole stream.
+    def generate():
+        try:
+            yield f"retry: {RECONNECT_MS}\n\n"
+            yield _sse_frame("ready", {"site_id": subscription.site_id})
+
+            while not subscription.overflowed:
+                event = subscription.get(timeout=KEEPALIVE_SECONDS)
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse_frame(event.get("type", "message"), event)
+        finally:
+            events_service.unsubscribe(subscription)
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -4,6 +4,8 @@ from . import bp
 from app.services import auth as auth_service
 from app.services import issues as issue_service
 from app.services import sites as site_service
+from app.services.concurrency import etag_for, expected_version_from_request
+from app.services.idempotency import idempotent
 from uuid import UUID
 
 def parse_uuid_arg(name: str):
@@ -17,6 +19,17 @@ def parse_uuid_arg(name: str):
     return v
 
 
+def parse_bool_arg(name: str):
+    value = (request.args.get(name) or "").strip().lower()
+    if value == "":
+        return None
+    if value in ("true", "1", "yes"):
+        return True
+    if value in ("false", "0", "no"):
+        return False
+    abort(400, description=f"Invalid {name}, must be true or false")
+
+
 def parse_site_arg(name: str = "site_id"):
     value = request.args.get(name)
     if value is None or value == "":
@@ -27,6 +40,19 @@ def parse_site_arg(name: str = "site_id"):
     except ValueError as exc:
         abort(400, description=str(exc))
 
+def parse_fields_arg(name: str = "fields"):
+    """Comma-separated sparse fieldset (?fields=id,title,status), or None."""
+    value = request.args.get(name)
+    if value is None or value.strip() == "":
+        return None
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+def parse_if_match(issue_id: str):
+    try:
+        return expected_version_from_request(lambda: issue_service.get_issue_version(issue_id))
+    except ValueError as exc:
+        abort(400, description=str(exc))
+
 def parse_uuid_field(data: dict, name: str, required: bool = False):
     """
     Parse a UUID from a JSON body field.
@@ -82,9 +108,13 @@ def list_issues():
         "created_from": request.args.get("created_from"),
         "created_to": request.args.get("created_to"),
         "search": request.args.get("search"),
+        "include_archived": parse_bool_arg("include_archived"),
     }
 
-    result = issue_service.list_issues(page, page_size, filters)
+    try:
+        result = issue_service.list_issues(page, page_size, filters, fields=parse_fields_arg())
+    except ValueError as exc:
+        abort(400, description=str(exc))
     return jsonify(result)
 
 @bp.route("/issues/<issue_id>", methods=["GET"])
@@ -95,19 +125,29 @@ def get_issue(issue_id):
     except ValueError:
         abort(400, description="Invalid issue_id, must be UUID")
 
-    issue = issue_service.get_issue(issue_id)
+    try:
+        issue = issue_service.get_issue(
+            issue_id,
+            include_archived=bool(parse_bool_arg("include_archived")),
+            fields=parse_fields_arg(),
+        )
+    except ValueError as exc:
+        abort(400, description=str(exc))
     if issue is None:
         abort(404, description="Issue not found")
 
-    return jsonify(issue)
+    response = jsonify(issue)
+    response.headers["ETag"] = etag_for(issue["version"])
+    return response
 
 @bp.route("/issues/<issue_id>/attachment", methods=["GET"])
 def get_issue_attachment(issue_id):
     issue_id = parse_uuid_path(issue_id, "issue_id")
 
-    row = issue_service.get_issue_attachment(issue_id)
+    row = issue_service.get_issue_attachment(issue_id, include_archived=True)
     if not row:
         abort(404, description="No attachment for this issue")
+    row = issue_service.ensure_browser_attachment(row)
 
     rel = row["filepath"]
     rel_norm = rel.replace("\\", "/")
@@ -128,6 +168,7 @@ def get_issue_attachment(issue_id):
     )
 
 @bp.route("/issues/<issue_id>/attachment", methods=["POST"])
+@idempotent
 def upload_issue_attachment(issue_id):
     issue_id = validate_uuid_path(issue_id, "issue_id")
 
@@ -172,6 +213,7 @@ def delete_attachment_content_type(content_type):
     return "", 204
 
 @bp.route("/issues", methods=["POST"])
+@idempotent
 def create_issue():
     data = request.get_json(silent=True) or {}
 
@@ -206,8 +248,10 @@ def create_issue():
     return jsonify(result), 201
 
 @bp.route("/issues/<issue_id>/actions", methods=["POST"])
+@idempotent
 def create_issue_action(issue_id):
     validate_uuid_path(issue_id, "issue_id")
+    expected_version = parse_if_match(issue_id)
 
     data = request.get_json(silent=True) or {}
 
@@ -233,18 +277,19 @@ def create_issue_action(issue_id):
     }
 
     try:
-        result = issue_service.add_issue_action(issue_id, payload)
+        result = issue_service.add_issue_action(issue_id, payload, expected_version=expected_version)
     except ValueError as e:
         abort(400, description=str(e))
 
     if result is None:
         abort(404, description="Issue not found")
 
-    return jsonify(result), 201
+    return jsonify(result), 201, {"ETag": etag_for(result["version"])}
 
 @bp.route("/issues/<issue_id>", methods=["PATCH"])
 def patch_issue(issue_id):
     validate_uuid_path(issue_id, "issue_id")
+    expected_version = parse_if_match(issue_id)
 
     data = request.get_json(silent=True) or {}
 
@@ -267,14 +312,16 @@ def patch_issue(issue_id):
     }
 
     try:
-        result = issue_service.update_issue(issue_id, payload)
+        result = issue_service.update_issue(issue_id, payload, expected_version=expected_version)
     except ValueError as e:
         abort(400, description=str(e))
 
     if result is None:
         abort(404, description="Issue not found")
 
-    return jsonify(result)
+    response = jsonify(result)
+    response.headers["ETag"] = etag_for(result["version"])
+    return response
 
 @bp.route("/issue-statuses", methods=["GET"])
 def get_issue_statuses():
@@ -0,0 +1,23 @@
+from flask import jsonify, request
+from . import bp
+from app.services import reliability as reliability_service
+
+
+@bp.route("/reliability", methods=["GET"])
+def reliability():
+    """
+    MTBF / MTTR / availability from the nightly reliability snapshot, worst first.
+    Example:
+      /maintenance/api/v2/reliability?scope=model&site_id=<uuid>&sort=availability&limit=50
+    """
+    try:
+        result = reliability_service.get_reliability_report(
+            scope=request.args.get("scope", "model"),
+            site_id=request.args.get("site_id"),
+            sort=request.args.get("sort", "availability"),
+            limit=request.args.get("limit", reliability_service.RELIABILITY_DEFAULT_LIMIT),
+        )
+    except ValueError as e:
+        return jsonify({"error": "invalid_input", "message": str(e)}), 400
+
+    return jsonify(result), 200
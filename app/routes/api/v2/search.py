@@ -0,0 +1,26 @@
+from flask import jsonify, request
+from . import bp
+from app.services import search as search_service
+
+
+@bp.route("/search", methods=["GET"])
+def search():
+    """
+    Search assets, issues and issue actions, grouped by entity.
+    Example:
+      /maintenance/api/v2/search?q=hydraulic+leak&site_id=<uuid>&types=issues,actions&limit=5
+    """
+    types_param = request.args.get("types", "")
+    types = [x.strip() for x in types_param.split(",") if x.strip()]
+
+    try:
+        result = search_service.search(
+            request.args.get("q", ""),
+            site_id=request.args.get("site_id"),
+            types=types,
+            limit=request.args.get("limit", search_service.SEARCH_DEFAULT_LIMIT),
+        )
+    except ValueError as e:
+        return jsonify({"error": "invalid_input", "message": str(e)}), 400
+
+    return jsonify(result), 200
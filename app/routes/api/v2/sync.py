@@ -0,0 +1,27 @@
+from flask import request, jsonify
+from . import bp
+from app.services import sync as sync_service
+
+
+@bp.route("/sync", methods=["GET"])
+def sync():
+    """
+    Incremental sync for clients that keep a local copy.
+    Example:
+      /maintenance/api/v2/sync                      -> {"cursor": ...} to start from
+      /maintenance/api/v2/sync?since=<cursor>&limit=500
+
+    Returns {"cursor", "has_more", "changes": [...]}; see
+    sync_service.get_changes. A cursor older than SYNC_RETENTION_DAYS gets
+    410 and the client starts over.
+    """
+    limit = request.args.get("limit", default=sync_service.SYNC_DEFAULT_LIMIT, type=int)
+
+    try:
+        result = sync_service.get_changes(since=request.args.get("since"), limit=limit)
+    except sync_service.SyncCursorExpired as e:
+        return jsonify({"error": "cursor_expired", "message": str(e)}), 410
+    except ValueError as e:
+        return jsonify({"error": "invalid_input", "message": str(e)}), 400
+
+    return jsonify(result), 200
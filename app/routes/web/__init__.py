@@ -8,3 +8,4 @@ from . import files         # noqa: F401
 from . import assets        # noqa: F401
 from . import sites         # noqa: F401
 from . import settings      # noqa: F401
+from . import reports       # noqa: F401
@@ -5,8 +5,24 @@ from . import bp as web_bp
 from uuid import UUID
 from app.services import assets as asset_service
 from app.services import lookups
+from app.services import reliability as reliability_service
 from app.services import sites as site_service
-from app.services import issues as issue_service
+
+
+# ?open_issues= on the asset list -> has_open_issues filter
+ASSET_OPEN_ISSUE_FILTERS = {
+    "": None,
+    "yes": True,
+    "no": False,
+}
+
+# ?sort= on the asset list; asset tag breaks ties so the order is stable.
+ASSET_LIST_SORTS = {
+    "": [("asset_tag", "asc")],
+    "open_issues": [("open_issue_count", "desc"), ("asset_tag", "asc")],
+    "last_issue": [("last_issue_at", "desc"), ("asset_tag", "asc")],
+    "last_status_change": [("last_status_change_at", "desc"), ("asset_tag", "asc")],
+}
 
 
 def parse_uuid_arg(name: str):
@@ -55,6 +71,8 @@ def _build_asset_filter_query_params(
     active_mode="active",
     asset_tag=None,
     include_active=False,
+    open_issues=None,
+    sort=None,
 ):
     params = {}
 
@@ -72,6 +90,10 @@ def _build_asset_filter_query_params(
         params["active"] = active_mode
     if asset_tag:
         params["asset_tag"] = asset_tag
+    if open_issues:
+        params["open_issues"] = open_issues
+    if sort:
+        params["sort"] = sort
 
     return params
 
@@ -105,6 +127,13 @@ def assets_index():
     raw_active_mode = (request.args.get("active") or request.args.get("retired") or "active").strip().lower()
     active_mode = raw_active_mode if raw_active_mode in ("active", "retired", "all") else "active"
 
+    open_issues = (request.args.get("open_issues") or "").strip().lower()
+    if open_issues not in ASSET_OPEN_ISSUE_FILTERS:
+        open_issues = ""
+    sort_key = (request.args.get("sort") or "").strip()
+    if sort_key not in ASSET_LIST_SORTS:
+        sort_key = ""
+
     categories = _normalize_uuid_rows(lookups.list_asset_categories(), "id")
     makes = _normalize_uuid_rows(
         lookups.list_makes(category_id=category_id) if category_id else lookups.list_makes(),
@@ -151,6 +180,8 @@ def assets_index():
         active_mode=active_mode,
         asset_tag=asset_tag,
         include_active="active" in request.args,
+        open_issues=request.args.get("open_issues"),
+        sort=request.args.get("sort"),
     )
     effective_params = _build_asset_filter_query_params(
         site_id=requested_site_id,
@@ -162,6 +193,8 @@ def assets_index():
         active_mode=active_mode,
         asset_tag=asset_tag,
         include_active=include_active_param,
+        open_issues=open_issues,
+        sort=sort_key,
     )
 
     # Redirect once to the cleaned query string if we dropped invalid dependent
@@ -183,14 +216,15 @@ def assets_index():
         "model_id": model_id,
         "variant_id": variant_id,
         "asset_tag": asset_tag,
+        "has_open_issues": ASSET_OPEN_ISSUE_FILTERS[open_issues],
     }
 
     result = asset_service.list_assets_service(
         filters=filters,
-        sort=[("asset_tag", "asc")],
+        sort=ASSET_LIST_SORTS[sort_key],
         page=1,
         page_size=200,
-        include=[],
+        include=["issue_summary"],
         retired_mode=active_mode,
     )
 
@@ -218,67 +252,25 @@ def assets_index():
         cur_variant_id=variant_id,
         cur_asset_tag=asset_tag or "",
         cur_active_mode=active_mode,
+        cur_open_issues=open_issues,
+        cur_sort=sort_key,
     )
 
 
+def _older_issues_url(asset_id, next_cursor):
+    if next_cursor is None:
+        return None
+    return url_for("app.asset_issue_history", asset_id=asset_id, before=next_cursor)
+
+
 @web_bp.get("/assets/<uuid:asset_id>", strict_slashes=False)
 def view_asset(asset_id):
-    asset = asset_service.get_asset_service(asset_id)
-    if asset is None:
+    detail = asset_service.get_asset_detail_service(asset_id)
+    if detail is None:
         abort(404)
 
-    issue_statuses = issue_service.list_issue_statuses()
-    issue_status_ids_by_code = {status["code"]: status["id"] for status in issue_statuses}
-    active_issue_status_ids = tuple(
-        issue_status_ids_by_code[code]
-        for code in ("OPEN", "IN_PROGRESS")
-        if code in issue_status_ids_by_code
-    )
-
-    past_issue_filters = {
-        "site_id": None,
-        "asset_id": str(asset_id),
-        "status_id": None,
-        "reported_by": None,
-        "created_from": None,
-        "created_to": None,
-        "search": None,
-        "category_id": None,
-        "make_id": None,
-        "model_id": None,
-        "variant_id": None,
-        "active_status_ids": None,
-    }
-
-    issue_result = issue_service.list_issues(
-        page=1,
-        page_size=200,
-        filters=past_issue_filters,
-    )
-
-    past_issues = issue_result["items"]
-    open_issue_count = 0
-    if len(active_issue_status_ids) == 1:
-        open_issue_result = issue_service.list_issues(
-            page=1,
-            page_size=1,
-            filters={
-                **past_issue_filters,
-                "status_id": active_issue_status_ids[0],
-            },
-        )
-        open_issue_count = open_issue_result["total"]
-    elif len(active_issue_status_ids) > 1:
-        open_issue_result = issue_service.list_issues(
-            page=1,
-            page_size=1,
-            filters={
-                **past_issue_filters,
-                "status_id": "00000000-0000-0000-0000-000000000000",
-                "active_status_ids": active_issue_status_ids,
-            },
-        )
-        open_issue_count = open_issue_result["total"]
+    asset = detail["asset"]
+    issue_history = detail["issues"]
 
     asset_edit_url = None
     for endpoint_name in ("app.edit_asset", "app.asset_edit", "app.settings_edit_asset"):
@@ -294,8 +286,10 @@ def view_asset(asset_id):
         render_template(
             "assets/specific_asset.html",
             asset=asset,
-            past_issues=past_issues,
-            open_issue_count=open_issue_count,
+            past_issues=issue_history["items"],
+            older_issues_url=_older_issues_url(asset["asset_id"], issue_history["next_cursor"]),
+            open_issue_count=detail["issue_counts"]["open"],
+            asset_reliability=reliability_service.get_asset_reliability(asset["asset_id"]),
             open_issues_url=_build_external_issue_list_url(asset_tag=asset.get("asset_tag")),
             asset_edit_url=asset_edit_url,
             asset_qr_image_url=url_for("api_v2.get_asset_qr_png", asset_id=asset["asset_id"]),
@@ -310,3 +304,22 @@ def view_asset(asset_id):
         site_service.set_preferred_site_cookie(response, asset_site_code)
 
     return response
+
+
+@web_bp.get("/assets/<uuid:asset_id>/issues", strict_slashes=False)
+def asset_issue_history(asset_id):
+    """HTML fragment with the next page of past issues for the asset page."""
+    try:
+        issue_history = asset_service.list_asset_issue_history_service(
+            asset_id,
+            before=request.args.get("before"),
+            limit=request.args.get("limit", asset_service.ASSET_ISSUE_HISTORY_PAGE_SIZE),
+        )
+    except ValueError as exc:
+        abort(400, description=str(exc))
+
+    return render_template(
+        "assets/_issue_history_rows.html",
+        past_issues=issue_history["items"],
+        older_issues_url=_older_issues_url(asset_id, issue_history["next_cursor"]),
+    )
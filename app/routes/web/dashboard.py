@@ -1,12 +1,16 @@
 from flask import render_template, url_for
 
+from app.services import sites as site_service
+
 from . import bp as web_bp
 
 
 @web_bp.get("/", strict_slashes=False)
 @web_bp.get("/dashboard", strict_slashes=False)
 def dashboard():
+    current_site = site_service.get_current_site() or {}
     return render_template(
         "dashboard/index.html",
         api_dashboard_url=url_for("api_v2.dashboard_data"),
+        api_events_url=url_for("api_v2.events", site_id=current_site.get("id")),
     )
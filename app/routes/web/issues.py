@@ -7,6 +7,7 @@ from app.services import assets as asset_service
 from app.services import issues as issue_service
 from app.services import lookups
 from app.services import sites as site_service
+from app.services.concurrency import VersionConflict
 
 
 def parse_uuid_arg(name: str):
@@ -198,13 +199,16 @@ def issues_list():
         cur_variant_id=variant_id,
         category_options=lookups.list_asset_categories(),
         make_options=lookups.list_makes(),
+        api_events_url=url_for("api_v2.events", site_id=site_id),
     )
 
 
 @bp.route("/issues/<issue_id>")
 @bp.route("/issues/<issue_id>/")
 def view_issue(issue_id):
-    issue = issue_service.get_issue(issue_id)
+    # Links to old issues (asset history, search, bookmarks) keep working
+    # after the issue has been archived.
+    issue = issue_service.get_issue(issue_id, include_archived=True)
     if issue is None:
         abort(404)
 
@@ -260,6 +264,14 @@ def add_issue_action(issue_id):
         if issue is None:
             abort(404)
         return _render_issue_detail(issue=issue, form_error=str(exc)), 400
+    except VersionConflict:
+        issue = issue_service.get_issue(issue_id)
+        if issue is None:
+            abort(404)
+        return _render_issue_detail(
+            issue=issue,
+            form_error="This issue is being updated by someone else. Check its status and submit again.",
+        ), 409
 
     if result is None:
         abort(404)
@@ -0,0 +1,60 @@
+from flask import abort, render_template, request
+
+from app.services import reliability as reliability_service
+from app.services import sites as site_service
+
+from . import bp as web_bp
+
+
+# ?scope= tabs on the reliability report
+RELIABILITY_SCOPE_LABELS = {
+    "site": "Sites",
+    "model": "Models",
+    "asset": "Assets",
+}
+
+RELIABILITY_SORT_LABELS = {
+    "availability": "Lowest availability",
+    "mtbf": "Shortest MTBF",
+    "mttr": "Longest MTTR",
+    "failures": "Most failures",
+}
+
+
+def parse_site_filter_arg(name: str = "site_id"):
+    if name not in request.args:
+        return False, None
+
+    raw_value = (request.args.get(name) or "").strip()
+    if not raw_value:
+        return True, None
+
+    try:
+        return True, site_service.validate_site_id(raw_value, required=True, field_name=name)
+    except ValueError as exc:
+        abort(400, description=str(exc))
+
+
+@web_bp.get("/reports/reliability", strict_slashes=False)
+def reliability_report():
+    scope = (request.args.get("scope") or "model").strip().lower()
+    sort = (request.args.get("sort") or "availability").strip().lower()
+    if scope not in RELIABILITY_SCOPE_LABELS or sort not in RELIABILITY_SORT_LABELS:
+        abort(400, description="Invalid scope or sort")
+
+    site_filter_was_explicit, requested_site_id = parse_site_filter_arg("site_id")
+    current_site = site_service.get_current_site()
+    site_id = requested_site_id if site_filter_was_explicit else ((current_site or {}).get("id"))
+
+    report = reliability_service.get_reliability_report(scope=scope, site_id=site_id, sort=sort)
+
+    return render_template(
+        "reports/reliability.html",
+        report=report,
+        items=report["items"],
+        cur_scope=scope,
+        cur_sort=sort,
+        cur_site_id=site_id,
+        scope_labels=RELIABILITY_SCOPE_LABELS,
+        sort_labels=RELIABILITY_SORT_LABELS,
+    )
@@ -711,3 +711,120 @@ def settings_issues():
         **_success_context(),
     )
     return response, status_code
+
+
+def _bulk_asset_filters(source) -> dict:
+    filters = {}
+    for field_name in ("site_id", "category_id", "status_id"):
+        try:
+            value = _normalize_uuid_text(source.get(field_name), field_name)
+        except ValueError:
+            value = None
+        if value:
+            filters[field_name] = value
+    return filters
+
+
+@web_bp.route("/settings/assets/bulk", methods=["GET", "POST"], strict_slashes=False)
+def settings_bulk_assets():
+    filters = _bulk_asset_filters(request.values)
+    form_values = {
+        "action": "move",
+        "scope": "selected",
+        "target_site_id": "",
+        "target_status_id": "",
+        "retire_reason": "",
+    }
+    selected_ids = None
+
+    form_error = None
+    status_code = 200
+
+    if request.method == "POST":
+        form_values.update(
+            {
+                "action": _clean_form_value("action", "move"),
+                "scope": _clean_form_value("scope", "selected"),
+                "target_site_id": _clean_form_value("target_site_id"),
+                "target_status_id": _clean_form_value("target_status_id"),
+                "retire_reason": _clean_form_value("retire_reason"),
+            }
+        )
+        selected_ids = [value for value in request.form.getlist("asset_ids") if value.strip()]
+
+        if not _settings_unlocked():
+            form_error = "Unlock settings before changing assets in bulk."
+            status_code = 403
+        elif form_values["scope"] != "filter" and not selected_ids:
+            form_error = "Select at least one asset, or apply the change to every matching asset."
+            status_code = 400
+        else:
+            payload = {
+                "action": form_values["action"],
+                "site_id": form_values["target_site_id"] or None,
+                "status_id": form_values["target_status_id"] or None,
+                "retire_reason": form_values["retire_reason"],
+            }
+            if form_values["scope"] == "filter":
+                payload["filter"] = filters
+            else:
+                payload["asset_ids"] = selected_ids
+
+            try:
+                summary = asset_service.bulk_update_assets_service(payload)
+                return redirect(
+                    url_for(
+                        "app.settings_bulk_assets",
+                        updated="1",
+                        matched=summary["matched"],
+                        changed=summary["updated"],
+                        **filters,
+                    )
+                )
+            except ValueError as exc:
+                form_error = str(exc)
+                status_code = 400
+
+    site_options = site_service.list_sites()
+    category_options = lookups.list_asset_categories()
+    status_options = asset_service.list_asset_statuses()
+
+    result = asset_service.list_assets_service(
+        filters=filters,
+        sort=[("asset_tag", "asc")],
+        page=1,
+        page_size=200,
+        include=[],
+        retired_mode="active",
+    )
+    assets = []
+    for row in result["items"]:
+        item = dict(row)
+        for field_name in ("asset_id", "site_id", "status_id"):
+            if item.get(field_name) is not None:
+                item[field_name] = str(item[field_name])
+        assets.append(item)
+    if selected_ids is None:
+        selected_ids = [asset["asset_id"] for asset in assets]
+
+    response = _render_settings(
+        "settings/assets_bulk.html",
+        active_tab="assets_bulk",
+        form_error=form_error,
+        form_values=form_values,
+        filters=filters,
+        assets=assets,
+        total_assets=result["total"],
+        selected_ids=set(selected_ids),
+        summary={
+            "matched": request.args.get("matched", type=int),
+            "changed": request.args.get("changed", type=int),
+        },
+        site_options=site_options,
+        category_options=category_options,
+        status_options=status_options,
+        site_by_id={site["id"]: site for site in site_options},
+        status_by_id={status["id"]: status for status in status_options},
+        **_success_context(),
+    )
+    return response, status_code
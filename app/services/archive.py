@@ -0,0 +1,80 @@
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from app.db import archive as archive_db
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_AFTER_DAYS = 180
+DEFAULT_ARCHIVE_BATCH_SIZE = 500
+
+
+def archive_settings() -> dict:
+    """Archive window and batch size from the environment."""
+    return {
+        "after_days": int(os.environ.get("ISSUE_ARCHIVE_AFTER_DAYS", DEFAULT_ARCHIVE_AFTER_DAYS)),
+        "batch_size": int(os.environ.get("ISSUE_ARCHIVE_BATCH_SIZE", DEFAULT_ARCHIVE_BATCH_SIZE)),
+    }
+
+
+def archive_cutoff(after_days: int, now: datetime | None = None) -> datetime:
+    if after_days < 0:
+        raise ValueError("after_days must be zero or more")
+    return (now or datetime.now(timezone.utc)) - timedelta(days=after_days)
+
+
+def count_archivable_issues(after_days: int) -> int:
+    return archive_db.count_archivable_issue_rows(archive_cutoff(after_days))
+
+
+def archive_closed_issues(after_days: int, *, batch_size: int, max_batches: int | None = None) -> dict:
+    """
+    Move issues closed more than `after_days` ago into the archive tables,
+    `batch_size` issues per transaction, until none are left (or
+    `max_batches` batches have run).
+
+    Every batch commits on its own, so the run can be stopped at any point
+    and started again later: it carries on with whatever is still live.
+    The cutoff is fixed when the run starts.
+
+    Returns:
+        {"cutoff": datetime, "batches": n, "issues": n, "actions": n,
+         "status_history": n, "attachments": n, "took_s": 1.2}
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    cutoff = archive_cutoff(after_days)
+    totals = {"issues": 0, "actions": 0, "status_history": 0, "attachments": 0}
+    batches = 0
+    started = perf_counter()
+
+    while max_batches is None or batches < max_batches:
+        moved = archive_db.archive_closed_issue_batch(cutoff, batch_size=batch_size)
+        if moved["issues"] == 0:
+            break
+
+        batches += 1
+        for key, value in moved.items():
+            totals[key] += value
+        logger.info(
+            "archive batch %s: %s issues, %s actions, %s status changes, %s attachments",
+            batches,
+            moved["issues"],
+            moved["actions"],
+            moved["status_history"],
+            moved["attachments"],
+        )
+
+        if moved["issues"] < batch_size:
+            break
+
+    return {
+        "cutoff": cutoff,
+        "batches": batches,
+        **totals,
+        "took_s": round(perf_counter() - started, 2),
+    }
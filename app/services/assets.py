@@ -1,16 +1,33 @@
+import hashlib
 import io
+import os
+from datetime import datetime
 from flask import current_app
-import qrcode
 from app.db import assets as assets_repo
 from uuid import UUID
 from sqlalchemy.exc import IntegrityError
 
+from app.services import jobs as job_service
 from app.services import lookups
+from app.services.concurrency import VersionConflict
 from app.services import sites as site_service
+from app.services.request_cache import invalidates_request_cache, memoize_for_request
 
 DEFAULT_PUBLIC_BASE_URL = "http://server2-ubuntu"
 QR_BOX_SIZE = 8
 QR_BORDER = 4
+ASSET_ISSUE_HISTORY_PAGE_SIZE = 20
+ASSET_SEARCH_DEFAULT_LIMIT = 10
+ASSET_SEARCH_MAX_LIMIT = 25
+ASSET_SEARCH_MAX_TERM_LENGTH = 64
+ASSET_BULK_MAX_ASSETS = 1000
+ASSET_LOOKUP_MAX_KEYS = 5000
+ASSET_INCLUDES = ("site", "category", "status", "variant")
+ASSET_BULK_ACTIONS = ("move", "set_status", "retire")
+ASSET_BULK_FILTER_FIELDS = ("site_id", "category_id", "status_id", "make_id", "model_id", "variant_id")
+
+# Background job kind handled here (see app/services/jobs.py).
+QR_RENDER_JOB = "asset.render_qr"
 
 def _parse_uuid_field(payload, field_name: str, required: bool = True):
     value = payload.get(field_name)
@@ -67,6 +84,9 @@ def _get_public_base_url() -> str:
 
 
 def _build_qr_png_bytes(payload: str) -> bytes:
+    # qrcode pulls in PIL; only the QR endpoints need it, so load on first use.
+    import qrcode
+
     qr = qrcode.QRCode(
         version=None,
         error_correction=qrcode.constants.ERROR_CORRECT_M,
@@ -147,6 +167,7 @@ def _serialize_asset_row(row: dict | None) -> dict | None:
     return asset
 
 
+@memoize_for_request
 def get_asset(asset_id, include=None):
     if include is None:
         include = []
@@ -155,6 +176,7 @@ def get_asset(asset_id, include=None):
     return _serialize_asset_row(row)
 
 
+@memoize_for_request
 def get_asset_by_tag(asset_tag: str):
     tag = (asset_tag or "").strip()
     if not tag:
@@ -164,6 +186,109 @@ def get_asset_by_tag(asset_tag: str):
     return _serialize_asset_row(row)
 
 
+def _normalize_lookup_keys(payload: dict, field_name: str) -> list[str]:
+    values = payload.get(field_name)
+    if values is None:
+        return []
+    if not isinstance(values, list):
+        raise ValueError(f"{field_name} must be a list")
+
+    keys = []
+    for value in values:
+        if field_name == "asset_ids":
+            keys.append(_normalize_uuid_value(value, field_name))
+            continue
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"{field_name} must only contain non-empty strings")
+        keys.append(value.strip())
+    # Scanners read the same code twice; keep the first occurrence.
+    return list(dict.fromkeys(keys))
+
+
+def lookup_assets_service(payload: dict) -> dict:
+    """
+    Resolve a batch of scanned asset tags and/or asset ids in one query, for
+    stocktakes and QR audits.
+
+    Payload:
+      - asset_tags: list of tags (exact match)
+      - asset_ids: list of asset UUIDs
+      - site_id (optional): the site being audited; found assets recorded
+        at another site are listed under site_mismatches
+
+    At most ASSET_LOOKUP_MAX_KEYS tags and ids together per request.
+
+    Returns:
+        {
+          "found": [{asset_id, asset_tag, site_id, site_shorthand, status_id,
+                     status_code, status_label, retired}, ...],
+          "missing": {"asset_tags": [...], "asset_ids": [...]},
+          "site_id": expected site or None,
+          "site_mismatches": [{asset_id, asset_tag, site_id, site_shorthand}, ...],
+          "counts": {"requested", "found", "missing", "site_mismatches"},
+        }
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object")
+
+    asset_tags = _normalize_lookup_keys(payload, "asset_tags")
+    asset_ids = _normalize_lookup_keys(payload, "asset_ids")
+    requested = len(asset_tags) + len(asset_ids)
+    if requested == 0:
+        raise ValueError("Provide asset_tags and/or asset_ids")
+    if requested > ASSET_LOOKUP_MAX_KEYS:
+        raise ValueError(f"At most {ASSET_LOOKUP_MAX_KEYS} asset_tags and asset_ids per lookup")
+
+    expected_site_id = site_service.validate_site_id(payload.get("site_id"), required=False, field_name="site_id")
+
+    rows = assets_repo.lookup_asset_rows(asset_tags=asset_tags, asset_ids=asset_ids)
+
+    found = []
+    site_mismatches = []
+    for row in rows:
+        item = {
+            "asset_id": str(row["id"]),
+            "asset_tag": row["asset_tag"],
+            "site_id": str(row["site_id"]),
+            "site_shorthand": row["site_shorthand"],
+            "status_id": str(row["status_id"]),
+            "status_code": row["status_code"],
+            "status_label": row["status_label"],
+            "retired": row["retired_at"] is not None,
+        }
+        found.append(item)
+        if expected_site_id is not None and item["site_id"] != expected_site_id:
+            site_mismatches.append(
+                {
+                    "asset_id": item["asset_id"],
+                    "asset_tag": item["asset_tag"],
+                    "site_id": item["site_id"],
+                    "site_shorthand": item["site_shorthand"],
+                }
+            )
+
+    found_tags = {item["asset_tag"] for item in found}
+    found_ids = {item["asset_id"] for item in found}
+    missing = {
+        "asset_tags": [tag for tag in asset_tags if tag not in found_tags],
+        "asset_ids": [asset_id for asset_id in asset_ids if asset_id not in found_ids],
+    }
+
+    return {
+        "found": found,
+        "missing": missing,
+        "site_id": expected_site_id,
+        "site_mismatches": site_mismatches,
+        "counts": {
+            "requested": requested,
+            "found": len(found),
+            "missing": len(missing["asset_tags"]) + len(missing["asset_ids"]),
+            "site_mismatches": len(site_mismatches),
+        },
+    }
+
+
+@memoize_for_request
 def list_asset_statuses():
     rows = assets_repo.list_asset_status_rows()
     items = []
@@ -179,6 +304,7 @@ def list_asset_statuses():
     return items
 
 
+@memoize_for_request
 def get_asset_status(status_id):
     normalized_status_id = _normalize_uuid_value(status_id, "status_id", required=True)
     row = assets_repo.get_asset_status_row(normalized_status_id)
@@ -193,49 +319,72 @@ def get_asset_status(status_id):
     }
 
 
-def set_asset_status(asset_id: str, to_status_id: str, changed_by: str | None = None):
+@invalidates_request_cache
+def set_asset_status(asset_id: str, to_status_id: str, changed_by: str | None = None, fields: dict | None = None):
+    """
+    Move an asset to `to_status_id`, writing the status history row when it
+    actually changes. One statement (see transition_asset_status_row); any
+    `fields` ({column_name: value}) are set in the same update.
+    """
     normalized_asset_id = _normalize_uuid_value(asset_id, "asset_id", required=True)
     normalized_to_status_id = _normalize_uuid_value(to_status_id, "to_status_id", required=True)
 
-    asset = assets_repo.get_asset_row(normalized_asset_id)
-    if asset is None:
-        raise ValueError("Unknown asset_id")
-
-    if assets_repo.get_asset_status_row(normalized_to_status_id) is None:
-        raise ValueError("Unknown to_status_id")
-
-    current_status_id = assets_repo.get_asset_status_id(normalized_asset_id)
-    normalized_from_status_id = None if current_status_id is None else str(current_status_id)
-
-    if normalized_from_status_id == normalized_to_status_id:
-        return {
-            "asset_id": normalized_asset_id,
-            "changed": False,
-            "from_status_id": normalized_from_status_id,
-            "to_status_id": normalized_to_status_id,
-        }
-
-    updated = assets_repo.update_asset_row(
-        asset_id=normalized_asset_id,
-        fields={"status_id": normalized_to_status_id},
-    )
-    if updated is None:
-        raise ValueError("Unknown asset_id")
-
-    assets_repo.create_asset_status_history_row(
-        asset_id=normalized_asset_id,
-        from_status_id=normalized_from_status_id,
-        to_status_id=normalized_to_status_id,
+    result = assets_repo.transition_asset_status_row(
+        normalized_asset_id,
+        normalized_to_status_id,
         changed_by=_normalize_changed_by(changed_by),
+        fields=fields,
     )
+    if not result["asset_found"]:
+        raise ValueError("Unknown asset_id")
+    if not result["status_found"]:
+        raise ValueError("Unknown to_status_id")
 
+    from_status_id = result["from_status_id"]
     return {
         "asset_id": normalized_asset_id,
-        "changed": True,
-        "from_status_id": normalized_from_status_id,
+        "changed": result["changed"],
+        "from_status_id": None if from_status_id is None else str(from_status_id),
         "to_status_id": normalized_to_status_id,
     }
 
+def _attach_asset_includes(items: list[dict], include) -> None:
+    """
+    Attach the nested objects named in `include` ("site", "category",
+    "status", "variant") to serialized assets, in place.
+
+    Each entity type is resolved once for the whole batch: sites from the
+    site catalog, categories and statuses from their (request-memoized) full
+    lists, variants with one query over the distinct variant ids. Unknown
+    include names are ignored.
+    """
+    include_set = set(include or [])
+    if not items or not include_set & set(ASSET_INCLUDES):
+        return
+
+    if "site" in include_set:
+        for item in items:
+            item["site"] = site_service.get_site(item.get("site_id"))
+
+    if "category" in include_set:
+        category_by_id = {category["id"]: category for category in lookups.list_asset_categories()}
+        for item in items:
+            item["category"] = category_by_id.get(item.get("category_id"))
+
+    if "status" in include_set:
+        status_by_id = {status["id"]: status for status in list_asset_statuses()}
+        for item in items:
+            item["status"] = status_by_id.get(item.get("status_id"))
+
+    if "variant" in include_set:
+        variant_by_id = lookups.get_variants_by_ids(
+            [item["variant_id"] for item in items if item.get("variant_id")]
+        )
+        for item in items:
+            item["variant"] = variant_by_id.get(item.get("variant_id"))
+
+
+@memoize_for_request
 def get_asset_service(asset_id, include=None):
     """
     Get a single asset by id, with optional expansions.
@@ -255,27 +404,112 @@ def get_asset_service(asset_id, include=None):
     if asset is None:
         return None
 
-    # --- Includes (commented out until db.lookups ready) ---
-
-    # if "site" in include_set and asset.get("site_id") is not None:
-    #     site = lookups_repo.get_site_row(asset["site_id"])
-    #     asset["site"] = site
-    #
-    # if "category" in include_set and asset.get("category_id") is not None:
-    #     category = lookups_repo.get_category_row(asset["category_id"])
-    #     asset["category"] = category
-    #
-    # if "status" in include_set and asset.get("status_id") is not None:
-    #     status = lookups_repo.get_asset_status_row(asset["status_id"])
-    #     asset["status"] = status
-    #
-    # if "variant" in include_set and asset.get("variant_id") is not None:
-    #     variant = lookups_repo.get_variant_row(asset["variant_id"])
-    #     asset["variant"] = variant
-
+    _attach_asset_includes([asset], include)
     return asset
 
 
+def _encode_issue_history_cursor(row: dict) -> str:
+    return f"{row['issue_created_at'].isoformat()},{row['issue_id']}"
+
+
+def _decode_issue_history_cursor(cursor: str | None):
+    if cursor is None or str(cursor).strip() == "":
+        return None
+
+    created_at, _, issue_id = str(cursor).strip().rpartition(",")
+    try:
+        return datetime.fromisoformat(created_at), str(UUID(issue_id))
+    except ValueError:
+        raise ValueError("Invalid before cursor") from None
+
+
+def _serialize_issue_history_row(row: dict) -> dict:
+    # Same shape as the items from issues.list_issues, minus the asset block.
+    return {
+        "id": str(row["issue_id"]),
+        "title": row["issue_title"],
+        "status": {
+            "id": str(row["issue_status_id"]),
+            "code": row["issue_status_code"],
+            "label": row["issue_status_label"],
+        },
+        "reported_by": row["issue_reported_by"],
+        "created_at": row["issue_created_at"],
+        "closed_at": row["issue_closed_at"],
+    }
+
+
+def _issue_history_page(rows: list[dict], limit: int) -> dict:
+    # Callers fetch limit + 1 rows; the extra one only says "there is more".
+    page_rows = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and page_rows:
+        next_cursor = _encode_issue_history_cursor(page_rows[-1])
+
+    return {
+        "items": [_serialize_issue_history_row(row) for row in page_rows],
+        "next_cursor": next_cursor,
+    }
+
+
+def _normalize_history_limit(limit) -> int:
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer") from None
+    if limit < 1 or limit > 200:
+        raise ValueError("limit must be between 1 and 200")
+    return limit
+
+
+@memoize_for_request
+def get_asset_detail_service(asset_id, history_limit: int = ASSET_ISSUE_HISTORY_PAGE_SIZE):
+    """
+    Asset page loader: the asset, its issue counts and the first page of its
+    issue history, fetched in a single query.
+
+    Returns:
+        None if the asset doesn't exist, otherwise
+        {
+          "asset": {...},  # same shape as get_asset()
+          "issue_counts": {"total": 7, "open": 2, "by_status": {"OPEN": 1, "IN_PROGRESS": 1, "CLOSED": 5}},
+          "issues": {"items": [...], "next_cursor": "2025-01-31T10:00:00+00:00,<uuid>" | None},
+        }
+    """
+    normalized_asset_id = _normalize_uuid_value(asset_id, "asset_id", required=True)
+    history_limit = _normalize_history_limit(history_limit)
+
+    detail = assets_repo.get_asset_detail_rows(normalized_asset_id, history_limit=history_limit + 1)
+    if detail is None:
+        return None
+
+    return {
+        "asset": _serialize_asset_row(detail["asset"]),
+        "issue_counts": detail["issue_counts"],
+        "issues": _issue_history_page(detail["issues"], history_limit),
+    }
+
+
+@memoize_for_request
+def list_asset_issue_history_service(asset_id, before=None, limit: int = ASSET_ISSUE_HISTORY_PAGE_SIZE):
+    """
+    Older issues for the asset page, newest first. `before` is the
+    next_cursor from get_asset_detail_service or a previous page.
+
+    Raises:
+        ValueError: bad asset_id, cursor or limit.
+    """
+    normalized_asset_id = _normalize_uuid_value(asset_id, "asset_id", required=True)
+    limit = _normalize_history_limit(limit)
+
+    rows = assets_repo.list_asset_issue_history_rows(
+        normalized_asset_id,
+        limit=limit + 1,
+        before=_decode_issue_history_cursor(before),
+    )
+    return _issue_history_page(rows, limit)
+
+
 def get_asset_qr_target_url_service(asset_id) -> str | None:
     asset = get_asset_service(asset_id)
     if asset is None:
@@ -284,13 +518,55 @@ def get_asset_qr_target_url_service(asset_id) -> str | None:
     return f"{_get_public_base_url()}/maintenance/assets/{asset['asset_id']}"
 
 
+def _qr_cache_path(target_url: str) -> str:
+    # Keyed by the encoded URL, so a new MAINTENANCE_PUBLIC_BASE_URL simply
+    # misses the old images.
+    digest = hashlib.sha256(target_url.encode("utf-8")).hexdigest()[:32]
+    attachment_root = current_app.config.get("ATTACHMENT_ROOT", "/tmp/attachments")
+    return os.path.join(attachment_root, "qr", f"{digest}.png")
+
+
+def _store_qr_png(target_url: str) -> bytes:
+    png = job_service.run_cpu_bound(_build_qr_png_bytes, target_url)
+    path = _qr_cache_path(target_url)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(png)
+    os.replace(tmp_path, path)
+    return png
+
+
+def render_asset_qr(payload: dict) -> None:
+    """Job handler: pre-render an asset's QR code PNG into the on-disk cache."""
+    target_url = get_asset_qr_target_url_service(payload["asset_id"])
+    if target_url is None or os.path.isfile(_qr_cache_path(target_url)):
+        return
+    _store_qr_png(target_url)
+
+
 def get_asset_qr_png_service(asset_id) -> bytes | None:
+    """
+    QR code PNG for an asset. New assets have theirs rendered ahead by the
+    job queue; anything not cached yet is rendered once here and kept.
+    """
     target_url = get_asset_qr_target_url_service(asset_id)
     if target_url is None:
         return None
 
-    return _build_qr_png_bytes(target_url)
+    try:
+        with open(_qr_cache_path(target_url), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
 
+    try:
+        return _store_qr_png(target_url)
+    except OSError:
+        # Read-only or full attachment disk: still answer the request.
+        return job_service.run_cpu_bound(_build_qr_png_bytes, target_url)
+
+@memoize_for_request
 def list_assets_service(
     filters,
     sort,
@@ -298,6 +574,7 @@ def list_assets_service(
     page_size,
     include=None,
     retired_mode: str = "active",
+    fields=None,
     ):
     """
     List assets with filters/sorting/pagination and optional expansions.
@@ -312,6 +589,7 @@ def list_assets_service(
                    "model_id": None,
                    "variant_id": None,
                    "asset_tag": None,
+                   "has_open_issues": True,
                  }
                  All keys are optional; missing/None = no filter.
 
@@ -321,8 +599,17 @@ def list_assets_service(
 
         page: 1-based page number (int)
         page_size: number of items per page (int)
-        include: iterable of include strings, e.g. ["site", "category"]
+        include: iterable of include strings, e.g. ["site", "category"].
+                 "site", "category", "status" and "variant" nest the related
+                 record under that key, resolved once per page (no per-row
+                 queries). "issue_summary" adds open_issue_count,
+                 last_issue_at and last_status_change_at to every item.
         retired_mode: view asset based on active statuses, e.g., ["active" (only), "retired" (only), all]
+        fields: optional subset of the asset columns
+                (assets_repo.ASSET_LIST_FIELD_COLUMNS) to select and return;
+                id/asset_id always are, nothing else is. Includes still
+                work (their ids are selected as needed, then dropped).
+                ValueError for an unknown field.
 
     Returns:
         dict:
@@ -337,6 +624,17 @@ def list_assets_service(
     if include is None:
         include = []
 
+    columns = None
+    if fields is not None:
+        fields = [name.strip() for name in fields if name and name.strip()]
+        unknown = [name for name in fields if name != "asset_id" and name not in assets_repo.ASSET_LIST_FIELD_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown field: {unknown[0]}")
+        fields = [name for name in fields if name != "asset_id"]
+        # Nested includes are looked up by the asset's <name>_id column.
+        include_ids = [f"{name}_id" for name in ASSET_INCLUDES if name in include]
+        columns = list(dict.fromkeys([*fields, *include_ids]))
+
     # Translate page/page_size into limit/offset for L3
     if page < 1:
         page = 1
@@ -359,18 +657,22 @@ def list_assets_service(
         limit=limit,
         offset=offset,
         retired_mode=retired_mode,
+        with_issue_summary="issue_summary" in include,
+        has_open_issues=filters.get("has_open_issues"),
+        fields=columns,
     )
 
-    # For now, we just return the rows as-is.
-    # Later we can add include expansions similar to get_asset_service.
     items = [_serialize_asset_row(row) for row in rows]
-
-
-    # --- Includes (optional future step) ---
-    # If you want "include=site,category" for lists too, this is where you'd:
-    #  - collect all site_ids/category_ids from items
-    #  - call lookups_repo.get_sites_by_ids(site_ids)
-    #  - attach site/category dicts onto each item
+    _attach_asset_includes(items, include)
+    if columns is not None:
+        # Only what was asked for: not the include ids, nor the issue summary
+        # that has_open_issues or an issue-summary sort pulls into the row.
+        wanted = {"id", "asset_id", *fields, *(name for name in ASSET_INCLUDES if name in include)}
+        if "issue_summary" in include:
+            wanted.update(assets_repo.ASSET_ISSUE_SUMMARY_COLUMNS)
+        for item in items:
+            for field_name in set(item) - wanted:
+                del item[field_name]
 
     return {
         "items": items,
@@ -379,6 +681,46 @@ def list_assets_service(
         "total": total,
     }
 
+@memoize_for_request
+def search_assets_service(q, site_id=None, limit=ASSET_SEARCH_DEFAULT_LIMIT, include_retired: bool = False) -> list[dict]:
+    """
+    Typeahead search for the asset picker: prefix and fuzzy matching over
+    tag, serial number and make/model/variant labels, best match first.
+
+    Returns:
+        list of asset dicts (get_asset() shape plus "rank"); empty for a
+        blank query.
+
+    Raises:
+        ValueError: bad site_id or limit.
+    """
+    term = " ".join(str(q or "").split())[:ASSET_SEARCH_MAX_TERM_LENGTH]
+    if not term:
+        return []
+
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer") from None
+    if limit < 1 or limit > ASSET_SEARCH_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {ASSET_SEARCH_MAX_LIMIT}")
+
+    rows = assets_repo.search_asset_rows(
+        term,
+        site_id=site_service.validate_site_id(site_id),
+        limit=limit,
+        include_retired=include_retired,
+    )
+
+    items = []
+    for row in rows:
+        item = _serialize_asset_row(row)
+        item["rank"] = round(item["rank"], 3)
+        items.append(item)
+    return items
+
+
+@invalidates_request_cache
 def create_asset_service(payload: dict) -> dict:
     """
     Create a new asset.
@@ -430,9 +772,11 @@ def create_asset_service(payload: dict) -> dict:
     except IntegrityError as exc:
         raise ValueError("Unable to create asset with the supplied values") from exc
 
+    job_service.enqueue(QR_RENDER_JOB, {"asset_id": str(row["id"])}, dedup_key=str(row["id"]))
     return row
 
 
+@invalidates_request_cache
 def update_asset_for_settings_service(asset_id, payload: dict) -> dict | None:
     normalized_asset_id = _normalize_uuid_value(asset_id, "asset_id", required=True)
     existing_asset = get_asset_service(normalized_asset_id)
@@ -473,19 +817,24 @@ def update_asset_for_settings_service(asset_id, payload: dict) -> dict | None:
         "variant_id": variant_id,
     }
 
-    row = assets_repo.update_asset_row(asset_id=normalized_asset_id, fields=update_fields)
-    if row is None:
-        return None
-
     set_asset_status(
         asset_id=normalized_asset_id,
         to_status_id=status_id,
         changed_by=payload.get("changed_by"),
+        fields=update_fields,
     )
 
     return get_asset_service(normalized_asset_id)
 
-def patch_asset_service(asset_id: UUID, payload: dict) -> dict | None:
+
+def get_asset_version(asset_id) -> int | None:
+    """The asset's current row version (its ETag), or None if it doesn't exist."""
+    row = assets_repo.get_asset_row(str(asset_id))
+    return None if row is None else row["version"]
+
+
+@invalidates_request_cache
+def patch_asset_service(asset_id: UUID, payload: dict, expected_version: int | None = None) -> dict | None:
     """
     Partially update an asset.
 
@@ -499,6 +848,11 @@ def patch_asset_service(asset_id: UUID, payload: dict) -> dict | None:
       - acquired_at (ISO datetime string)
       - retired_at (ISO datetime string)
       - retire_reason (str)
+
+    Fields and a status change are written in one statement (through
+    transition_asset_status_row when the status is in the payload). With
+    expected_version (If-Match) the asset must still be at that version,
+    otherwise VersionConflict is raised and nothing is written.
     """
 
     update_fields: dict[str, object] = {}
@@ -554,25 +908,38 @@ def patch_asset_service(asset_id: UUID, payload: dict) -> dict | None:
 
     normalized_asset_id = str(asset_id)
 
-    if update_fields:
-        row = assets_repo.update_asset_row(asset_id=asset_id, fields=update_fields)
-        if row is None:
+    if requested_status_id is not None:
+        result = assets_repo.transition_asset_status_row(
+            normalized_asset_id,
+            requested_status_id,
+            changed_by=_normalize_changed_by(payload.get("changed_by")),
+            fields=update_fields,
+            expected_version=expected_version,
+        )
+        if not result["asset_found"]:
             return None
+        if not result["status_found"]:
+            raise ValueError("Unknown status_id")
+        if not result["applied"]:
+            raise VersionConflict(get_asset_version(normalized_asset_id))
     else:
-        row = assets_repo.get_asset_row(normalized_asset_id)
-        if row is None:
-            return None
-
-    if "status_id" in payload:
-        set_asset_status(
+        row = assets_repo.update_asset_row(
             asset_id=normalized_asset_id,
-            to_status_id=requested_status_id,
-            changed_by=payload.get("changed_by"),
+            fields=update_fields,
+            expected_version=expected_version,
         )
+        if row is None:
+            if expected_version is None:
+                return None
+            current_version = get_asset_version(normalized_asset_id)
+            if current_version is None:
+                return None
+            raise VersionConflict(current_version)
 
     return get_asset_service(normalized_asset_id)
 
 
+@invalidates_request_cache
 def delete_asset_service(asset_id) -> bool:
     normalized_asset_id = _normalize_uuid_value(asset_id, "asset_id", required=True)
     if assets_repo.get_asset_row(normalized_asset_id) is None:
@@ -583,6 +950,7 @@ def delete_asset_service(asset_id) -> bool:
     except IntegrityError as exc:
         raise ValueError("Asset cannot be deleted because it is in use") from exc
 
+@invalidates_request_cache
 def retire_asset_service(asset_id: UUID, retire_reason: str | None = None) -> bool:
     """
     Mark an asset as retired.
@@ -593,3 +961,109 @@ def retire_asset_service(asset_id: UUID, retire_reason: str | None = None) -> bo
     """
     row = assets_repo.retire_asset_row(asset_id=asset_id, retire_reason=retire_reason)
     return row is not None
+
+
+def _normalize_bulk_selection(payload: dict) -> tuple[list[str] | None, dict | None]:
+    asset_ids = payload.get("asset_ids")
+    filters = payload.get("filter")
+    if (asset_ids is None) == (filters is None):
+        raise ValueError("Provide exactly one of asset_ids or filter")
+
+    if asset_ids is not None:
+        if not isinstance(asset_ids, list) or not asset_ids:
+            raise ValueError("asset_ids must be a non-empty list of UUID strings")
+        normalized_ids = list(dict.fromkeys(_normalize_uuid_value(value, "asset_ids") for value in asset_ids))
+        if len(normalized_ids) > ASSET_BULK_MAX_ASSETS:
+            raise ValueError(f"asset_ids may list at most {ASSET_BULK_MAX_ASSETS} assets")
+        return normalized_ids, None
+
+    if not isinstance(filters, dict):
+        raise ValueError("filter must be an object")
+    unknown = set(filters) - set(ASSET_BULK_FILTER_FIELDS) - {"retired"}
+    if unknown:
+        raise ValueError(f"Unknown filter field: {sorted(unknown)[0]}")
+
+    normalized_filters = {
+        field_name: _normalize_uuid_value(filters.get(field_name), f"filter.{field_name}", required=False)
+        for field_name in ASSET_BULK_FILTER_FIELDS
+    }
+    normalized_filters = {key: value for key, value in normalized_filters.items() if value is not None}
+    if not normalized_filters:
+        # Never let an empty filter rewrite the whole fleet.
+        raise ValueError("filter needs at least one of " + ", ".join(ASSET_BULK_FILTER_FIELDS))
+
+    retired_mode = filters.get("retired") or "active"
+    if retired_mode not in ("active", "retired", "all"):
+        raise ValueError("filter.retired must be one of: active, retired, all")
+    normalized_filters["retired_mode"] = retired_mode
+    return None, normalized_filters
+
+
+@invalidates_request_cache
+def bulk_update_assets_service(payload: dict) -> dict:
+    """
+    Move, re-status or retire many assets in one transaction.
+
+    Payload:
+      - action: "move" (needs site_id), "set_status" (needs status_id) or
+        "retire" (needs retire_reason)
+      - asset_ids: list of asset UUIDs, or
+      - filter: {site_id, category_id, status_id, make_id, model_id,
+        variant_id, retired: active|retired|all}, at least one id given
+      - changed_by (optional, recorded on status history)
+      - dry_run (optional): count what would change without writing
+
+    Assets that already have the target value are left alone. More than
+    ASSET_BULK_MAX_ASSETS matching assets is refused.
+
+    Returns a summary:
+        {"action", "dry_run", "matched", "updated", "unchanged",
+         "status_changes", "missing_ids"}
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object")
+
+    action = payload.get("action")
+    if action not in ASSET_BULK_ACTIONS:
+        raise ValueError("action must be one of: " + ", ".join(ASSET_BULK_ACTIONS))
+
+    asset_ids, filters = _normalize_bulk_selection(payload)
+
+    change: dict[str, object] = {}
+    if action == "move":
+        change["to_site_id"] = site_service.validate_site_id(payload.get("site_id"), required=True, field_name="site_id")
+    elif action == "set_status":
+        change["to_status_id"] = lookups.validate_asset_status_id(
+            payload.get("status_id"),
+            required=True,
+            field_name="status_id",
+        )
+    else:
+        retire_reason = payload.get("retire_reason")
+        if not isinstance(retire_reason, str) or not retire_reason.strip():
+            raise ValueError("retire_reason is required to retire assets")
+        change["retire_reason"] = retire_reason.strip()
+
+    dry_run = bool(payload.get("dry_run"))
+    summary = assets_repo.bulk_update_asset_rows(
+        asset_ids=asset_ids,
+        filters=filters,
+        changed_by=_normalize_changed_by(payload.get("changed_by")),
+        max_assets=ASSET_BULK_MAX_ASSETS,
+        dry_run=dry_run,
+        **change,
+    )
+    if not dry_run and not summary["applied"]:
+        raise ValueError(
+            f"{summary['matched']} assets match; bulk changes are limited to {ASSET_BULK_MAX_ASSETS}. Narrow the filter."
+        )
+
+    return {
+        "action": action,
+        "dry_run": dry_run,
+        "matched": summary["matched"],
+        "updated": summary["updated"],
+        "unchanged": summary["matched"] - summary["updated"],
+        "status_changes": summary["status_changes"],
+        "missing_ids": [str(asset_id) for asset_id in summary["missing_ids"]],
+    }
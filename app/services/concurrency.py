@@ -0,0 +1,84 @@
+import re
+
+from flask import request
+
+
+# Compare-and-swap writes retry this many times, re-reading the row, when the
+# caller did not pin a version with If-Match.
+CAS_ATTEMPTS = 3
+
+
+class VersionConflict(Exception):
+    """
+    The issue or asset was changed after the version the write was based on.
+    The API answers 412 Precondition Failed with the current ETag.
+    """
+
+    def __init__(self, current_version: int | None):
+        super().__init__("The resource was modified since it was read")
+        self.current_version = current_version
+
+
+def etag_for(version: int) -> str:
+    return f'"{version}"'
+
+
+# One element of an If-Match list (RFC 9110 section 8.8.3): an optional W/
+# weakness prefix and a quoted opaque tag, then a comma or the end.
+_IF_MATCH_ELEMENT = re.compile(r'[ \t]*(?:(W/)?"([\x21\x23-\x7e\x80-\xff]*)")?[ \t]*(?:,|$)')
+
+_VERSION_TAG = re.compile(r"[0-9]+")
+
+
+def _parse_if_match(header: str) -> list[tuple[bool, str]]:
+    """[(weak, opaque_tag), ...] for an If-Match list; ValueError if malformed."""
+    tags = []
+    position = 0
+    while position < len(header):
+        match = _IF_MATCH_ELEMENT.match(header, position)
+        if match is None or match.end() == position:
+            raise ValueError("If-Match must be \"*\" or a list of ETags from previous responses")
+        if match.group(2) is not None:
+            tags.append((match.group(1) is not None, match.group(2)))
+        position = match.end()
+
+    if not tags:
+        raise ValueError("If-Match must be \"*\" or a list of ETags from previous responses")
+    return tags
+
+
+def expected_version_from_request(current_version) -> int | None:
+    """
+    The row version an If-Match request header pins the write to, or None
+    when there is no header or it is "*".
+
+    If-Match is compared strongly: a weak ETag (W/"2", as added by proxies
+    that compress responses) or one this API never issued cannot match, and
+    when nothing listed can, VersionConflict (412) is raised. When the list
+    names several versions, current_version() (the resource's version now,
+    also used for the 412's ETag, or None if it doesn't exist) picks the one
+    to write against.
+
+    Raises:
+        ValueError: the header is not "*" or a valid list of ETags.
+        VersionConflict: no listed ETag can match the current one.
+    """
+    header = request.headers.get("If-Match")
+    if header is None or header.strip() == "*":
+        return None
+
+    versions = sorted({
+        int(tag)
+        for weak, tag in _parse_if_match(header)
+        if not weak and _VERSION_TAG.fullmatch(tag)
+    })
+    if len(versions) == 1:
+        return versions[0]
+
+    current = current_version()
+    if current is None:
+        # No such resource: nothing to pin, the write itself answers 404.
+        return None
+    if current not in versions:
+        raise VersionConflict(current)
+    return current
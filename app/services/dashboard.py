@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime, timedelta, timezone
 
+from app import metrics
 from app.db import dashboard as dashboard_db
 from app.helpers import human_delta_2_times, human_delta_to_now
 
@@ -108,7 +109,8 @@ def _safe_bounds():
     fallback_trend_start = fallback_today - timedelta(days=90)
 
     try:
-        bounds = dashboard_db.get_dashboard_time_bounds() or {}
+        with metrics.timed_dashboard_query("time_bounds"):
+            bounds = dashboard_db.get_dashboard_time_bounds() or {}
     except Exception:
         logger.exception("Dashboard time-bounds query failed; using fallback bounds.")
         bounds = {}
@@ -125,45 +127,50 @@ def get_dashboard_data(site_id: str | None = None):
     bounds = _safe_bounds()
 
     try:
-        overview = dashboard_db.get_dashboard_overview(
-            week_start=bounds["week_start"],
-            week_end=bounds["week_end"],
-            site_id=site_id,
-        ) or {}
+        with metrics.timed_dashboard_query("overview"):
+            overview = dashboard_db.get_dashboard_overview(
+                week_start=bounds["week_start"],
+                week_end=bounds["week_end"],
+                site_id=site_id,
+            ) or {}
     except Exception:
         logger.exception("Dashboard overview query failed; returning default summary values.")
         overview = {}
 
     try:
-        repeat_all_time = dashboard_db.get_repeat_offender(site_id=site_id)
+        with metrics.timed_dashboard_query("repeat_offender_all_time"):
+            repeat_all_time = dashboard_db.get_repeat_offender(site_id=site_id)
     except Exception:
         logger.exception("Dashboard repeat-offender all-time query failed.")
         repeat_all_time = None
 
     try:
-        repeat_recent = dashboard_db.get_repeat_offender(
-            window_start=bounds["trend_start"],
-            site_id=site_id,
-        )
+        with metrics.timed_dashboard_query("repeat_offender_recent"):
+            repeat_recent = dashboard_db.get_repeat_offender(
+                window_start=bounds["trend_start"],
+                site_id=site_id,
+            )
     except Exception:
         logger.exception("Dashboard repeat-offender recent query failed.")
         repeat_recent = None
 
     try:
-        problem_models = dashboard_db.get_top_models_by_issue_rate(
-            window_start=bounds["trend_start"],
-            site_id=site_id,
-        )
+        with metrics.timed_dashboard_query("top_models"):
+            problem_models = dashboard_db.get_top_models_by_issue_rate(
+                window_start=bounds["trend_start"],
+                site_id=site_id,
+            )
     except Exception:
         logger.exception("Dashboard top-models query failed; returning empty list.")
         problem_models = []
 
     try:
-        trend_rows = dashboard_db.get_issue_trend_rows(
-            trend_start=bounds["trend_start"],
-            trend_end=bounds["today"],
-            site_id=site_id,
-        )
+        with metrics.timed_dashboard_query("trend"):
+            trend_rows = dashboard_db.get_issue_trend_rows(
+                trend_start=bounds["trend_start"],
+                trend_end=bounds["today"],
+                site_id=site_id,
+            )
     except Exception:
         logger.exception("Dashboard trend query failed; returning empty trend data.")
         trend_rows = []
@@ -0,0 +1,190 @@
+import logging
+import os
+import queue
+import threading
+import time
+
+from app.db import events as events_repo
+from app.services import sites as site_service
+
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPES = (
+    "issue.created",
+    "issue.updated",
+    "issue.deleted",
+    "issue_action.created",
+    "asset.status_changed",
+)
+DEFAULT_MAX_STREAMS = 100
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# How long the listener blocks on its socket before checking whether anyone
+# is still subscribed, and how long it backs off after losing the database.
+_LISTEN_POLL_SECONDS = 5.0
+_RECONNECT_DELAYS = (1, 2, 5, 10, 30)
+
+
+class Subscription:
+    """
+    One connected stream: a bounded queue of events for a site (or all
+    sites). A client that falls SUBSCRIBER_QUEUE_SIZE events behind is cut
+    loose with overflowed=True rather than letting its queue grow.
+    """
+
+    def __init__(self, site_id=None):
+        self.site_id = site_id
+        self.overflowed = False
+        self._queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def matches(self, event: dict) -> bool:
+        if self.site_id is None:
+            return True
+        # Events without a site (e.g. "resync") go to everyone.
+        return event.get("site_id") in (None, self.site_id)
+
+    def offer(self, event: dict) -> bool:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+            return False
+        return True
+
+    def get(self, timeout: float):
+        """Next event, or None if nothing arrived within `timeout` seconds."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBroker:
+    """
+    Per-process fan-out of the maintenance_events channel.
+
+    A single listener thread holds the process's only LISTEN connection and
+    copies each notification into every matching subscriber's queue, so the
+    database sees one listener per worker however many browsers are
+    connected. The thread starts with the first subscriber and exits (closing
+    its connection) once the last one has gone. Under gevent workers the
+    thread and the queue waits are greenlets, so idle streams cost no OS
+    thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: set[Subscription] = set()
+        self._listener: threading.Thread | None = None
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def subscribe(self, site_id=None, *, max_streams: int = DEFAULT_MAX_STREAMS) -> Subscription | None:
+        """Register a stream; returns None when this process already serves max_streams."""
+        subscription = Subscription(site_id)
+        with self._lock:
+            if len(self._subscribers) >= max_streams:
+                return None
+            self._subscribers.add(subscription)
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name="event-listener", daemon=True)
+                self._listener.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, events: list[dict]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        dropped = []
+        for subscription in subscribers:
+            for event in events:
+                if subscription.matches(event) and not subscription.offer(event):
+                    dropped.append(subscription)
+                    break
+
+        if dropped:
+            logger.warning("Dropping %s event stream(s) that fell %s events behind", len(dropped), SUBSCRIBER_QUEUE_SIZE)
+            with self._lock:
+                self._subscribers.difference_update(dropped)
+
+    def _idle(self) -> bool:
+        # Called by the listener; releasing the slot under the lock means a
+        # concurrent subscribe() either sees this thread or starts a new one.
+        with self._lock:
+            if self._subscribers:
+                return False
+            self._listener = None
+            return True
+
+    def _listen(self) -> None:
+        attempt = 0
+        while True:
+            conn = None
+            try:
+                conn = events_repo.open_listen_connection()
+                if attempt:
+                    # Changes made while disconnected were never delivered.
+                    self.publish([{"type": "resync"}])
+                attempt = 0
+
+                while not self._idle():
+                    events = events_repo.wait_for_events(conn, _LISTEN_POLL_SECONDS)
+                    if events:
+                        self.publish(events)
+                return
+            except Exception:
+                delay = _RECONNECT_DELAYS[min(attempt, len(_RECONNECT_DELAYS) - 1)]
+                attempt += 1
+                logger.exception("Event listener lost its database connection; retrying in %ss", delay)
+                time.sleep(delay)
+                if self._idle():
+                    return
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+_broker = EventBroker()
+
+
+def _reset_broker() -> None:
+    # A forked worker inherits neither the listener thread nor its socket in
+    # a usable state; start from an empty broker.
+    global _broker
+    _broker = EventBroker()
+
+
+os.register_at_fork(after_in_child=_reset_broker)
+
+
+def subscribe(site_id=None, *, max_streams: int = DEFAULT_MAX_STREAMS) -> Subscription | None:
+    """
+    Subscribe to change events, optionally for one site.
+
+    Returns:
+        a Subscription, or None when this worker is already serving
+        max_streams streams.
+
+    Raises:
+        ValueError: bad site_id.
+    """
+    site_id = site_service.validate_site_id(site_id)
+    return _broker.subscribe(site_id, max_streams=max_streams)
+
+
+def unsubscribe(subscription: Subscription) -> None:
+    _broker.unsubscribe(subscription)
+
+
+def stream_count() -> int:
+    return _broker.subscriber_count()
@@ -0,0 +1,142 @@
+import functools
+import hashlib
+import logging
+import os
+
+from flask import Response, current_app, jsonify, request
+
+from app.db import idempotency as idempotency_db
+
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+DEFAULT_TTL_HOURS = 24
+DEFAULT_LOCK_SECONDS = 60
+
+# Response headers kept with the stored body and sent again on replay. ETag
+# lets a client whose first attempt timed out send its next If-Match.
+_STORED_HEADERS = ("Content-Type", "Location", "ETag")
+
+
+def idempotency_settings() -> dict:
+    """Key lifetime and pending-claim lock from the environment."""
+    return {
+        "ttl_hours": float(os.environ.get("IDEMPOTENCY_KEY_TTL_HOURS", DEFAULT_TTL_HOURS)),
+        "lock_seconds": float(os.environ.get("IDEMPOTENCY_LOCK_SECONDS", DEFAULT_LOCK_SECONDS)),
+    }
+
+
+def _request_fingerprint() -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {request.path}\n".encode("utf-8"))
+
+    if request.mimetype == "multipart/form-data":
+        # Retries pick a new multipart boundary, so hash the parsed fields
+        # and file contents rather than the raw body.
+        for name, value in sorted(request.form.items(multi=True)):
+            digest.update(f"field {name}={value}\n".encode("utf-8"))
+        for name, storage in sorted(request.files.items(multi=True), key=lambda item: item[0]):
+            digest.update(f"file {name}={storage.filename}\n".encode("utf-8"))
+            for chunk in iter(lambda: storage.stream.read(65536), b""):
+                digest.update(chunk)
+            storage.stream.seek(0)
+    else:
+        digest.update(request.get_data(cache=True))
+
+    return digest.hexdigest()
+
+
+def _error(status_code: int, error: str, message: str, headers: dict | None = None):
+    response = jsonify({"error": error, "message": message})
+    response.status_code = status_code
+    for name, value in (headers or {}).items():
+        response.headers[name] = value
+    return response
+
+
+def _replay(row: dict) -> Response:
+    response = Response(row["response_body"], status=row["response_status"])
+    for name, value in (row["response_headers"] or {}).items():
+        response.headers[name] = value
+    response.headers[REPLAYED_HEADER] = "true"
+    return response
+
+
+def purge_expired_keys() -> int:
+    return idempotency_db.delete_expired_idempotency_key_rows()
+
+
+def idempotent(view):
+    """
+    Honour an Idempotency-Key request header on a POST view.
+
+    The first request with a key runs the view; a 2xx response is stored
+    against the key (for IDEMPOTENCY_KEY_TTL_HOURS) and replayed verbatim,
+    with Idempotent-Replayed: true, to any retry of the same request. Error
+    responses are not stored: the key is released and a retry runs again.
+
+    A retry that arrives while the first request is still running gets 409;
+    reusing a key for a different request gets 422. Requests without the
+    header are not affected.
+    """
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if key is None:
+            return view(*args, **kwargs)
+
+        key = key.strip()
+        if not key or len(key) > MAX_KEY_LENGTH:
+            return _error(400, "invalid_input", f"{IDEMPOTENCY_KEY_HEADER} must be 1 to {MAX_KEY_LENGTH} characters")
+
+        settings = idempotency_settings()
+        request_hash = _request_fingerprint()
+        claim = idempotency_db.claim_idempotency_key_row(
+            key,
+            request_hash=request_hash,
+            ttl_seconds=settings["ttl_hours"] * 3600,
+            lock_seconds=settings["lock_seconds"],
+        )
+
+        if not claim["claimed"]:
+            row = claim["row"]
+            if row["request_hash"] != request_hash:
+                return _error(422, "idempotency_key_reused", f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request")
+            if row["status"] == "pending":
+                return _error(
+                    409,
+                    "idempotency_key_in_progress",
+                    f"A request with this {IDEMPOTENCY_KEY_HEADER} is still being processed",
+                    headers={"Retry-After": "1"},
+                )
+            return _replay(row)
+
+        try:
+            response = current_app.make_response(view(*args, **kwargs))
+        except BaseException:
+            idempotency_db.release_idempotency_key_row(key, request_hash=request_hash)
+            raise
+
+        if 200 <= response.status_code < 300 and not response.is_streamed:
+            headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+            try:
+                idempotency_db.complete_idempotency_key_row(
+                    key,
+                    status_code=response.status_code,
+                    headers=headers,
+                    body=response.get_data(),
+                )
+            except Exception:
+                # The work is done; failing to record it only loses the
+                # replay: a retry after IDEMPOTENCY_LOCK_SECONDS runs again.
+                logger.exception("Failed to store response for idempotency key %r", key)
+        else:
+            idempotency_db.release_idempotency_key_row(key, request_hash=request_hash)
+
+        return response
+
+    return wrapper
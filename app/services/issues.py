@@ -1,11 +1,135 @@
 import os
+import threading
+from functools import cache
+from time import perf_counter
 from uuid import UUID
 from flask import current_app
+from app import metrics
 import app.db.helpers as helpers
 from app.db import issues as issue_db
 from app.services import assets as asset_service
+from app.services import jobs as job_service
+from app.services.concurrency import CAS_ATTEMPTS, VersionConflict
+from app.services.request_cache import invalidates_request_cache, memoize_for_request
 
-def list_issues(page: int, page_size: int, filters: dict):
+# Background job kinds handled here (see app/services/jobs.py).
+HEIC_CONVERSION_JOB = "attachment.convert_heic"
+ATTACHMENT_FILE_DELETION_JOB = "attachment.delete_files"
+
+def _issue_status(r: dict) -> dict:
+    return {
+        "id": r["status_id"],
+        "code": r["status_code"],
+        "label": r["status_label"],
+    }
+
+
+def _issue_asset(r: dict) -> dict:
+    return {
+        "id": r["asset_id"],
+        "asset_tag": r["asset_tag"],
+        "site_id": r["site_id"],
+        "make":{
+            "id":r["make_id"],
+            "name":r["make_name"],
+            "label":r["make_label"],
+        },
+
+        "model":{
+            "id":r["model_id"],
+            "name":r["model_name"],
+            "label":r["model_label"],
+        },
+
+        "variant":{
+            "id":r["variant_id"],
+            "name":r["variant_name"],
+            "label":r["variant_label"],
+        },
+    }
+
+
+# Payload fields of the issue list, in output order (fields=... picks a subset;
+# the columns behind them are mapped in issue_db.ISSUE_LIST_FIELD_COLUMNS).
+_ISSUE_LIST_FIELDS = {
+    "id": lambda r: r["id"],
+    "title": lambda r: r["title"],
+    "description": lambda r: r["description"],
+    "status": _issue_status,
+    "asset": _issue_asset,
+    "reported_by": lambda r: r["reported_by"],  # string or None
+    "created_at": lambda r: r["created_at"],
+    "updated_at": lambda r: r["updated_at"],
+    "closed_at": lambda r: r["closed_at"],
+    "last_action_at": lambda r: r["last_action_at"],
+    "last_action_type": lambda r: r["last_action_type_code"],
+    "is_archived": lambda r: r["is_archived"],
+}
+
+# Detail fields answered by separate queries rather than issue columns.
+_ISSUE_DETAIL_EXTRA_FIELDS = ("has_attachment", "actions", "status_history", "is_archived")
+
+_ISSUE_DETAIL_ROW_FIELDS = {
+    **_ISSUE_LIST_FIELDS,
+    "version": lambda r: r["version"],
+    "last_action_type_label": lambda r: r["last_action_type_label"],
+    "site_shorthand": lambda r: r["site_shorthand"],
+    "site_fullname": lambda r: r["site_fullname"],
+}
+_ISSUE_DETAIL_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "asset",
+    "has_attachment",
+    "reported_by",
+    "created_at",
+    "updated_at",
+    "closed_at",
+    "version",
+    "last_action_at",
+    "last_action_type",
+    "last_action_type_label",
+    "actions",
+    "status_history",
+    "site_shorthand",
+    "site_fullname",
+    "is_archived",
+)
+
+
+def _normalize_fields(fields, allowed) -> tuple[str, ...] | None:
+    """A fields=... selection as a tuple of known names, or None for all."""
+    if fields is None:
+        return None
+
+    names = []
+    for name in fields:
+        name = (name or "").strip()
+        if not name:
+            continue
+        if name not in allowed:
+            raise ValueError(f"Unknown field: {name}")
+        if name not in names:
+            names.append(name)
+    return tuple(names) or None
+
+
+@memoize_for_request
+def list_issues(page: int, page_size: int, filters: dict, fields=None):
+    """
+    fields: optional subset of the item fields (_ISSUE_LIST_FIELDS) to
+    select and return; id is always included. Raises ValueError for an
+    unknown field.
+    """
+    fields = _normalize_fields(fields, _ISSUE_LIST_FIELDS)
+    if fields is None:
+        # description is only returned when asked for: it can be long and
+        # list views never show it.
+        selected = [name for name in _ISSUE_LIST_FIELDS if name != "description"]
+    else:
+        selected = ["id", *(name for name in fields if name != "id")]
     offset = (page - 1) * page_size
     closed_mode = "all"
 
@@ -41,48 +165,13 @@ def list_issues(page: int, page_size: int, filters: dict):
         limit=page_size,
         offset=offset,
         active_status_ids=filters.get("active_status_ids"),
+        include_archived=bool(filters.get("include_archived")),
+        fields=[name for name in selected if name not in ("id", "is_archived")],
     )
 
-
     items = []
     for r in rows:
-        items.append({
-            "id": r["id"],
-            "title": r["title"],
-            "status": {
-                "id": r["status_id"],
-                "code": r["status_code"],
-                "label": r["status_label"],
-            },
-            "asset": {
-                "id": r["asset_id"],
-                "asset_tag": r["asset_tag"],
-                "site_id": r["site_id"],
-                "make":{
-                    "id":r["make_id"],
-                    "name":r["make_name"],
-                    "label":r["make_label"],
-                },
-
-                "model":{
-                    "id":r["model_id"],
-                    "name":r["model_name"],
-                    "label":r["model_label"],
-                },
-
-                "variant":{
-                    "id":r["variant_id"],
-                    "name":r["variant_name"],
-                    "label":r["variant_label"],
-                },
-            },
-            "reported_by": r["reported_by"],  # string or None
-            "created_at": r["created_at"],
-            "updated_at": r["updated_at"],
-            "closed_at": r["closed_at"],
-            "last_action_at": r["last_action_at"],
-            "last_action_type": r["last_action_type_code"],
-        })
+        items.append({name: _ISSUE_LIST_FIELDS[name](r) for name in selected})
 
     return {
         "page": page,
@@ -91,16 +180,8 @@ def list_issues(page: int, page_size: int, filters: dict):
         "items": items,
     }
 
-def get_issue(issue_id: str):
-    """
-    Return a single issue with its actions, or None if not found.
-    """
-    r = issue_db.get_issue_row(issue_id)
-    if r is None:
-        return None
-
-    # Fetch actions timeline
-    action_rows = issue_db.list_issue_actions(issue_id)
+def _issue_actions(issue_id: str, archived: bool) -> list[dict]:
+    action_rows = issue_db.list_issue_actions(issue_id, archived=archived)
     actions = []
     for a in action_rows:
         actions.append({
@@ -117,9 +198,11 @@ def get_issue(issue_id: str):
                 "name": str(a["created_by"] or "-"),  # TODO: not sure if i like this
             },
         })
+    return actions
+
 
-    # Status history
-    hist_rows = issue_db.list_issue_status_history(issue_id)
+def _issue_status_history(issue_id: str, archived: bool) -> list[dict]:
+    hist_rows = issue_db.list_issue_status_history(issue_id, archived=archived)
     status_history = []
     for h in hist_rows:
         status_history.append({
@@ -137,52 +220,51 @@ def get_issue(issue_id: str):
             "changed_at": h["changed_at"],
             "changed_by": h["changed_by"] or "-",
         })
+    return status_history
 
-    return {
-        "id": r["id"],
-        "title": r["title"],
-        "description": r["description"],
-        "status": {
-            "id": r["status_id"],
-            "code": r["status_code"],
-            "label": r["status_label"],
-        },
-        "asset": {
-            "id": r["asset_id"],
-            "asset_tag": r["asset_tag"],
-            "site_id": r["site_id"],
-            "make":{
-                "id":r["make_id"],
-                "name":r["make_name"],
-                "label":r["make_label"],
-            },
 
-            "model":{
-                "id":r["model_id"],
-                "name":r["model_name"],
-                "label":r["model_label"],
-            },
+@memoize_for_request
+def get_issue(issue_id: str, include_archived: bool = False, fields=None):
+    """
+    Return a single issue with its actions, or None if not found.
+    With include_archived, an issue that has been moved to the archive
+    tables is returned too (is_archived=True).
 
-            "variant":{
-                "id":r["variant_id"],
-                "name":r["variant_name"],
-                "label":r["variant_label"],
-            },
-        },
-        "has_attachment": issue_db.get_issue_attachment_by_issue_id(issue_id=issue_id) is not None,
-        "reported_by": r["reported_by"],
-        "created_at": r["created_at"],
-        "updated_at": r["updated_at"],
-        "closed_at": r["closed_at"],
-        "last_action_at": r["last_action_at"],
-        "last_action_type": r["last_action_type_code"],
-        "last_action_type_label": r["last_action_type_label"],
-        "actions": actions,
-        "status_history": status_history,
-        "site_shorthand": r["site_shorthand"],
-        "site_fullname": r["site_fullname"]
+    fields: optional subset of _ISSUE_DETAIL_FIELDS to return (id and
+    version always are). Only the columns behind them are selected, and the
+    actions / status history / attachment lookups run only when asked for.
+    Raises ValueError for an unknown field.
+    """
+    fields = _normalize_fields(fields, _ISSUE_DETAIL_FIELDS)
+    if fields is None:
+        selected = set(_ISSUE_DETAIL_FIELDS)
+        column_fields = None
+    else:
+        selected = {"id", "version", *fields}
+        column_fields = [name for name in fields if name not in _ISSUE_DETAIL_EXTRA_FIELDS]
+
+    archived = False
+    r = issue_db.get_issue_row(issue_id, fields=column_fields)
+    if r is None and include_archived:
+        archived = True
+        r = issue_db.get_issue_row(issue_id, archived=True, fields=column_fields)
+    if r is None:
+        return None
+
+    extra_fields = {
+        "has_attachment": lambda: issue_db.get_issue_attachment_by_issue_id(issue_id=issue_id, archived=archived) is not None,
+        "actions": lambda: _issue_actions(issue_id, archived),
+        "status_history": lambda: _issue_status_history(issue_id, archived),
+        "is_archived": lambda: archived,
     }
 
+    return {
+        name: extra_fields[name]() if name in extra_fields else _ISSUE_DETAIL_ROW_FIELDS[name](r)
+        for name in _ISSUE_DETAIL_FIELDS
+        if name in selected
+    }
+
+@invalidates_request_cache
 def create_issue(data: dict):
     """
     Create a new issue, initial action, and status history.
@@ -264,7 +346,8 @@ def create_issue(data: dict):
 
     return {"id": issue_id}
 
-def add_issue_action(issue_id: str, data: dict):
+@invalidates_request_cache
+def add_issue_action(issue_id: str, data: dict, expected_version: int | None = None):
     """
     Add an action to an issue, optionally changing status.
 
@@ -274,6 +357,11 @@ def add_issue_action(issue_id: str, data: dict):
       - created_by       (str, optional, default "-")
       - new_status_id    (UUID string, optional)
       - new_asset_status_id (UUID string, optional)
+
+    expected_version is the issue version (If-Match) the caller based the
+    action on; if the issue has moved on, VersionConflict is raised and
+    nothing is written. Without it, a concurrent change is retried against
+    the fresh row, so the status history never records a stale from-status.
     """
 
     action_type_code = data.get("action_type_code")
@@ -299,14 +387,41 @@ def add_issue_action(issue_id: str, data: dict):
     else:
         target_asset_status = None
 
-    current_status_id = issue_row["status_id"]
-
     # look up action_type.id by code
     action_type_id = issue_db.get_action_type_id_by_code(action_type_code)
     if not action_type_id:
         raise ValueError(f"Unknown action_type_code: {action_type_code}")
 
-    # 1) insert action
+    # 1) status change (or plain updated_at bump), compare-and-swap on the
+    #    version read above
+    for _ in range(CAS_ATTEMPTS):
+        if expected_version is not None and issue_row["version"] != expected_version:
+            raise VersionConflict(issue_row["version"])
+
+        current_status_id = issue_row["status_id"]
+        if new_status_id and new_status_id != str(current_status_id):
+            closed = str(new_status_id) == str(issue_db.get_issue_status_id_by_code("CLOSED"))
+            updated = issue_db.change_issue_status_row(
+                issue_id,
+                expected_version=issue_row["version"],
+                from_status_id=current_status_id,
+                to_status_id=new_status_id,
+                closed_at=helpers.get_current_utc_timestamp() if closed else None,
+                changed_by=created_by,
+            )
+        else:
+            updated = issue_db.update_issue_row(issue_id, expected_version=issue_row["version"])
+
+        if updated is not None:
+            break
+
+        issue_row = issue_db.get_issue_row(issue_id)
+        if issue_row is None:
+            return None
+    else:
+        raise VersionConflict(issue_row["version"])
+
+    # 2) insert action
     issue_db.create_issue_action_row(
         issue_id=issue_id,
         action_type_id=action_type_id,
@@ -314,23 +429,6 @@ def add_issue_action(issue_id: str, data: dict):
         created_by=created_by,
     )
 
-    # 2) optional status change
-    if new_status_id and new_status_id != str(current_status_id):
-        issue_db.create_issue_status_history_row(
-            issue_id=issue_id,
-            from_status_id=current_status_id,
-            to_status_id=new_status_id,
-            changed_by=created_by,
-        )
-        issue_db.update_issue_row(
-            issue_id,
-            {"status_id": new_status_id, "closed_at": None if str(new_status_id) != str(issue_db.get_issue_status_id_by_code("CLOSED")) else helpers.get_current_utc_timestamp()},
-        )
-    else:
-        issue_db.update_issue_row(
-            issue_id
-        )
-
     if target_asset_status is not None:
         asset_service.set_asset_status(
             asset_id=issue_row["asset_id"],
@@ -338,9 +436,15 @@ def add_issue_action(issue_id: str, data: dict):
             changed_by=created_by,
         )
 
-    return {"issue_id": issue_id}
+    return {"issue_id": issue_id, "version": updated["version"]}
 
-def update_issue(issue_id: str, data: dict):
+def get_issue_version(issue_id: str) -> int | None:
+    """The issue's current row version (its ETag), or None if it doesn't exist."""
+    row = issue_db.get_issue_row(issue_id, fields=["version"])
+    return None if row is None else row["version"]
+
+@invalidates_request_cache
+def update_issue(issue_id: str, data: dict, expected_version: int | None = None):
     """
     Partially update an issue. Does NOT change status.
     Allowed fields:
@@ -348,6 +452,9 @@ def update_issue(issue_id: str, data: dict):
       - description
       - reported_by
       - asset_id
+
+    With expected_version (If-Match), the update only applies while the
+    issue is still at that version; otherwise VersionConflict is raised.
     """
 
     fields = {}
@@ -366,15 +473,24 @@ def update_issue(issue_id: str, data: dict):
 
     if not fields:
         # nothing to do; just return current issue
-        return get_issue(issue_id)
+        issue = get_issue(issue_id)
+        if issue is not None and expected_version is not None and issue["version"] != expected_version:
+            raise VersionConflict(issue["version"])
+        return issue
 
-    updated = issue_db.update_issue_row(issue_id, fields)
+    updated = issue_db.update_issue_row(issue_id, fields, expected_version=expected_version)
     if updated is None:
-        return None
+        if expected_version is None:
+            return None
+        current = issue_db.get_issue_row(issue_id)
+        if current is None:
+            return None
+        raise VersionConflict(current["version"])
 
     # Return full issue view (with actions/history)
     return get_issue(issue_id)
 
+@invalidates_request_cache
 def delete_issue(issue_id: str) -> bool:
     try:
         normalized_issue_id = str(UUID(str(issue_id)))
@@ -389,15 +505,37 @@ def delete_issue(issue_id: str) -> bool:
     if not deleted:
         raise ValueError("Unknown issue_id")
 
+    # Removing the files is left to the job queue so the response doesn't
+    # wait on the attachment disk.
+    filepaths = [row["filepath"] for row in attachment_rows if row.get("filepath")]
+    if filepaths:
+        job_service.enqueue(
+            ATTACHMENT_FILE_DELETION_JOB,
+            {"filepaths": filepaths},
+            dedup_key=f"issue:{normalized_issue_id}",
+        )
+
+    return True
+
+def _attachment_abs_path(rel_path: str) -> str | None:
+    """Absolute path under ATTACHMENT_ROOT, or None for an unsafe stored path."""
+    rel_norm = (rel_path or "").strip().replace("\\", "/")
+    if not rel_norm or rel_norm.startswith("/") or ".." in rel_norm:
+        return None
+
     attachment_root = current_app.config.get("ATTACHMENT_ROOT", "/tmp/attachments")
+    return os.path.join(attachment_root, rel_norm)
 
-    for row in attachment_rows:
-        rel_path = (row.get("filepath") or "").strip()
-        rel_norm = rel_path.replace("\\", "/")
-        if not rel_norm or rel_norm.startswith("/") or ".." in rel_norm:
+def delete_attachment_files(payload: dict) -> None:
+    """
+    Job handler: remove attachment files (and their then-empty directories)
+    left behind by a deleted issue. Missing files are fine.
+    """
+    for rel_path in payload.get("filepaths") or []:
+        abs_path = _attachment_abs_path(rel_path)
+        if abs_path is None:
             continue
 
-        abs_path = os.path.join(attachment_root, rel_norm)
         try:
             if os.path.isfile(abs_path):
                 os.remove(abs_path)
@@ -411,8 +549,7 @@ def delete_issue(issue_id: str) -> bool:
         except OSError:
             pass
 
-    return True
-
+@memoize_for_request
 def list_issue_statuses():
     rows = issue_db.list_issue_status_rows()
     return [
@@ -425,6 +562,7 @@ def list_issue_statuses():
         for r in rows
     ]
 
+@memoize_for_request
 def list_action_types():
     rows = issue_db.list_action_type_rows()
     return [
@@ -437,6 +575,7 @@ def list_action_types():
         for r in rows
     ]
 
+@invalidates_request_cache
 def create_issue_status(data: dict):
     code = (data.get("code") or "").strip().upper()
     label = (data.get("label") or "").strip()
@@ -456,6 +595,7 @@ def create_issue_status(data: dict):
         "display_order": row["display_order"],
     }
 
+@invalidates_request_cache
 def create_action_type(data: dict):
     code = (data.get("code") or "").strip().upper()
     label = (data.get("label") or "").strip()
@@ -475,13 +615,29 @@ def create_action_type(data: dict):
         "display_order": row["display_order"],
     }
 
-def get_issue_attachment(issue_id: str):
+@memoize_for_request
+def get_issue_attachment(issue_id: str, include_archived: bool = False):
     """
     Return attachment metadata for an issue, or None.
     Expected keys: filepath, content_type
     """
-    return issue_db.get_issue_attachment_by_issue_id(issue_id)
+    attachment = issue_db.get_issue_attachment_by_issue_id(issue_id)
+    if attachment is None and include_archived:
+        attachment = issue_db.get_issue_attachment_by_issue_id(issue_id, archived=True)
+    return attachment
+
+@cache
+def _heif_image_module():
+    """
+    PIL.Image with the HEIF opener registered. pillow_heif is slow to import,
+    so it is loaded on the first HEIC upload instead of at app start.
+    """
+    from PIL import Image
+    from pillow_heif import register_heif_opener
+    register_heif_opener()
+    return Image
 
+@invalidates_request_cache
 def add_issue_attachment(issue_id: str, file_storage):
     if file_storage is None or not getattr(file_storage, "filename", ""):
         raise ValueError("Missing file")
@@ -526,13 +682,14 @@ def add_issue_attachment(issue_id: str, file_storage):
     abs_dir = os.path.join(attachment_root, rel_dir)
     os.makedirs(abs_dir, exist_ok=True)
 
-    # Always store web-friendly output
-    out_content_type = content_type
+    # Always store web-friendly output. HEIC is checked here but stored as
+    # uploaded; the JPEG re-encode is left to a background job
+    # (convert_heic_attachment), or to the first request that serves it.
     out_ext = {
         "image/jpeg": "jpg",
         "image/png": "png",
         "image/webp": "webp",
-        "image/heic": "jpg",   # convert to jpeg
+        "image/heic": "heic",
     }[content_type]
 
     rel_path = f"{rel_dir}/attachment.{out_ext}"
@@ -545,21 +702,10 @@ def add_issue_attachment(issue_id: str, file_storage):
         pass
 
     if content_type == "image/heic":
-        # Convert HEIC/HEIF -> JPEG for browser compatibility
-        try:
-            from PIL import Image
-            from pillow_heif import register_heif_opener
-            register_heif_opener()
-
-            img = Image.open(file_storage.stream)
-            img = img.convert("RGB")
-            img.save(abs_path, format="JPEG", quality=92, optimize=True)
+        _check_heif_upload(file_storage.stream)
 
-            out_content_type = "image/jpeg"
-        except Exception as e:
-            raise ValueError(f"Failed to process HEIC image: {e}")
-    else:
-        file_storage.save(abs_path)
+    started = perf_counter()
+    file_storage.save(abs_path)
 
     if not os.path.isfile(abs_path) or os.path.getsize(abs_path) == 0:
         try:
@@ -568,16 +714,112 @@ def add_issue_attachment(issue_id: str, file_storage):
             pass
         raise ValueError("Uploaded file saved as 0 bytes")
 
+    # The stored size: a chunked upload has no Content-Length.
+    metrics.observe_attachment(content_type, os.path.getsize(abs_path), perf_counter() - started)
+
     row = issue_db.create_issue_attachment(
         issue_id=issue_id,
         filepath=rel_path,
-        content_type=out_content_type,
+        content_type=content_type,
     )
+
+    if content_type == "image/heic":
+        job_service.enqueue(
+            HEIC_CONVERSION_JOB,
+            {"attachment_id": str(row["id"]), "filepath": rel_path},
+            dedup_key=str(row["id"]),
+        )
+
     return row
 
+def _check_heif_upload(stream) -> None:
+    """
+    Decode an uploaded HEIC/HEIF so a broken or non-HEIF file (an MP4 shares
+    the ISO-BMFF header) is rejected with the upload, not in the job.
+    ValueError if it can't be decoded; the stream is rewound either way.
+    """
+    try:
+        job_service.run_cpu_bound(_decode_heif, stream)
+    except Exception as e:
+        raise ValueError(f"Failed to process HEIC image: {e}")
+    finally:
+        stream.seek(0)
+
+def _decode_heif(stream) -> None:
+    with _heif_image_module().open(stream) as img:
+        img.load()
+
+def _heif_to_jpeg(src_path: str, dest_path: str) -> tuple[int, int]:
+    """Write src_path as a JPEG at dest_path; returns its (width, height)."""
+    with _heif_image_module().open(src_path) as img:
+        img = img.convert("RGB")
+        img.save(dest_path, format="JPEG", quality=92, optimize=True)
+        return img.size
+
+def ensure_browser_attachment(attachment: dict) -> dict:
+    """
+    An attachment row whose file a browser can show: a HEIC upload still
+    waiting for its conversion job is converted now (the job then finds
+    nothing to do). Archived attachments are returned as they are.
+    """
+    if attachment["content_type"] != "image/heic":
+        return attachment
+
+    convert_heic_attachment({"attachment_id": str(attachment["id"]), "filepath": attachment["filepath"]})
+    return issue_db.get_issue_attachment_row(attachment["id"]) or attachment
+
+def convert_heic_attachment(payload: dict) -> None:
+    """
+    Job handler: convert a stored HEIC/HEIF attachment to JPEG for browser
+    compatibility and point the attachment row at the JPEG.
+
+    A no-op if the attachment was deleted or already converted meanwhile;
+    if that happens while converting, the new JPEG is removed again.
+    """
+    attachment = issue_db.get_issue_attachment_row(payload["attachment_id"])
+    if attachment is None or attachment["filepath"] != payload["filepath"]:
+        return
+
+    src_path = _attachment_abs_path(attachment["filepath"])
+    if src_path is None:
+        raise ValueError(f"Invalid attachment filepath stored: {attachment['filepath']}")
+
+    rel_path = f"{os.path.splitext(attachment['filepath'])[0]}.jpg"
+    abs_path = _attachment_abs_path(rel_path)
+    # The job and a request serving the attachment may convert it at once.
+    tmp_path = f"{abs_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    width, height = job_service.run_cpu_bound(_heif_to_jpeg, src_path, tmp_path)
+    os.replace(tmp_path, abs_path)
+
+    replaced = issue_db.replace_issue_attachment_file(
+        attachment["id"],
+        from_filepath=attachment["filepath"],
+        filepath=rel_path,
+        content_type="image/jpeg",
+        width=width,
+        height=height,
+    )
+
+    if replaced:
+        stale_path = src_path
+    else:
+        # Lost the race to another conversion of the same file: its JPEG is
+        # the one at abs_path now, so leave that alone.
+        current = issue_db.get_issue_attachment_row(attachment["id"])
+        if current is not None and current["filepath"] == rel_path:
+            return
+        stale_path = abs_path
+    try:
+        os.remove(stale_path)
+    except OSError:
+        pass
+
+@memoize_for_request
 def list_accepted_attachment_content_types():
     return issue_db.list_accepted_attachment_content_types()
 
+@invalidates_request_cache
 def create_accepted_attachment_content_type(data: dict):
     content_type = (data.get("content_type") or "").strip().lower()
 
@@ -589,6 +831,7 @@ def create_accepted_attachment_content_type(data: dict):
 
     return issue_db.create_accepted_attachment_content_type(content_type)
 
+@invalidates_request_cache
 def delete_accepted_attachment_content_type(content_type: str):
     ok = issue_db.delete_accepted_attachment_content_type(content_type)
     if not ok:
@@ -0,0 +1,257 @@
+import logging
+import os
+import random
+import socket
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from time import monotonic, perf_counter
+
+from app import metrics
+from app.db import jobs as jobs_db
+from app.services import idempotency as idempotency_service
+from app.services import sync as sync_service
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_THREADS = 1
+DEFAULT_POLL_SECONDS = 1.0
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_RETENTION_DAYS = 7
+
+BACKOFF_BASE_SECONDS = 10
+BACKOFF_MAX_SECONDS = 3600
+
+# Lease expiry and retention clean-up run at most this often per worker.
+_HOUSEKEEPING_SECONDS = 60
+
+
+def run_cpu_bound(func, *args):
+    """
+    Call func(*args) for image decoding/encoding and similar CPU-heavy work.
+    Under a gevent-patched worker job threads and requests are greenlets on
+    one hub, so the call goes to gevent's pool of real OS threads (Pillow
+    releases the GIL while it codes images) instead of stalling every other
+    request and stream; otherwise it runs inline. func must not need the app
+    context or a database connection.
+    """
+    if "gevent" in sys.modules:
+        from gevent import get_hub, monkey
+
+        if monkey.is_module_patched("threading"):
+            return get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+
+def job_settings() -> dict:
+    """Worker pool and retry settings from the environment."""
+    return {
+        "worker_threads": int(os.environ.get("JOB_WORKER_THREADS", DEFAULT_WORKER_THREADS)),
+        "poll_seconds": float(os.environ.get("JOB_POLL_SECONDS", DEFAULT_POLL_SECONDS)),
+        "max_attempts": int(os.environ.get("JOB_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)),
+        "lease_seconds": float(os.environ.get("JOB_LEASE_SECONDS", DEFAULT_LEASE_SECONDS)),
+        "retention_days": int(os.environ.get("JOB_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)),
+    }
+
+
+def _handlers() -> dict:
+    # Imported here: these services enqueue their jobs through this module.
+    from app.services import assets as asset_service
+    from app.services import issues as issue_service
+
+    return {
+        issue_service.HEIC_CONVERSION_JOB: issue_service.convert_heic_attachment,
+        issue_service.ATTACHMENT_FILE_DELETION_JOB: issue_service.delete_attachment_files,
+        asset_service.QR_RENDER_JOB: asset_service.render_asset_qr,
+    }
+
+
+def enqueue(kind: str, payload: dict | None = None, *, dedup_key: str | None = None, delay_seconds: float = 0):
+    """
+    Queue a background job. `payload` must be JSON-serialisable; the handler
+    for `kind` receives it as a dict.
+
+    Returns:
+        the job id, or None when a queued/running job with the same kind
+        and dedup_key already exists.
+    """
+    job_id = jobs_db.enqueue_job_row(
+        kind,
+        payload or {},
+        dedup_key=dedup_key,
+        delay_seconds=delay_seconds,
+        max_attempts=job_settings()["max_attempts"],
+    )
+    metrics.record_job_enqueued(kind, job_id is not None)
+    return job_id
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Delay before retry number `attempts`: exponential, capped, with +-25% jitter."""
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0), BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.75, 1.25)
+
+
+def run_job(job: dict) -> str:
+    """
+    Run one claimed job and record its outcome. Handler exceptions are
+    caught: the job is retried with backoff until max_attempts, then failed.
+
+    Returns:
+        "done", "retry" or "failed"; "lease_lost" when the job was requeued
+        while it ran and the outcome was not recorded
+    """
+    kind = job["kind"]
+    handler = _handlers().get(kind)
+    queue_delay = (job["locked_at"] - job["run_after"]).total_seconds()
+    owner = {"worker_id": job["locked_by"]}
+
+    started = perf_counter()
+    try:
+        if handler is None:
+            raise LookupError(f"No handler for job kind {kind!r}")
+        handler(job["payload"])
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        if handler is None or job["attempts"] >= job["max_attempts"]:
+            logger.exception("Job %s (%s) failed after %s attempt(s)", job["id"], kind, job["attempts"])
+            recorded = jobs_db.fail_job_row(job["id"], error=error, **owner)
+            outcome = "failed"
+        else:
+            delay = backoff_seconds(job["attempts"])
+            logger.warning("Job %s (%s) attempt %s failed, retrying in %.0fs: %s", job["id"], kind, job["attempts"], delay, error)
+            recorded = jobs_db.retry_job_row(job["id"], error=error, delay_seconds=delay, **owner)
+            outcome = "retry"
+    else:
+        recorded = jobs_db.complete_job_row(job["id"], **owner)
+        outcome = "done"
+
+    if not recorded:
+        # Ran past JOB_LEASE_SECONDS: housekeeping requeued it, so the row
+        # (maybe claimed again meanwhile) is no longer ours to update.
+        logger.warning("Job %s (%s) lost its lease before finishing; %s not recorded", job["id"], kind, outcome)
+        outcome = "lease_lost"
+
+    metrics.observe_job(kind, outcome, perf_counter() - started, queue_delay)
+    return outcome
+
+
+def run_housekeeping(*, lease_seconds: float, retention_days: int) -> dict:
+    """
+    Requeue jobs whose worker died, delete old finished jobs and purge
+    expired idempotency keys and sync change log entries.
+    """
+    finished_before = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    return {
+        "requeued": jobs_db.requeue_stale_job_rows(lease_seconds),
+        "deleted": jobs_db.delete_finished_job_rows(finished_before),
+        "idempotency_keys_purged": idempotency_service.purge_expired_keys(),
+        "sync_changes_purged": sync_service.purge_expired_changes(),
+    }
+
+
+def get_job_stats() -> list[dict]:
+    return jobs_db.list_job_stat_rows()
+
+
+class JobWorker:
+    """
+    Claims ready jobs one at a time and runs each inside its own app
+    context until stop() is called. Any number of workers, in any number of
+    processes, can share the queue.
+    """
+
+    def __init__(self, app, *, name: str = "job-worker", settings: dict | None = None):
+        self.app = app
+        self.name = name
+        self.settings = settings or job_settings()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def worker_id(self) -> str:
+        # Read at claim time: the pid changes if the process forks after
+        # the worker is built.
+        return f"{socket.gethostname()}:{os.getpid()}:{self.name}"
+
+    def run_available(self, max_jobs: int | None = None) -> int:
+        """Run jobs until none are ready (or max_jobs ran). Returns how many ran."""
+        ran = 0
+        while not self._stop.is_set() and (max_jobs is None or ran < max_jobs):
+            claimed = jobs_db.claim_job_rows(self.worker_id, limit=1)
+            if not claimed:
+                break
+            with self.app.app_context():
+                run_job(claimed[0])
+            ran += 1
+        return ran
+
+    def run_forever(self) -> None:
+        next_housekeeping = 0.0
+        while not self._stop.is_set():
+            if monotonic() >= next_housekeeping:
+                # Advanced even on failure: a purge that keeps failing must
+                # not stop jobs from running or be retried every poll.
+                next_housekeeping = monotonic() + _HOUSEKEEPING_SECONDS
+                try:
+                    run_housekeeping(
+                        lease_seconds=self.settings["lease_seconds"],
+                        retention_days=self.settings["retention_days"],
+                    )
+                except Exception:
+                    logger.exception("Job worker %s failed running housekeeping", self.name)
+
+            ran = 0
+            try:
+                ran = self.run_available()
+            except Exception:
+                logger.exception("Job worker %s failed polling the queue", self.name)
+
+            if not ran:
+                self._stop.wait(self.settings["poll_seconds"])
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.run_forever, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the worker to stop after its current job."""
+        self._stop.set()
+
+    def join(self, timeout: float | None = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_workers: list[JobWorker] = []
+
+
+def start_worker_threads(app, count: int | None = None) -> list[JobWorker]:
+    """
+    Run `count` (default JOB_WORKER_THREADS) job workers as daemon threads in
+    this process, e.g. inside each gunicorn worker. 0 starts none, leaving
+    the queue to python -m app.jobs.run_worker.
+    """
+    settings = job_settings()
+    if count is None:
+        count = settings["worker_threads"]
+
+    started = []
+    for index in range(count):
+        worker = JobWorker(app, name=f"job-worker-{index + 1}", settings=settings)
+        worker.start()
+        started.append(worker)
+
+    _workers.extend(started)
+    return started
+
+
+def stop_worker_threads(timeout: float | None = None) -> None:
+    workers = list(_workers)
+    _workers.clear()
+    for worker in workers:
+        worker.stop()
+    for worker in workers:
+        worker.join(timeout)
@@ -4,6 +4,7 @@ from sqlalchemy.exc import IntegrityError
 
 from app.db import assets as assets_db
 from app.db import lookups as lookups_db
+from app.services.request_cache import invalidates_request_cache, memoize_for_request
 
 
 def _serialize_lookup_row(row: dict | None, *uuid_fields: str):
@@ -41,10 +42,12 @@ def _normalize_uuid(value, *, field_name: str, required: bool = False) -> str |
         raise ValueError(f"Invalid {field_name}, must be a UUID string")
 
 
+@memoize_for_request
 def list_asset_statuses():
     return _serialize_lookup_rows(assets_db.list_asset_status_rows(), "id")
 
 
+@memoize_for_request
 def get_asset_status(status_id):
     normalized_status_id = _normalize_uuid(
         status_id,
@@ -72,14 +75,17 @@ def validate_asset_status_id(status_id, *, required: bool = False, field_name: s
     return normalized_status_id
 
 
+@memoize_for_request
 def list_asset_categories():
     return _serialize_lookup_rows(lookups_db.list_category_rows(), "id")
 
 
+@memoize_for_request
 def list_categories():
     return list_asset_categories()
 
 
+@memoize_for_request
 def get_category(category_id):
     normalized_category_id = _normalize_uuid(
         category_id,
@@ -107,6 +113,7 @@ def validate_category_id(category_id, *, required: bool = False, field_name: str
     return normalized_category_id
 
 
+@invalidates_request_cache
 def create_category(*, name: str) -> dict:
     normalized_name = _normalize_name(name, "Category name")
 
@@ -124,6 +131,7 @@ def create_category(*, name: str) -> dict:
     return _serialize_lookup_row(row, "id")
 
 
+@invalidates_request_cache
 def update_category(*, category_id, name: str) -> dict:
     normalized_category_id = validate_category_id(
         category_id,
@@ -150,6 +158,7 @@ def update_category(*, category_id, name: str) -> dict:
     return _serialize_lookup_row(row, "id")
 
 
+@invalidates_request_cache
 def delete_category(category_id) -> bool:
     normalized_category_id = validate_category_id(
         category_id,
@@ -162,6 +171,7 @@ def delete_category(category_id) -> bool:
         raise ValueError("Category cannot be deleted because it is in use") from exc
 
 
+@memoize_for_request
 def list_makes(category_id=None):
     normalized_category_id = None
     if category_id is not None and str(category_id).strip():
@@ -178,6 +188,7 @@ def list_makes(category_id=None):
     )
 
 
+@memoize_for_request
 def get_make(make_id):
     normalized_make_id = _normalize_uuid(make_id, field_name="make_id", required=True)
     return _serialize_lookup_row(
@@ -202,6 +213,7 @@ def validate_make_id(make_id, *, required: bool = False, field_name: str = "make
     return normalized_make_id
 
 
+@invalidates_request_cache
 def create_make(*, category_id, name: str) -> dict:
     normalized_category_id = validate_category_id(
         category_id,
@@ -225,6 +237,7 @@ def create_make(*, category_id, name: str) -> dict:
     return _serialize_lookup_row(row, "id", "category_id")
 
 
+@invalidates_request_cache
 def update_make(*, make_id, category_id, name: str) -> dict:
     normalized_make_id = validate_make_id(
         make_id,
@@ -257,6 +270,7 @@ def update_make(*, make_id, category_id, name: str) -> dict:
     return _serialize_lookup_row(row, "id", "category_id")
 
 
+@invalidates_request_cache
 def delete_make(make_id) -> bool:
     normalized_make_id = validate_make_id(
         make_id,
@@ -269,6 +283,7 @@ def delete_make(make_id) -> bool:
         raise ValueError("Make cannot be deleted because it is in use") from exc
 
 
+@memoize_for_request
 def list_models(make_id=None):
     normalized_make_id = None
     if make_id is not None and str(make_id).strip():
@@ -286,6 +301,7 @@ def list_models(make_id=None):
     )
 
 
+@memoize_for_request
 def get_model(model_id):
     normalized_model_id = _normalize_uuid(model_id, field_name="model_id", required=True)
     return _serialize_lookup_row(
@@ -311,6 +327,7 @@ def validate_model_id(model_id, *, required: bool = False, field_name: str = "mo
     return normalized_model_id
 
 
+@invalidates_request_cache
 def create_model(*, make_id, name: str) -> dict:
     normalized_make_id = validate_make_id(
         make_id,
@@ -334,6 +351,7 @@ def create_model(*, make_id, name: str) -> dict:
     return _serialize_lookup_row(row, "id", "make_id")
 
 
+@invalidates_request_cache
 def update_model(*, model_id, make_id, name: str) -> dict:
     normalized_model_id = validate_model_id(
         model_id,
@@ -370,6 +388,7 @@ def update_model(*, model_id, make_id, name: str) -> dict:
     return _serialize_lookup_row(row, "id", "make_id")
 
 
+@invalidates_request_cache
 def delete_model(model_id) -> bool:
     normalized_model_id = validate_model_id(
         model_id,
@@ -382,6 +401,7 @@ def delete_model(model_id) -> bool:
         raise ValueError("Model cannot be deleted because it is in use") from exc
 
 
+@memoize_for_request
 def list_variants(model_id=None):
     normalized_model_id = None
     if model_id is not None and str(model_id).strip():
@@ -400,6 +420,7 @@ def list_variants(model_id=None):
     )
 
 
+@memoize_for_request
 def get_variant(variant_id):
     normalized_variant_id = _normalize_uuid(
         variant_id,
@@ -415,6 +436,28 @@ def get_variant(variant_id):
     )
 
 
+@memoize_for_request
+def get_variants_by_ids(variant_ids) -> dict[str, dict]:
+    """Variants keyed by id, resolved with one query for the whole batch."""
+    normalized_ids = sorted(
+        {
+            _normalize_uuid(variant_id, field_name="variant_id", required=True)
+            for variant_id in variant_ids
+        }
+    )
+    if not normalized_ids:
+        return {}
+
+    rows = _serialize_lookup_rows(
+        lookups_db.list_variant_rows_by_ids(normalized_ids),
+        "id",
+        "model_id",
+        "make_id",
+        "category_id",
+    )
+    return {row["id"]: row for row in rows}
+
+
 def validate_variant_id(variant_id, *, required: bool = False, field_name: str = "variant_id") -> str | None:
     normalized_variant_id = _normalize_uuid(
         variant_id,
@@ -430,6 +473,7 @@ def validate_variant_id(variant_id, *, required: bool = False, field_name: str =
     return normalized_variant_id
 
 
+@invalidates_request_cache
 def create_variant(*, model_id, name: str) -> dict:
     normalized_model_id = validate_model_id(
         model_id,
@@ -453,6 +497,7 @@ def create_variant(*, model_id, name: str) -> dict:
     return _serialize_lookup_row(row, "id", "model_id")
 
 
+@invalidates_request_cache
 def update_variant(*, variant_id, model_id, name: str) -> dict:
     normalized_variant_id = validate_variant_id(
         variant_id,
@@ -489,6 +534,7 @@ def update_variant(*, variant_id, model_id, name: str) -> dict:
     return _serialize_lookup_row(row, "id", "model_id")
 
 
+@invalidates_request_cache
 def delete_variant(variant_id) -> bool:
     normalized_variant_id = validate_variant_id(
         variant_id,
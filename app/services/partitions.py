@@ -0,0 +1,40 @@
+import logging
+import os
+from datetime import date
+
+from app.db import partitions as partition_db
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITION_MONTHS_AHEAD = 3
+
+
+def months_ahead_setting() -> int:
+    return int(os.environ.get("PARTITION_MONTHS_AHEAD", DEFAULT_PARTITION_MONTHS_AHEAD))
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def ensure_future_partitions(months_ahead: int, today: date | None = None) -> dict[str, list[str]]:
+    """
+    Make sure every event log has a partition for the current month and the
+    next `months_ahead` months. Existing partitions are left alone, so this
+    is safe to run as often as you like.
+    """
+    if months_ahead < 0:
+        raise ValueError("months_ahead must be zero or more")
+
+    this_month = (today or date.today()).replace(day=1)
+    created = partition_db.create_monthly_partition_rows(this_month, _add_months(this_month, months_ahead))
+    for parent, names in created.items():
+        if names:
+            logger.info("created %s partition(s) for %s: %s", len(names), parent, ", ".join(names))
+    return created
+
+
+def list_partitions() -> list[dict]:
+    return partition_db.list_partition_rows()
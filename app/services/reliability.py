@@ -0,0 +1,328 @@
+import logging
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from flask import url_for
+
+from app.db import reliability as reliability_db
+from app.helpers import human_delta_2_times
+from app.services import sites as site_service
+from app.services.request_cache import memoize_for_request
+
+
+logger = logging.getLogger(__name__)
+
+RELIABILITY_SCOPES = ("asset", "model", "site")
+RELIABILITY_SORTS = tuple(reliability_db.RELIABILITY_SORTS)
+DEFAULT_RELIABILITY_WINDOW_DAYS = 90
+RELIABILITY_DEFAULT_LIMIT = 100
+RELIABILITY_MAX_LIMIT = 1000
+
+
+def window_days_setting() -> int:
+    return int(os.environ.get("RELIABILITY_WINDOW_DAYS", DEFAULT_RELIABILITY_WINDOW_DAYS))
+
+
+def reliability_window(window_days: int, now: datetime | None = None) -> tuple[datetime, datetime]:
+    """[start, end) ending at the last UTC midnight, so a nightly run covers whole days."""
+    if window_days < 1:
+        raise ValueError("window_days must be at least 1")
+    now = now or datetime.now(timezone.utc)
+    window_end = now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return window_end - timedelta(days=window_days), window_end
+
+
+def _interval_durations(group, starts, window_start: float, window_end: float):
+    """
+    Seconds each state change holds within [window_start, window_end).
+
+    `starts` are state-change times sorted by (group, time); a state lasts
+    until the next change in the same group, or the end of the window for
+    the last one.
+    """
+    import numpy as np
+
+    ends = np.full_like(starts, window_end)
+    if len(starts) > 1:
+        same_group_next = group[1:] == group[:-1]
+        ends[:-1] = np.where(same_group_next, starts[1:], window_end)
+    return np.clip(np.minimum(ends, window_end) - np.maximum(starts, window_start), 0.0, None)
+
+
+def _ratios(totals: dict) -> dict:
+    import numpy as np
+
+    uptime = totals["observed_seconds"] - totals["downtime_seconds"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "mtbf_seconds": np.where(totals["failure_count"] > 0, uptime / totals["failure_count"], np.nan),
+            "mttr_seconds": np.where(totals["repair_count"] > 0, totals["repair_seconds"] / totals["repair_count"], np.nan),
+            "availability": np.where(totals["observed_seconds"] > 0, uptime / totals["observed_seconds"], np.nan),
+        }
+
+
+def _aggregate(totals: dict, group, n_groups: int) -> dict:
+    import numpy as np
+
+    return {key: np.bincount(group, weights=values, minlength=n_groups) for key, values in totals.items()}
+
+
+def _snapshot_rows(scope: str, subject_ids, site_ids, totals: dict, window_start, window_end) -> list[dict]:
+    metrics = {**totals, **_ratios(totals)}
+    columns = {key: values.tolist() for key, values in metrics.items()}
+
+    rows = []
+    for index, subject_id in enumerate(subject_ids):
+        if columns["observed_seconds"][index] <= 0 and columns["failure_count"][index] == 0:
+            continue
+        row = {
+            "scope": scope,
+            "subject_id": subject_id,
+            "site_id": site_ids[index],
+            "window_start": window_start,
+            "window_end": window_end,
+        }
+        for key, values in columns.items():
+            value = values[index]
+            if key in ("asset_count", "failure_count", "repair_count"):
+                value = int(value)
+            elif math.isnan(value):
+                value = None
+            row[key] = value
+        rows.append(row)
+    return rows
+
+
+def compute_reliability_rows(window_start: datetime, window_end: datetime) -> list[dict]:
+    """
+    MTBF, MTTR and availability per asset, per model (per site and across
+    all sites) and per site over [window_start, window_end).
+
+    - observed time: time in the window the asset existed and was not retired
+    - downtime: observed time spent in a down asset status (maintenance/down)
+    - failures: issues opened in the window
+    - repairs: issues closed in the window; repair time is all the time the
+      issue spent not CLOSED, reopen cycles included
+    - MTBF = (observed - downtime) / failures, MTTR = repair time / repairs,
+      availability = (observed - downtime) / observed
+
+    Status intervals come from asset_status_history and issue_status_history,
+    fetched once as arrays; durations and group sums are vectorized NumPy
+    (no per-row Python), then model/site rows are bincount roll-ups of the
+    asset totals.
+
+    Returns:
+        reliability_snapshot rows (dicts), ready for replace_reliability_snapshot_rows
+    """
+    import numpy as np
+
+    start, end = window_start.timestamp(), window_end.timestamp()
+    data = reliability_db.fetch_reliability_input_rows(window_start=window_start, window_end=window_end)
+
+    asset_ids = data["assets"]["id"]
+    n_assets = len(asset_ids)
+    if n_assets == 0:
+        return []
+
+    # Asset status intervals -> observed and down time per asset.
+    asset_events = data["asset_events"]
+    event_asset = np.asarray(asset_events["asset_idx"], dtype=np.int64)
+    held = _interval_durations(event_asset, np.asarray(asset_events["changed_at"], dtype=float), start, end)
+    retired = np.asarray(asset_events["is_retired"], dtype=bool)
+    down = np.asarray(asset_events["is_down"], dtype=bool) & ~retired
+    observed = np.bincount(event_asset, weights=held * ~retired, minlength=n_assets)
+    downtime = np.bincount(event_asset, weights=held * down, minlength=n_assets)
+
+    # Issue status intervals -> failures, repairs and repair time per asset.
+    issues = data["issues"]
+    issue_asset = np.asarray(issues["asset_idx"], dtype=np.int64)
+    created = np.asarray(issues["created_at"], dtype=float)
+    closed = np.asarray(issues["closed_at"], dtype=float)  # None -> nan
+    issue_events = data["issue_events"]
+    event_issue = np.asarray(issue_events["issue_idx"], dtype=np.int64)
+    not_closed = ~np.asarray(issue_events["is_closed"], dtype=bool)
+    open_time = _interval_durations(
+        event_issue,
+        np.asarray(issue_events["changed_at"], dtype=float),
+        -np.inf,
+        end,
+    ) * not_closed
+    repair_time = np.bincount(event_issue, weights=open_time, minlength=len(created))
+
+    failed = (created >= start) & (created < end)
+    with np.errstate(invalid="ignore"):
+        repaired = (closed >= start) & (closed < end)
+
+    asset_totals = {
+        "asset_count": (observed > 0).astype(float),
+        "observed_seconds": observed,
+        "downtime_seconds": downtime,
+        "failure_count": np.bincount(issue_asset, weights=failed, minlength=n_assets),
+        "repair_count": np.bincount(issue_asset, weights=repaired, minlength=n_assets),
+        "repair_seconds": np.bincount(issue_asset, weights=repair_time * repaired, minlength=n_assets),
+    }
+
+    asset_site_ids = data["assets"]["site_id"]
+    rows = _snapshot_rows("asset", asset_ids, asset_site_ids, asset_totals, window_start, window_end)
+
+    sites, site_idx = np.unique(np.asarray(asset_site_ids, dtype=object), return_inverse=True)
+    models, model_idx = np.unique(np.asarray(data["assets"]["model_id"], dtype=object), return_inverse=True)
+
+    site_totals = _aggregate(asset_totals, site_idx, len(sites))
+    rows += _snapshot_rows("site", sites.tolist(), sites.tolist(), site_totals, window_start, window_end)
+
+    model_totals = _aggregate(asset_totals, model_idx, len(models))
+    rows += _snapshot_rows("model", models.tolist(), [None] * len(models), model_totals, window_start, window_end)
+
+    site_model_keys, site_model_idx = np.unique(site_idx * len(models) + model_idx, return_inverse=True)
+    site_model_totals = _aggregate(asset_totals, site_model_idx, len(site_model_keys))
+    rows += _snapshot_rows(
+        "model",
+        models[site_model_keys % len(models)].tolist(),
+        sites[site_model_keys // len(models)].tolist(),
+        site_model_totals,
+        window_start,
+        window_end,
+    )
+
+    return rows
+
+
+def refresh_reliability_snapshot(window_days: int | None = None, now: datetime | None = None) -> dict:
+    """
+    Recompute every reliability row and swap reliability_snapshot in one
+    transaction. Run nightly (python -m app.jobs.compute_reliability).
+    """
+    if window_days is None:
+        window_days = window_days_setting()
+    window_start, window_end = reliability_window(window_days, now)
+
+    started = perf_counter()
+    rows = compute_reliability_rows(window_start, window_end)
+    computed_s = perf_counter() - started
+    written = reliability_db.replace_reliability_snapshot_rows(rows)
+
+    result = {
+        "window_start": window_start,
+        "window_end": window_end,
+        "rows": written,
+        "assets": sum(1 for row in rows if row["scope"] == "asset"),
+        "compute_s": round(computed_s, 2),
+        "took_s": round(perf_counter() - started, 2),
+    }
+    logger.info("reliability snapshot refreshed: %s", result)
+    return result
+
+
+def _format_duration_from_seconds(total_seconds):
+    if total_seconds is None:
+        return None
+
+    safe_seconds = max(int(round(float(total_seconds))), 0)
+    anchor = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return human_delta_2_times(anchor, anchor + timedelta(seconds=safe_seconds))
+
+
+def _format_availability(availability):
+    if availability is None:
+        return None
+    return f"{availability * 100:.1f}%"
+
+
+def _reliability_item(row: dict) -> dict:
+    item = {
+        "id": str(row["subject_id"]),
+        "label": row["label"],
+        "sublabel": row["sublabel"] or None,
+        "site_id": str(row["site_id"]) if row["site_id"] is not None else None,
+        "site_shorthand": row["site_shorthand"],
+        "asset_count": row["asset_count"],
+        "failure_count": row["failure_count"],
+        "repair_count": row["repair_count"],
+        "observed_seconds": round(row["observed_seconds"]),
+        "downtime_seconds": round(row["downtime_seconds"]),
+        "downtime_display": _format_duration_from_seconds(row["downtime_seconds"]),
+        "mtbf_seconds": round(row["mtbf_seconds"]) if row["mtbf_seconds"] is not None else None,
+        "mtbf_display": _format_duration_from_seconds(row["mtbf_seconds"]),
+        "mttr_seconds": round(row["mttr_seconds"]) if row["mttr_seconds"] is not None else None,
+        "mttr_display": _format_duration_from_seconds(row["mttr_seconds"]),
+        "availability": round(row["availability"], 4) if row["availability"] is not None else None,
+        "availability_display": _format_availability(row["availability"]),
+        "url": None,
+    }
+    if row["scope"] == "asset":
+        item["url"] = url_for("app.view_asset", asset_id=row["subject_id"])
+    return item
+
+
+@memoize_for_request
+def get_reliability_report(scope="model", site_id=None, sort="availability", limit=RELIABILITY_DEFAULT_LIMIT) -> dict:
+    """
+    Precomputed reliability rows for one scope, worst first.
+
+    Returns:
+        {
+          "scope": "model", "site_id": "<uuid>" | None, "sort": "availability",
+          "window": {"start": ..., "end": ..., "days": 90} | None,
+          "computed_at": ... | None,
+          "items": [{id, label, sublabel, mtbf_seconds, mttr_seconds, availability, ...}],
+        }
+
+    Raises:
+        ValueError: unknown scope/sort, bad site_id or limit.
+    """
+    if scope not in RELIABILITY_SCOPES:
+        raise ValueError(f"Unknown scope: {scope}; expected one of {', '.join(RELIABILITY_SCOPES)}")
+    if sort not in RELIABILITY_SORTS:
+        raise ValueError(f"Unknown sort: {sort}; expected one of {', '.join(RELIABILITY_SORTS)}")
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer") from None
+    if limit < 1 or limit > RELIABILITY_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {RELIABILITY_MAX_LIMIT}")
+    site_id = site_service.validate_site_id(site_id)
+
+    meta = reliability_db.get_reliability_snapshot_meta()
+    if meta is None:
+        # First use before the nightly job has ever run: fill it once here.
+        refresh_reliability_snapshot()
+        meta = reliability_db.get_reliability_snapshot_meta()
+
+    rows = reliability_db.list_reliability_snapshot_rows(scope, site_id=site_id, sort=sort, limit=limit)
+
+    window = None
+    if meta is not None:
+        window = {
+            "start": meta["window_start"],
+            "end": meta["window_end"],
+            "days": (meta["window_end"] - meta["window_start"]).days,
+        }
+
+    return {
+        "scope": scope,
+        "site_id": site_id,
+        "sort": sort,
+        "window": window,
+        "computed_at": meta["computed_at"] if meta is not None else None,
+        "items": [_reliability_item(row) for row in rows],
+    }
+
+
+@memoize_for_request
+def get_asset_reliability(asset_id) -> dict | None:
+    """Display-ready availability / MTBF / MTTR for one asset from the snapshot, or None."""
+    row = reliability_db.get_asset_reliability_row(asset_id)
+    if row is None:
+        return None
+
+    return {
+        "availability": row["availability"],
+        "availability_display": _format_availability(row["availability"]),
+        "mtbf_display": _format_duration_from_seconds(row["mtbf_seconds"]),
+        "mttr_display": _format_duration_from_seconds(row["mttr_seconds"]),
+        "failure_count": row["failure_count"],
+        "window_days": (row["window_end"] - row["window_start"]).days,
+    }
@@ -0,0 +1,130 @@
+import functools
+import json
+import logging
+
+from flask import g, has_app_context, request
+
+from app import metrics
+
+
+logger = logging.getLogger(__name__)
+
+_CACHE_KEY = "_service_request_cache"
+_STATS_KEY = "_service_request_cache_stats"
+_MISSING = object()
+
+
+def _freeze(value):
+    """Turn dict/list/set arguments into something hashable for the cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _copy_result(value):
+    # Callers treat service results as their own (routes add keys, pop
+    # fields, ...); hand out fresh containers but share the leaf values.
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_result(item) for item in value)
+    return value
+
+
+def _stats() -> dict:
+    stats = g.get(_STATS_KEY)
+    if stats is None:
+        stats = {"hits": 0, "misses": 0, "invalidations": 0, "by_function": {}}
+        setattr(g, _STATS_KEY, stats)
+    return stats
+
+
+def memoize_for_request(func):
+    """
+    Cache a service read for the rest of the current request (on flask.g).
+    Outside an app context, or with unhashable arguments, it just calls through.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not has_app_context():
+            return func(*args, **kwargs)
+
+        try:
+            key = (name, _freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        cache = g.get(_CACHE_KEY)
+        if cache is None:
+            cache = {}
+            setattr(g, _CACHE_KEY, cache)
+
+        stats = _stats()
+        per_function = stats["by_function"].setdefault(name, {"hits": 0, "misses": 0})
+
+        result = cache.get(key, _MISSING)
+        metrics.record_cache_lookup("request_memo", result is not _MISSING)
+        if result is _MISSING:
+            stats["misses"] += 1
+            per_function["misses"] += 1
+            result = func(*args, **kwargs)
+            cache[key] = result
+        else:
+            stats["hits"] += 1
+            per_function["hits"] += 1
+
+        return _copy_result(result)
+
+    return wrapper
+
+
+def clear_request_cache() -> None:
+    if has_app_context() and g.get(_CACHE_KEY):
+        g.get(_CACHE_KEY).clear()
+        _stats()["invalidations"] += 1
+
+
+def invalidates_request_cache(func):
+    """
+    Mark a service write: anything memoized earlier in the request is dropped,
+    before the write runs (so a write that re-reads what it wrote, e.g.
+    update_issue returning get_issue, gets the new row) and again after.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        clear_request_cache()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            clear_request_cache()
+
+    return wrapper
+
+
+def install_request_cache(app) -> None:
+    """In debug mode, report per-request memo hit counts (header + log line)."""
+
+    @app.after_request
+    def report_request_cache(response):
+        if not app.debug:
+            return response
+
+        stats = g.get(_STATS_KEY)
+        if not stats:
+            return response
+
+        response.headers["X-Request-Cache"] = (
+            f"hits={stats['hits']}; misses={stats['misses']}; invalidations={stats['invalidations']}"
+        )
+        logger.info("request_cache %s", json.dumps({"path": request.path, **stats}, sort_keys=True))
+        return response
@@ -0,0 +1,164 @@
+import logging
+from time import perf_counter
+
+from flask import current_app, url_for
+from sqlalchemy.exc import OperationalError
+
+from app.db import assets as assets_repo
+from app.db import search as search_repo
+from app.services import sites as site_service
+
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TYPES = ("assets", "issues", "actions")
+SEARCH_DEFAULT_LIMIT = 5
+SEARCH_MAX_LIMIT = 25
+SEARCH_MAX_QUERY_LENGTH = 200
+DEFAULT_SEARCH_BUDGET_MS = 300
+
+# SQLSTATE query_canceled, raised when statement_timeout fires.
+_QUERY_CANCELED = "57014"
+
+
+def _is_statement_timeout(exc: OperationalError) -> bool:
+    return getattr(exc.orig, "pgcode", None) == _QUERY_CANCELED
+
+
+def _asset_result(row: dict) -> dict:
+    labels = [row.get("make_label"), row.get("model_label"), row.get("variant_label")]
+    return {
+        "type": "asset",
+        "id": str(row["id"]),
+        "title": row["asset_tag"],
+        "subtitle": " / ".join(label for label in labels if label) or None,
+        "snippet": None,
+        "rank": round(row["rank"], 4),
+        "site_id": str(row["site_id"]),
+        "status": {"code": row["status_code"], "label": row["status_label"]},
+        "url": url_for("app.view_asset", asset_id=row["id"]),
+    }
+
+
+def _issue_result(row: dict) -> dict:
+    return {
+        "type": "issue",
+        "id": str(row["id"]),
+        "title": row["title"],
+        "subtitle": row["asset_tag"],
+        "snippet": row["snippet"],
+        "rank": round(row["rank"], 4),
+        "site_id": str(row["site_id"]),
+        "status": {"code": row["status_code"], "label": row["status_label"]},
+        "asset_id": str(row["asset_id"]),
+        "created_at": row["created_at"],
+        "url": url_for("app.view_issue", issue_id=row["id"]),
+    }
+
+
+def _action_result(row: dict) -> dict:
+    return {
+        "type": "issue_action",
+        "id": row["id"],
+        "title": row["issue_title"],
+        "subtitle": row["asset_tag"],
+        "snippet": row["snippet"],
+        "rank": round(row["rank"], 4),
+        "site_id": str(row["site_id"]),
+        "issue_id": str(row["issue_id"]),
+        "action_type": {"code": row["action_type_code"], "label": row["action_type_label"]},
+        "created_by": row["created_by"],
+        "created_at": row["created_at"],
+        "url": url_for("app.view_issue", issue_id=row["issue_id"]),
+    }
+
+
+def _search_group(search_type: str, query: str, *, site_id, limit: int, timeout_ms: int) -> list[dict]:
+    if search_type == "assets":
+        rows = assets_repo.search_asset_rows(query, site_id=site_id, limit=limit, timeout_ms=timeout_ms)
+        return [_asset_result(row) for row in rows]
+    if search_type == "issues":
+        rows = search_repo.search_issue_rows(query, site_id=site_id, limit=limit, timeout_ms=timeout_ms)
+        return [_issue_result(row) for row in rows]
+    rows = search_repo.search_issue_action_rows(query, site_id=site_id, limit=limit, timeout_ms=timeout_ms)
+    return [_action_result(row) for row in rows]
+
+
+def _normalize_types(types) -> tuple[str, ...]:
+    if not types:
+        return SEARCH_TYPES
+
+    requested = []
+    for search_type in types:
+        if search_type not in SEARCH_TYPES:
+            raise ValueError(f"Unknown search type: {search_type}; expected one of {', '.join(SEARCH_TYPES)}")
+        if search_type not in requested:
+            requested.append(search_type)
+    return tuple(requested)
+
+
+def search(q, *, site_id=None, types=None, limit=SEARCH_DEFAULT_LIMIT) -> dict:
+    """
+    Search assets, issues and issue actions in one call.
+
+    Each entity type is one indexed query (trigram/prefix for assets,
+    full-text for issues and actions), ranked within its own group. All
+    groups share SEARCH_BUDGET_MS: each query runs with the budget that is
+    left as its statement_timeout, and a group that runs out comes back
+    empty with timed_out=True instead of holding the response.
+
+    Returns:
+        {
+          "query": "hydraulic leak",
+          "site_id": "<uuid>" | None,
+          "groups": {
+            "assets":  {"items": [...], "timed_out": False},
+            "issues":  {"items": [...], "timed_out": False},
+            "actions": {"items": [...], "timed_out": True},
+          },
+          "took_ms": 12.3,
+        }
+
+    Raises:
+        ValueError: blank query, bad site_id, type or limit.
+    """
+    query = " ".join(str(q or "").split())[:SEARCH_MAX_QUERY_LENGTH]
+    if not query:
+        raise ValueError("Missing required field: q")
+
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer") from None
+    if limit < 1 or limit > SEARCH_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {SEARCH_MAX_LIMIT}")
+
+    site_id = site_service.validate_site_id(site_id)
+    search_types = _normalize_types(types)
+
+    budget_ms = current_app.config.get("SEARCH_BUDGET_MS", DEFAULT_SEARCH_BUDGET_MS)
+    started = perf_counter()
+    groups = {}
+    for search_type in search_types:
+        remaining_ms = budget_ms - (perf_counter() - started) * 1000
+        if remaining_ms < 1:
+            groups[search_type] = {"items": [], "timed_out": True}
+            continue
+
+        try:
+            items = _search_group(search_type, query, site_id=site_id, limit=limit, timeout_ms=int(remaining_ms))
+        except OperationalError as exc:
+            if not _is_statement_timeout(exc):
+                raise
+            logger.warning("search %s timed out after %.0f ms for %r", search_type, remaining_ms, query)
+            groups[search_type] = {"items": [], "timed_out": True}
+            continue
+
+        groups[search_type] = {"items": items, "timed_out": False}
+
+    return {
+        "query": query,
+        "site_id": site_id,
+        "groups": groups,
+        "took_ms": round((perf_counter() - started) * 1000, 1),
+    }
@@ -1,10 +1,13 @@
 from time import monotonic
+from types import MappingProxyType
 from uuid import UUID
 
 from flask import request
 from sqlalchemy.exc import IntegrityError
 
+from app import metrics
 from app.db import sites as sites_db
+from app.services.request_cache import invalidates_request_cache
 
 
 PREFERRED_SITE_COOKIE_NAME = "preferred_site"
@@ -13,8 +16,8 @@ MAINTENANCE_SITE_CONTEXT_COOKIE_NAME = "maintenance_site_context"
 MAINTENANCE_SPLASH_COOKIE_NAME = "maintenance_welcome_seen"
 MAINTENANCE_SPLASH_STORAGE_KEY = "maintenanceWelcomeShown"
 _SITE_CACHE_TTL_SECONDS = 300
-_SITE_SNAPSHOT = None
-_SITE_SNAPSHOT_EXPIRES_AT = 0.0
+_SITE_CATALOG = None
+_SITE_CATALOG_EXPIRES_AT = 0.0
 _MAINTENANCE_SPLASH_ENDPOINTS = {"app.dashboard"}
 
 
@@ -36,61 +39,60 @@ def _normalize_site_id(site_id) -> str | None:
         return None
 
 
-def _clone_site(site: dict) -> dict:
+def _clone_site(site) -> dict:
     return dict(site)
 
 
-def _build_site_snapshot(rows: list[dict]) -> tuple[dict, ...]:
+def _build_site_catalog(rows: list[dict]) -> MappingProxyType:
+    """
+    Build the read-only catalog once per snapshot. Sites are frozen
+    mappings shared by every lookup, so reads never copy.
+    """
     sites = []
+    by_id = {}
+    by_code = {}
 
     for row in rows:
         site = dict(row)
         site["id"] = str(site["id"])
         site["code"] = _normalize_site_code(site.get("shorthand"))
+        site = MappingProxyType(site)
+
         sites.append(site)
+        by_id[site["id"]] = site
+        if site["code"]:
+            by_code[site["code"]] = site
 
-    return tuple(sites)
+    return MappingProxyType({
+        "sites": tuple(sites),
+        "by_id": MappingProxyType(by_id),
+        "by_code": MappingProxyType(by_code),
+        "valid_site_ids": frozenset(by_id),
+        "valid_site_codes": frozenset(by_code),
+    })
 
 
-def _get_site_snapshot(force_refresh: bool = False) -> tuple[dict, ...]:
-    global _SITE_SNAPSHOT
-    global _SITE_SNAPSHOT_EXPIRES_AT
+def get_site_catalog(force_refresh: bool = False) -> MappingProxyType:
+    global _SITE_CATALOG
+    global _SITE_CATALOG_EXPIRES_AT
 
     now = monotonic()
-    if force_refresh or _SITE_SNAPSHOT is None or now >= _SITE_SNAPSHOT_EXPIRES_AT:
-        _SITE_SNAPSHOT = _build_site_snapshot(sites_db.list_site_rows())
-        _SITE_SNAPSHOT_EXPIRES_AT = now + _SITE_CACHE_TTL_SECONDS
+    stale = force_refresh or _SITE_CATALOG is None or now >= _SITE_CATALOG_EXPIRES_AT
+    metrics.record_cache_lookup("site_catalog", hit=not stale)
+    if stale:
+        _SITE_CATALOG = _build_site_catalog(sites_db.list_site_rows())
+        _SITE_CATALOG_EXPIRES_AT = now + _SITE_CACHE_TTL_SECONDS
 
-    return _SITE_SNAPSHOT
+    return _SITE_CATALOG
 
 
 def list_sites(force_refresh: bool = False) -> list[dict]:
-    snapshot = _get_site_snapshot(force_refresh=force_refresh)
-    return [_clone_site(site) for site in snapshot]
-
-
-def get_site_catalog(force_refresh: bool = False) -> dict:
-    sites = list_sites(force_refresh=force_refresh)
-    by_id = {}
-    by_code = {}
-
-    for site in sites:
-        by_id[site["id"]] = site
-        if site["code"]:
-            by_code[site["code"]] = site
+    """Sites as plain dicts (safe to mutate / jsonify)."""
+    return [_clone_site(site) for site in get_site_catalog(force_refresh=force_refresh)["sites"]]
 
-    return {
-        "sites": sites,
-        "by_id": {site_id: _clone_site(site) for site_id, site in by_id.items()},
-        "by_code": {code: _clone_site(site) for code, site in by_code.items()},
-        "valid_site_ids": set(by_id.keys()),
-        "valid_site_codes": set(by_code.keys()),
-    }
 
-
-def get_valid_site_codes(force_refresh: bool = False) -> set[str]:
-    catalog = get_site_catalog(force_refresh=force_refresh)
-    return set(catalog["valid_site_codes"])
+def get_valid_site_codes(force_refresh: bool = False) -> frozenset[str]:
+    return get_site_catalog(force_refresh=force_refresh)["valid_site_codes"]
 
 
 def get_site(site_id):
@@ -103,12 +105,12 @@ def get_site(site_id):
 
 
 def get_site_by_code(site_code: str | None):
+    """Read-only site mapping for a code, or None."""
     normalized_site_code = _normalize_site_code(site_code)
     if not normalized_site_code:
         return None
 
-    site = get_site_catalog()["by_code"].get(normalized_site_code)
-    return _clone_site(site) if site else None
+    return get_site_catalog()["by_code"].get(normalized_site_code)
 
 
 def get_current_site(site_code: str | None = None):
@@ -158,6 +160,7 @@ def validate_site_id(site_id, *, required: bool = False, field_name: str = "site
     return normalized_site_id
 
 
+@invalidates_request_cache
 def create_site(*, shorthand: str, fullname: str) -> dict:
     normalized_shorthand = _normalize_site_code(shorthand)
     normalized_fullname = _normalize_site_fullname(fullname)
@@ -176,7 +179,7 @@ def create_site(*, shorthand: str, fullname: str) -> dict:
     except IntegrityError as exc:
         raise ValueError("Site short code already exists") from exc
 
-    _get_site_snapshot(force_refresh=True)
+    get_site_catalog(force_refresh=True)
 
     site = dict(row)
     site["id"] = str(site["id"])
@@ -184,6 +187,7 @@ def create_site(*, shorthand: str, fullname: str) -> dict:
     return site
 
 
+@invalidates_request_cache
 def update_site(*, site_id, shorthand: str, fullname: str) -> dict:
     normalized_site_id = validate_site_id(site_id, required=True, field_name="site_id")
     normalized_shorthand = _normalize_site_code(shorthand)
@@ -210,7 +214,7 @@ def update_site(*, site_id, shorthand: str, fullname: str) -> dict:
     if row is None:
         raise ValueError("Unknown site_id")
 
-    _get_site_snapshot(force_refresh=True)
+    get_site_catalog(force_refresh=True)
 
     site = dict(row)
     site["id"] = str(site["id"])
@@ -218,6 +222,7 @@ def update_site(*, site_id, shorthand: str, fullname: str) -> dict:
     return site
 
 
+@invalidates_request_cache
 def delete_site(site_id) -> bool:
     normalized_site_id = validate_site_id(site_id, required=True, field_name="site_id")
     try:
@@ -226,7 +231,7 @@ def delete_site(site_id) -> bool:
         raise ValueError("Site cannot be deleted because it is in use") from exc
 
     if deleted:
-        _get_site_snapshot(force_refresh=True)
+        get_site_catalog(force_refresh=True)
     return deleted
 
 
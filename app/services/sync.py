@@ -0,0 +1,112 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+from app.db import sync as sync_db
+
+
+SYNC_DEFAULT_LIMIT = 500
+SYNC_MAX_LIMIT = 2000
+DEFAULT_RETENTION_DAYS = 30
+
+
+class SyncCursorExpired(Exception):
+    """
+    The cursor is older than the retained change log; the client has to
+    refetch everything and start again from a fresh cursor. The API answers
+    410 Gone.
+    """
+
+    def __init__(self):
+        super().__init__("Changes since this cursor are no longer kept; resync from scratch")
+
+
+def sync_retention_days() -> float:
+    return float(os.environ.get("SYNC_RETENTION_DAYS", DEFAULT_RETENTION_DAYS))
+
+
+def _encode_cursor(txid: int, seq: int) -> str:
+    return f"{txid}.{seq}"
+
+
+def _decode_cursor(cursor: str) -> tuple[int, int]:
+    try:
+        txid, seq = cursor.split(".", 1)
+        return int(txid), int(seq)
+    except ValueError:
+        raise ValueError("Invalid since cursor")
+
+
+def _serialize_change_row(row: dict) -> dict:
+    return {
+        "seq": row["seq"],
+        "entity": row["entity"],
+        "id": row["entity_id"],
+        "op": row["op"],
+        "data": row["data"],
+        "changed_at": row["changed_at"],
+    }
+
+
+def get_changes(since: str | None = None, limit: int = SYNC_DEFAULT_LIMIT) -> dict:
+    """
+    Changes to issues, issue actions, issue/asset status history and assets
+    after the `since` cursor, oldest first.
+
+    Without `since` no changes are returned, only the cursor of "now": a
+    client takes it first, then loads the full lists, then syncs from it
+    (changes in between come through again, harmlessly).
+
+    Each change is {"seq", "entity", "id", "op": "upsert" | "delete" |
+    "archive", "data": the record as it now is (null for a delete or an
+    issue moved to the archive), "changed_at"}.
+    When a record changed several times within one page only its last
+    change is returned. Pass the returned cursor as `since` next time;
+    has_more means another page is ready right away.
+
+    Raises:
+        ValueError: malformed cursor or limit.
+        SyncCursorExpired: the cursor predates the retained change log.
+    """
+    if since is None or not since.strip():
+        head = sync_db.get_change_log_head()
+        return {
+            "cursor": _encode_cursor(head["txid"], head["seq"]),
+            "has_more": False,
+            "changes": [],
+        }
+
+    if limit < 1 or limit > SYNC_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {SYNC_MAX_LIMIT}")
+
+    since = since.strip()
+    since_txid, since_seq = _decode_cursor(since)
+
+    result = sync_db.list_change_rows(since_txid=since_txid, since_seq=since_seq, limit=limit + 1)
+    if result["pruned_through_txid"] and since_txid <= result["pruned_through_txid"]:
+        raise SyncCursorExpired()
+
+    rows = result["rows"]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    cursor = since
+    if rows:
+        cursor = _encode_cursor(rows[-1]["txid"], rows[-1]["seq"])
+
+    last_change = {(row["entity"], row["entity_id"]): index for index, row in enumerate(rows)}
+    changes = [
+        _serialize_change_row(row)
+        for index, row in enumerate(rows)
+        if last_change[(row["entity"], row["entity_id"])] == index
+    ]
+
+    return {
+        "cursor": cursor,
+        "has_more": has_more,
+        "changes": changes,
+    }
+
+
+def purge_expired_changes() -> int:
+    changed_before = datetime.now(timezone.utc) - timedelta(days=sync_retention_days())
+    return sync_db.delete_expired_change_rows(changed_before)
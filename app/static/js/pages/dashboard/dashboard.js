@@ -377,26 +377,153 @@
     renderTrendChart(data.trend || {});
   }
 
-  fetch(apiUrl)
-    .then(function (response) {
-      if (!response.ok) {
-        throw new Error("HTTP status " + response.status);
+  var currentData = null;
+
+  function loadDashboard() {
+    return fetch(apiUrl)
+      .then(function (response) {
+        if (!response.ok) {
+          throw new Error("HTTP status " + response.status);
+        }
+        return response.json();
+      })
+      .then(function (data) {
+        if (errorBox) {
+          errorBox.hidden = true;
+        }
+        currentData = data;
+        renderDashboard(data);
+      })
+      .catch(function (error) {
+        console.error("Failed to load dashboard data:", error);
+
+        if (currentData) {
+          return;
+        }
+
+        renderDashboard(buildFallbackDashboardData());
+
+        if (errorBox) {
+          errorBox.hidden = true;
+        }
+      });
+  }
+
+  loadDashboard();
+
+  // Live updates: headline counters are patched straight from each change
+  // event; the rest (trend, offenders, resolution) comes from one refetch
+  // at most every REFRESH_DELAY_MS while changes keep arriving.
+  var eventsUrl = pageRoot.getAttribute("data-events-url");
+  var REFRESH_DELAY_MS = 15000;
+  var refreshTimer = null;
+
+  function scheduleRefresh() {
+    if (refreshTimer !== null) {
+      return;
+    }
+    refreshTimer = window.setTimeout(function () {
+      refreshTimer = null;
+      loadDashboard();
+    }, REFRESH_DELAY_MS);
+  }
+
+  function statusCode(status) {
+    return status && status.code ? String(status.code).toUpperCase() : "";
+  }
+
+  function isOpenStatus(status) {
+    var code = statusCode(status);
+    return code === "OPEN" || code === "IN_PROGRESS";
+  }
+
+  function isBlockedStatus(status) {
+    return statusCode(status) === "BLOCKED";
+  }
+
+  // Same rule as the assets_down query in app/db/dashboard.py.
+  function isAssetDown(status, retired) {
+    if (!status || retired) {
+      return false;
+    }
+    return statusCode(status).indexOf("MAINTEN") !== -1
+      || String(status.label || "").toUpperCase().indexOf("MAINTEN") !== -1;
+  }
+
+  function adjustCounter(group, key, delta) {
+    if (!currentData || !currentData[group] || typeof currentData[group][key] !== "number" || !delta) {
+      return;
+    }
+    currentData[group][key] = Math.max(0, currentData[group][key] + delta);
+  }
+
+  function countIssue(status, sign) {
+    adjustCounter("summary", "open_issues", isOpenStatus(status) ? sign : 0);
+    adjustCounter("summary", "blocked_issues", isBlockedStatus(status) ? sign : 0);
+  }
+
+  function applyEvent(event) {
+    if (event.type === "issue.created") {
+      countIssue(event.status, 1);
+      adjustCounter("throughput", "opened_this_week", 1);
+    } else if (event.type === "issue.deleted") {
+      countIssue(event.status, -1);
+    } else if (event.type === "issue.updated") {
+      if (statusCode(event.previous_status) === statusCode(event.status)) {
+        return false;
       }
-      return response.json();
-    })
-    .then(function (data) {
-      if (errorBox) {
-        errorBox.hidden = true;
+      countIssue(event.previous_status, -1);
+      countIssue(event.status, 1);
+      if (statusCode(event.status) === "CLOSED") {
+        adjustCounter("throughput", "closed_this_week", 1);
       }
-      renderDashboard(data);
-    })
-    .catch(function (error) {
-      console.error("Failed to load dashboard data:", error);
+    } else if (event.type === "asset.status_changed") {
+      var wasDown = isAssetDown(event.previous_status, event.retired);
+      var isDown = isAssetDown(event.status, event.retired);
+      adjustCounter("summary", "assets_down", (isDown ? 1 : 0) - (wasDown ? 1 : 0));
+    } else {
+      return false;
+    }
+    return true;
+  }
 
-      renderDashboard(buildFallbackDashboardData());
+  if (eventsUrl && window.EventSource) {
+    var source = new EventSource(eventsUrl);
+    var connectedOnce = false;
+
+    var onChange = function (message) {
+      var event;
+      try {
+        event = JSON.parse(message.data);
+      } catch (error) {
+        console.error("Ignoring malformed live event:", error);
+        return;
+      }
 
-      if (errorBox) {
-        errorBox.hidden = true;
+      if (applyEvent(event) && currentData) {
+        renderDashboard(currentData);
       }
+      scheduleRefresh();
+    };
+
+    ["issue.created", "issue.updated", "issue.deleted", "asset.status_changed"].forEach(function (eventType) {
+      source.addEventListener(eventType, onChange);
+    });
+
+    // Nothing is replayed across a reconnect, so resync on every "ready"
+    // after the first and whenever the server reports lost events.
+    source.addEventListener("ready", function () {
+      if (connectedOnce) {
+        loadDashboard();
+      }
+      connectedOnce = true;
     });
+    source.addEventListener("resync", function () {
+      loadDashboard();
+    });
+
+    window.addEventListener("pagehide", function () {
+      source.close();
+    });
+  }
 })();
@@ -0,0 +1,155 @@
+(function () {
+  var pageRoot = document.querySelector(".issues-wrap");
+  if (!pageRoot || !window.EventSource) {
+    return;
+  }
+
+  var eventsUrl = pageRoot.getAttribute("data-events-url");
+  var statusFilter = pageRoot.getAttribute("data-status-filter") || "";
+  var notice = document.getElementById("issues-live-notice");
+  var noticeText = document.getElementById("issues-live-notice-text");
+
+  var STATUS_CLASSES = {
+    OPEN: "status-open",
+    IN_PROGRESS: "status-in-progress",
+    BLOCKED: "status-blocked",
+    CLOSED: "status-closed"
+  };
+
+  var newIssueCount = 0;
+  var connectedOnce = false;
+
+  if (!eventsUrl) {
+    return;
+  }
+
+  function statusMatchesFilter(status) {
+    var code = status && status.code;
+    if (!statusFilter) {
+      return true;
+    }
+    if (statusFilter === "ACTIVE") {
+      return code === "OPEN" || code === "IN_PROGRESS";
+    }
+    return code === statusFilter;
+  }
+
+  function findRow(issueId) {
+    if (!issueId) {
+      return null;
+    }
+    return pageRoot.querySelector('.table-row[data-issue-id="' + issueId + '"]');
+  }
+
+  function showNotice(message) {
+    if (!notice || !noticeText) {
+      return;
+    }
+    noticeText.textContent = message;
+    notice.hidden = false;
+  }
+
+  function flashRow(row) {
+    row.classList.remove("table-row--updated");
+    // Force a reflow so the animation restarts on repeated updates.
+    void row.offsetWidth;
+    row.classList.add("table-row--updated");
+  }
+
+  function setRowStatus(row, status) {
+    var chip = row.querySelector(".issue-status");
+    if (!chip || !status) {
+      return;
+    }
+
+    var className;
+    for (className in STATUS_CLASSES) {
+      if (Object.prototype.hasOwnProperty.call(STATUS_CLASSES, className)) {
+        chip.classList.remove(STATUS_CLASSES[className]);
+      }
+    }
+    chip.classList.remove("status-unknown");
+    chip.classList.add(STATUS_CLASSES[status.code] || "status-unknown");
+    chip.textContent = status.label || status.code || "";
+  }
+
+  function onIssueCreated(event) {
+    if (!statusMatchesFilter(event.status)) {
+      return;
+    }
+    newIssueCount += 1;
+    showNotice(
+      newIssueCount === 1
+        ? "1 new issue has been reported."
+        : newIssueCount + " new issues have been reported."
+    );
+  }
+
+  function onIssueUpdated(event) {
+    var row = findRow(event.id);
+    if (!row) {
+      return;
+    }
+
+    if (!statusMatchesFilter(event.status)) {
+      row.remove();
+      return;
+    }
+
+    var title = row.querySelector(".issue-title");
+    if (title && event.title) {
+      title.textContent = event.title;
+    }
+    setRowStatus(row, event.status);
+    flashRow(row);
+  }
+
+  function onIssueDeleted(event) {
+    var row = findRow(event.id);
+    if (row) {
+      row.remove();
+    }
+  }
+
+  function onIssueActionCreated(event) {
+    var row = findRow(event.issue_id);
+    if (row) {
+      flashRow(row);
+    }
+  }
+
+  function listen(eventType, handler) {
+    source.addEventListener(eventType, function (message) {
+      var event;
+      try {
+        event = JSON.parse(message.data);
+      } catch (error) {
+        console.error("Ignoring malformed live event:", error);
+        return;
+      }
+      handler(event);
+    });
+  }
+
+  var source = new EventSource(eventsUrl);
+
+  // "ready" opens every (re)connect; anything sent while disconnected is
+  // not replayed, so after the first one the list may be out of date.
+  listen("ready", function () {
+    if (connectedOnce) {
+      showNotice("Live updates were interrupted; this list may be out of date.");
+    }
+    connectedOnce = true;
+  });
+  listen("resync", function () {
+    showNotice("Live updates were interrupted; this list may be out of date.");
+  });
+  listen("issue.created", onIssueCreated);
+  listen("issue.updated", onIssueUpdated);
+  listen("issue.deleted", onIssueDeleted);
+  listen("issue_action.created", onIssueActionCreated);
+
+  window.addEventListener("pagehide", function () {
+    source.close();
+  });
+})();
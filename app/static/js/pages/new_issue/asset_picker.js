@@ -18,6 +18,7 @@
 
    data attributes on #assetPicker:
    - data-assets-url              (default: /maintenance/api/v2/assets)
+   - data-asset-search-url        (default: /maintenance/api/v2/assets/search)
    - data-asset-statuses-url      (default: /maintenance/api/v2/asset-statuses)
    - data-makes-url               (default: /maintenance/api/v2/assets/makes)
    - data-models-url              (default: /maintenance/api/v2/assets/models)
@@ -53,6 +54,7 @@
 
   const URLS = {
     assets: panel.dataset.assetsUrl || "/maintenance/api/v2/assets",
+    search: panel.dataset.assetSearchUrl || "/maintenance/api/v2/assets/search",
     statuses: panel.dataset.assetStatusesUrl || "/maintenance/api/v2/asset-statuses",
     makes: panel.dataset.makesUrl || "/maintenance/api/v2/assets/makes",
     models: panel.dataset.modelsUrl || "/maintenance/api/v2/assets/models",
@@ -98,8 +100,8 @@
     selectEl.disabled = !!disabled;
   }
 
-  async function fetchJson(url) {
-    const res = await fetch(url, { headers: { Accept: "application/json" } });
+  async function fetchJson(url, options = {}) {
+    const res = await fetch(url, { headers: { Accept: "application/json" }, ...options });
     if (!res.ok) throw new Error(`HTTP ${res.status} for ${url}`);
     return res.json();
   }
@@ -314,7 +316,7 @@
     const rows = items.map((a) => {
       const id = escapeHtml(a.id || a.asset_id || "");
       const tag = escapeHtml(a.asset_tag || "");
-      const serial = escapeHtml(a.serial_num || "");
+      const serial = escapeHtml(a.serial_num || a.serial_number || "");
       const site = escapeHtml(deriveSite(a));
       const make = escapeHtml(deriveMake(a));
       const model = escapeHtml(deriveModel(a));
@@ -347,21 +349,57 @@
   // -----------------------------
   // Search actions
   // -----------------------------
-  async function runSearch() {
-    setLoading("Searching…");
+  // Only the newest request may render; older ones are aborted.
+  let searchController = null;
 
-    const url = `${URLS.assets}?${buildAssetSearchParams().toString()}`;
+  async function fetchAssets(url) {
+    if (searchController) searchController.abort();
+    const controller = new AbortController();
+    searchController = controller;
 
     try {
-      const data = await fetchJson(url);
-      const items = Array.isArray(data) ? data : (data.items || []);
-      renderResults(items);
+      const data = await fetchJson(url, { signal: controller.signal });
+      if (controller !== searchController) return;
+      renderResults(Array.isArray(data) ? data : (data.items || []));
     } catch (e) {
+      if (e.name === "AbortError") return;
       console.error("Asset search failed:", e);
       setEmpty("Search failed. Check console + API route.");
     }
   }
 
+  function hasClassificationFilters() {
+    return [el.status, el.category, el.make, el.model, el.variant].some((s) => s?.value);
+  }
+
+  // Typed text goes to the ranked typeahead (prefix + fuzzy over tag, serial
+  // and make/model/variant); the dropdown filters use the plain asset list.
+  function typeaheadUrl(term) {
+    const p = new URLSearchParams({ q: term, limit: "10" });
+    if (el.site?.value) p.set("site_id", el.site.value);
+    return `${URLS.search}?${p.toString()}`;
+  }
+
+  async function runSearch() {
+    setLoading("Searching…");
+
+    const term = (el.input?.value || "").trim();
+    if (term && !hasClassificationFilters()) {
+      await fetchAssets(typeaheadUrl(term));
+      return;
+    }
+
+    await fetchAssets(`${URLS.assets}?${buildAssetSearchParams().toString()}`);
+  }
+
+  let typeaheadTimer = null;
+  el.input?.addEventListener("input", () => {
+    clearTimeout(typeaheadTimer);
+    const term = (el.input.value || "").trim();
+    if (!term || hasClassificationFilters()) return;
+    typeaheadTimer = setTimeout(() => fetchAssets(typeaheadUrl(term)), 120);
+  });
+
   function clearAll() {
     if (el.input) el.input.value = "";
 
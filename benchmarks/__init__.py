@@ -0,0 +1,14 @@
+"""
+Benchmark suite for the maintenance app's hot paths.
+
+Each run provisions a throwaway Postgres cluster (initdb in a temp dir),
+loads sql/schema.sql plus sql/migrations/, generates synthetic data at one
+or more scales and times the repository/service functions the pages lean
+on. Results are written as JSON so two commits can be compared:
+
+    python -m benchmarks.run --scale small --scale medium
+    python -m benchmarks.compare benchmarks/results/<old>.json benchmarks/results/<new>.json
+
+Postgres binaries are found via --pg-bin, $PG_BIN, `pg_config --bindir`
+or PATH. initdb refuses to run as root, so run as a regular user.
+"""
@@ -0,0 +1,65 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _load(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def compare(base: dict, head: dict, *, metric: str = "median_ms", threshold: float = 0.10) -> tuple[list, int]:
+    """
+    Return (table rows, regression count). A case regresses when head is
+    slower than base by more than `threshold` (as a fraction).
+    """
+    rows = []
+    regressions = 0
+    for scale_name, head_scale in head.get("scales", {}).items():
+        base_cases = base.get("scales", {}).get(scale_name, {}).get("cases", {})
+        for case_name, head_stats in head_scale.get("cases", {}).items():
+            base_stats = base_cases.get(case_name)
+            if base_stats is None:
+                rows.append((scale_name, case_name, None, head_stats[metric], None, ""))
+                continue
+
+            ratio = head_stats[metric] / base_stats[metric] if base_stats[metric] else None
+            flag = ""
+            if ratio is not None and ratio > 1 + threshold:
+                flag = "slower"
+                regressions += 1
+            elif ratio is not None and ratio < 1 - threshold:
+                flag = "faster"
+            rows.append((scale_name, case_name, base_stats[metric], head_stats[metric], ratio, flag))
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.compare",
+        description="Compare two benchmark result files case by case.",
+    )
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--metric", default="median_ms", help="stat to compare (default: median_ms)")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change to flag (default: 0.10)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if any case got slower")
+    args = parser.parse_args(argv)
+
+    base = _load(args.base)
+    head = _load(args.head)
+    rows, regressions = compare(base, head, metric=args.metric, threshold=args.threshold)
+
+    print(f"base {(base.get('git_sha') or '?')[:10]}  head {(head.get('git_sha') or '?')[:10]}  ({args.metric})")
+    for scale_name, case_name, base_value, head_value, ratio, flag in rows:
+        base_text = "-" if base_value is None else f"{base_value:.3f}"
+        ratio_text = "-" if ratio is None else f"{ratio:.2f}x"
+        print(f"{scale_name:<8} {case_name:<45} {base_text:>10} {head_value:>10.3f} {ratio_text:>7} {flag}")
+
+    if args.fail_on_regression and regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,400 @@
+import csv
+import io
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+
+SCALES = {
+    "small": {
+        "sites": 3,
+        "categories": 2,
+        "makes_per_category": 2,
+        "models_per_make": 3,
+        "variants_per_model": 2,
+        "assets": 300,
+        "issues": 1500,
+        "history_days": 365,
+    },
+    "medium": {
+        "sites": 8,
+        "categories": 3,
+        "makes_per_category": 3,
+        "models_per_make": 4,
+        "variants_per_model": 3,
+        "assets": 3000,
+        "issues": 25000,
+        "history_days": 730,
+    },
+    "large": {
+        "sites": 20,
+        "categories": 4,
+        "makes_per_category": 4,
+        "models_per_make": 5,
+        "variants_per_model": 3,
+        "assets": 15000,
+        "issues": 150000,
+        "history_days": 1095,
+    },
+}
+
+ISSUE_STATUSES = (
+    ("OPEN", "Open", 1),
+    ("IN_PROGRESS", "In Progress", 2),
+    ("BLOCKED", "Blocked", 3),
+    ("CLOSED", "Closed", 4),
+)
+ACTION_TYPES = (
+    ("CREATED", "Created", 1),
+    ("NOTE", "Note", 2),
+    ("INSPECT", "Inspect", 3),
+    ("REPAIR", "Repair", 4),
+    ("CLOSED", "Closed", 5),
+)
+ASSET_STATUSES = (
+    ("ACTIVE", "Active", 1),
+    ("MAINTENANCE", "Under Maintenance", 2),
+    ("RETIRED", "Retired", 3),
+)
+CONTENT_TYPES = ("image/jpeg", "image/png", "image/webp", "image/heic")
+
+_CATEGORY_NAMES = ("Robot", "Charger", "Tablet", "Controller", "Sensor Kit", "Battery Pack")
+_PROBLEMS = (
+    "Hydraulic leak",
+    "Wheel motor fault",
+    "Battery not charging",
+    "Lidar misaligned",
+    "Gripper jammed",
+    "Firmware crash loop",
+    "Bumper sensor stuck",
+    "Loose cable harness",
+    "Overheating drive",
+    "Screen cracked",
+    "Bluetooth pairing fails",
+    "Noisy gearbox",
+)
+_LOCATIONS = ("front left", "front right", "rear", "top panel", "base", "arm joint", "charging port")
+_NOTES = (
+    "Checked connectors, reseated harness.",
+    "Ordered replacement part.",
+    "Ran diagnostics, error persists.",
+    "Cleaned contacts and retested.",
+    "Waiting on vendor response.",
+    "Replaced seal, monitoring for leaks.",
+    "Updated firmware to latest release.",
+    "Tightened mounting bolts.",
+)
+_PEOPLE = ("alex", "sam", "jordan", "casey", "riley", "morgan", "taylor", None)
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _copy_rows(cursor, table: str, columns: tuple, rows: list) -> None:
+    if not rows:
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["\\N" if value is None else value for value in row])
+    buffer.seek(0)
+
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        buffer,
+    )
+
+
+def _lookup_rows(rng: random.Random, values: tuple) -> tuple[list, dict]:
+    rows = []
+    ids_by_code = {}
+    for code, label, display_order in values:
+        row_id = _uuid(rng)
+        rows.append((row_id, code, label, display_order))
+        ids_by_code[code] = row_id
+    return rows, ids_by_code
+
+
+def _issue_timeline(rng: random.Random, created_at: datetime, now: datetime) -> list:
+    """
+    Return [(at, action_code, to_status_code or None)] for one issue, starting
+    with its CREATED action. Older issues are more likely to have been closed.
+    """
+    events = [(created_at, "CREATED", None)]
+    at = created_at
+    status = "OPEN"
+    age_days = (now - created_at).total_seconds() / 86400
+    will_close = rng.random() < min(0.97, 0.15 + age_days / 20)
+
+    def step(max_hours: float) -> datetime | None:
+        nonlocal at
+        candidate = at + timedelta(hours=rng.uniform(0.25, max_hours))
+        if candidate >= now:
+            return None
+        at = candidate
+        return at
+
+    if rng.random() < 0.85 and step(48):
+        status = "IN_PROGRESS"
+        events.append((at, "INSPECT", status))
+
+        if rng.random() < 0.15 and step(72):
+            status = "BLOCKED"
+            events.append((at, "NOTE", status))
+            if step(240):
+                status = "IN_PROGRESS"
+                events.append((at, "NOTE", status))
+
+    for _ in range(rng.randint(0, 4)):
+        if not step(96):
+            break
+        events.append((at, rng.choice(("NOTE", "INSPECT", "REPAIR")), None))
+
+    if will_close and step(120):
+        events.append((at, "CLOSED", "CLOSED"))
+
+    return events
+
+
+def generate(conn, *, seed: int = 1234, now: datetime | None = None, **scale) -> dict:
+    """
+    Fill an empty schema with synthetic data and return ids useful to the
+    benchmark cases. `scale` takes the keys of an entry in SCALES.
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc).replace(microsecond=0)
+    history_start = now - timedelta(days=scale["history_days"])
+
+    issue_status_rows, issue_status_ids = _lookup_rows(rng, ISSUE_STATUSES)
+    action_type_rows, action_type_ids = _lookup_rows(rng, ACTION_TYPES)
+    asset_status_rows, asset_status_ids = _lookup_rows(rng, ASSET_STATUSES)
+
+    sites = []
+    for index in range(scale["sites"]):
+        sites.append((_uuid(rng), f"S{index + 1:02d}", f"Site {index + 1:02d}"))
+
+    categories, makes, models, variants = [], [], [], []
+    for category_index in range(scale["categories"]):
+        name = _CATEGORY_NAMES[category_index % len(_CATEGORY_NAMES)]
+        if category_index >= len(_CATEGORY_NAMES):
+            name = f"{name} {category_index}"
+        category_id = _uuid(rng)
+        categories.append((category_id, name, name))
+
+        for _ in range(scale["makes_per_category"]):
+            make_id = _uuid(rng)
+            make_name = f"Make {len(makes) + 1:02d}"
+            makes.append((make_id, category_id, make_name, make_name))
+
+            for model_index in range(scale["models_per_make"]):
+                model_id = _uuid(rng)
+                model_name = f"{make_name[-2:]}M{model_index + 1}"
+                models.append((model_id, make_id, model_name, model_name))
+
+                for variant_index in range(scale["variants_per_model"]):
+                    variant_name = f"Rev {chr(ord('A') + variant_index)}"
+                    variants.append((_uuid(rng), model_id, variant_name, variant_name, category_id, model_name))
+
+    assets = []
+    asset_history = []
+    for index in range(scale["assets"]):
+        site_id, site_code, _ = rng.choice(sites)
+        variant_id, _, _, _, category_id, model_name = rng.choice(variants)
+        created_at = history_start + timedelta(seconds=rng.uniform(0, 0.3) * scale["history_days"] * 86400)
+        assets.append({
+            "id": _uuid(rng),
+            "variant_id": variant_id,
+            "category_id": category_id,
+            "site_id": site_id,
+            "asset_tag": f"{site_code}-{model_name}-{index + 1:05d}",
+            "acquired_at": created_at.date(),
+            "created_at": created_at,
+            "status": "ACTIVE",
+            "events": [],
+        })
+
+    issues, issue_actions, issue_history = [], [], []
+    span_seconds = (now - history_start).total_seconds()
+    # A few assets attract a disproportionate share of issues.
+    weights = [rng.paretovariate(1.5) for _ in assets]
+    issue_assets = rng.choices(assets, weights=weights, k=scale["issues"])
+
+    for asset in issue_assets:
+        created_at = max(
+            asset["created_at"] + timedelta(hours=1),
+            history_start + timedelta(seconds=rng.uniform(0, span_seconds)),
+        )
+        if created_at >= now:
+            created_at = now - timedelta(minutes=rng.randint(5, 600))
+
+        problem = rng.choice(_PROBLEMS)
+        issue_id = _uuid(rng)
+        reporter = rng.choice(_PEOPLE)
+        status = "OPEN"
+        closed_at = None
+
+        issue_history.append((issue_id, issue_status_ids["OPEN"], issue_status_ids["OPEN"], created_at, reporter))
+        timeline = _issue_timeline(rng, created_at, now)
+
+        for at, action_code, to_status in timeline:
+            body = "Issue created" if action_code == "CREATED" else rng.choice(_NOTES)
+            actor = reporter if action_code == "CREATED" else rng.choice(_PEOPLE)
+            issue_actions.append((issue_id, action_type_ids[action_code], body, at, actor or "SYSTEM"))
+
+            if to_status and to_status != status:
+                issue_history.append((issue_id, issue_status_ids[status], issue_status_ids[to_status], at, actor))
+                status = to_status
+                if status == "CLOSED":
+                    closed_at = at
+
+        if rng.random() < 0.5:
+            asset["events"].append((created_at, "MAINTENANCE", reporter))
+            if closed_at is not None:
+                asset["events"].append((closed_at, "ACTIVE", None))
+
+        issues.append((
+            issue_id,
+            asset["id"],
+            issue_status_ids[status],
+            f"{problem} ({rng.choice(_LOCATIONS)})",
+            f"{problem} observed on {asset['asset_tag']} near the {rng.choice(_LOCATIONS)}. "
+            f"{rng.choice(_NOTES)}",
+            reporter,
+            closed_at,
+            created_at,
+            timeline[-1][0],
+        ))
+
+    asset_rows = []
+    for asset in assets:
+        status = "ACTIVE"
+        asset_history.append((asset["id"], None, asset_status_ids[status], asset["created_at"], None))
+        for at, to_status, actor in sorted(asset["events"], key=lambda event: event[0]):
+            if to_status != status:
+                asset_history.append((asset["id"], asset_status_ids[status], asset_status_ids[to_status], at, actor))
+                status = to_status
+
+        retired_at = None
+        retire_reason = None
+        if status == "ACTIVE" and rng.random() < 0.03:
+            retired_at = now - timedelta(days=rng.randint(1, 60))
+            retire_reason = "Decommissioned"
+            asset_history.append((asset["id"], asset_status_ids[status], asset_status_ids["RETIRED"], retired_at, "admin"))
+            status = "RETIRED"
+
+        asset_rows.append((
+            asset["id"],
+            asset["variant_id"],
+            asset["category_id"],
+            asset["site_id"],
+            asset_status_ids[status],
+            asset["asset_tag"],
+            asset["acquired_at"],
+            retired_at.date() if retired_at else None,
+            retire_reason,
+            asset["created_at"],
+            asset["created_at"],
+        ))
+
+    with conn.cursor() as cursor:
+        # A bulk load is not a stream of live changes; skip the per-row
+        # NOTIFY triggers (007_change_events) for this transaction.
+        cursor.execute("SELECT set_config('maintenance.skip_events', 'on', true)")
+        # Spread the synthetic history over monthly partitions like a
+        # long-running database has them, instead of the DEFAULT partition.
+        for table, column in (
+            ("issue_action", "created_at"),
+            ("issue_status_history", "changed_at"),
+            ("asset_status_history", "changed_at"),
+        ):
+            cursor.execute(
+                "SELECT create_monthly_partitions(%s::regclass, %s, %s, %s)",
+                (table, column, history_start.date(), now.date()),
+            )
+        _copy_rows(cursor, "issue_status", ("id", "code", "label", "display_order"), issue_status_rows)
+        _copy_rows(cursor, "action_type", ("id", "code", "label", "display_order"), action_type_rows)
+        _copy_rows(cursor, "asset_status", ("id", "code", "label", "display_order"), asset_status_rows)
+        _copy_rows(cursor, "accepted_attachment_content_type", ("content_type",), [(c,) for c in CONTENT_TYPES])
+        _copy_rows(cursor, "site", ("id", "shorthand", "fullname"), sites)
+        _copy_rows(cursor, "category", ("id", "name", "label"), categories)
+        _copy_rows(cursor, "make", ("id", "category_id", "name", "label"), makes)
+        _copy_rows(cursor, "model", ("id", "make_id", "name", "label"), models)
+        _copy_rows(cursor, "variant", ("id", "model_id", "name", "label"), [row[:4] for row in variants])
+        _copy_rows(
+            cursor,
+            "asset",
+            (
+                "id", "variant_id", "category_id", "site_id", "status_id", "asset_tag",
+                "acquired_at", "retired_at", "retire_reason", "created_at", "updated_at",
+            ),
+            asset_rows,
+        )
+        _copy_rows(
+            cursor,
+            "asset_status_history",
+            ("asset_id", "from_status_id", "to_status_id", "changed_at", "changed_by"),
+            asset_history,
+        )
+        _copy_rows(
+            cursor,
+            "issue",
+            (
+                "id", "asset_id", "status_id", "title", "description", "reported_by",
+                "closed_at", "created_at", "updated_at",
+            ),
+            issues,
+        )
+        _copy_rows(
+            cursor,
+            "issue_action",
+            ("issue_id", "action_type_id", "body", "created_at", "created_by"),
+            issue_actions,
+        )
+        _copy_rows(
+            cursor,
+            "issue_status_history",
+            ("issue_id", "from_status_id", "to_status_id", "changed_at", "changed_by"),
+            issue_history,
+        )
+        cursor.execute("ANALYZE")
+    conn.commit()
+
+    busiest_asset = max(assets, key=lambda asset: len(asset["events"]))
+    return {
+        "issue_status_ids": issue_status_ids,
+        "asset_status_ids": asset_status_ids,
+        "site_ids": [site[0] for site in sites],
+        "category_id": categories[0][0],
+        "make_id": makes[0][0],
+        "model_id": models[0][0],
+        "variant_id": variants[0][0],
+        "asset_ids": [asset["id"] for asset in assets],
+        "busiest_asset_id": busiest_asset["id"],
+        "asset_tag_prefix": busiest_asset["asset_tag"][:6],
+        "issue_ids": [issue[0] for issue in rng.sample(issues, min(len(issues), 200))],
+        "search_term": _PROBLEMS[0].split()[0].lower(),
+        "row_counts": {
+            "site": len(sites),
+            "variant": len(variants),
+            "asset": len(asset_rows),
+            "asset_status_history": len(asset_history),
+            "issue": len(issues),
+            "issue_action": len(issue_actions),
+            "issue_status_history": len(issue_history),
+        },
+    }
+
+
+def truncate_all(conn) -> None:
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT string_agg(quote_ident(tablename), ', ')
+            FROM pg_tables
+            WHERE schemaname = current_schema()
+        """)
+        tables = cursor.fetchone()[0]
+        if tables:
+            cursor.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+    conn.commit()
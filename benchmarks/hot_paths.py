@@ -0,0 +1,149 @@
+import statistics
+from datetime import datetime, timedelta, timezone
+from itertools import cycle
+from time import perf_counter
+
+from app.db import assets as assets_db
+from app.db import issues as issue_db
+from app.db import search as search_db
+from app.profiling import begin_profile
+from app.services import dashboard as dashboard_service
+from app.services import issues as issue_service
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarise(samples: list, query_counts: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "samples": len(ordered),
+        "min_ms": round(ordered[0] * 1000, 3),
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "queries_per_call": round(statistics.fmean(query_counts), 2),
+    }
+
+
+def _list_issue_cases(data: dict) -> dict:
+    status_ids = data["issue_status_ids"]
+    now = datetime.now(timezone.utc)
+
+    filters = {
+        "no_filter": {},
+        "site": {"site_id": data["site_ids"][0]},
+        "asset": {"asset_id": data["busiest_asset_id"]},
+        "status_open": {"status_id": status_ids["OPEN"]},
+        "status_active": {
+            "status_id": "00000000-0000-0000-0000-000000000000",
+            "active_status_ids": (status_ids["OPEN"], status_ids["IN_PROGRESS"]),
+        },
+        "search": {"search": data["search_term"]},
+        "category": {"category_id": data["category_id"]},
+        "make": {"make_id": data["make_id"]},
+        "model": {"model_id": data["model_id"]},
+        "variant": {"variant_id": data["variant_id"]},
+        "created_last_30d": {"created_from": now - timedelta(days=30), "created_to": now},
+        "site_active_search": {
+            "site_id": data["site_ids"][0],
+            "status_id": "00000000-0000-0000-0000-000000000000",
+            "active_status_ids": (status_ids["OPEN"], status_ids["IN_PROGRESS"]),
+            "search": data["search_term"],
+        },
+    }
+
+    def make_case(kwargs):
+        return lambda: issue_db.list_issue_rows(sort=[("created_at", "desc")], limit=200, offset=0, **kwargs)
+
+    return {f"list_issue_rows[{name}]": make_case(kwargs) for name, kwargs in filters.items()}
+
+
+def build_cases(data: dict) -> dict:
+    """
+    Return {case name: zero-arg callable}. Read cases rotate through the
+    sampled ids so one hot row does not sit in cache for the whole run.
+    """
+    issue_ids = cycle(data["issue_ids"])
+    asset_ids = cycle(data["asset_ids"])
+    status_ids = data["issue_status_ids"]
+    asset_status_ids = data["asset_status_ids"]
+
+    def create_issue():
+        return issue_service.create_issue({
+            "asset_id": next(asset_ids),
+            "title": "Benchmark issue",
+            "description": "Created by the benchmark suite",
+            "asset_status_id": asset_status_ids["MAINTENANCE"],
+            "reported_by": "bench",
+        })
+
+    def add_issue_action():
+        return issue_service.add_issue_action(next(issue_ids), {
+            "action_type_code": "NOTE",
+            "body": "Benchmark note",
+            "created_by": "bench",
+            "new_status_id": status_ids["IN_PROGRESS"],
+            "new_asset_status_id": asset_status_ids["ACTIVE"],
+        })
+
+    cases = _list_issue_cases(data)
+    cases.update({
+        "get_issue": lambda: issue_service.get_issue(next(issue_ids)),
+        "get_dashboard_data[all_sites]": lambda: dashboard_service.get_dashboard_data(),
+        "get_dashboard_data[site]": lambda: dashboard_service.get_dashboard_data(site_id=data["site_ids"][0]),
+        "get_asset_detail_rows[busiest]": lambda: assets_db.get_asset_detail_rows(
+            data["busiest_asset_id"],
+            history_limit=21,
+        ),
+        "search_asset_rows[prefix]": lambda: assets_db.search_asset_rows(data["asset_tag_prefix"].lower(), limit=10),
+        "search_asset_rows[label]": lambda: assets_db.search_asset_rows("rev b", limit=10),
+        "search_issue_rows": lambda: search_db.search_issue_rows(data["search_term"], limit=5),
+        "search_issue_action_rows": lambda: search_db.search_issue_action_rows("replacement part", limit=5),
+        "list_asset_rows[site]": lambda: assets_db.list_asset_rows(
+            site_id=data["site_ids"][0],
+            sort=[("asset_tag", "asc")],
+            limit=50,
+            offset=0,
+        ),
+        "list_asset_rows[all]": lambda: assets_db.list_asset_rows(
+            sort=[("asset_tag", "asc")],
+            limit=50,
+            offset=0,
+            retired_mode="all",
+        ),
+        # Writes go last so the read cases see the generated data only.
+        "create_issue": create_issue,
+        "add_issue_action": add_issue_action,
+    })
+    return cases
+
+
+def run_cases(app, cases: dict, *, repeat: int, warmup: int, only: list | None = None) -> dict:
+    results = {}
+    for name, func in cases.items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+
+        samples = []
+        query_counts = []
+        # A fresh request per call, so the per-request service memo never
+        # turns a repeated read into a free cache hit.
+        for _ in range(warmup):
+            with app.test_request_context():
+                func()
+        for _ in range(repeat):
+            with app.test_request_context():
+                profile = begin_profile()
+                started = perf_counter()
+                func()
+                samples.append(perf_counter() - started)
+                query_counts.append(profile.query_count)
+
+        results[name] = _summarise(samples, query_counts)
+    return results
@@ -0,0 +1,98 @@
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks.postgres import REPO_ROOT
+
+
+# Heavy optional subsystems; each is imported inside the function that needs it.
+LAZY_MODULES = ("PIL", "pillow_heif", "qrcode", "numpy")
+
+# Enough for app.db.connection / initialise_application(); nothing connects.
+_IMPORT_ENV = {
+    "FLASK_SECRET": "import-budget",
+    "POSTGRES_USER": "maintenance",
+    "POSTGRES_PASSWORD": "",
+    "POSTGRES_DB": "maintenance",
+}
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """
+    Parse `-X importtime` output into [{"module", "self_us", "cumulative_us", "depth"}]
+    in the order the interpreter reported them.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        rows.append({
+            "module": name.strip(),
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+        })
+    return rows
+
+
+def measure(target: str = "wsgi") -> list[dict]:
+    env = {**os.environ, **{k: v for k, v in _IMPORT_ENV.items() if k not in os.environ}}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def check(rows: list[dict], *, budget_ms: float, target: str = "wsgi") -> list[str]:
+    problems = []
+
+    total_us = next((row["cumulative_us"] for row in rows if row["module"] == target), None)
+    if total_us is None:
+        problems.append(f"{target} not found in importtime output")
+    elif total_us / 1000 > budget_ms:
+        problems.append(f"import {target} took {total_us / 1000:.1f} ms, budget is {budget_ms:.0f} ms")
+
+    imported = {row["module"].split(".")[0] for row in rows}
+    for module in LAZY_MODULES:
+        if module in imported:
+            problems.append(f"{module} is imported at startup; it should load on first use")
+
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.imports",
+        description="Check `python -X importtime -c 'import wsgi'` against a budget and the lazy-only module list.",
+    )
+    parser.add_argument("--budget-ms", type=float, default=600, help="cumulative import budget (default: 600)")
+    parser.add_argument("--target", default="wsgi", help="module to import (default: wsgi)")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to list (default: 15)")
+    args = parser.parse_args(argv)
+
+    rows = measure(args.target)
+    for row in sorted(rows, key=lambda r: r["self_us"], reverse=True)[: args.top]:
+        print(f"{row['self_us'] / 1000:>8.1f} ms self {row['cumulative_us'] / 1000:>8.1f} ms cum  {row['module']}")
+
+    problems = check(rows, budget_ms=args.budget_ms, target=args.target)
+    for problem in problems:
+        print(f"FAIL: {problem}", file=sys.stderr)
+    if not problems:
+        total = next(row["cumulative_us"] for row in rows if row["module"] == args.target)
+        print(f"OK: import {args.target} {total / 1000:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
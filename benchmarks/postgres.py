@@ -0,0 +1,169 @@
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import psycopg2
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_PATH = REPO_ROOT / "sql" / "schema.sql"
+MIGRATIONS_DIR = REPO_ROOT / "sql" / "migrations"
+
+BENCH_DB_USER = "maintenance"
+BENCH_DB_NAME = "maintenance"
+BENCH_DB_SCHEMA = "maintenance"
+
+# Contrib extensions the schema needs: citext (schema.sql) and pg_trgm
+# (002_asset_search_indexes).
+REQUIRED_EXTENSIONS = ("citext", "pg_trgm")
+
+
+def _find_bin_dir(bin_dir: str | None = None) -> Path:
+    candidates = [bin_dir, os.environ.get("PG_BIN")]
+
+    pg_config = shutil.which("pg_config")
+    if pg_config:
+        try:
+            candidates.append(
+                subprocess.run(
+                    [pg_config, "--bindir"],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.strip()
+            )
+        except subprocess.CalledProcessError:
+            pass
+
+    initdb = shutil.which("initdb")
+    if initdb:
+        candidates.append(os.path.dirname(initdb))
+
+    for candidate in candidates:
+        if candidate and (Path(candidate) / "initdb").is_file():
+            return Path(candidate)
+
+    raise RuntimeError("Could not find initdb; pass --pg-bin or set PG_BIN")
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _run(args: list, **kwargs) -> None:
+    result = subprocess.run([str(a) for a in args], capture_output=True, text=True, **kwargs)
+    if result.returncode != 0:
+        raise RuntimeError(f"{Path(str(args[0])).name} failed:\n{result.stdout}{result.stderr}")
+
+
+@contextmanager
+def throwaway_postgres(bin_dir: str | None = None, *, keep: bool = False):
+    """
+    Start a private Postgres cluster in a temp dir and yield its connection
+    settings as POSTGRES_* style keys. The cluster only listens on a unix
+    socket inside the temp dir and is stopped/removed on exit.
+    """
+    bin_path = _find_bin_dir(bin_dir)
+    base_dir = Path(tempfile.mkdtemp(prefix="maint-bench-"))
+    data_dir = base_dir / "data"
+    port = free_port()
+
+    _run([
+        bin_path / "initdb",
+        "-D", data_dir,
+        "-U", BENCH_DB_USER,
+        "--auth=trust",
+        "--encoding=UTF8",
+        "--no-locale",
+    ])
+    _run([
+        bin_path / "pg_ctl",
+        "-D", data_dir,
+        "-l", base_dir / "postgres.log",
+        "-w",
+        "-o", f"-p {port} -k {base_dir} -c listen_addresses=''",
+        "start",
+    ])
+
+    try:
+        yield {
+            "POSTGRES_HOST": str(base_dir),
+            "POSTGRES_PORT": str(port),
+            "POSTGRES_USER": BENCH_DB_USER,
+            "POSTGRES_PASSWORD": "",
+            "POSTGRES_DB": BENCH_DB_NAME,
+        }
+    finally:
+        _run([bin_path / "pg_ctl", "-D", data_dir, "-m", "fast", "-w", "stop"])
+        if not keep:
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+
+def connect(settings: dict, dbname: str | None = None):
+    return psycopg2.connect(
+        host=settings["POSTGRES_HOST"],
+        port=settings["POSTGRES_PORT"],
+        user=settings["POSTGRES_USER"],
+        password=settings.get("POSTGRES_PASSWORD") or None,
+        dbname=dbname or settings["POSTGRES_DB"],
+    )
+
+
+def schema_files() -> list[Path]:
+    files = [SCHEMA_PATH]
+    if MIGRATIONS_DIR.is_dir():
+        files.extend(sorted(MIGRATIONS_DIR.glob("*.sql")))
+    return files
+
+
+def _create_extensions(cursor) -> None:
+    # Up front, so a server without contrib fails with what to install
+    # rather than halfway through schema.sql.
+    for name in REQUIRED_EXTENSIONS:
+        try:
+            cursor.execute(f"CREATE EXTENSION IF NOT EXISTS {name}")
+        except psycopg2.Error as exc:
+            raise RuntimeError(
+                f"Postgres extension {name} is not available ({str(exc).strip()}); install the server's "
+                "contrib package (e.g. postgresql-contrib) or point PG_BIN at a build that has it"
+            ) from exc
+
+
+def create_database(settings: dict) -> None:
+    """
+    Create the benchmark database laid out like production: tables in a
+    `maintenance` schema that is first on the search_path.
+    """
+    admin = connect(settings, dbname="postgres")
+    admin.autocommit = True
+    with admin.cursor() as cursor:
+        cursor.execute(f"CREATE DATABASE {BENCH_DB_NAME}")
+        cursor.execute(
+            f"ALTER DATABASE {BENCH_DB_NAME} SET search_path = {BENCH_DB_SCHEMA}, public"
+        )
+    admin.close()
+
+    conn = connect(settings)
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {BENCH_DB_SCHEMA}")
+        cursor.execute(f"SET search_path = {BENCH_DB_SCHEMA}, public")
+        _create_extensions(cursor)
+        for path in schema_files():
+            cursor.execute(path.read_text())
+    conn.close()
+
+
+def server_version(settings: dict) -> str:
+    conn = connect(settings)
+    with conn.cursor() as cursor:
+        cursor.execute("SHOW server_version")
+        version = cursor.fetchone()[0]
+    conn.close()
+    return version
@@ -0,0 +1,124 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks import datagen
+from benchmarks.postgres import REPO_ROOT, connect, create_database, server_version, throwaway_postgres
+
+
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+
+
+def run_git(*args) -> str | None:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Time the app's hot paths against a throwaway Postgres with synthetic data.",
+    )
+    parser.add_argument(
+        "--scale",
+        action="append",
+        choices=sorted(datagen.SCALES),
+        help="data scale preset; repeat for several (default: small)",
+    )
+    parser.add_argument("--sites", type=int, help="override the number of sites")
+    parser.add_argument("--assets", type=int, help="override the number of assets")
+    parser.add_argument("--issues", type=int, help="override the number of issues")
+    parser.add_argument("--repeat", type=int, default=30, help="timed calls per case (default: 30)")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed calls per case (default: 3)")
+    parser.add_argument("--seed", type=int, default=1234, help="data generator seed (default: 1234)")
+    parser.add_argument("--case", action="append", help="only run cases whose name contains this")
+    parser.add_argument("--pg-bin", help="directory holding initdb/pg_ctl")
+    parser.add_argument("--keep-cluster", action="store_true", help="leave the temp cluster on disk")
+    parser.add_argument("--output", type=Path, help="result file (default: benchmarks/results/<time>-<sha>.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    scales = args.scale or ["small"]
+
+    with throwaway_postgres(args.pg_bin, keep=args.keep_cluster) as settings:
+        create_database(settings)
+
+        # app.db.connection builds its URL from the environment on import.
+        os.environ.update(settings)
+        os.environ.setdefault("FLASK_SECRET", "benchmark")
+        os.environ.setdefault("REQUEST_PROFILING", "1")
+
+        from app import initialise_application
+        from benchmarks.hot_paths import build_cases, run_cases
+
+        app = initialise_application()
+        app.logger.disabled = True
+        logging.getLogger("app.profiling").disabled = True
+
+        report = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_sha": run_git("rev-parse", "HEAD"),
+            "git_dirty": bool(run_git("status", "--porcelain", "--untracked-files=no")),
+            "python": platform.python_version(),
+            "postgres": server_version(settings),
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "scales": {},
+        }
+
+        for scale_name in scales:
+            scale = dict(datagen.SCALES[scale_name])
+            for key in ("sites", "assets", "issues"):
+                if getattr(args, key):
+                    scale[key] = getattr(args, key)
+
+            conn = connect(settings)
+            datagen.truncate_all(conn)
+            print(f"[{scale_name}] generating data ...", file=sys.stderr)
+            data = datagen.generate(conn, seed=args.seed, **scale)
+            conn.close()
+
+            print(f"[{scale_name}] running cases ...", file=sys.stderr)
+            cases = run_cases(app, build_cases(data), repeat=args.repeat, warmup=args.warmup, only=args.case)
+            report["scales"][scale_name] = {
+                "params": scale,
+                "row_counts": data["row_counts"],
+                "cases": cases,
+            }
+
+            for name, stats in cases.items():
+                print(
+                    f"  {name:<45} median {stats['median_ms']:>9.3f} ms"
+                    f"  p95 {stats['p95_ms']:>9.3f} ms  queries {stats['queries_per_call']:>5}",
+                    file=sys.stderr,
+                )
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = RESULTS_DIR / f"{stamp}-{(report['git_sha'] or 'nogit')[:10]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import argparse
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+from contextlib import nullcontext
+from time import perf_counter, sleep
+
+from benchmarks.postgres import REPO_ROOT, create_database, free_port, throwaway_postgres
+
+
+def _get(port: int, path: str) -> int:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+def time_to_first_request(env: dict, *, workers: int, path: str, timeout: float = 60.0) -> dict:
+    """
+    Start gunicorn wsgi:app and return seconds from spawn until /health first
+    answers, and until `path` (which touches the database) first answers.
+    """
+    port = free_port()
+    started = perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn",
+            "--bind", f"127.0.0.1:{port}",
+            "--workers", str(workers),
+            "--log-level", "warning",
+            "wsgi:app",
+        ],
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        health_at = None
+        while perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"gunicorn exited with {process.returncode}:\n{process.stderr.read().decode()[-2000:]}")
+            try:
+                if _get(port, "/maintenance/health") == 200:
+                    health_at = perf_counter()
+                    break
+            except OSError:
+                sleep(0.005)
+        if health_at is None:
+            raise RuntimeError("gunicorn did not answer /maintenance/health in time")
+
+        status = _get(port, path)
+        first_page_at = perf_counter()
+        return {
+            "health_s": health_at - started,
+            "first_request_s": first_page_at - started,
+            "first_request_status": status,
+        }
+    finally:
+        process.terminate()
+        process.wait(timeout=15)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Measure time-to-first-request for wsgi:app under gunicorn.",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to time (default: 5)")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers (default: 2)")
+    parser.add_argument("--path", default="/maintenance/api/v2/dashboard", help="first real request to time")
+    parser.add_argument("--use-env-db", action="store_true", help="use POSTGRES_* instead of a throwaway cluster")
+    parser.add_argument("--pg-bin", help="directory holding initdb/pg_ctl")
+    args = parser.parse_args(argv)
+
+    cluster = nullcontext(None) if args.use_env_db else throwaway_postgres(args.pg_bin)
+    with cluster as settings:
+        if settings is not None:
+            create_database(settings)
+        env = {
+            **os.environ,
+            **(settings or {}),
+            "FLASK_SECRET": os.environ.get("FLASK_SECRET", "startup-benchmark"),
+            "REQUEST_PROFILING": "0",
+        }
+
+        runs = []
+        for index in range(args.runs):
+            result = time_to_first_request(env, workers=args.workers, path=args.path)
+            runs.append(result)
+            print(
+                f"run {index + 1}: health {result['health_s'] * 1000:.0f} ms, "
+                f"first {args.path} {result['first_request_s'] * 1000:.0f} ms ({result['first_request_status']})",
+                file=sys.stderr,
+            )
+
+    summary = {
+        "workers": args.workers,
+        "path": args.path,
+        "runs": runs,
+        "median_health_ms": round(statistics.median(r["health_s"] for r in runs) * 1000, 1),
+        "median_first_request_ms": round(statistics.median(r["first_request_s"] for r in runs) * 1000, 1),
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# Picked up automatically by gunicorn when started from the repo root.
+# Command line flags (--workers, --bind, ...) still override anything here.
+import os
+import shutil
+
+# /api/v2/events keeps one response open per browser tab, which would hold a
+# whole sync worker for as long as the tab is open. Hosts that serve the
+# stream run GUNICORN_WORKER_CLASS=gevent, where an open stream is a parked
+# greenlet; under any other class streams are off unless EVENTS_MAX_STREAMS
+# is set (see post_worker_init).
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+
+def on_starting(server):
+    # Samples from a previous master's workers would otherwise be summed in.
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def post_fork(server, worker):
+    # psycopg2 blocks in C; this makes its socket waits yield to other
+    # greenlets so one slow query doesn't stall every request in the worker.
+    if server.cfg.worker_class_str.startswith("gevent"):
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
+
+
+def post_worker_init(worker):
+    # The app (and its lazily built engine) is loaded by now; open the first
+    # pooled connection(s) before this worker starts accepting requests.
+    from app.db.connection import warm_up_pool
+    from app.services.jobs import start_worker_threads
+
+    warm_up_pool()
+    if not worker.cfg.worker_class_str.startswith("gevent") and "EVENTS_MAX_STREAMS" not in os.environ:
+        # Answer /api/v2/events with 503 rather than let a few open tabs
+        # take every sync worker; the pages work without live updates.
+        worker.wsgi.config["EVENTS_MAX_STREAMS"] = 0
+    # JOB_WORKER_THREADS background job workers per gunicorn worker (0 when
+    # python -m app.jobs.run_worker runs the queue on its own). Under gevent
+    # they are greenlets; the CPU-heavy part of a job (HEIC conversion, QR
+    # render) runs on gevent's OS thread pool via run_cpu_bound.
+    start_worker_threads(worker.wsgi)
+
+
+def worker_exit(server, worker):
+    # Let a running job finish; anything cut off is requeued once its lease
+    # (JOB_LEASE_SECONDS) runs out.
+    from app.services.jobs import stop_worker_threads
+
+    stop_worker_threads(timeout=10)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,15 @@
+"""
+HTTP load tests against the real WSGI app under gunicorn.
+
+A run seeds a throwaway Postgres the same way the benchmark suite does.
+For each worker count/class in the sweep it starts `gunicorn wsgi:app`
+and replays a weighted scenario mix against it for a fixed duration:
+dashboard polls, issue list filtering, QR-scan asset views, issue
+creation with a photo, and action posts.
+
+    python -m loadtest.run --scale small --workers 2,4 --worker-class sync,gthread --duration 30
+
+Requests/s and p50/p95/p99 per scenario are printed and written as JSON to
+loadtest/results/. Pass --use-env-db to run against an already seeded
+database taken from POSTGRES_* instead of a throwaway cluster.
+"""
@@ -0,0 +1,138 @@
+import http.client
+import random
+import statistics
+import threading
+from time import perf_counter, sleep
+
+from loadtest.scenarios import ScenarioRequests
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarise(samples: dict, elapsed: float) -> dict:
+    """
+    Turn {scenario: [(seconds, status)]} into per-scenario and overall stats.
+    Any status >= 500 or a transport error (status 0) counts as an error;
+    4xx and redirects are the app answering and count as successes.
+    """
+    def stats(entries: list) -> dict:
+        latencies = sorted(seconds for seconds, _ in entries)
+        errors = sum(1 for _, status in entries if status == 0 or status >= 500)
+        statuses = {}
+        for _, status in entries:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        return {
+            "requests": len(entries),
+            "errors": errors,
+            "rps": round(len(entries) / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+            "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            "statuses": statuses,
+        }
+
+    everything = [entry for entries in samples.values() for entry in entries]
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "overall": stats(everything),
+        "scenarios": {name: stats(entries) for name, entries in sorted(samples.items())},
+    }
+
+
+class _Client(threading.Thread):
+    def __init__(self, host, port, mix, targets, photo, seed, deadline, warmup_until, timeout):
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.names = [name for name, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.rng = random.Random(seed)
+        self.requests = ScenarioRequests(targets, self.rng, photo)
+        self.deadline = deadline
+        self.warmup_until = warmup_until
+        self.timeout = timeout
+        self.samples = {}
+        self.conn = None
+
+    def _send(self, method, path, body, headers) -> int:
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            self.conn.request(method, path, body=body, headers=headers)
+            response = self.conn.getresponse()
+            response.read()
+            if response.getheader("Connection", "").lower() == "close":
+                self.conn.close()
+                self.conn = None
+            return response.status
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = None
+            return 0
+
+    def run(self):
+        while True:
+            now = perf_counter()
+            if now >= self.deadline:
+                break
+
+            name = self.rng.choices(self.names, weights=self.weights)[0]
+            method, path, body, headers = self.requests.build(name)
+
+            started = perf_counter()
+            status = self._send(method, path, body, headers)
+            elapsed = perf_counter() - started
+
+            if started >= self.warmup_until:
+                self.samples.setdefault(name, []).append((elapsed, status))
+            if status == 0:
+                # Server went away or refused; don't spin.
+                sleep(0.05)
+
+        if self.conn is not None:
+            self.conn.close()
+
+
+def run_load(
+    *,
+    host: str,
+    port: int,
+    mix: tuple,
+    targets: dict,
+    photo: bytes,
+    concurrency: int,
+    duration: float,
+    warmup: float = 2.0,
+    seed: int = 1234,
+    timeout: float = 30.0,
+) -> dict:
+    """
+    Drive the server with `concurrency` keep-alive clients for warmup +
+    duration seconds; only requests started after the warmup are counted.
+    """
+    started = perf_counter()
+    warmup_until = started + warmup
+    deadline = warmup_until + duration
+
+    clients = [
+        _Client(host, port, mix, targets, photo, seed + index, deadline, warmup_until, timeout)
+        for index in range(concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+
+    samples = {}
+    for client in clients:
+        for name, entries in client.samples.items():
+            samples.setdefault(name, []).extend(entries)
+
+    return summarise(samples, perf_counter() - warmup_until)
@@ -0,0 +1,209 @@
+import argparse
+import http.client
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter, sleep
+
+from benchmarks import datagen
+from benchmarks.postgres import REPO_ROOT, connect, create_database, free_port, throwaway_postgres
+from benchmarks.run import run_git
+from loadtest.client import run_load
+from loadtest.scenarios import build_photo, load_targets, parse_mix
+
+
+RESULTS_DIR = REPO_ROOT / "loadtest" / "results"
+
+
+def _csv(value: str) -> list:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest.run",
+        description="Load test wsgi:app under gunicorn with a weighted scenario mix.",
+    )
+    parser.add_argument("--scale", default="small", choices=sorted(datagen.SCALES), help="seed data scale (default: small)")
+    parser.add_argument("--seed", type=int, default=1234, help="data/scenario seed (default: 1234)")
+    parser.add_argument("--use-env-db", action="store_true", help="use the already seeded POSTGRES_* database")
+    parser.add_argument("--pg-bin", help="directory holding initdb/pg_ctl")
+    parser.add_argument("--workers", type=_csv, default=["2"], help="comma separated worker counts to sweep (default: 2)")
+    parser.add_argument(
+        "--worker-class",
+        type=_csv,
+        default=["sync"],
+        help="comma separated gunicorn worker classes to sweep, e.g. sync,gthread (default: sync)",
+    )
+    parser.add_argument("--threads", type=int, default=4, help="threads per gthread worker (default: 4)")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent keep-alive clients (default: 16)")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds per configuration (default: 30)")
+    parser.add_argument("--warmup", type=float, default=3, help="unmeasured seconds per configuration (default: 3)")
+    parser.add_argument("--mix", help='override weights, e.g. "dashboard_poll=5,issue_view=1"')
+    parser.add_argument("--profile", action="store_true", help="keep REQUEST_PROFILING on in the workers")
+    parser.add_argument("--output", type=Path, help="result file (default: loadtest/results/<time>-<sha>.json)")
+    return parser.parse_args(argv)
+
+
+def _wait_healthy(port: int, process, timeout: float = 30.0) -> None:
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with {process.returncode}")
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+        try:
+            conn.request("GET", "/maintenance/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        finally:
+            conn.close()
+        sleep(0.2)
+    raise RuntimeError("gunicorn did not become healthy in time")
+
+
+@contextmanager
+def gunicorn_server(env: dict, *, workers: int, worker_class: str, threads: int, log_path: Path):
+    port = free_port()
+    args = [
+        sys.executable, "-m", "gunicorn",
+        "--bind", f"127.0.0.1:{port}",
+        "--workers", str(workers),
+        "--worker-class", worker_class,
+        "--keep-alive", "5",
+        "--log-level", "warning",
+    ]
+    if worker_class == "gthread":
+        args += ["--threads", str(threads)]
+    args.append("wsgi:app")
+
+    with open(log_path, "ab") as log:
+        process = subprocess.Popen(args, cwd=REPO_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+        try:
+            _wait_healthy(port, process)
+            yield port
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    mix = parse_mix(args.mix)
+    work_dir = Path(tempfile.mkdtemp(prefix="maint-load-"))
+    photo = build_photo()
+
+    cluster = nullcontext(None) if args.use_env_db else throwaway_postgres(args.pg_bin)
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_sha": run_git("rev-parse", "HEAD"),
+        "git_dirty": bool(run_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "scale": None if args.use_env_db else args.scale,
+        "mix": dict(mix),
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "runs": [],
+    }
+
+    try:
+        with cluster as settings:
+            if settings is None:
+                settings = {
+                    key: os.environ[key]
+                    for key in ("POSTGRES_HOST", "POSTGRES_PORT", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB")
+                    if key in os.environ
+                }
+            else:
+                create_database(settings)
+                conn = connect(settings)
+                print(f"seeding {args.scale} data ...", file=sys.stderr)
+                datagen.generate(conn, seed=args.seed, **datagen.SCALES[args.scale])
+                conn.close()
+
+            conn = connect(settings)
+            targets = load_targets(conn)
+            conn.close()
+
+            env = {
+                **os.environ,
+                **settings,
+                "FLASK_SECRET": os.environ.get("FLASK_SECRET", "loadtest"),
+                "ATTACHMENT_ROOT": str(work_dir / "attachments"),
+                "REQUEST_PROFILING": "1" if args.profile else "0",
+            }
+
+            for worker_class in args.worker_class:
+                for workers in args.workers:
+                    label = f"{worker_class} x{workers}"
+                    print(f"[{label}] running {args.duration:g}s at concurrency {args.concurrency} ...", file=sys.stderr)
+                    try:
+                        with gunicorn_server(
+                            env,
+                            workers=int(workers),
+                            worker_class=worker_class,
+                            threads=args.threads,
+                            log_path=work_dir / "gunicorn.log",
+                        ) as port:
+                            result = run_load(
+                                host="127.0.0.1",
+                                port=port,
+                                mix=mix,
+                                targets=targets,
+                                photo=photo,
+                                concurrency=args.concurrency,
+                                duration=args.duration,
+                                warmup=args.warmup,
+                                seed=args.seed,
+                            )
+                    except RuntimeError as exc:
+                        print(f"[{label}] skipped: {exc} (see {work_dir / 'gunicorn.log'})", file=sys.stderr)
+                        report["runs"].append({"worker_class": worker_class, "workers": int(workers), "error": str(exc)})
+                        continue
+
+                    report["runs"].append({
+                        "worker_class": worker_class,
+                        "workers": int(workers),
+                        "threads": args.threads if worker_class == "gthread" else None,
+                        **result,
+                    })
+                    _print_result(label, result)
+    finally:
+        # Keep the gunicorn log around if something went wrong.
+        shutil.rmtree(work_dir / "attachments", ignore_errors=True)
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = RESULTS_DIR / f"{stamp}-{(report['git_sha'] or 'nogit')[:10]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(output)
+    return 0
+
+
+def _print_result(label: str, result: dict) -> None:
+    rows = [("overall", result["overall"])] + list(result["scenarios"].items())
+    print(f"[{label}]", file=sys.stderr)
+    for name, stats in rows:
+        print(
+            f"  {name:<26} {stats['rps']:>8.1f} req/s  p50 {stats['p50_ms']:>8.1f}  p95 {stats['p95_ms']:>8.1f}"
+            f"  p99 {stats['p99_ms']:>8.1f} ms  errors {stats['errors']}",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
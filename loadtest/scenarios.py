@@ -0,0 +1,176 @@
+import io
+import random
+import uuid
+from urllib.parse import urlencode
+
+
+# (name, weight). Weights are relative; roughly what a shop floor shift
+# looks like: wall dashboards polling, techs browsing/filtering issues and
+# scanning asset QR codes, with fewer writes.
+DEFAULT_MIX = (
+    ("dashboard_poll", 25),
+    ("issue_list", 20),
+    ("issue_list_filtered", 10),
+    ("asset_qr_view", 20),
+    ("issue_view", 10),
+    ("action_post", 10),
+    ("issue_create_with_photo", 5),
+)
+
+
+def parse_mix(value: str | None) -> tuple:
+    """Parse "name=weight,name=weight" into a mix, defaulting to DEFAULT_MIX."""
+    if not value:
+        return DEFAULT_MIX
+
+    known = {name for name, _ in DEFAULT_MIX}
+    mix = []
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in known:
+            raise ValueError(f"Unknown scenario: {name}")
+        mix.append((name, int(weight or 1)))
+    return tuple(mix)
+
+
+def load_targets(conn) -> dict:
+    """Read the ids the scenarios pick from out of a seeded database."""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT id::text FROM site ORDER BY shorthand")
+        site_ids = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute("""
+            SELECT asset.id::text
+            FROM asset
+            JOIN asset_status ON asset_status.id = asset.status_id
+            WHERE asset_status.code <> 'RETIRED'
+            ORDER BY random()
+            LIMIT 2000
+        """)
+        asset_ids = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute("""
+            SELECT issue.id::text
+            FROM issue
+            ORDER BY issue.created_at DESC
+            LIMIT 2000
+        """)
+        issue_ids = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute("SELECT code::text, id::text FROM issue_status")
+        issue_status_ids = dict(cursor.fetchall())
+
+        cursor.execute("SELECT code::text, id::text FROM asset_status")
+        asset_status_ids = dict(cursor.fetchall())
+
+        cursor.execute("SELECT asset_tag FROM asset ORDER BY random() LIMIT 200")
+        asset_tags = [row[0] for row in cursor.fetchall()]
+
+    if not asset_ids or not issue_ids:
+        raise RuntimeError("Database has no assets/issues; seed it before load testing")
+
+    return {
+        "site_ids": site_ids,
+        "asset_ids": asset_ids,
+        "issue_ids": issue_ids,
+        "asset_tags": asset_tags,
+        "issue_status_ids": issue_status_ids,
+        "asset_status_ids": asset_status_ids,
+    }
+
+
+def build_photo(size: tuple = (1024, 768)) -> bytes:
+    """A phone-photo sized JPEG with enough noise that it does not compress to nothing."""
+    from PIL import Image
+
+    image = Image.effect_noise(size, 48).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+def _multipart(fields: dict, files: dict) -> tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    lines = []
+    for name, value in fields.items():
+        lines.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for name, (filename, content_type, payload) in files.items():
+        lines.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode()
+            + payload
+            + b"\r\n"
+        )
+    lines.append(f"--{boundary}--\r\n".encode())
+    return b"".join(lines), f"multipart/form-data; boundary={boundary}"
+
+
+class ScenarioRequests:
+    """
+    Turns a scenario name into (method, path, body, headers). One instance
+    per client thread; all randomness comes from the thread's own rng.
+    """
+
+    def __init__(self, targets: dict, rng: random.Random, photo: bytes):
+        self.targets = targets
+        self.rng = rng
+        self.photo = photo
+
+    def build(self, name: str) -> tuple:
+        return getattr(self, name)()
+
+    def dashboard_poll(self):
+        return "GET", "/maintenance/api/v2/dashboard", None, {"Accept": "application/json"}
+
+    def issue_list(self):
+        query = urlencode({"status": "ACTIVE"})
+        return "GET", f"/maintenance/issues/?{query}", None, {}
+
+    def issue_list_filtered(self):
+        params = {"page": 1, "page_size": 50}
+        choice = self.rng.random()
+        if choice < 0.4 and self.targets["site_ids"]:
+            params["site_id"] = self.rng.choice(self.targets["site_ids"])
+        elif choice < 0.7:
+            params["status_id"] = self.targets["issue_status_ids"].get("OPEN", "")
+        elif self.targets["asset_tags"]:
+            params["search"] = self.rng.choice(self.targets["asset_tags"])
+        query = urlencode(params)
+        return "GET", f"/maintenance/api/v2/issues?{query}", None, {"Accept": "application/json"}
+
+    def asset_qr_view(self):
+        return "GET", f"/maintenance/assets/{self.rng.choice(self.targets['asset_ids'])}", None, {}
+
+    def issue_view(self):
+        return "GET", f"/maintenance/issues/{self.rng.choice(self.targets['issue_ids'])}", None, {}
+
+    def action_post(self):
+        issue_id = self.rng.choice(self.targets["issue_ids"])
+        body = urlencode({
+            "action_type_code": self.rng.choice(("NOTE", "INSPECT", "REPAIR")),
+            "body": "Load test note",
+            "created_by": "loadtest",
+            "new_status_id": self.targets["issue_status_ids"].get("IN_PROGRESS", ""),
+        }).encode()
+        return (
+            "POST",
+            f"/maintenance/issues/{issue_id}/add-action",
+            body,
+            {"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+    def issue_create_with_photo(self):
+        body, content_type = _multipart(
+            {
+                "asset_id": self.rng.choice(self.targets["asset_ids"]),
+                "asset_status_id": self.targets["asset_status_ids"].get("ACTIVE", ""),
+                "title": "Load test issue",
+                "description": "Created by the load test harness",
+                "reported_by": "loadtest",
+            },
+            {"photo": ("photo.jpg", "image/jpeg", self.photo)},
+        )
+        return "POST", "/maintenance/issues", body, {"Content-Type": content_type}
@@ -0,0 +1,3 @@
+-- Asset page issue history: newest-first keyset paging per asset
+-- (WHERE asset_id = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC).
+CREATE INDEX IF NOT EXISTS issue_asset_idx_created_at_id ON issue (asset_id, created_at DESC, id DESC);
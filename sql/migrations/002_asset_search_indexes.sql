@@ -0,0 +1,12 @@
+-- Asset typeahead (assets_db.search_asset_rows).
+--
+-- Prefix matches ("EV3-RC" -> "EV3-RC-11") use the text_pattern_ops btrees,
+-- which stay usable under any collation. Fuzzy/infix matches use pg_trgm GIN
+-- indexes through the % operator. make/model/variant labels are matched
+-- against those small lookup tables directly and need no index.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS asset_tag_lower_pattern_idx ON asset (lower(asset_tag) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS asset_serial_num_text_pattern_idx ON asset ((serial_num::text) text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS asset_tag_trgm_idx ON asset USING gin (asset_tag gin_trgm_ops);
@@ -0,0 +1,19 @@
+-- Full-text search for /api/v2/search (app/db/search.py).
+--
+-- Stored generated columns keep the tsvectors in step with every insert and
+-- update without triggers; GIN indexes serve the @@ matches. Adding a stored
+-- column rewrites the table once.
+ALTER TABLE issue
+    ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS issue_search_vector_idx ON issue USING gin (search_vector);
+
+ALTER TABLE issue_action
+    ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(body, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS issue_action_search_vector_idx ON issue_action USING gin (search_vector);
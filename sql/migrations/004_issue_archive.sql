@@ -0,0 +1,45 @@
+-- Cold storage for issues closed long ago (app/db/archive.py).
+--
+-- Same columns as the live tables (including the generated search_vector),
+-- so rows move across with INSERT ... SELECT and reads can UNION ALL both
+-- sides. Archived rows keep their ids. Search does not cover the archive, so
+-- it carries no GIN indexes.
+CREATE TABLE IF NOT EXISTS issue_archive (
+    LIKE issue INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS,
+    archived_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (id),
+    FOREIGN KEY (asset_id) REFERENCES asset (id) ON DELETE RESTRICT,
+    FOREIGN KEY (status_id) REFERENCES issue_status (id) ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS issue_archive_asset_idx_created_at ON issue_archive (asset_id, created_at);
+CREATE INDEX IF NOT EXISTS issue_archive_closed_at_idx ON issue_archive (closed_at);
+
+CREATE TABLE IF NOT EXISTS issue_action_archive (
+    LIKE issue_action INCLUDING GENERATED INCLUDING CONSTRAINTS,
+    PRIMARY KEY (id),
+    FOREIGN KEY (issue_id) REFERENCES issue_archive (id) ON DELETE CASCADE,
+    FOREIGN KEY (action_type_id) REFERENCES action_type (id) ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS issue_action_archive_issue_idx_created_at ON issue_action_archive (issue_id, created_at);
+
+CREATE TABLE IF NOT EXISTS issue_status_history_archive (
+    LIKE issue_status_history INCLUDING CONSTRAINTS,
+    PRIMARY KEY (id),
+    FOREIGN KEY (issue_id) REFERENCES issue_archive (id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS issue_status_history_archive_issue_idx_changed_at
+    ON issue_status_history_archive (issue_id, changed_at);
+
+CREATE TABLE IF NOT EXISTS issue_attachment_archive (
+    LIKE issue_attachment INCLUDING CONSTRAINTS,
+    PRIMARY KEY (id),
+    FOREIGN KEY (issue_id) REFERENCES issue_archive (id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS issue_attachment_archive_issue_idx_created_at ON issue_attachment_archive (issue_id, created_at);
+
+-- The mover's batch scan: oldest closed issues first.
+CREATE INDEX IF NOT EXISTS issue_closed_at_idx ON issue (closed_at, id) WHERE closed_at IS NOT NULL;
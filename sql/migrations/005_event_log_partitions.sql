@@ -0,0 +1,198 @@
+-- Monthly range partitions for the append-only event logs: issue_action
+-- (created_at), issue_status_history and asset_status_history (changed_at).
+--
+-- Time-bounded reads (dashboard trends, per-issue lookups bounded by the
+-- issue's created_at) prune to the months they touch, and old months can be
+-- detached or dropped whole. Inserts land in the current month's partition;
+-- python -m app.jobs.create_partitions keeps the next months created ahead
+-- of time, and a DEFAULT partition catches anything outside the created
+-- ranges so an insert never fails because the job fell behind.
+--
+-- Each partitioned table is built from the live one (LIKE, plus its foreign
+-- keys) rather than from a column list typed in here, so a column, default,
+-- check or generated expression this file doesn't know about is carried
+-- over, and every stored column is copied across.
+--
+-- The primary keys become (id, <timestamp>) because a partitioned table's
+-- unique constraints must include the partition key; ids still come from
+-- the original sequences and stay unique. Indexes are recreated below.
+
+CREATE OR REPLACE FUNCTION create_monthly_partitions(
+    parent regclass,
+    partition_column text,
+    from_month date,
+    to_month date
+) RETURNS SETOF text
+LANGUAGE plpgsql AS $$
+DECLARE
+    parent_schema text;
+    parent_name text;
+    default_name text;
+    month_start date;
+    month_end date;
+    partition_name text;
+    has_default_rows boolean;
+BEGIN
+    SELECT n.nspname, c.relname
+    INTO parent_schema, parent_name
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.oid = parent;
+
+    default_name := parent_name || '_default';
+    month_start := date_trunc('month', from_month)::date;
+
+    WHILE month_start <= to_month LOOP
+        month_end := (month_start + INTERVAL '1 month')::date;
+        partition_name := parent_name || '_p' || to_char(month_start, 'YYYY_MM');
+
+        IF to_regclass(format('%I.%I', parent_schema, partition_name)) IS NULL THEN
+            has_default_rows := FALSE;
+            IF to_regclass(format('%I.%I', parent_schema, default_name)) IS NOT NULL THEN
+                EXECUTE format(
+                    'SELECT EXISTS (SELECT 1 FROM %I.%I WHERE %I >= $1 AND %I < $2)',
+                    parent_schema, default_name, partition_column, partition_column
+                )
+                INTO has_default_rows
+                USING month_start, month_end;
+            END IF;
+
+            -- Rows for this month already sit in the default partition; they
+            -- stay there (still correct, just not pruned) rather than failing.
+            IF has_default_rows THEN
+                RAISE NOTICE 'skipping %: % has rows in that range', partition_name, default_name;
+            ELSE
+                EXECUTE format(
+                    'CREATE TABLE %I.%I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                    parent_schema, partition_name, parent, month_start, month_end
+                );
+                RETURN NEXT partition_name;
+            END IF;
+        END IF;
+
+        month_start := month_end;
+    END LOOP;
+END;
+$$;
+
+
+
+-- Swaps `parent_name` for a copy partitioned by RANGE (partition_column),
+-- with a DEFAULT partition and monthly partitions from its oldest row to 3
+-- months ahead, and moves its rows over. The caller adds the primary key
+-- and indexes.
+CREATE OR REPLACE FUNCTION partition_event_log(
+    parent_name text,
+    partition_column text
+) RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    old_name text := parent_name || '_unpartitioned';
+    id_sequence text;
+    first_month date;
+    column_list text;
+    foreign_key record;
+BEGIN
+    id_sequence := pg_get_serial_sequence(parent_name, 'id');
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', parent_name, old_name);
+    IF id_sequence IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY NONE', id_sequence);
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS'
+        ' INCLUDING GENERATED INCLUDING STORAGE INCLUDING COMMENTS)'
+        ' PARTITION BY RANGE (%I)',
+        parent_name, old_name, partition_column
+    );
+
+    -- LIKE doesn't copy foreign keys.
+    FOR foreign_key IN
+        SELECT conname, pg_get_constraintdef(oid) AS definition
+        FROM pg_constraint
+        WHERE conrelid = old_name::regclass AND contype = 'f'
+        ORDER BY conname
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I ADD CONSTRAINT %I %s',
+            parent_name, foreign_key.conname, foreign_key.definition
+        );
+    END LOOP;
+
+    EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', parent_name || '_default', parent_name);
+
+    EXECUTE format('SELECT COALESCE(min(%I), now())::date FROM %I', partition_column, old_name)
+    INTO first_month;
+    PERFORM create_monthly_partitions(
+        parent_name::regclass, partition_column, first_month, (now() + INTERVAL '3 months')::date
+    );
+
+    -- Every stored column; generated ones are recomputed on insert.
+    SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum)
+    INTO column_list
+    FROM pg_attribute
+    WHERE attrelid = old_name::regclass
+      AND attnum > 0
+      AND NOT attisdropped
+      AND attgenerated = '';
+
+    EXECUTE format(
+        'INSERT INTO %I (%s) SELECT %s FROM %I',
+        parent_name, column_list, column_list, old_name
+    );
+
+    EXECUTE format('DROP TABLE %I', old_name);
+    IF id_sequence IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY %I.id', id_sequence, parent_name);
+    END IF;
+END;
+$$;
+
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'issue_action'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    PERFORM partition_event_log('issue_action', 'created_at');
+
+    ALTER TABLE issue_action ADD CONSTRAINT issue_action_pkey PRIMARY KEY (id, created_at);
+    CREATE INDEX issue_action_issue_idx_created_at ON issue_action (issue_id, created_at);
+    CREATE INDEX issue_action_created_at_brin ON issue_action USING brin (created_at);
+    CREATE INDEX issue_action_search_vector_idx ON issue_action USING gin (search_vector);
+END;
+$$;
+
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'issue_status_history'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    PERFORM partition_event_log('issue_status_history', 'changed_at');
+
+    ALTER TABLE issue_status_history ADD CONSTRAINT issue_status_history_pkey PRIMARY KEY (id, changed_at);
+    CREATE INDEX issue_status_history_issue_idx_changed_at ON issue_status_history (issue_id, changed_at);
+    CREATE INDEX issue_status_history_changed_at_brin ON issue_status_history USING brin (changed_at);
+END;
+$$;
+
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'asset_status_history'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    PERFORM partition_event_log('asset_status_history', 'changed_at');
+
+    ALTER TABLE asset_status_history ADD CONSTRAINT asset_status_history_pkey PRIMARY KEY (id, changed_at);
+    CREATE INDEX asset_status_history_asset_idx_changed_at ON asset_status_history (asset_id, changed_at);
+    CREATE INDEX asset_status_history_changed_at_brin ON asset_status_history USING brin (changed_at);
+END;
+$$;
+
+DROP FUNCTION partition_event_log(text, text);
@@ -0,0 +1,28 @@
+-- Precomputed reliability metrics (MTBF / MTTR / availability) per asset,
+-- model and site, refreshed nightly by python -m app.jobs.compute_reliability
+-- (app/services/reliability.py) so the report page and API only read rows.
+--
+-- site_id is the site filter the row was computed under: asset and site rows
+-- always carry their own site; model rows exist once per site and once with
+-- site_id NULL for all sites together.
+CREATE TABLE IF NOT EXISTS reliability_snapshot (
+    id               bigserial PRIMARY KEY,
+    scope            text NOT NULL CHECK (scope IN ('asset', 'model', 'site')),
+    subject_id       uuid NOT NULL,
+    site_id          uuid,
+    window_start     timestamptz NOT NULL,
+    window_end       timestamptz NOT NULL,
+    asset_count      integer NOT NULL,
+    observed_seconds double precision NOT NULL,
+    downtime_seconds double precision NOT NULL,
+    failure_count    integer NOT NULL,
+    repair_count     integer NOT NULL,
+    repair_seconds   double precision NOT NULL,
+    mtbf_seconds     double precision,
+    mttr_seconds     double precision,
+    availability     double precision,
+    computed_at      timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS reliability_snapshot_scope_site_idx ON reliability_snapshot (scope, site_id);
+CREATE INDEX IF NOT EXISTS reliability_snapshot_subject_idx ON reliability_snapshot (subject_id);
@@ -0,0 +1,139 @@
+-- Change notifications for the live /api/v2/events stream.
+--
+-- Row triggers on issue, issue_action and asset publish a small JSON payload
+-- on the maintenance_events channel with pg_notify(). Each app worker keeps
+-- one LISTEN connection (app/services/events.py) and fans the payloads out
+-- to its connected browsers, so a change is pushed once per worker instead
+-- of every open page re-polling the dashboard.
+--
+-- NOTIFY is transactional: nothing is sent for a rolled-back change, and a
+-- committed transaction's notifications arrive together after COMMIT.
+--
+-- Bulk loads can skip the notifications for their transaction with
+--   SELECT set_config('maintenance.skip_events', 'on', true);
+
+CREATE OR REPLACE FUNCTION notify_change_event(payload jsonb) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF current_setting('maintenance.skip_events', true) = 'on' THEN
+        RETURN;
+    END IF;
+
+    PERFORM pg_notify(
+        'maintenance_events',
+        (payload || jsonb_build_object('at', clock_timestamp()))::text
+    );
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION issue_status_json(status_id uuid) RETURNS jsonb
+LANGUAGE sql STABLE AS $$
+    SELECT jsonb_build_object('code', issue_status.code, 'label', issue_status.label)
+    FROM issue_status
+    WHERE issue_status.id = status_id
+$$;
+
+CREATE OR REPLACE FUNCTION asset_status_json(status_id uuid) RETURNS jsonb
+LANGUAGE sql STABLE AS $$
+    SELECT jsonb_build_object('code', asset_status.code, 'label', asset_status.label)
+    FROM asset_status
+    WHERE asset_status.id = status_id
+$$;
+
+CREATE OR REPLACE FUNCTION issue_change_event() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    row_data issue%ROWTYPE;
+    payload jsonb;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := OLD;
+    ELSE
+        row_data := NEW;
+    END IF;
+
+    -- Titles are cut short: a NOTIFY payload must stay under 8000 bytes.
+    payload := jsonb_build_object(
+        'type', CASE TG_OP
+            WHEN 'INSERT' THEN 'issue.created'
+            WHEN 'UPDATE' THEN 'issue.updated'
+            ELSE 'issue.deleted'
+        END,
+        'id', row_data.id,
+        'asset_id', row_data.asset_id,
+        'site_id', (SELECT asset.site_id FROM asset WHERE asset.id = row_data.asset_id),
+        'title', left(row_data.title, 200),
+        'status', issue_status_json(row_data.status_id),
+        'updated_at', row_data.updated_at
+    );
+
+    -- Lets clients adjust status counters without refetching them.
+    IF TG_OP = 'UPDATE' THEN
+        payload := payload || jsonb_build_object('previous_status', issue_status_json(OLD.status_id));
+    END IF;
+
+    PERFORM notify_change_event(payload);
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION issue_action_change_event() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM notify_change_event(jsonb_build_object(
+        'type', 'issue_action.created',
+        'id', NEW.id,
+        'issue_id', NEW.issue_id,
+        'asset_id', asset.id,
+        'site_id', asset.site_id,
+        'action_type', (
+            SELECT jsonb_build_object('code', action_type.code, 'label', action_type.label)
+            FROM action_type
+            WHERE action_type.id = NEW.action_type_id
+        ),
+        'created_at', NEW.created_at
+    ))
+    FROM issue
+    JOIN asset ON asset.id = issue.asset_id
+    WHERE issue.id = NEW.issue_id;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION asset_status_change_event() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM notify_change_event(jsonb_build_object(
+        'type', 'asset.status_changed',
+        'id', NEW.id,
+        'site_id', NEW.site_id,
+        'asset_tag', NEW.asset_tag,
+        'retired', NEW.retired_at IS NOT NULL,
+        'status', asset_status_json(NEW.status_id),
+        'previous_status', asset_status_json(OLD.status_id)
+    ));
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS issue_change_event ON issue;
+CREATE TRIGGER issue_change_event
+    AFTER INSERT OR UPDATE OR DELETE ON issue
+    FOR EACH ROW EXECUTE FUNCTION issue_change_event();
+
+-- issue_action is partitioned (005); a row trigger on the parent is cloned
+-- onto every existing and future partition.
+DROP TRIGGER IF EXISTS issue_action_change_event ON issue_action;
+CREATE TRIGGER issue_action_change_event
+    AFTER INSERT ON issue_action
+    FOR EACH ROW EXECUTE FUNCTION issue_action_change_event();
+
+DROP TRIGGER IF EXISTS asset_status_change_event ON asset;
+CREATE TRIGGER asset_status_change_event
+    AFTER UPDATE OF status_id ON asset
+    FOR EACH ROW
+    WHEN (OLD.status_id IS DISTINCT FROM NEW.status_id)
+    EXECUTE FUNCTION asset_status_change_event();
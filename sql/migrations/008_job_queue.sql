@@ -0,0 +1,48 @@
+-- Durable background jobs (app/services/jobs.py).
+--
+-- Requests enqueue slow side work (HEIC conversion, attachment file clean-up,
+-- QR rendering) as rows here and return; workers claim ready rows with
+-- FOR UPDATE SKIP LOCKED, so any number of them (threads inside gunicorn or
+-- python -m app.jobs.run_worker processes) share the queue without
+-- handing out a job twice.
+--
+-- status: queued -> running -> done, or back to queued with a later
+-- run_after while attempts < max_attempts, else failed. A running job whose
+-- worker died is requeued once locked_at is older than the lease.
+CREATE TABLE IF NOT EXISTS job (
+    id           bigserial PRIMARY KEY,
+    kind         text NOT NULL,
+    payload      jsonb NOT NULL DEFAULT '{}'::jsonb,
+    dedup_key    text,
+    status       text NOT NULL DEFAULT 'queued'
+                 CHECK (status IN ('queued', 'running', 'done', 'failed')),
+    attempts     integer NOT NULL DEFAULT 0,
+    max_attempts integer NOT NULL DEFAULT 5,
+    run_after    timestamptz NOT NULL DEFAULT now(),
+    locked_at    timestamptz,
+    locked_by    text,
+    last_error   text,
+    created_at   timestamptz NOT NULL DEFAULT now(),
+    finished_at  timestamptz
+);
+
+-- The claim query: oldest ready job first, only queued rows indexed.
+CREATE INDEX IF NOT EXISTS job_ready_idx
+    ON job (run_after, id)
+    WHERE status = 'queued';
+
+-- Lease expiry scan.
+CREATE INDEX IF NOT EXISTS job_running_idx
+    ON job (locked_at)
+    WHERE status = 'running';
+
+-- One pending job per (kind, dedup_key); once it finishes the key is free
+-- again.
+CREATE UNIQUE INDEX IF NOT EXISTS job_dedup_key_idx
+    ON job (kind, dedup_key)
+    WHERE dedup_key IS NOT NULL AND status IN ('queued', 'running');
+
+-- Retention clean-up of finished jobs.
+CREATE INDEX IF NOT EXISTS job_finished_idx
+    ON job (finished_at)
+    WHERE status IN ('done', 'failed');
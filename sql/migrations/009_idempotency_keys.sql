@@ -0,0 +1,27 @@
+-- Idempotency-Key support for retried POSTs (app/services/idempotency.py).
+--
+-- A client-chosen key is claimed (status 'pending') before the request runs
+-- and holds the stored 2xx response once it has ('completed'); a retry with
+-- the same key and request gets that response back instead of creating the
+-- issue / action / attachment again. Rows expire after
+-- IDEMPOTENCY_KEY_TTL_HOURS and are purged by the job workers' housekeeping.
+--
+-- request_hash fingerprints method, path and body, so reusing a key for a
+-- different request is refused rather than answered with the wrong result.
+-- locked_until lets a retry take over a 'pending' claim whose request died
+-- without finishing or releasing it.
+CREATE TABLE IF NOT EXISTS idempotency_key (
+    key              text PRIMARY KEY,
+    request_hash     text NOT NULL,
+    status           text NOT NULL DEFAULT 'pending'
+                     CHECK (status IN ('pending', 'completed')),
+    response_status  integer,
+    response_headers jsonb,
+    response_body    bytea,
+    locked_until     timestamptz,
+    created_at       timestamptz NOT NULL DEFAULT now(),
+    expires_at       timestamptz NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idempotency_key_expires_at_idx
+    ON idempotency_key (expires_at);
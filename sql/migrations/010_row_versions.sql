@@ -0,0 +1,14 @@
+-- Row versions for optimistic concurrency on issue and asset updates.
+--
+-- Every write through update_issue_row / update_asset_row bumps version,
+-- and a caller that read version N can make its write conditional on
+-- "version = N" (compare-and-swap) instead of holding a row lock. The API
+-- exposes it as the ETag of GET/PATCH responses and honours If-Match on
+-- PATCH /issues/<id>, POST /issues/<id>/actions and PATCH /assets/<id>,
+-- answering 412 when the row moved on.
+--
+-- Adding a NOT NULL column with a constant default does not rewrite the
+-- table. issue_archive carries the column so archived rows keep theirs.
+ALTER TABLE issue ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1;
+ALTER TABLE issue_archive ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1;
+ALTER TABLE asset ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1;
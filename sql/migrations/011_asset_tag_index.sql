@@ -0,0 +1,7 @@
+-- Exact asset tag lookups (assets_db.lookup_asset_rows, get_asset_row_by_tag).
+--
+-- The search indexes in 002 are on lower(asset_tag) and trigrams and cannot
+-- answer "asset_tag = ANY(:asset_tags)", which a stocktake resolves for
+-- thousands of scanned tags at a time. A plain btree turns that into one
+-- index probe per tag.
+CREATE INDEX IF NOT EXISTS asset_tag_idx ON asset (asset_tag);
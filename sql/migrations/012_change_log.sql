@@ -0,0 +1,88 @@
+-- Change log for incremental sync (GET /api/v2/sync, app/services/sync.py).
+--
+-- Row triggers append one change_log row per insert, update or delete of an
+-- issue, issue action, issue status change, asset or asset status change:
+-- the row as it now is (data) for inserts/updates, a tombstone (data NULL)
+-- for deletes. Deleting an issue or asset (delete_issue_row /
+-- delete_asset_row) and archiving an issue both leave a tombstone; actions
+-- and status history removed with their issue get none of their own.
+--
+-- Order and cursor are (txid, seq). seq alone is not safe to resume from:
+-- sequence values are handed out before commit, so a transaction can commit
+-- a lower seq after a reader has already moved past it. Readers only return
+-- rows of transactions older than their snapshot's xmin (all finished) in
+-- (txid, seq) order, so nothing can appear behind a cursor afterwards.
+--
+-- Entries are kept SYNC_RETENTION_DAYS and purged by the job workers'
+-- housekeeping; change_log_horizon remembers the newest transaction purged,
+-- and a cursor at or behind it is refused (410) so the client resyncs.
+--
+-- Like the NOTIFY triggers (007), maintenance.skip_events = 'on' skips
+-- logging for a bulk-load transaction.
+CREATE TABLE IF NOT EXISTS change_log (
+    seq        bigserial PRIMARY KEY,
+    txid       xid8 NOT NULL DEFAULT pg_current_xact_id(),
+    entity     text NOT NULL,
+    entity_id  text NOT NULL,
+    op         text NOT NULL CHECK (op IN ('upsert', 'delete')),
+    data       jsonb,
+    changed_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS change_log_txid_seq_idx ON change_log (txid, seq);
+CREATE INDEX IF NOT EXISTS change_log_changed_at_idx ON change_log (changed_at);
+
+CREATE TABLE IF NOT EXISTS change_log_horizon (
+    id                  boolean PRIMARY KEY DEFAULT TRUE CHECK (id),
+    pruned_through_txid xid8 NOT NULL DEFAULT '0'
+);
+
+INSERT INTO change_log_horizon (id) VALUES (TRUE) ON CONFLICT (id) DO NOTHING;
+
+-- TG_ARGV[0] is the entity name clients see. The generated search_vector
+-- (003) is an index helper, not data: it is left out of the payload.
+CREATE OR REPLACE FUNCTION record_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF current_setting('maintenance.skip_events', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO change_log (entity, entity_id, op)
+        VALUES (TG_ARGV[0], OLD.id::text, 'delete');
+    ELSE
+        INSERT INTO change_log (entity, entity_id, op, data)
+        VALUES (TG_ARGV[0], NEW.id::text, 'upsert', to_jsonb(NEW) - 'search_vector');
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS issue_change_log ON issue;
+CREATE TRIGGER issue_change_log
+    AFTER INSERT OR UPDATE OR DELETE ON issue
+    FOR EACH ROW EXECUTE FUNCTION record_change('issue');
+
+DROP TRIGGER IF EXISTS asset_change_log ON asset;
+CREATE TRIGGER asset_change_log
+    AFTER INSERT OR UPDATE OR DELETE ON asset
+    FOR EACH ROW EXECUTE FUNCTION record_change('asset');
+
+-- The event tables are partitioned (005) and append-only; a row trigger on
+-- the parent is cloned onto every existing and future partition.
+DROP TRIGGER IF EXISTS issue_action_change_log ON issue_action;
+CREATE TRIGGER issue_action_change_log
+    AFTER INSERT ON issue_action
+    FOR EACH ROW EXECUTE FUNCTION record_change('issue_action');
+
+DROP TRIGGER IF EXISTS issue_status_history_change_log ON issue_status_history;
+CREATE TRIGGER issue_status_history_change_log
+    AFTER INSERT ON issue_status_history
+    FOR EACH ROW EXECUTE FUNCTION record_change('issue_status_change');
+
+DROP TRIGGER IF EXISTS asset_status_history_change_log ON asset_status_history;
+CREATE TRIGGER asset_status_history_change_log
+    AFTER INSERT ON asset_status_history
+    FOR EACH ROW EXECUTE FUNCTION record_change('asset_status_change');
@@ -0,0 +1,26 @@
+-- Bulk writes and the live /api/v2/events stream.
+--
+-- A bulk asset change (up to 1000 rows) fires one row-trigger NOTIFY per
+-- row (007), far more than a subscriber's queue holds, so every open stream
+-- overflowed and was dropped. Such a transaction now sets
+--   SELECT set_config('maintenance.skip_notify', 'on', true);
+-- and sends a single {"type": "resync"} event itself (app/db/events.py notify_resync),
+-- on which the pages refetch what they show.
+--
+-- Unlike maintenance.skip_events this only silences NOTIFY: the sync change
+-- log (012) still records every row.
+
+CREATE OR REPLACE FUNCTION notify_change_event(payload jsonb) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF current_setting('maintenance.skip_events', true) = 'on'
+        OR current_setting('maintenance.skip_notify', true) = 'on' THEN
+        RETURN;
+    END IF;
+
+    PERFORM pg_notify(
+        'maintenance_events',
+        (payload || jsonb_build_object('at', clock_timestamp()))::text
+    );
+END;
+$$;
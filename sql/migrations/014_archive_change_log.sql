@@ -0,0 +1,36 @@
+-- Archiving an issue is not deleting it.
+--
+-- archive_closed_issue_batch (app/db/archive.py) moves issues out of the
+-- live table with a DELETE, which the change log (012) recorded as an
+-- ordinary "delete" tombstone, so sync clients dropped issues that are
+-- still readable with include_archived=true. The archive transaction sets
+--   SELECT set_config('maintenance.archiving', 'on', true);
+-- and its deletes are logged with op 'archive' instead. (Its NOTIFYs are
+-- replaced by one resync event, 013.)
+
+ALTER TABLE change_log DROP CONSTRAINT IF EXISTS change_log_op_check;
+ALTER TABLE change_log
+    ADD CONSTRAINT change_log_op_check CHECK (op IN ('upsert', 'delete', 'archive'));
+
+CREATE OR REPLACE FUNCTION record_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF current_setting('maintenance.skip_events', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO change_log (entity, entity_id, op)
+        VALUES (
+            TG_ARGV[0],
+            OLD.id::text,
+            CASE WHEN current_setting('maintenance.archiving', true) = 'on' THEN 'archive' ELSE 'delete' END
+        );
+    ELSE
+        INSERT INTO change_log (entity, entity_id, op, data)
+        VALUES (TG_ARGV[0], NEW.id::text, 'upsert', to_jsonb(NEW) - 'search_vector');
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
@@ -0,0 +1,170 @@
+-- Baseline schema for the maintenance database.
+--
+-- Tables live in whatever schema is first on the role's search_path
+-- (production uses `maintenance`). Later changes go in sql/migrations/ and
+-- are applied in file-name order on top of this file.
+
+CREATE EXTENSION IF NOT EXISTS citext;
+
+CREATE TABLE site (
+    id        uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    shorthand text NOT NULL,
+    fullname  text NOT NULL,
+    CONSTRAINT "site.shorthand.unique" UNIQUE (shorthand),
+    CONSTRAINT "site.fullname.unique" UNIQUE (fullname)
+);
+
+CREATE TABLE category (
+    id    uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    name  citext NOT NULL,
+    label text NOT NULL,
+    CONSTRAINT "category.name.unique" UNIQUE (name)
+);
+
+CREATE TABLE make (
+    id          uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    category_id uuid REFERENCES category (id) ON DELETE RESTRICT,
+    name        citext NOT NULL,
+    label       text NOT NULL,
+    CONSTRAINT "make.name.unique" UNIQUE (name),
+    CONSTRAINT "make.label.unique" UNIQUE (label)
+);
+
+CREATE TABLE model (
+    id      uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    make_id uuid NOT NULL,
+    name    citext NOT NULL,
+    label   text NOT NULL,
+    CONSTRAINT "model.make_id_refs_make.id" FOREIGN KEY (make_id) REFERENCES make (id) ON DELETE RESTRICT,
+    CONSTRAINT "model.make_id+name.unique" UNIQUE (make_id, name)
+);
+
+CREATE TABLE variant (
+    id       uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    model_id uuid NOT NULL,
+    name     citext NOT NULL,
+    label    text NOT NULL,
+    CONSTRAINT "variant.model_id_refs_model.id" FOREIGN KEY (model_id) REFERENCES model (id) ON DELETE RESTRICT,
+    CONSTRAINT "variant.model_id+name_unique" UNIQUE (model_id, name)
+);
+
+CREATE TABLE asset_status (
+    id            uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    code          citext NOT NULL,
+    label         text NOT NULL,
+    display_order integer NOT NULL,
+    CONSTRAINT "asset_status.code.unique" UNIQUE (code)
+);
+
+CREATE SEQUENCE asset_serial_num_seq;
+
+CREATE TABLE asset (
+    id            uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    variant_id    uuid NOT NULL REFERENCES variant (id) ON DELETE RESTRICT,
+    category_id   uuid NOT NULL REFERENCES category (id) ON DELETE RESTRICT,
+    site_id       uuid NOT NULL REFERENCES site (id) ON DELETE RESTRICT,
+    status_id     uuid NOT NULL REFERENCES asset_status (id) ON DELETE RESTRICT,
+    serial_num    bigint NOT NULL DEFAULT nextval('asset_serial_num_seq'),
+    asset_tag     text NOT NULL,
+    acquired_at   date,
+    retired_at    date,
+    retire_reason text,
+    created_at    timestamptz NOT NULL DEFAULT now(),
+    updated_at    timestamptz NOT NULL DEFAULT now(),
+    CONSTRAINT retired_needs_reason CHECK (
+        retired_at IS NULL OR length(COALESCE(TRIM(BOTH FROM retire_reason), '')) > 0
+    )
+);
+
+ALTER SEQUENCE asset_serial_num_seq OWNED BY asset.serial_num;
+
+CREATE INDEX asset_variant_idx ON asset (variant_id);
+CREATE INDEX asset_category_idx ON asset (category_id);
+CREATE INDEX asset_site_status_idx ON asset (site_id, status_id);
+
+CREATE TABLE asset_status_history (
+    id             bigserial PRIMARY KEY,
+    asset_id       uuid NOT NULL REFERENCES asset (id) ON DELETE CASCADE,
+    from_status_id uuid REFERENCES asset_status (id),
+    to_status_id   uuid NOT NULL REFERENCES asset_status (id),
+    changed_at     timestamptz NOT NULL DEFAULT now(),
+    changed_by     text
+);
+
+CREATE INDEX asset_status_history_asset_idx_changed_at ON asset_status_history (asset_id, changed_at);
+
+CREATE TABLE issue_status (
+    id            uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    code          citext NOT NULL,
+    label         text NOT NULL,
+    display_order integer NOT NULL,
+    CONSTRAINT "issue_status.code.unique" UNIQUE (code)
+);
+
+CREATE TABLE action_type (
+    id            uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    code          citext NOT NULL UNIQUE,
+    label         text NOT NULL UNIQUE,
+    display_order integer NOT NULL
+);
+
+CREATE TABLE issue (
+    id          uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    asset_id    uuid NOT NULL REFERENCES asset (id) ON DELETE RESTRICT,
+    status_id   uuid NOT NULL REFERENCES issue_status (id) ON DELETE RESTRICT,
+    title       text NOT NULL,
+    description text NOT NULL,
+    reported_by text,
+    closed_at   timestamptz,
+    created_at  timestamptz NOT NULL DEFAULT now(),
+    updated_at  timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX issue_asset_status_idx_created_at ON issue (asset_id, status_id, created_at);
+CREATE INDEX issue_status_idx_created_at ON issue (status_id, created_at);
+
+CREATE TABLE issue_action (
+    id             bigserial PRIMARY KEY,
+    issue_id       uuid NOT NULL REFERENCES issue (id) ON DELETE CASCADE,
+    action_type_id uuid NOT NULL REFERENCES action_type (id) ON DELETE RESTRICT,
+    body           text NOT NULL,
+    created_at     timestamptz NOT NULL DEFAULT now(),
+    created_by     text
+);
+
+CREATE INDEX issue_action_issue_idx_created_at ON issue_action (issue_id, created_at);
+
+CREATE TABLE issue_status_history (
+    id             bigserial PRIMARY KEY,
+    issue_id       uuid NOT NULL REFERENCES issue (id) ON DELETE CASCADE,
+    from_status_id uuid NOT NULL REFERENCES issue_status (id),
+    to_status_id   uuid NOT NULL REFERENCES issue_status (id),
+    changed_at     timestamptz NOT NULL DEFAULT now(),
+    changed_by     text
+);
+
+CREATE INDEX issue_status_history_issue_idx_changed_at ON issue_status_history (issue_id, changed_at);
+
+CREATE TABLE accepted_attachment_content_type (
+    id           uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    content_type text NOT NULL UNIQUE
+);
+
+CREATE TABLE issue_attachment (
+    id           uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    issue_id     uuid NOT NULL REFERENCES issue (id) ON DELETE CASCADE,
+    filepath     text NOT NULL,
+    content_type text NOT NULL REFERENCES accepted_attachment_content_type (content_type) ON DELETE CASCADE,
+    width        integer,
+    height       integer,
+    created_at   timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX issue_attachment_issue_idx_created_at ON issue_attachment (issue_id, created_at);
+
+CREATE TABLE admin_gate (
+    id            uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    name          text NOT NULL UNIQUE,
+    password_hash text NOT NULL,
+    is_enabled    boolean NOT NULL DEFAULT TRUE
+);
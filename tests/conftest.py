@@ -0,0 +1,57 @@
+"""
+Tests run against a throwaway Postgres cluster built the same way as the
+benchmarks' (benchmarks/postgres.py): schema plus every migration, filled
+with a small datagen data set. They are skipped, with the reason, when no
+Postgres binaries are found (set PG_BIN) or the server lacks the contrib
+extensions the schema needs (citext, pg_trgm: install postgresql-contrib).
+"""
+import os
+import tempfile
+
+import pytest
+
+from benchmarks import datagen
+from benchmarks.postgres import _find_bin_dir, connect, create_database, throwaway_postgres
+
+TEST_SCALE = {**datagen.SCALES["small"], "assets": 40, "issues": 120}
+
+
+@pytest.fixture(scope="session")
+def database():
+    try:
+        bin_dir = _find_bin_dir()
+    except RuntimeError as exc:
+        pytest.skip(str(exc))
+
+    with throwaway_postgres(bin_dir) as settings:
+        try:
+            create_database(settings)
+        except RuntimeError as exc:
+            pytest.skip(str(exc))
+        conn = connect(settings)
+        data = datagen.generate(conn, **TEST_SCALE)
+        conn.close()
+        yield {"settings": settings, "data": data}
+
+
+@pytest.fixture(scope="session")
+def app(database):
+    # app.db.connection builds its URL from the environment on import.
+    os.environ.update(database["settings"])
+    os.environ.setdefault("FLASK_SECRET", "tests")
+    os.environ.setdefault("REQUEST_PROFILING", "0")
+    os.environ.setdefault("ATTACHMENT_ROOT", tempfile.mkdtemp(prefix="maint-tests-"))
+
+    from app import initialise_application
+
+    return initialise_application()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def data(database):
+    return database["data"]
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from app.db import archive as archive_db
+from app.db import events as events_repo
+from app.db.connection import get_connection
+
+from .test_events import _drain
+
+API = "/maintenance/api/v2"
+
+LONG_AGO = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def _close_long_ago(issue_ids) -> None:
+    # Older than anything datagen closes, so only these issues qualify.
+    with get_connection() as conn:
+        conn.execute(
+            text("UPDATE issue SET closed_at = :closed_at WHERE id = ANY(CAST(:ids AS uuid[]))"),
+            {"closed_at": datetime(1999, 1, 1, tzinfo=timezone.utc), "ids": issue_ids},
+        )
+
+
+def _count(sql: str, issue_ids) -> int:
+    with get_connection() as conn:
+        return conn.execute(text(sql), {"ids": issue_ids}).scalar_one()
+
+
+def test_archive_batch_moves_issues_with_their_history(app, data):
+    issue_ids = data["issue_ids"][-6:-3]
+    with app.app_context():
+        _close_long_ago(issue_ids)
+        live_actions = _count("SELECT COUNT(*) FROM issue_action WHERE issue_id = ANY(CAST(:ids AS uuid[]))", issue_ids)
+
+        first = archive_db.archive_closed_issue_batch(LONG_AGO, batch_size=2)
+        second = archive_db.archive_closed_issue_batch(LONG_AGO, batch_size=2)
+        assert (first["issues"], second["issues"]) == (2, 1)
+        assert archive_db.archive_closed_issue_batch(LONG_AGO, batch_size=2)["issues"] == 0
+
+        assert first["actions"] + second["actions"] == live_actions
+        assert _count("SELECT COUNT(*) FROM issue WHERE id = ANY(CAST(:ids AS uuid[]))", issue_ids) == 0
+        assert _count("SELECT COUNT(*) FROM issue_archive WHERE id = ANY(CAST(:ids AS uuid[]))", issue_ids) == 3
+        assert _count(
+            "SELECT COUNT(*) FROM issue_action_archive WHERE issue_id = ANY(CAST(:ids AS uuid[]))", issue_ids
+        ) == live_actions
+
+
+def test_archived_issue_syncs_as_archive_and_streams_resync(app, client, data):
+    issue_ids = data["issue_ids"][-3:]
+    cursor = client.get(f"{API}/sync").get_json()["cursor"]
+
+    with app.app_context():
+        _close_long_ago(issue_ids)
+        conn = events_repo.open_listen_connection()
+        try:
+            _drain(conn)
+            assert archive_db.archive_closed_issue_batch(LONG_AGO)["issues"] == 3
+            events = _drain(conn)
+        finally:
+            conn.close()
+
+    assert [event["type"] for event in events] == ["resync"]
+
+    changes = client.get(f"{API}/sync", query_string={"since": cursor}).get_json()["changes"]
+    archived = {change["id"]: change for change in changes if change["entity"] == "issue"}
+    assert set(archived) == set(issue_ids)
+    assert {change["op"] for change in archived.values()} == {"archive"}
+
+    response = client.get(f"{API}/issues/{issue_ids[0]}", query_string={"include_archived": "true"})
+    assert response.status_code == 200
@@ -0,0 +1,40 @@
+from app.services import auth as auth_service
+
+API = "/maintenance/api/v2"
+
+
+def test_bulk_status_dry_run_counts_status_changes(client, data):
+    client.set_cookie(auth_service.SETTINGS_ADMIN_GATE_COOKIE_NAME, "1")
+    asset_ids = data["asset_ids"][10:16]
+    payload = {
+        "action": "set_status",
+        "asset_ids": asset_ids,
+        "status_id": data["asset_status_ids"]["MAINTENANCE"],
+    }
+
+    dry_run = client.post(f"{API}/assets/bulk", json={**payload, "dry_run": True})
+    assert dry_run.status_code == 200
+    preview = dry_run.get_json()
+    assert preview["updated"] > 0
+
+    applied = client.post(f"{API}/assets/bulk", json=payload).get_json()
+    assert preview["status_changes"] == applied["status_changes"] == applied["updated"]
+
+
+def test_bulk_update_over_the_limit_writes_nothing(app, data):
+    from app.db import assets as assets_repo
+    from app.services import assets as asset_service
+
+    asset_ids = data["asset_ids"][20:23]
+    with app.app_context():
+        before = [asset_service.get_asset_version(asset_id) for asset_id in asset_ids]
+        summary = assets_repo.bulk_update_asset_rows(
+            asset_ids=asset_ids,
+            retire_reason="over the limit",
+            max_assets=2,
+        )
+        after = [asset_service.get_asset_version(asset_id) for asset_id in asset_ids]
+
+    assert summary["matched"] == 3
+    assert summary["applied"] is False
+    assert before == after
@@ -0,0 +1,48 @@
+from sqlalchemy import text
+
+from app.db.connection import get_connection
+from app.services import assets as asset_service
+
+
+def _busiest_asset() -> tuple[str, list[str]]:
+    with get_connection() as conn:
+        rows = conn.execute(text("""
+            SELECT asset_id, array_agg(id::text ORDER BY created_at DESC, id DESC) AS issue_ids
+            FROM issue
+            GROUP BY asset_id
+            ORDER BY COUNT(*) DESC, asset_id
+            LIMIT 1
+        """)).mappings().first()
+    return str(rows["asset_id"]), list(rows["issue_ids"])
+
+
+def test_detail_counts_and_history_pages_cover_every_issue(app):
+    with app.app_context():
+        asset_id, issue_ids = _busiest_asset()
+        assert len(issue_ids) >= 3
+
+        detail = asset_service.get_asset_detail_service(asset_id, history_limit=2)
+        assert detail["asset"]["asset_id"] == asset_id
+        assert detail["issue_counts"]["total"] == len(issue_ids)
+        assert sum(detail["issue_counts"]["by_status"].values()) == len(issue_ids)
+
+        page = detail["issues"]
+        seen = [item["id"] for item in page["items"]]
+        while page["next_cursor"] is not None:
+            page = asset_service.list_asset_issue_history_service(asset_id, before=page["next_cursor"], limit=2)
+            seen += [item["id"] for item in page["items"]]
+
+    assert seen == issue_ids
+
+
+def test_asset_page_and_older_issues_fragment(client, app):
+    with app.app_context():
+        asset_id, _ = _busiest_asset()
+        cursor = asset_service.get_asset_detail_service(asset_id, history_limit=1)["issues"]["next_cursor"]
+
+    assert client.get(f"/maintenance/assets/{asset_id}").status_code == 200
+
+    fragment = client.get(f"/maintenance/assets/{asset_id}/issues", query_string={"before": cursor, "limit": 1})
+    assert fragment.status_code == 200
+    bad = client.get(f"/maintenance/assets/{asset_id}/issues", query_string={"before": "yesterday"})
+    assert bad.status_code == 400
@@ -0,0 +1,48 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.db.connection import get_engine
+
+API = "/maintenance/api/v2"
+
+INCLUDES = "site,category,status,variant"
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _list(client, page_size):
+    with _count_queries() as statements:
+        response = client.get(f"{API}/assets", query_string={"include": INCLUDES, "page_size": page_size})
+    assert response.status_code == 200
+    return response.get_json()["items"], len(statements)
+
+
+def test_includes_match_the_asset_ids(client):
+    items, _ = _list(client, 20)
+    assert items
+    for item in items:
+        assert item["site"]["id"] == item["site_id"]
+        assert item["status"]["id"] == item["status_id"]
+        if item["variant_id"]:
+            assert item["variant"]["id"] == item["variant_id"]
+
+
+def test_includes_cost_the_same_queries_for_any_page_size(client):
+    _list(client, 2)  # warm the site catalog
+    _, few = _list(client, 2)
+    _, many = _list(client, 30)
+    assert few == many
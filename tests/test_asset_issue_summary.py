@@ -0,0 +1,50 @@
+from sqlalchemy import text
+
+from app.db.assets import ACTIVE_ISSUE_STATUS_CODES
+from app.db.connection import get_connection
+
+API = "/maintenance/api/v2"
+
+
+def _open_issue_counts() -> dict[str, int]:
+    with get_connection() as conn:
+        rows = conn.execute(
+            text("""
+                SELECT issue.asset_id::text, COUNT(*)::int
+                FROM issue
+                JOIN issue_status ON issue.status_id = issue_status.id
+                WHERE issue_status.code = ANY(:codes)
+                GROUP BY issue.asset_id
+            """),
+            {"codes": list(ACTIVE_ISSUE_STATUS_CODES)},
+        ).all()
+    return dict(rows)
+
+
+def _list(client, **params):
+    response = client.get(f"{API}/assets", query_string={"retired": "all", "page_size": 100, **params})
+    assert response.status_code == 200
+    return response.get_json()["items"]
+
+
+def test_issue_summary_counts_open_issues(client, app):
+    with app.app_context():
+        expected = _open_issue_counts()
+
+    items = _list(client, include="issue_summary")
+    assert items
+    for item in items:
+        assert item["open_issue_count"] == expected.get(item["asset_id"], 0)
+
+
+def test_has_open_issues_filter_and_sort(client, app):
+    with app.app_context():
+        expected = _open_issue_counts()
+
+    with_open = _list(client, has_open_issues="true", sort="-open_issue_count")
+    assert {item["asset_id"] for item in with_open} == set(expected)
+    counts = [item["open_issue_count"] for item in with_open]
+    assert counts == sorted(counts, reverse=True)
+
+    without_open = _list(client, has_open_issues="false")
+    assert not {item["asset_id"] for item in without_open} & set(expected)
@@ -0,0 +1,38 @@
+import uuid
+
+from app.services import assets as asset_service
+
+API = "/maintenance/api/v2"
+
+
+def _assets_at_two_sites(client, data) -> tuple[dict, dict]:
+    assets = [client.get(f"{API}/assets/{asset_id}").get_json() for asset_id in data["asset_ids"][35:40]]
+    first = assets[0]
+    other = next(asset for asset in assets if asset["site_id"] != first["site_id"])
+    return first, other
+
+
+def test_lookup_reports_found_missing_and_other_site(client, data):
+    here, elsewhere = _assets_at_two_sites(client, data)
+    missing_id = str(uuid.uuid4())
+
+    response = client.post(f"{API}/assets/lookup", json={
+        "asset_tags": [here["asset_tag"], here["asset_tag"], "NO-SUCH-TAG"],
+        "asset_ids": [elsewhere["asset_id"], missing_id],
+        "site_id": here["site_id"],
+    })
+    assert response.status_code == 200
+    result = response.get_json()
+
+    assert {item["asset_id"] for item in result["found"]} == {here["asset_id"], elsewhere["asset_id"]}
+    assert result["missing"] == {"asset_tags": ["NO-SUCH-TAG"], "asset_ids": [missing_id]}
+    assert [item["asset_id"] for item in result["site_mismatches"]] == [elsewhere["asset_id"]]
+    assert result["counts"] == {"requested": 4, "found": 2, "missing": 2, "site_mismatches": 1}
+
+
+def test_lookup_validation(client):
+    too_many = [f"TAG-{n}" for n in range(asset_service.ASSET_LOOKUP_MAX_KEYS + 1)]
+    assert client.post(f"{API}/assets/lookup", json={"asset_tags": too_many}).status_code == 400
+    assert client.post(f"{API}/assets/lookup", json={}).status_code == 400
+    assert client.post(f"{API}/assets/lookup", json={"asset_ids": ["not-a-uuid"]}).status_code == 400
+    assert client.post(f"{API}/assets/lookup", json={"asset_tags": "TAG-1"}).status_code == 400
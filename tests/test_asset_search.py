@@ -0,0 +1,33 @@
+API = "/maintenance/api/v2"
+
+
+def _asset(client, asset_id):
+    response = client.get(f"{API}/assets/{asset_id}")
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_tag_prefix_finds_the_asset_first(client, data):
+    asset = _asset(client, data["asset_ids"][5])
+    tag = asset["asset_tag"]
+
+    response = client.get(f"{API}/assets/search", query_string={"q": tag, "limit": 5})
+    assert response.status_code == 200
+    items = response.get_json()["items"]
+    assert items[0]["asset_tag"] == tag
+
+    prefix = client.get(f"{API}/assets/search", query_string={"q": tag[:-1].lower(), "limit": 25})
+    assert tag in [item["asset_tag"] for item in prefix.get_json()["items"]]
+
+
+def test_site_filter_and_limits(client, data):
+    asset = _asset(client, data["asset_ids"][5])
+    site_id = asset["site_id"]
+
+    response = client.get(f"{API}/assets/search", query_string={"q": asset["asset_tag"][:3], "site_id": site_id})
+    assert response.status_code == 200
+    assert all(item["site_id"] == site_id for item in response.get_json()["items"])
+
+    assert client.get(f"{API}/assets/search", query_string={"q": "   "}).get_json() == {"items": []}
+    assert client.get(f"{API}/assets/search", query_string={"q": "a", "limit": 0}).status_code == 400
+    assert client.get(f"{API}/assets/search", query_string={"q": "a", "site_id": "nope"}).status_code == 400
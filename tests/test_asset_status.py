@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.db.connection import get_connection
+from app.services import assets as asset_service
+
+
+def _history(asset_id) -> list[tuple]:
+    with get_connection() as conn:
+        rows = conn.execute(
+            text("""
+                SELECT from_status_id, to_status_id
+                FROM asset_status_history
+                WHERE asset_id = :asset_id
+                ORDER BY changed_at
+            """),
+            {"asset_id": asset_id},
+        ).all()
+    return [(str(from_id) if from_id else None, str(to_id)) for from_id, to_id in rows]
+
+
+def test_transition_writes_history_only_on_a_change(app, data):
+    asset_id = data["asset_ids"][7]
+    statuses = data["asset_status_ids"]
+
+    with app.app_context():
+        asset_service.set_asset_status(asset_id, statuses["ACTIVE"])
+        version = asset_service.get_asset_version(asset_id)
+        history = _history(asset_id)
+
+        moved = asset_service.set_asset_status(asset_id, statuses["MAINTENANCE"], changed_by="status test")
+        assert moved["changed"] is True
+        assert moved["from_status_id"] == str(statuses["ACTIVE"])
+
+        again = asset_service.set_asset_status(asset_id, statuses["MAINTENANCE"])
+        assert again["changed"] is False
+
+        assert _history(asset_id) == history + [(str(statuses["ACTIVE"]), str(statuses["MAINTENANCE"]))]
+        assert asset_service.get_asset_version(asset_id) == version + 1
+
+
+def test_transition_rejects_unknown_ids(app, data):
+    with app.app_context():
+        with pytest.raises(ValueError, match="Unknown asset_id"):
+            asset_service.set_asset_status(str(uuid.uuid4()), data["asset_status_ids"]["ACTIVE"])
+        with pytest.raises(ValueError, match="Unknown to_status_id"):
+            asset_service.set_asset_status(data["asset_ids"][7], str(uuid.uuid4()))
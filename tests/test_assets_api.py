@@ -0,0 +1,28 @@
+API = "/maintenance/api/v2"
+
+
+def test_asset_list_fields_with_has_open_issues(client):
+    response = client.get(f"{API}/assets", query_string={
+        "fields": "id,asset_tag",
+        "has_open_issues": "true",
+        "retired": "all",
+    })
+    assert response.status_code == 200
+    items = response.get_json()["items"]
+    assert items
+    for item in items:
+        assert set(item) == {"id", "asset_id", "asset_tag"}
+
+
+def test_asset_list_fields_keep_requested_includes(client):
+    response = client.get(f"{API}/assets", query_string={
+        "fields": "asset_tag",
+        "include": "site,issue_summary",
+        "sort": "-open_issue_count",
+    })
+    assert response.status_code == 200
+    for item in response.get_json()["items"]:
+        assert set(item) == {
+            "id", "asset_id", "asset_tag", "site",
+            "open_issue_count", "last_issue_at", "last_status_change_at",
+        }
@@ -0,0 +1,66 @@
+import io
+
+import pytest
+
+from app.services import jobs as job_service
+
+API = "/maintenance/api/v2"
+
+
+@pytest.fixture(scope="module")
+def heic_bytes():
+    pillow_heif = pytest.importorskip("pillow_heif")
+    from PIL import Image
+
+    pillow_heif.register_heif_opener()
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), (200, 10, 10)).save(buffer, format="HEIF")
+    return buffer.getvalue()
+
+
+def _new_issue(client, data, title):
+    response = client.post(f"{API}/issues", json={
+        "asset_id": data["asset_ids"][2],
+        "title": title,
+        "description": "Attachment test",
+        "asset_status_id": data["asset_status_ids"]["ACTIVE"],
+    })
+    assert response.status_code == 201
+    return response.get_json()["id"]
+
+
+def _upload(client, issue_id, body, filename):
+    return client.post(
+        f"{API}/issues/{issue_id}/attachment",
+        data={"file": (io.BytesIO(body), filename, "image/heic")},
+        content_type="multipart/form-data",
+    )
+
+
+def test_non_heif_upload_is_rejected(client, data):
+    issue_id = _new_issue(client, data, "MP4 as HEIC")
+    # An MP4 starts with the same ISO-BMFF 'ftyp' box as a HEIC.
+    mp4 = b"\x00\x00\x00\x18ftypisom\x00\x00\x02\x00isomiso2" + b"\x00" * 64
+
+    response = _upload(client, issue_id, mp4, "clip.heic")
+    assert response.status_code == 400
+    assert client.get(f"{API}/issues/{issue_id}/attachment").status_code == 404
+
+
+def test_heic_is_served_as_jpeg_before_and_after_the_job(app, client, data, heic_bytes):
+    issue_id = _new_issue(client, data, "HEIC upload")
+
+    response = _upload(client, issue_id, heic_bytes, "photo.heic")
+    assert response.status_code == 201
+    assert response.get_json()["content_type"] == "image/heic"
+
+    served = client.get(f"{API}/issues/{issue_id}/attachment")
+    assert served.status_code == 200
+    assert served.mimetype == "image/jpeg"
+    assert served.data[:2] == b"\xff\xd8"
+
+    # The queued conversion finds the attachment already converted.
+    job_service.JobWorker(app, name="test").run_available()
+    served = client.get(f"{API}/issues/{issue_id}/attachment")
+    assert served.status_code == 200
+    assert served.mimetype == "image/jpeg"
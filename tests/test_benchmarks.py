@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+from benchmarks import datagen
+from benchmarks.compare import compare
+
+NOW = datetime(2026, 1, 15, tzinfo=timezone.utc)
+
+
+class _RecordingCursor:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.log.append((sql, params))
+
+    def copy_expert(self, sql, buffer):
+        self.log.append((sql, buffer.read()))
+
+
+class _RecordingConnection:
+    """Stands in for psycopg2: keeps every statement and COPY payload."""
+
+    def __init__(self):
+        self.log = []
+
+    def cursor(self):
+        return _RecordingCursor(self.log)
+
+    def commit(self):
+        pass
+
+
+def _generate(seed):
+    conn = _RecordingConnection()
+    ids = datagen.generate(conn, seed=seed, now=NOW, **datagen.SCALES["small"])
+    return conn.log, ids
+
+
+def test_datagen_is_reproducible_for_a_seed():
+    first_log, first_ids = _generate(7)
+    second_log, second_ids = _generate(7)
+    assert first_log == second_log
+    assert first_ids == second_ids
+
+    other_log, _ = _generate(8)
+    assert other_log != first_log
+
+
+def test_compare_flags_cases_past_the_threshold():
+    base = {"scales": {"small": {"cases": {"a": {"median_ms": 10.0}, "b": {"median_ms": 10.0}}}}}
+    head = {"scales": {"small": {"cases": {
+        "a": {"median_ms": 12.0},
+        "b": {"median_ms": 8.5},
+        "c": {"median_ms": 1.0},
+    }}}}
+
+    rows, regressions = compare(base, head, threshold=0.10)
+
+    assert regressions == 1
+    flags = {case: flag for _, case, _, _, _, flag in rows}
+    assert flags == {"a": "slower", "b": "faster", "c": ""}
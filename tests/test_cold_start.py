@@ -0,0 +1,30 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Only the endpoints that use them may pay for loading these.
+HEAVY_MODULES = ("PIL", "qrcode", "pillow_heif", "numpy")
+
+_PROBE = f"""
+import json, sys
+from app import initialise_application
+initialise_application()
+print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))
+"""
+
+
+def test_app_starts_without_loading_image_or_numeric_libraries(database):
+    env = {**os.environ, **database["settings"], "FLASK_SECRET": "tests"}
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
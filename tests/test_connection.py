@@ -0,0 +1,42 @@
+import os
+
+from sqlalchemy import text
+
+from app.db.connection import get_connection, warm_up_pool
+
+
+def _backend_pid() -> int:
+    with get_connection() as conn:
+        return conn.execute(text("SELECT pg_backend_pid()")).scalar_one()
+
+
+def test_forked_child_opens_its_own_connections(app):
+    assert warm_up_pool(1) == 1
+    parent_pid = _backend_pid()
+
+    read_fd, write_fd = os.pipe()
+    child = os.fork()
+    if child == 0:
+        # Child: must not reuse the parent's pooled socket.
+        status = 1
+        try:
+            os.close(read_fd)
+            os.write(write_fd, str(_backend_pid()).encode())
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        child_pid = int(pipe.read() or 0)
+    _, status = os.waitpid(child, 0)
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert child_pid not in (0, parent_pid)
+    # The child dropped its copy without closing the parent's connection.
+    with get_connection() as conn:
+        alive = conn.execute(
+            text("SELECT COUNT(*) FROM pg_stat_activity WHERE pid = :pid"),
+            {"pid": parent_pid},
+        ).scalar_one()
+    assert alive == 1
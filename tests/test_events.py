@@ -0,0 +1,60 @@
+import time
+
+from app.db import events as events_repo
+from app.services import auth as auth_service
+from app.services import events as events_service
+
+API = "/maintenance/api/v2"
+
+
+def _drain(conn, quiet_seconds: float = 0.5) -> list[dict]:
+    events = []
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        batch = events_repo.wait_for_events(conn, quiet_seconds)
+        if not batch:
+            break
+        events.extend(batch)
+    return events
+
+
+def test_subscriber_that_falls_behind_is_dropped(app):
+    broker = events_service.EventBroker()
+    with app.app_context():
+        subscription = broker.subscribe()
+    try:
+        broker.publish([{"type": "issue.updated", "n": n} for n in range(events_service.SUBSCRIBER_QUEUE_SIZE + 1)])
+        assert subscription.overflowed
+        assert broker.subscriber_count() == 0
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def test_site_subscription_gets_its_site_and_resyncs(app):
+    subscription = events_service.Subscription("site-a")
+    assert subscription.matches({"type": "issue.updated", "site_id": "site-a"})
+    assert not subscription.matches({"type": "issue.updated", "site_id": "site-b"})
+    assert subscription.matches({"type": "resync"})
+
+
+def test_bulk_asset_change_sends_one_resync_event(app, client, data):
+    client.set_cookie(auth_service.SETTINGS_ADMIN_GATE_COOKIE_NAME, "1")
+    asset_ids = data["asset_ids"][24:34]
+
+    with app.app_context():
+        conn = events_repo.open_listen_connection()
+    try:
+        _drain(conn)
+        response = client.post(f"{API}/assets/bulk", json={
+            "action": "set_status",
+            "asset_ids": asset_ids,
+            "status_id": data["asset_status_ids"]["MAINTENANCE"],
+        })
+        assert response.status_code == 200
+        assert response.get_json()["status_changes"] > 1
+
+        events = _drain(conn)
+    finally:
+        conn.close()
+
+    assert [event["type"] for event in events] == ["resync"]
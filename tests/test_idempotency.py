@@ -0,0 +1,20 @@
+API = "/maintenance/api/v2"
+
+
+def test_replayed_action_keeps_the_etag(client, data):
+    issue_id = data["issue_ids"][5]
+    request = {
+        "path": f"{API}/issues/{issue_id}/actions",
+        "json": {"action_type_code": "NOTE", "body": "Replayed note"},
+        "headers": {"Idempotency-Key": f"test-replay-etag-{issue_id}"},
+    }
+
+    first = client.post(**request)
+    assert first.status_code == 201
+    assert first.headers["ETag"]
+
+    replay = client.post(**request)
+    assert replay.status_code == 201
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert replay.headers["ETag"] == first.headers["ETag"]
+    assert replay.get_json() == first.get_json()
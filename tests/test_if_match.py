@@ -0,0 +1,77 @@
+import pytest
+
+API = "/maintenance/api/v2"
+
+
+def _issue_etag(client, issue_id):
+    response = client.get(f"{API}/issues/{issue_id}")
+    assert response.status_code == 200
+    return response.headers["ETag"]
+
+
+def _patch(client, issue_id, if_match):
+    return client.patch(
+        f"{API}/issues/{issue_id}",
+        json={"reported_by": "if-match test"},
+        headers={"If-Match": if_match},
+    )
+
+
+def test_weak_etag_is_a_failed_precondition(client, data):
+    issue_id = data["issue_ids"][1]
+    etag = _issue_etag(client, issue_id)
+
+    response = _patch(client, issue_id, f"W/{etag}")
+    assert response.status_code == 412
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("extra", ['"999999"', 'W/"1"', '"not-ours"'])
+def test_etag_list_matches_the_current_version(client, data, extra):
+    issue_id = data["issue_ids"][2]
+    etag = _issue_etag(client, issue_id)
+
+    response = _patch(client, issue_id, f"{extra}, {etag}")
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_etag_list_without_the_current_version(client, data):
+    issue_id = data["issue_ids"][3]
+    etag = _issue_etag(client, issue_id)
+
+    response = _patch(client, issue_id, '"999998", "999999"')
+    assert response.status_code == 412
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("if_match", ["2", '"2', '"2" "3"', ",", 'W/ "2"'])
+def test_unparseable_if_match_is_a_bad_request(client, data, if_match):
+    response = _patch(client, data["issue_ids"][4], if_match)
+    assert response.status_code == 400
+
+
+def test_asset_patch_with_weak_etag(client, data):
+    asset_id = data["asset_ids"][1]
+    etag = client.get(f"{API}/assets/{asset_id}").headers["ETag"]
+
+    response = client.patch(
+        f"{API}/assets/{asset_id}",
+        json={"retire_reason": "if-match test"},
+        headers={"If-Match": f"W/{etag}"},
+    )
+    assert response.status_code == 412
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("if_match", ['"1"', '"1", "2"', 'W/"1"'])
+def test_if_match_on_a_missing_resource_is_not_found(client, if_match):
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    assert _patch(client, missing_id, if_match).status_code == 404
+    response = client.patch(
+        f"{API}/assets/{missing_id}",
+        json={"retire_reason": "if-match test"},
+        headers={"If-Match": if_match},
+    )
+    assert response.status_code == 404
@@ -0,0 +1,89 @@
+from sqlalchemy import text
+
+from app.db import jobs as jobs_db
+from app.db.connection import get_connection
+from app.services import jobs as job_service
+
+TEST_JOB = "test_job"
+
+
+def _job_row(job_id) -> dict:
+    with get_connection() as conn:
+        row = conn.execute(
+            text("SELECT status, attempts, locked_by, last_error FROM job WHERE id = :id"),
+            {"id": job_id},
+        ).mappings().first()
+    return dict(row)
+
+
+def _claim(worker_id: str) -> dict:
+    claimed = jobs_db.claim_job_rows(worker_id, limit=1)
+    assert len(claimed) == 1
+    return claimed[0]
+
+
+def _enqueue_alone(app) -> int:
+    # Run whatever earlier tests queued so the next claim gets this job.
+    job_service.JobWorker(app, name="drain").run_available()
+    return job_service.enqueue(TEST_JOB, {"n": 1})
+
+
+def test_late_finisher_does_not_overwrite_a_requeued_job(app, monkeypatch):
+    with app.app_context():
+        job_id = _enqueue_alone(app)
+        first = _claim("host:1:slow-worker")
+        assert first["id"] == job_id
+
+        # The slow worker outlives its lease; housekeeping requeues the job
+        # and another worker claims it.
+        assert jobs_db.requeue_stale_job_rows(0) >= 1
+        second = _claim("host:2:job-worker-1")
+        assert second["id"] == job_id
+
+        monkeypatch.setattr(job_service, "_handlers", lambda: {TEST_JOB: lambda payload: None})
+        assert job_service.run_job(first) == "lease_lost"
+        assert _job_row(job_id)["status"] == "running"
+        assert _job_row(job_id)["locked_by"] == "host:2:job-worker-1"
+
+        assert job_service.run_job(second) == "done"
+        assert _job_row(job_id)["status"] == "done"
+
+
+def test_failing_job_is_retried_then_failed(app, monkeypatch):
+    def broken(payload):
+        raise RuntimeError("still broken")
+
+    monkeypatch.setattr(job_service, "_handlers", lambda: {TEST_JOB: broken})
+    with app.app_context():
+        job_id = _enqueue_alone(app)
+        job = _claim("host:1:job-worker-1")
+        assert job_service.run_job(job) == "retry"
+        row = _job_row(job_id)
+        assert (row["status"], row["locked_by"]) == ("queued", None)
+        assert row["last_error"] == "RuntimeError: still broken"
+
+        job = {**job, "attempts": job["max_attempts"]}
+        with get_connection() as conn:
+            conn.execute(
+                text("UPDATE job SET status = 'running', locked_by = :worker WHERE id = :id"),
+                {"id": job_id, "worker": job["locked_by"]},
+            )
+        assert job_service.run_job(job) == "failed"
+        assert _job_row(job_id)["status"] == "failed"
+
+
+def test_housekeeping_command_requeues_a_dead_workers_job(app, capsys):
+    from app.jobs import housekeeping
+
+    with app.app_context():
+        job_id = _enqueue_alone(app)
+        _claim("host:1:dead-worker")
+
+        assert housekeeping.main(["--lease-seconds", "0"]) == 0
+        assert "requeued 1 stale job(s)" in capsys.readouterr().out
+        row = _job_row(job_id)
+        assert (row["status"], row["locked_by"]) == ("queued", None)
+
+
+def test_cpu_bound_work_runs_inline_without_gevent():
+    assert job_service.run_cpu_bound(sum, [1, 2, 3]) == 6
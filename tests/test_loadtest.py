@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from benchmarks.postgres import connect
+from loadtest.client import summarise
+from loadtest.scenarios import DEFAULT_MIX, ScenarioRequests, build_photo, load_targets, parse_mix
+
+
+def test_parse_mix():
+    assert parse_mix(None) == DEFAULT_MIX
+    assert parse_mix("issue_list=3,issue_view") == (("issue_list", 3), ("issue_view", 1))
+    with pytest.raises(ValueError):
+        parse_mix("homepage=1")
+
+
+def test_summarise_counts_only_server_failures_as_errors():
+    samples = {
+        "issue_list": [(0.010, 200), (0.030, 302), (0.020, 404)],
+        "issue_view": [(0.100, 500), (0.050, 0)],
+    }
+
+    summary = summarise(samples, elapsed=2.0)
+
+    assert summary["overall"]["requests"] == 5
+    assert summary["overall"]["errors"] == 2
+    assert summary["overall"]["rps"] == 2.5
+    assert summary["scenarios"]["issue_list"]["errors"] == 0
+    assert summary["scenarios"]["issue_list"]["p50_ms"] == 20.0
+    assert summary["scenarios"]["issue_view"]["statuses"] == {"500": 1, "0": 1}
+
+
+@pytest.mark.parametrize("scenario", [name for name, _ in DEFAULT_MIX])
+def test_every_scenario_is_served_by_the_app(client, database, scenario):
+    conn = connect(database["settings"])
+    try:
+        targets = load_targets(conn)
+    finally:
+        conn.close()
+
+    requests = ScenarioRequests(targets, random.Random(1), build_photo((64, 48)))
+    method, path, body, headers = requests.build(scenario)
+
+    response = client.open(path, method=method, data=body, headers=headers)
+    assert response.status_code < 400, response.data[:300]
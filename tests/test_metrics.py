@@ -0,0 +1,46 @@
+import io
+
+from prometheus_client import REGISTRY
+
+from app.services import auth as auth_service
+
+API = "/maintenance/api/v2"
+
+
+def test_metrics_need_the_admin_gate_or_the_token(client, monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+
+    assert client.get("/maintenance/metrics").status_code == 403
+    assert client.get("/maintenance/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 403
+
+    response = client.get("/maintenance/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert b"maintenance_http_requests_total" in response.data
+
+    client.set_cookie(auth_service.SETTINGS_ADMIN_GATE_COOKIE_NAME, "1")
+    assert client.get("/maintenance/metrics").status_code == 200
+
+
+def test_attachment_size_is_the_stored_size(client, data):
+    def observed_bytes():
+        return REGISTRY.get_sample_value(
+            "maintenance_attachment_upload_bytes_sum", {"content_type": "image/png"}
+        ) or 0
+
+    response = client.post(f"{API}/issues", json={
+        "asset_id": data["asset_ids"][3],
+        "title": "Metrics attachment test",
+        "description": "Attachment size",
+        "asset_status_id": data["asset_status_ids"]["ACTIVE"],
+    })
+    issue_id = response.get_json()["id"]
+    body = b"\x89PNG\r\n\x1a\n" + bytes(5000)
+
+    before = observed_bytes()
+    response = client.post(
+        f"{API}/issues/{issue_id}/attachment",
+        data={"file": (io.BytesIO(body), "photo.png", "image/png")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 201
+    assert observed_bytes() - before == len(body)
@@ -0,0 +1,26 @@
+from datetime import date
+
+from app.db.partitions import PARTITIONED_TABLES
+from app.services import partitions as partition_service
+
+
+def test_add_months_rolls_over_the_year():
+    assert partition_service._add_months(date(2031, 11, 1), 1) == date(2031, 12, 1)
+    assert partition_service._add_months(date(2031, 11, 1), 3) == date(2032, 2, 1)
+
+
+def test_future_partitions_are_created_once(app):
+    with app.app_context():
+        created = partition_service.ensure_future_partitions(2, today=date(2031, 11, 15))
+        assert created == {
+            parent: [f"{parent}_p2031_11", f"{parent}_p2031_12", f"{parent}_p2032_01"]
+            for parent in PARTITIONED_TABLES
+        }
+
+        again = partition_service.ensure_future_partitions(1, today=date(2031, 12, 2))
+        assert again == {parent: [] for parent in PARTITIONED_TABLES}
+
+        bounds = {row["name"]: row["bounds"] for row in partition_service.list_partitions()}
+
+    assert "2031-12-01" in bounds["issue_action_p2031_12"] and "2032-01-01" in bounds["issue_action_p2031_12"]
+    assert bounds["issue_action_default"] == "DEFAULT"
@@ -0,0 +1,57 @@
+import json
+import logging
+
+from flask import Flask, jsonify
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.db.connection import get_connection
+from app.profiling import install_request_profiling
+
+
+def _profiled_app() -> Flask:
+    profiled = Flask("profiling-test")
+    install_request_profiling(profiled)
+
+    @profiled.route("/queries")
+    def queries():
+        for _ in range(2):
+            with get_connection() as conn:
+                conn.execute(text("SELECT 1"))
+        try:
+            with get_connection() as conn:
+                conn.execute(text("SELECT 1 / 0"))
+        except DBAPIError:
+            pass
+        return jsonify({"ok": True})
+
+    return profiled
+
+
+def test_server_timing_and_log_line(app, caplog):
+    profiled = _profiled_app()
+
+    with caplog.at_level(logging.INFO, logger="app.profiling"):
+        response = profiled.test_client().get("/queries")
+
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    # The statement that raised is not counted (nor left behind for the next).
+    assert 'db;dur=' in timing and 'desc="2 queries"' in timing
+    for metric in ("pool;dur=", "tpl;dur=", "ser;dur=", "total;dur="):
+        assert metric in timing
+
+    line = next(record.getMessage() for record in caplog.records if record.getMessage().startswith("request_profile "))
+    fields = json.loads(line.removeprefix("request_profile "))
+    assert fields["endpoint"] == "queries"
+    assert fields["query_count"] == 2
+    assert fields["repeated_query_count"] == 1
+
+
+def test_profiling_can_be_switched_off(app):
+    unprofiled = Flask("unprofiled-test")
+    unprofiled.config["REQUEST_PROFILING"] = False
+    install_request_profiling(unprofiled)
+    unprofiled.add_url_rule("/ping", "ping", lambda: "pong")
+
+    assert "Server-Timing" not in unprofiled.test_client().get("/ping").headers
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from app.services import reliability as reliability_service
+
+API = "/maintenance/api/v2"
+
+HOUR = 3600.0
+
+
+def test_state_lasts_until_the_next_change_of_its_own_group():
+    group = np.array([0, 0, 1])
+    starts = np.array([-2 * HOUR, 5 * HOUR, 1 * HOUR])
+
+    held = reliability_service._interval_durations(group, starts, 0.0, 10 * HOUR)
+
+    # Clipped to the window start; the last change of each group runs to the window end.
+    assert held.tolist() == [5 * HOUR, 5 * HOUR, 9 * HOUR]
+
+
+def test_ratios_leave_undefined_metrics_empty():
+    totals = {
+        "observed_seconds": np.array([100.0, 0.0]),
+        "downtime_seconds": np.array([20.0, 0.0]),
+        "failure_count": np.array([2.0, 0.0]),
+        "repair_count": np.array([1.0, 0.0]),
+        "repair_seconds": np.array([30.0, 0.0]),
+    }
+
+    ratios = reliability_service._ratios(totals)
+
+    assert ratios["mtbf_seconds"][0] == 40.0
+    assert ratios["mttr_seconds"][0] == 30.0
+    assert ratios["availability"][0] == pytest.approx(0.8)
+    assert all(np.isnan(ratios[key][1]) for key in ratios)
+
+
+def test_rollups_add_up_to_the_asset_rows(app):
+    with app.app_context():
+        window_start, window_end = reliability_service.reliability_window(90)
+        rows = reliability_service.compute_reliability_rows(window_start, window_end)
+
+    assets = [row for row in rows if row["scope"] == "asset"]
+    sites = [row for row in rows if row["scope"] == "site"]
+    models = [row for row in rows if row["scope"] == "model" and row["site_id"] is None]
+    assert assets
+
+    for key in ("failure_count", "repair_count", "observed_seconds", "downtime_seconds"):
+        total = sum(row[key] for row in assets)
+        assert sum(row[key] for row in sites) == pytest.approx(total)
+        assert sum(row[key] for row in models) == pytest.approx(total)
+
+    for row in rows:
+        if row["availability"] is not None:
+            assert 0.0 <= row["availability"] <= 1.0
+
+
+def test_reliability_report_api(client, data):
+    response = client.get(f"{API}/reliability", query_string={"scope": "asset", "limit": 5})
+    assert response.status_code == 200
+    report = response.get_json()
+    assert report["window"]["days"] == reliability_service.window_days_setting()
+    assert 0 < len(report["items"]) <= 5
+
+    availabilities = [item["availability"] for item in report["items"] if item["availability"] is not None]
+    assert availabilities == sorted(availabilities)
+
+    assert client.get(f"{API}/reliability", query_string={"scope": "fleet"}).status_code == 400
@@ -0,0 +1,22 @@
+from app.services import assets as asset_service
+from app.services import issues as issue_service
+
+
+def test_update_issue_returns_the_written_version(app, data):
+    issue_id = data["issue_ids"][0]
+    with app.test_request_context():
+        before = issue_service.get_issue(issue_id)
+        updated = issue_service.update_issue(issue_id, {"title": "Renamed in this request"})
+
+    assert updated["title"] == "Renamed in this request"
+    assert updated["version"] == before["version"] + 1
+
+
+def test_patch_asset_returns_the_written_version(app, data):
+    asset_id = data["asset_ids"][0]
+    with app.test_request_context():
+        before = asset_service.get_asset_service(asset_id)
+        updated = asset_service.patch_asset_service(asset_id, {"retire_reason": "Renamed in this request"})
+
+    assert updated["retire_reason"] == "Renamed in this request"
+    assert updated["version"] == before["version"] + 1
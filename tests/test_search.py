@@ -0,0 +1,45 @@
+API = "/maintenance/api/v2"
+
+
+def _search(client, **params):
+    response = client.get(f"{API}/search", query_string=params)
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_search_groups_issues_and_actions(client, data):
+    created = client.post(f"{API}/issues", json={
+        "asset_id": data["asset_ids"][6],
+        "title": "Zanzibarite gasket weeping",
+        "description": "Found during the search test",
+        "asset_status_id": data["asset_status_ids"]["ACTIVE"],
+    })
+    assert created.status_code == 201
+    issue_id = created.get_json()["id"]
+    action = client.post(f"{API}/issues/{issue_id}/actions", json={
+        "action_type_code": "NOTE",
+        "body": "Replaced the quixotically routed hose",
+    })
+    assert action.status_code == 201
+
+    result = _search(client, q="zanzibarite gasket")
+    assert set(result["groups"]) == {"assets", "issues", "actions"}
+    issues = result["groups"]["issues"]["items"]
+    assert issues[0]["id"] == issue_id
+
+    result = _search(client, q="quixotically", types="actions")
+    assert list(result["groups"]) == ["actions"]
+    assert [item["issue_id"] for item in result["groups"]["actions"]["items"]] == [issue_id]
+
+
+def test_spent_budget_times_groups_out(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, "SEARCH_BUDGET_MS", 0)
+
+    result = _search(client, q="pump")
+    assert all(group == {"items": [], "timed_out": True} for group in result["groups"].values())
+
+
+def test_search_validation(client):
+    assert client.get(f"{API}/search", query_string={"q": " "}).status_code == 400
+    assert client.get(f"{API}/search", query_string={"q": "pump", "types": "sites"}).status_code == 400
+    assert client.get(f"{API}/search", query_string={"q": "pump", "limit": 26}).status_code == 400
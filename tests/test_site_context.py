@@ -0,0 +1,41 @@
+import pytest
+from flask import render_template_string
+
+from app.services import sites as site_service
+
+API = "/maintenance/api/v2"
+
+
+@pytest.fixture
+def current_site_calls(monkeypatch):
+    calls = []
+    original = site_service.get_current_site
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(site_service, "get_current_site", counting)
+    return calls
+
+
+def test_api_requests_skip_the_site_context(client, data, current_site_calls):
+    assert client.get(f"{API}/issues/{data['issue_ids'][0]}").status_code == 200
+    assert current_site_calls == []
+
+
+def test_templates_resolve_the_site_context_once(app, current_site_calls):
+    with app.test_request_context("/maintenance/assets"):
+        render_template_string("{{ current_site }}{{ current_site }}{{ preferred_site_return_to }}")
+        assert len(current_site_calls) == 1
+
+        render_template_string("{{ preferred_site_return_to }}")
+        assert len(current_site_calls) == 1
+
+
+def test_site_catalog_is_read_only(app):
+    with app.app_context():
+        catalog = site_service.get_site_catalog()
+    with pytest.raises(TypeError):
+        catalog["by_id"] = {}
+    assert site_service.get_site_catalog() is catalog
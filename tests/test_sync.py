@@ -0,0 +1,33 @@
+API = "/maintenance/api/v2"
+
+ISSUE_KEYS = {
+    "id", "asset_id", "status_id", "title", "description", "reported_by",
+    "closed_at", "created_at", "updated_at", "version",
+}
+
+
+def _changes_since(client, cursor):
+    response = client.get(f"{API}/sync", query_string={"since": cursor})
+    assert response.status_code == 200
+    return response.get_json()["changes"]
+
+
+def test_sync_payload_leaves_out_search_vector(client, data):
+    cursor = client.get(f"{API}/sync").get_json()["cursor"]
+
+    created = client.post(f"{API}/issues", json={
+        "asset_id": data["asset_ids"][0],
+        "title": "Sync payload",
+        "description": "Checks which columns /sync hands out",
+        "asset_status_id": data["asset_status_ids"]["ACTIVE"],
+    })
+    assert created.status_code == 201
+    issue_id = created.get_json()["id"]
+
+    changes = _changes_since(client, cursor)
+    issue = next(c for c in changes if c["entity"] == "issue" and c["id"] == issue_id)
+    assert set(issue) == {"seq", "entity", "id", "op", "data", "changed_at"}
+    assert set(issue["data"]) == ISSUE_KEYS
+
+    for change in changes:
+        assert "search_vector" not in (change["data"] or {})